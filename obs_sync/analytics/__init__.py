@@ -1,6 +1,8 @@
 """Analytics modules for task insights and streak tracking."""
 
+from .aggregator import InsightsAggregator, InsightsSummary
+from .history import CompletionHistory
 from .streaks import StreakTracker
 from .hygiene import HygieneAnalyzer
 
-__all__ = ['StreakTracker', 'HygieneAnalyzer']
+__all__ = ['InsightsAggregator', 'InsightsSummary', 'CompletionHistory', 'StreakTracker', 'HygieneAnalyzer']
@@ -0,0 +1,237 @@
+"""
+Single-pass aggregation of task insights.
+
+One walk over the Reminders tasks, joined to their linked Obsidian tasks
+through dictionaries, yields everything the sync summary, streak tracking
+and the hygiene report need: completions, overdue and new-task counts by list
+and tag, completions grouped by day for streaks, and the stagnant,
+missing-due and overdue items listed by ``obs-sync insights``.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional
+
+from ..core.models import SyncConfig, TaskStatus
+
+
+# Completions within this many days count towards insights and streaks
+COMPLETION_WINDOW_DAYS = 7
+
+SYNC_COUNTERS = ("completions", "overdue", "new_tasks")
+HYGIENE_COUNTERS = ("stagnant", "missing_due")
+
+
+def _as_date(value: Any) -> Optional[date]:
+    return value.date() if isinstance(value, datetime) else value
+
+
+@dataclass
+class InsightsSummary:
+    """Everything one aggregation pass produces."""
+
+    completions: int = 0
+    overdue: int = 0
+    new_tasks: int = 0
+    stagnant: int = 0
+    missing_due: int = 0
+    by_list: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    by_tag: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # completion date -> {"by_tag": {tag: n}, "by_list": {list: n}}
+    completions_by_date: Dict[date, Dict[str, Dict[str, int]]] = field(default_factory=dict)
+    # stagnant / missing_due / overdue items, most severe first
+    hygiene: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict)
+
+    def insights(self) -> Dict[str, Any]:
+        """Counts in the shape sync results and daily notes use."""
+        return {
+            "completions": self.completions,
+            "overdue": self.overdue,
+            "new_tasks": self.new_tasks,
+            "by_list": {name: dict(counts) for name, counts in self.by_list.items()},
+            "by_tag": {tag: dict(counts) for tag, counts in self.by_tag.items()},
+        }
+
+
+class InsightsAggregator:
+    """Computes an :class:`InsightsSummary` in one linear pass.
+
+    Args:
+        stagnant_threshold_days: Days before an incomplete task is stagnant
+        hygiene: Also collect stagnant and missing-due items and counts
+        today: Reference date (defaults to today)
+    """
+
+    def __init__(
+        self,
+        stagnant_threshold_days: int = 14,
+        hygiene: bool = False,
+        today: Optional[date] = None,
+    ):
+        self.stagnant_threshold = stagnant_threshold_days
+        self.hygiene = hygiene
+        self.today = today or date.today()
+
+    def _bucket(self, table: Dict[str, Dict[str, int]], name: str) -> Dict[str, int]:
+        bucket = table.get(name)
+        if bucket is None:
+            counters = SYNC_COUNTERS + HYGIENE_COUNTERS if self.hygiene else SYNC_COUNTERS
+            bucket = table[name] = dict.fromkeys(counters, 0)
+        return bucket
+
+    @staticmethod
+    def _tags(obs_task: Any) -> List[str]:
+        tags = []
+        for tag in getattr(obs_task, "tags", None) or []:
+            normalized = SyncConfig._normalize_tag_value(tag)
+            if normalized:
+                tags.append(normalized)
+        return tags
+
+    def _count(self, summary: InsightsSummary, counter: str, list_name: Optional[str], tags: List[str]) -> None:
+        setattr(summary, counter, getattr(summary, counter) + 1)
+        if list_name is not None:
+            self._bucket(summary.by_list, list_name)[counter] += 1
+        for tag in tags:
+            self._bucket(summary.by_tag, tag)[counter] += 1
+
+    def run(
+        self,
+        rem_tasks: Iterable[Any],
+        obs_tasks: Iterable[Any] = (),
+        links: Iterable[Any] = (),
+        created_rem_ids: Iterable[str] = (),
+        created_obs_ids: Iterable[str] = (),
+    ) -> InsightsSummary:
+        """Aggregate insights over Reminders tasks and their linked Obsidian tasks.
+
+        Args:
+            rem_tasks: Reminders tasks to walk
+            obs_tasks: Obsidian tasks, used for tags of linked reminders and
+                for Obsidian tasks created during the sync
+            links: Sync links joining the two sides
+            created_rem_ids: Reminders created during the sync
+            created_obs_ids: Obsidian tasks created during the sync
+        """
+        summary = InsightsSummary()
+        today = self.today
+        threshold_date = today - timedelta(days=self.stagnant_threshold)
+
+        obs_by_uuid: Dict[str, Any] = {}
+        for obs_task in obs_tasks:
+            obs_by_uuid.setdefault(obs_task.uuid, obs_task)
+        obs_for_rem: Dict[str, str] = {}
+        rem_for_obs: Dict[str, str] = {}
+        for link in links:
+            obs_for_rem[link.rem_uuid] = link.obs_uuid
+            rem_for_obs[link.obs_uuid] = link.rem_uuid
+        created_rem = set(created_rem_ids)
+        created_obs = set(created_obs_ids)
+
+        rem_by_uuid: Dict[str, Any] = {}
+        stagnant: List[Dict[str, Any]] = []
+        missing_due: List[Dict[str, Any]] = []
+        overdue: List[Dict[str, Any]] = []
+        by_date: DefaultDict[date, Dict[str, DefaultDict[str, int]]] = defaultdict(
+            lambda: {"by_tag": defaultdict(int), "by_list": defaultdict(int)}
+        )
+
+        for rem_task in rem_tasks:
+            rem_by_uuid.setdefault(rem_task.uuid, rem_task)
+            list_name = rem_task.list_name or "Unknown"
+            linked_obs = obs_by_uuid.get(obs_for_rem.get(rem_task.uuid, ""))
+            tags = self._tags(linked_obs) if linked_obs is not None else []
+            done = rem_task.status == TaskStatus.DONE
+
+            if done and rem_task.completion_date:
+                if (today - rem_task.completion_date).days <= COMPLETION_WINDOW_DAYS:
+                    self._count(summary, "completions", list_name, tags)
+                    day = by_date[rem_task.completion_date]
+                    day["by_list"][list_name] += 1
+                    for tag in tags:
+                        day["by_tag"][tag] += 1
+
+            if not done and rem_task.due_date and rem_task.due_date < today:
+                self._count(summary, "overdue", list_name, tags)
+                if self.hygiene:
+                    overdue.append({
+                        "uuid": rem_task.uuid,
+                        "title": rem_task.title,
+                        "list_name": rem_task.list_name,
+                        "due_date": rem_task.due_date.isoformat(),
+                        "days_overdue": (today - rem_task.due_date).days,
+                    })
+
+            if rem_task.uuid in created_rem:
+                self._count(summary, "new_tasks", list_name, tags)
+
+            if self.hygiene and not done:
+                self._hygiene(summary, rem_task, list_name, tags, threshold_date, stagnant, missing_due)
+
+        for obs_uuid in created_obs:
+            obs_task = obs_by_uuid.get(obs_uuid)
+            if obs_task is None:
+                continue
+            linked_rem = rem_by_uuid.get(rem_for_obs.get(obs_uuid, ""))
+            list_name = (linked_rem.list_name or "Unknown") if linked_rem is not None else None
+            self._count(summary, "new_tasks", list_name, self._tags(obs_task))
+
+        summary.completions_by_date = {
+            day: {"by_tag": dict(counts["by_tag"]), "by_list": dict(counts["by_list"])}
+            for day, counts in by_date.items()
+        }
+        if self.hygiene:
+            stagnant.sort(key=lambda item: item.get("days_stagnant", 0), reverse=True)
+            overdue.sort(key=lambda item: item.get("days_overdue", 0), reverse=True)
+            summary.hygiene = {"stagnant": stagnant, "missing_due": missing_due, "overdue": overdue}
+        return summary
+
+    def _hygiene(
+        self,
+        summary: InsightsSummary,
+        rem_task: Any,
+        list_name: str,
+        tags: List[str],
+        threshold_date: date,
+        stagnant: List[Dict[str, Any]],
+        missing_due: List[Dict[str, Any]],
+    ) -> None:
+        """Collect stagnant and missing-due items for an incomplete reminder."""
+        today = self.today
+        created_at = rem_task.created_at
+        if not rem_task.due_date:
+            self._count(summary, "missing_due", list_name, tags)
+            missing_due.append({
+                "uuid": rem_task.uuid,
+                "title": rem_task.title,
+                "list_name": rem_task.list_name,
+                "created_at": created_at.isoformat() if created_at else None,
+            })
+            # Undated tasks go stagnant from their creation date
+            created_date = _as_date(created_at) if created_at else None
+            if created_date and created_date <= threshold_date:
+                self._count(summary, "stagnant", list_name, tags)
+                stagnant.append({
+                    "uuid": rem_task.uuid,
+                    "title": rem_task.title,
+                    "list_name": rem_task.list_name,
+                    "days_stagnant": (today - created_date).days,
+                    "created_at": created_at.isoformat(),
+                })
+            return
+
+        # Dated tasks go stagnant from their last modification, unless already overdue
+        check_date = rem_task.modified_at or created_at
+        if not check_date or rem_task.due_date < today:
+            return
+        check_day = _as_date(check_date)
+        if check_day is not None and check_day <= threshold_date:
+            self._count(summary, "stagnant", list_name, tags)
+            stagnant.append({
+                "uuid": rem_task.uuid,
+                "title": rem_task.title,
+                "list_name": rem_task.list_name,
+                "days_stagnant": (today - check_day).days,
+                "last_modified": check_date.isoformat(),
+            })
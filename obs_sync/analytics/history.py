@@ -0,0 +1,233 @@
+"""
+Columnar completion history for streaks and insights.
+
+Each (vault, category, key) series is a day ordinal plus a packed array of
+daily completion counts, so recording today is an append and totals over a
+date range are a slice sum. The whole store is persisted as one compact
+binary file that loads without parsing per-day entries.
+
+File layout (little-endian)::
+
+    b"OSCH" | u16 version | u32 series count
+    per series: 3 x (u16 length + UTF-8 bytes) for vault, category, key,
+                u32 first day ordinal, u32 day count, day count x u32 counts
+"""
+
+import logging
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+MAGIC = b"OSCH"
+VERSION = 1
+
+SeriesKey = Tuple[str, str, str]
+
+
+def _packed(counts: array) -> bytes:
+    if sys.byteorder == "little":
+        return counts.tobytes()
+    swapped = array("I", counts)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+class DailySeries:
+    """Completion counts for consecutive days starting at ``start`` (a date ordinal)."""
+
+    __slots__ = ("start", "counts")
+
+    def __init__(self, start: int, counts: Optional[array] = None):
+        self.start = start
+        self.counts = counts if counts is not None else array("I")
+
+    @property
+    def end(self) -> int:
+        """Ordinal one past the last stored day."""
+        return self.start + len(self.counts)
+
+    def get(self, ordinal: int) -> int:
+        index = ordinal - self.start
+        return self.counts[index] if 0 <= index < len(self.counts) else 0
+
+    def set(self, ordinal: int, count: int) -> int:
+        """Store ``count`` for a day and return the previous count.
+
+        Days after the last stored one are appended (gaps filled with zeros);
+        days before the first one shift the array, which only backfills need.
+        """
+        if not self.counts:
+            self.start = ordinal
+            self.counts.append(count)
+            return 0
+        index = ordinal - self.start
+        if index < 0:
+            self.counts[0:0] = array("I", [0]) * (-index)
+            self.start = ordinal
+            index = 0
+        elif index >= len(self.counts):
+            self.counts.extend(array("I", [0]) * (index - len(self.counts)))
+            self.counts.append(count)
+            return 0
+        previous = self.counts[index]
+        self.counts[index] = count
+        return previous
+
+    def total(self, start: int, end: int) -> int:
+        """Sum of counts for ordinals in ``[start, end)``."""
+        lo = max(start, self.start) - self.start
+        hi = min(end, self.end) - self.start
+        return sum(self.counts[lo:hi]) if hi > lo else 0
+
+    def active_days(self) -> Iterator[int]:
+        """Ordinals of days with at least one completion, oldest first."""
+        for index, count in enumerate(self.counts):
+            if count:
+                yield self.start + index
+
+    def trim_before(self, ordinal: int) -> None:
+        cut = ordinal - self.start
+        if cut <= 0:
+            return
+        del self.counts[:cut]
+        self.start = ordinal if self.counts else 0
+
+    def is_empty(self) -> bool:
+        return not any(self.counts)
+
+
+class CompletionHistory:
+    """Daily completion series per ``(vault_id, category, key)``.
+
+    Args:
+        path: Binary file backing the store; loaded eagerly, written by :meth:`save`
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+        self._series: Dict[SeriesKey, DailySeries] = {}
+        self.dirty = False
+        self._load()
+
+    # ---------------------------------------------------------------- storage
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as handle:
+                blob = handle.read()
+        except OSError:
+            return
+        try:
+            self._series = self._decode(blob)
+        except (ValueError, struct.error, UnicodeDecodeError) as exc:
+            self.logger.warning("Ignoring unreadable completion history at %s: %s", self.path, exc)
+            self._series = {}
+
+    @staticmethod
+    def _decode(blob: bytes) -> Dict[SeriesKey, DailySeries]:
+        if blob[:4] != MAGIC:
+            raise ValueError("not a completion history file")
+        version, count = struct.unpack_from("<HI", blob, 4)
+        if version != VERSION:
+            raise ValueError(f"unsupported version {version}")
+        offset = 10
+        series: Dict[SeriesKey, DailySeries] = {}
+        for _ in range(count):
+            names = []
+            for _ in range(3):
+                (length,) = struct.unpack_from("<H", blob, offset)
+                offset += 2
+                names.append(blob[offset:offset + length].decode("utf-8"))
+                offset += length
+            start, days = struct.unpack_from("<II", blob, offset)
+            offset += 8
+            counts = array("I")
+            counts.frombytes(blob[offset:offset + 4 * days])
+            if sys.byteorder != "little":
+                counts.byteswap()
+            offset += 4 * days
+            series[(names[0], names[1], names[2])] = DailySeries(start, counts)
+        return series
+
+    def _encode(self) -> bytes:
+        parts = [MAGIC, struct.pack("<HI", VERSION, len(self._series))]
+        for names, series in self._series.items():
+            for name in names:
+                raw = name.encode("utf-8")
+                parts.append(struct.pack("<H", len(raw)))
+                parts.append(raw)
+            parts.append(struct.pack("<II", series.start, len(series.counts)))
+            parts.append(_packed(series.counts))
+        return b"".join(parts)
+
+    def save(self) -> None:
+        """Write the store atomically if anything changed since the last save."""
+        if not self.dirty:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".bin")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(self._encode())
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    # ---------------------------------------------------------------- records
+
+    def record(self, vault_id: str, category: str, key: str, day: date, count: int) -> Optional[int]:
+        """Store a day's count; returns the previous count, or None if the day had none."""
+        names = (vault_id, category, key)
+        series = self._series.get(names)
+        if series is None:
+            if not count:
+                # Nothing to store; an all-zero series would only take up space
+                return None
+            series = self._series[names] = DailySeries(day.toordinal())
+        previous = series.set(day.toordinal(), count)
+        if previous != count:
+            self.dirty = True
+        return previous or None
+
+    def series(self, vault_id: str, category: str, key: str) -> Optional[DailySeries]:
+        return self._series.get((vault_id, category, key))
+
+    def keys(self, vault_id: str, category: str) -> List[str]:
+        return [key for (vault, cat, key) in self._series if vault == vault_id and cat == category]
+
+    def counts(self, vault_id: str, category: str, key: str) -> Dict[date, int]:
+        """Non-zero daily counts for one series, oldest first."""
+        series = self.series(vault_id, category, key)
+        if series is None:
+            return {}
+        return {date.fromordinal(day): series.get(day) for day in series.active_days()}
+
+    def trim(self, before: date) -> None:
+        """Drop every day before ``before``; emptied series are removed."""
+        cutoff = before.toordinal()
+        for names in list(self._series):
+            series = self._series[names]
+            if series.start >= cutoff:
+                continue
+            series.trim_before(cutoff)
+            if series.is_empty():
+                del self._series[names]
+            self.dirty = True
+
+    # ---------------------------------------------------------------- rollups
+
+    def total(self, vault_id: str, category: str, key: str, start: date, end: date) -> int:
+        """Completions from ``start`` to ``end`` inclusive."""
+        series = self.series(vault_id, category, key)
+        if series is None:
+            return 0
+        return series.total(start.toordinal(), end.toordinal() + 1)
@@ -5,9 +5,9 @@ Identifies stagnant tasks, missing due dates, and overdue items
 to help maintain a healthy task list.
 """
 
-from datetime import date, datetime, timedelta, timezone
 from typing import List, Dict, Any
-from ..core.models import RemindersTask, TaskStatus
+from ..core.models import RemindersTask
+from .aggregator import InsightsAggregator, InsightsSummary
 
 
 class HygieneAnalyzer:
@@ -42,77 +42,21 @@ class HygieneAnalyzer:
                 - missing_due: Tasks without due dates
                 - overdue: Tasks past their due date
         """
-        stagnant = []
-        missing_due = []
-        overdue = []
-        
-        today = date.today()
-        threshold_date = today - timedelta(days=self.stagnant_threshold)
-        
-        for task in tasks:
-            # Skip completed tasks
-            if task.status == TaskStatus.DONE:
-                continue
-            
-            # Check for missing due date
-            if not task.due_date:
-                missing_due.append({
-                    "uuid": task.uuid,
-                    "title": task.title,
-                    "list_name": task.list_name,
-                    "created_at": task.created_at.isoformat() if task.created_at else None
-                })
-                
-                # Also check if stagnant (based on created_at)
-                if task.created_at:
-                    created_date = task.created_at.date() if isinstance(task.created_at, datetime) else task.created_at
-                    if created_date <= threshold_date:
-                        days_stagnant = (today - created_date).days
-                        stagnant.append({
-                            "uuid": task.uuid,
-                            "title": task.title,
-                            "list_name": task.list_name,
-                            "days_stagnant": days_stagnant,
-                            "created_at": task.created_at.isoformat() if task.created_at else None
-                        })
-            else:
-                # Check if overdue
-                if task.due_date < today:
-                    days_overdue = (today - task.due_date).days
-                    overdue.append({
-                        "uuid": task.uuid,
-                        "title": task.title,
-                        "list_name": task.list_name,
-                        "due_date": task.due_date.isoformat(),
-                        "days_overdue": days_overdue
-                    })
-                
-                # Check if stagnant (incomplete for threshold+ days)
-                # Use modified_at if available, otherwise created_at
-                check_date = task.modified_at or task.created_at
-                if check_date:
-                    check_date_val = check_date.date() if isinstance(check_date, datetime) else check_date
-                    if check_date_val <= threshold_date:
-                        days_stagnant = (today - check_date_val).days
-                        # Avoid duplicating overdue tasks in stagnant
-                        if task.due_date >= today or not task.due_date:
-                            stagnant.append({
-                                "uuid": task.uuid,
-                                "title": task.title,
-                                "list_name": task.list_name,
-                                "days_stagnant": days_stagnant,
-                                "last_modified": check_date.isoformat() if check_date else None
-                            })
-        
-        # Sort by severity
-        stagnant.sort(key=lambda x: x.get("days_stagnant", 0), reverse=True)
-        overdue.sort(key=lambda x: x.get("days_overdue", 0), reverse=True)
-        
-        return {
-            "stagnant": stagnant,
-            "missing_due": missing_due,
-            "overdue": overdue
-        }
+        return self.summarize(tasks).hygiene
+
+    def summarize(self, tasks: List[RemindersTask]) -> InsightsSummary:
+        """
+        Run the shared insights aggregation with hygiene checks enabled.
+
+        Args:
+            tasks: List of RemindersTask objects to analyze
+
+        Returns:
+            InsightsSummary whose ``hygiene`` holds the :meth:`analyze` result
+            and whose ``by_list`` holds per-list counts
+        """
+        aggregator = InsightsAggregator(stagnant_threshold_days=self.stagnant_threshold, hygiene=True)
+        return aggregator.run(tasks)
     
     def get_summary(self, analysis: Dict[str, List[Dict[str, Any]]]) -> Dict[str, int]:
         """
@@ -7,26 +7,46 @@ for each tag and reminder list across vaults.
 
 import json
 import os
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 from pathlib import Path
 
+from .history import CompletionHistory
+
+
+# Per-vault key holding the derived streak state
+STATE_KEY = "streaks"
+
+CATEGORIES = ("tags", "lists")
+
+
+def history_path_for(data_path: str) -> str:
+    """Completion history file kept next to a streak state file."""
+    return f"{os.path.splitext(data_path)[0]}.history"
+
 
 class StreakTracker:
     """
     Tracks and persists task completion streaks.
     
-    Streak data is keyed by vault_id -> tag/list -> dates with completion counts.
-    Streaks are calculated on-demand to determine current and best runs.
+    Daily completion counts live in a columnar :class:`CompletionHistory`
+    (``streaks.history`` next to the state file). The JSON state file keeps,
+    per vault -> tags/lists -> key, a derived state (last completion date,
+    length of the run ending there, best run) that recording a new day
+    updates in constant time, so reading streaks never walks the history.
+    Only out-of-order days and cleanups fall back to a rebuild from history.
     """
     
-    def __init__(self, data_path: Optional[str] = None):
+    def __init__(self, data_path: Optional[str] = None, history_path: Optional[str] = None):
         """
         Initialize streak tracker.
         
         Args:
-            data_path: Path to JSON file for persisting streak data.
+            data_path: Path to JSON file for persisting streak state.
                       Defaults to ~/.config/obs-tools/streaks.json
+            history_path: Path to the binary completion history.
+                      Defaults to ``data_path`` with a ``.history`` extension
         """
         if data_path is None:
             config_dir = Path.home() / ".config" / "obs-tools"
@@ -34,24 +54,108 @@ class StreakTracker:
             data_path = str(config_dir / "streaks.json")
         
         self.data_path = data_path
+        self.history = CompletionHistory(history_path or history_path_for(data_path))
         self.data = self._load()
+        self._batch_depth = 0
+        self._dirty = False
     
     def _load(self) -> Dict[str, Any]:
-        """Load streak data from disk."""
+        """Load streak state from disk, moving legacy per-date JSON into the history."""
         if not os.path.exists(self.data_path):
             return {}
         
         try:
             with open(self.data_path, 'r') as f:
-                return json.load(f)
+                data = json.load(f)
         except (json.JSONDecodeError, IOError):
             return {}
+        if not isinstance(data, dict):
+            return {}
+
+        for vault_id, vault in data.items():
+            if not isinstance(vault, dict):
+                continue
+            for category in CATEGORIES:
+                legacy = vault.pop(category, None)
+                if not isinstance(legacy, dict):
+                    continue
+                for key, dates in legacy.items():
+                    if not isinstance(dates, dict):
+                        continue
+                    for day, count in dates.items():
+                        try:
+                            self.history.record(vault_id, category, key, date.fromisoformat(day), int(count))
+                        except (TypeError, ValueError):
+                            continue
+        return data
     
     def _save(self) -> None:
-        """Persist streak data to disk."""
+        """Persist streak data to disk, or defer it while a batch is open."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.history.save()
         os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
         with open(self.data_path, 'w') as f:
-            json.dump(self.data, f, indent=2)
+            json.dump(self.data, f, separators=(',', ':'))
+        self._dirty = False
+
+    @contextmanager
+    def batch(self) -> Iterator["StreakTracker"]:
+        """Group several recordings into a single write when the batch closes."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save()
+
+    def _rebuild_state(self, vault_id: str, category: str, key: str) -> Optional[Dict[str, Any]]:
+        """Derive the streak state of one key from its full history."""
+        series = self.history.series(vault_id, category, key)
+        days = list(series.active_days()) if series is not None else []
+        if not days:
+            return None
+        run = best = 1
+        for previous, current in zip(days, days[1:]):
+            run = run + 1 if current - previous == 1 else 1
+            best = max(best, run)
+        return {"last": date.fromordinal(days[-1]).isoformat(), "run": run, "best": best}
+
+    def _states(self, vault_id: str, category: str) -> Dict[str, Any]:
+        vault = self.data.setdefault(vault_id, {})
+        return vault.setdefault(STATE_KEY, {}).setdefault(category, {})
+
+    def _state(self, vault_id: str, category: str, key: str) -> Optional[Dict[str, Any]]:
+        """The derived state for a key, built from history on first use."""
+        if self.history.series(vault_id, category, key) is None:
+            return None
+        states = self._states(vault_id, category)
+        state = states.get(key)
+        if not isinstance(state, dict) or "last" not in state:
+            state = self._rebuild_state(vault_id, category, key)
+            states[key] = state
+        return state
+
+    def _advance(self, vault_id: str, category: str, key: str, day: date, is_new: bool) -> None:
+        """Update a key's state after ``day`` was recorded."""
+        states = self._states(vault_id, category)
+        state = states.get(key)
+        if not is_new and isinstance(state, dict):
+            return  # Only the count changed
+        if not isinstance(state, dict) or "last" not in state:
+            states[key] = self._rebuild_state(vault_id, category, key)
+            return
+
+        last = date.fromisoformat(state["last"])
+        gap = (day - last).days
+        if gap <= 0:
+            # A day filled in behind the latest one can join two runs
+            states[key] = self._rebuild_state(vault_id, category, key)
+            return
+        run = state["run"] + 1 if gap == 1 else 1
+        states[key] = {"last": day.isoformat(), "run": run, "best": max(state["best"], run)}
     
     def record_completions(
         self,
@@ -69,24 +173,18 @@ class StreakTracker:
             by_tag: Dict mapping tag names to completion counts
             by_list: Dict mapping list names to completion counts
         """
-        if vault_id not in self.data:
-            self.data[vault_id] = {"tags": {}, "lists": {}}
-        
-        date_str = target_date.isoformat()
-        
-        # Record tag completions
-        for tag, count in by_tag.items():
-            if tag not in self.data[vault_id]["tags"]:
-                self.data[vault_id]["tags"][tag] = {}
-            self.data[vault_id]["tags"][tag][date_str] = count
-        
-        # Record list completions
-        for list_name, count in by_list.items():
-            if list_name not in self.data[vault_id]["lists"]:
-                self.data[vault_id]["lists"][list_name] = {}
-            self.data[vault_id]["lists"][list_name][date_str] = count
-        
-        self._save()
+        changed = False
+
+        for category, counts in (("tags", by_tag), ("lists", by_list)):
+            for key, count in counts.items():
+                previous = self.history.record(vault_id, category, key, target_date, count)
+                if previous == count or (previous is None and not count):
+                    continue
+                self._advance(vault_id, category, key, target_date, previous is None)
+                changed = True
+
+        if changed:
+            self._save()
     
     def get_streak(
         self,
@@ -105,49 +203,15 @@ class StreakTracker:
         Returns:
             Dict with "current" and "best" streak counts in days
         """
-        if vault_id not in self.data:
+        state = self._state(vault_id, category, key)
+        if state is None:
             return {"current": 0, "best": 0}
-        
-        if key not in self.data[vault_id].get(category, {}):
-            return {"current": 0, "best": 0}
-        
-        completion_dates = self.data[vault_id][category][key]
-        if not completion_dates:
-            return {"current": 0, "best": 0}
-        
-        # Sort dates and calculate streaks
-        dates = sorted([date.fromisoformat(d) for d in completion_dates.keys()])
-        
-        current_streak = 0
-        best_streak = 0
-        temp_streak = 0
-        
-        today = date.today()
-        
-        # Calculate current streak (working backwards from today)
-        for i in range(len(dates) - 1, -1, -1):
-            check_date = today - timedelta(days=len(dates) - 1 - i)
-            if dates[i] == check_date:
-                current_streak += 1
-            else:
-                break
-        
-        # Calculate best streak
-        for i, d in enumerate(dates):
-            if i == 0:
-                temp_streak = 1
-            else:
-                # Check if consecutive day
-                if (d - dates[i-1]).days == 1:
-                    temp_streak += 1
-                else:
-                    temp_streak = 1
-            
-            best_streak = max(best_streak, temp_streak)
-        
+
+        # The current streak is the run ending today
+        current = state["run"] if state["last"] == date.today().isoformat() else 0
         return {
-            "current": current_streak,
-            "best": best_streak
+            "current": current,
+            "best": state["best"]
         }
     
     def get_all_streaks(
@@ -167,20 +231,11 @@ class StreakTracker:
         """
         streaks = {}
         
-        if vault_id not in self.data:
-            return streaks
-        
-        # Process tags
-        for tag, _ in self.data[vault_id].get("tags", {}).items():
-            streak_info = self.get_streak(vault_id, tag, "tags")
-            if streak_info["current"] >= min_current:
-                streaks[f"tag:{tag}"] = streak_info
-        
-        # Process lists
-        for list_name, _ in self.data[vault_id].get("lists", {}).items():
-            streak_info = self.get_streak(vault_id, list_name, "lists")
-            if streak_info["current"] >= min_current:
-                streaks[f"list:{list_name}"] = streak_info
+        for category, prefix in (("tags", "tag"), ("lists", "list")):
+            for key in self.history.keys(vault_id, category):
+                streak_info = self.get_streak(vault_id, key, category)
+                if streak_info["current"] >= min_current:
+                    streaks[f"{prefix}:{key}"] = streak_info
         
         return streaks
     
@@ -192,29 +247,11 @@ class StreakTracker:
             days_to_keep: Number of days of history to retain
         """
         cutoff_date = date.today() - timedelta(days=days_to_keep)
-        cutoff_str = cutoff_date.isoformat()
+        self.history.trim(cutoff_date)
         
-        for vault_id in self.data:
-            # Clean tags
-            for tag in list(self.data[vault_id].get("tags", {}).keys()):
-                dates = self.data[vault_id]["tags"][tag]
-                self.data[vault_id]["tags"][tag] = {
-                    d: count for d, count in dates.items()
-                    if d >= cutoff_str
-                }
-                # Remove empty entries
-                if not self.data[vault_id]["tags"][tag]:
-                    del self.data[vault_id]["tags"][tag]
-            
-            # Clean lists
-            for list_name in list(self.data[vault_id].get("lists", {}).keys()):
-                dates = self.data[vault_id]["lists"][list_name]
-                self.data[vault_id]["lists"][list_name] = {
-                    d: count for d, count in dates.items()
-                    if d >= cutoff_str
-                }
-                # Remove empty entries
-                if not self.data[vault_id]["lists"][list_name]:
-                    del self.data[vault_id]["lists"][list_name]
+        for vault in self.data.values():
+            # Best runs may have started before the cutoff; rebuild on next read
+            if isinstance(vault, dict):
+                vault.pop(STATE_KEY, None)
         
         self._save()
@@ -0,0 +1,19 @@
+"""Synthetic workloads and timing scenarios for performance benchmarks."""
+
+from .synthetic import SyntheticRemindersGateway, SyntheticWorkload, VaultSpec, apply_churn, generate_workload
+from .runner import (
+    SCENARIOS,
+    BenchmarkResult,
+    Regression,
+    ScenarioResult,
+    compare_to_baselines,
+    load_baselines,
+    run_benchmark,
+    save_baselines,
+)
+
+__all__ = [
+    'VaultSpec', 'SyntheticWorkload', 'SyntheticRemindersGateway', 'generate_workload', 'apply_churn',
+    'SCENARIOS', 'BenchmarkResult', 'ScenarioResult', 'Regression',
+    'run_benchmark', 'load_baselines', 'save_baselines', 'compare_to_baselines',
+]
@@ -0,0 +1,232 @@
+"""
+Benchmark scenarios and baseline comparison.
+
+Each size runs four scenarios against a fresh synthetic workload:
+
+``first_match``
+    Dry run with no stored links, i.e. the matcher pairs everything.
+``cold_sync``
+    First applied sync with a new engine: links are created and persisted,
+    counterparts are written.
+``warm_noop``
+    Applied sync straight after ``cold_sync`` with nothing changed.
+``churn_sync``
+    Applied sync after about 1% of tasks were edited on either side.
+
+Baselines are stored as JSON and compared with a multiplicative tolerance
+plus an absolute slack, so small timings do not flap on noisy machines.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..reminders.tasks import RemindersTaskManager
+from .synthetic import SyntheticWorkload, VaultSpec, apply_churn, generate_workload
+
+
+SCENARIOS = ("first_match", "cold_sync", "warm_noop", "churn_sync")
+DEFAULT_SIZES = (1000, 10000, 100000)
+DEFAULT_TOLERANCE = 1.5
+DEFAULT_SLACK_SECONDS = 0.25
+
+
+@dataclass
+class ScenarioResult:
+    """Timing and outcome of one scenario run."""
+
+    name: str
+    seconds: float
+    timings: Dict[str, float] = field(default_factory=dict)
+    changes: Dict[str, int] = field(default_factory=dict)
+    gateway_calls: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seconds": round(self.seconds, 6),
+            "timings": self.timings,
+            "changes": self.changes,
+            "gateway_calls": self.gateway_calls,
+        }
+
+
+@dataclass
+class BenchmarkResult:
+    """All scenario results for one workload size."""
+
+    size: int
+    scenarios: Dict[str, ScenarioResult] = field(default_factory=dict)
+
+    def seconds(self) -> Dict[str, float]:
+        return {name: result.seconds for name, result in self.scenarios.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "scenarios": {name: result.to_dict() for name, result in self.scenarios.items()},
+        }
+
+
+@dataclass
+class Regression:
+    """A scenario that exceeded its baseline."""
+
+    size: int
+    scenario: str
+    seconds: float
+    baseline: float
+    allowed: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.scenario} @ {self.size} tasks: {self.seconds:.3f}s "
+            f"(baseline {self.baseline:.3f}s, allowed {self.allowed:.3f}s)"
+        )
+
+
+def _new_engine(workload: SyntheticWorkload, logger: logging.Logger) -> Any:
+    from ..sync.engine import SyncEngine
+
+    engine = SyncEngine(workload.engine_config(), logger=logger)
+    # The synthetic gateway stands in for EventKit by duck typing
+    gateway: Any = workload.gateway
+    engine.rem_manager = RemindersTaskManager(gateway=gateway, logger=logger)
+    engine.rem_manager.include_completed = True
+    return engine
+
+
+def _run_scenario(name: str, engine: Any, workload: SyntheticWorkload, dry_run: bool) -> ScenarioResult:
+    workload.gateway.reset_calls()
+    started = time.perf_counter()
+    results = engine.sync(workload.vault_path, [workload.list_id], dry_run=dry_run)
+    elapsed = time.perf_counter() - started
+    return ScenarioResult(
+        name=name,
+        seconds=elapsed,
+        timings=dict(results.get("timings") or {}),
+        changes=dict(results.get("changes") or {}),
+        gateway_calls=dict(workload.gateway.calls),
+    )
+
+
+def run_benchmark(
+    size: int,
+    spec: Optional[VaultSpec] = None,
+    scenarios: Iterable[str] = SCENARIOS,
+    churn_fraction: float = 0.01,
+    workdir: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+) -> BenchmarkResult:
+    """Generate a workload of ``size`` tasks and time the requested scenarios.
+
+    Scenarios always run in :data:`SCENARIOS` order because each one starts
+    from the state the previous one left behind.
+
+    Args:
+        size: Number of Obsidian tasks
+        spec: Workload shape; ``tasks`` is overridden by ``size``
+        scenarios: Subset of :data:`SCENARIOS` to report
+        churn_fraction: Fraction of tasks edited before ``churn_sync``
+        workdir: Directory for the generated vault (a temp dir by default)
+        logger: Logger for the engine; quiet by default
+
+    Returns:
+        Timings and change counts per scenario
+    """
+    wanted = set(scenarios)
+    unknown = wanted - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenario(s): {', '.join(sorted(unknown))}")
+
+    if logger is None:
+        logger = logging.getLogger("obs_sync.bench")
+        logger.setLevel(logging.WARNING)
+
+    base = dict(vars(spec)) if spec else {}
+    base["tasks"] = size
+    spec = VaultSpec(**base)
+    result = BenchmarkResult(size=size)
+
+    with tempfile.TemporaryDirectory(prefix="obs-sync-bench-", dir=workdir) as root:
+        workload = generate_workload(root, spec)
+
+        if "first_match" in wanted:
+            engine = _new_engine(workload, logger)
+            result.scenarios["first_match"] = _run_scenario("first_match", engine, workload, dry_run=True)
+
+        if wanted & {"cold_sync", "warm_noop", "churn_sync"}:
+            engine = _new_engine(workload, logger)
+            cold = _run_scenario("cold_sync", engine, workload, dry_run=False)
+            if "cold_sync" in wanted:
+                result.scenarios["cold_sync"] = cold
+
+        if wanted & {"warm_noop", "churn_sync"}:
+            warm = _run_scenario("warm_noop", engine, workload, dry_run=False)
+            if "warm_noop" in wanted:
+                result.scenarios["warm_noop"] = warm
+
+        if "churn_sync" in wanted:
+            apply_churn(workload, fraction=churn_fraction)
+            result.scenarios["churn_sync"] = _run_scenario("churn_sync", engine, workload, dry_run=False)
+
+    return result
+
+
+def load_baselines(path: str) -> Dict[str, Any]:
+    """Load stored baselines; a missing file yields an empty baseline set."""
+    if not os.path.exists(path):
+        return {"sizes": {}}
+    with open(path, "r", encoding="utf-8") as handle:
+        data: Dict[str, Any] = json.load(handle)
+    data.setdefault("sizes", {})
+    return data
+
+
+def save_baselines(path: str, results: Iterable[BenchmarkResult], existing: Optional[Dict[str, Any]] = None) -> None:
+    """Record ``results`` as the new baselines, keeping other sizes intact."""
+    data = dict(existing) if existing else load_baselines(path)
+    data.setdefault("tolerance", DEFAULT_TOLERANCE)
+    data.setdefault("slack_seconds", DEFAULT_SLACK_SECONDS)
+    sizes = dict(data.get("sizes", {}))
+    for result in results:
+        entry = dict(sizes.get(str(result.size), {}))
+        entry.update({name: round(seconds, 4) for name, seconds in result.seconds().items()})
+        sizes[str(result.size)] = entry
+    data["sizes"] = sizes
+    # The baselines file is checked in, so it ends with a newline like other tracked files
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def compare_to_baselines(
+    results: Iterable[BenchmarkResult],
+    baselines: Dict[str, Any],
+    tolerance: Optional[float] = None,
+    slack_seconds: Optional[float] = None,
+) -> List[Regression]:
+    """Return the scenarios slower than ``baseline * tolerance + slack``.
+
+    Scenarios without a stored baseline are not compared.
+    """
+    if tolerance is None:
+        tolerance = float(baselines.get("tolerance", DEFAULT_TOLERANCE))
+    if slack_seconds is None:
+        slack_seconds = float(baselines.get("slack_seconds", DEFAULT_SLACK_SECONDS))
+
+    regressions: List[Regression] = []
+    for result in results:
+        stored = baselines.get("sizes", {}).get(str(result.size), {})
+        for name, seconds in result.seconds().items():
+            baseline = stored.get(name)
+            if baseline is None:
+                continue
+            allowed = float(baseline) * tolerance + slack_seconds
+            if seconds > allowed:
+                regressions.append(Regression(result.size, name, seconds, float(baseline), allowed))
+    return regressions
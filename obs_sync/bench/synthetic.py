@@ -0,0 +1,347 @@
+"""
+Synthetic vaults and Reminders data for benchmarking.
+
+:func:`generate_workload` writes a realistic Obsidian vault (folders of notes
+mixing prose with tasks, tags, due dates, priorities and block IDs) and builds
+a paired Reminders data set inside :class:`SyntheticRemindersGateway`, an
+in-memory stand-in for :class:`~obs_sync.reminders.gateway.RemindersGateway`.
+Generation is seeded, so the same spec always produces the same workload.
+"""
+
+import os
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.models import Priority, TaskStatus
+from ..obsidian.parser import format_task_line
+from ..reminders.gateway import ReminderData
+
+
+_VERBS = (
+    "Review", "Draft", "Call", "Email", "Book", "Renew", "Plan", "Fix",
+    "Update", "Order", "Schedule", "Prepare", "Clean", "Pay", "Read", "Write",
+)
+_OBJECTS = (
+    "quarterly budget", "dentist appointment", "insurance policy", "team offsite",
+    "garden shed", "tax return", "project roadmap", "car service", "birthday gift",
+    "library books", "server backups", "meeting notes", "travel itinerary",
+    "kitchen tap", "blog post", "grant application",
+)
+_PROSE = (
+    "Notes from the weekly check-in.",
+    "Follow up on the open questions below.",
+    "Context: see the linked project page.",
+    "",
+)
+
+
+@dataclass
+class VaultSpec:
+    """Shape of a synthetic workload.
+
+    Args:
+        tasks: Number of Obsidian tasks to generate
+        tasks_per_note: Tasks written to each note
+        notes_per_folder: Notes per top-level folder
+        tags: Tag vocabulary; tagged tasks draw one or two tags from it
+        tag_ratio: Fraction of tasks carrying tags
+        due_ratio: Fraction of tasks with a due date
+        due_window_days: Due dates fall within +/- this many days of today
+        done_ratio: Fraction of tasks already completed
+        priority_ratio: Fraction of tasks with a priority marker
+        block_id_ratio: Fraction of tasks that already carry a block ID
+        paired_ratio: Fraction of tasks that also exist in Reminders
+        reminders_only_ratio: Extra Reminders-only items, relative to ``tasks``
+        seed: Random seed
+    """
+
+    tasks: int = 1000
+    tasks_per_note: int = 20
+    notes_per_folder: int = 25
+    tags: Tuple[str, ...] = ("work", "home", "errands", "health", "project/alpha", "reading")
+    tag_ratio: float = 0.4
+    due_ratio: float = 0.5
+    due_window_days: int = 30
+    done_ratio: float = 0.2
+    priority_ratio: float = 0.15
+    block_id_ratio: float = 0.8
+    paired_ratio: float = 0.9
+    reminders_only_ratio: float = 0.02
+    seed: int = 1
+
+
+@dataclass
+class SyntheticWorkload:
+    """A generated vault plus its paired Reminders data."""
+
+    root: str
+    vault_path: str
+    list_id: str
+    gateway: "SyntheticRemindersGateway"
+    spec: VaultSpec
+    notes: List[str] = field(default_factory=list)
+
+    @property
+    def links_path(self) -> str:
+        return os.path.join(self.root, "data", "sync_links.json")
+
+    def engine_config(self) -> Dict:
+        """Config dict for a :class:`~obs_sync.sync.engine.SyncEngine` run."""
+        return {
+            "links_path": self.links_path,
+            "default_calendar_id": self.list_id,
+            "min_score": 0.75,
+            "days_tolerance": 1,
+            "include_completed": True,
+        }
+
+
+class SyntheticRemindersGateway:
+    """In-memory Reminders store exposing the ``RemindersGateway`` interface.
+
+    Call counts are kept in :attr:`calls` so benchmarks can report how much
+    Reminders traffic a scenario generated.
+    """
+
+    def __init__(self, lists: Optional[Dict[str, str]] = None):
+        self.lists: Dict[str, str] = dict(lists or {})
+        self.reminders: Dict[str, ReminderData] = {}
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def reset_calls(self) -> None:
+        self.calls = {}
+
+    def add(self, reminder: ReminderData) -> None:
+        self.reminders[reminder.uuid] = reminder
+
+    def get_lists(self) -> List[Dict[str, str]]:
+        self._count("get_lists")
+        return [{"identifier": list_id, "name": name} for list_id, name in self.lists.items()]
+
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
+        self._count("get_reminders")
+        wanted = set(list_ids) if list_ids else None
+        return [
+            ReminderData(**vars(reminder))
+            for reminder in self.reminders.values()
+            if wanted is None or reminder.list_id in wanted
+        ]
+
+    def get_changed_reminders(
+        self, list_ids: Optional[List[str]], known: Dict[str, str]
+    ) -> Tuple[List[ReminderData], List[str]]:
+        self._count("get_changed_reminders")
+        wanted = set(list_ids) if list_ids else None
+        changed: List[ReminderData] = []
+        unchanged: List[str] = []
+        for reminder in self.reminders.values():
+            if wanted is not None and reminder.list_id not in wanted:
+                continue
+            if reminder.modified_at and known.get(reminder.uuid) == reminder.modified_at:
+                unchanged.append(reminder.uuid)
+            else:
+                changed.append(ReminderData(**vars(reminder)))
+        return changed, unchanged
+
+    def get_reminders_by_ids(self, uuids: List[str]) -> List[ReminderData]:
+        self._count("get_reminders_by_ids")
+        return [ReminderData(**vars(self.reminders[uuid])) for uuid in uuids if uuid in self.reminders]
+
+    def get_list_fingerprints(self, list_ids: Optional[List[str]] = None) -> Dict[str, Dict]:
+        self._count("get_list_fingerprints")
+        summary: Dict[str, Dict] = {
+            list_id: {"count": 0, "max_modified": None} for list_id in (list_ids or [])
+        }
+        for reminder in self.reminders.values():
+            if list_ids and reminder.list_id not in list_ids:
+                continue
+            entry = summary.setdefault(reminder.list_id or "", {"count": 0, "max_modified": None})
+            entry["count"] += 1
+            if reminder.modified_at and (entry["max_modified"] or "") < reminder.modified_at:
+                entry["max_modified"] = reminder.modified_at
+        return summary
+
+    def create_reminder(self, title: str, list_id: Optional[str] = None, **properties: Any) -> Optional[str]:
+        self._count("create_reminder")
+        reminder_id = f"rem-{uuid.uuid4().hex[:12]}"
+        now = datetime.now(timezone.utc).isoformat()
+        self.reminders[reminder_id] = ReminderData(
+            uuid=reminder_id,
+            title=title,
+            completed=bool(properties.get("completed", False)),
+            due_date=properties.get("due_date"),
+            priority=properties.get("priority"),
+            url=properties.get("url"),
+            notes=properties.get("notes"),
+            tags=list(properties.get("tags") or []),
+            list_id=list_id,
+            list_name=self.lists.get(list_id or "", "Reminders"),
+            created_at=now,
+            modified_at=now,
+        )
+        return reminder_id
+
+    def update_reminder(self, uuid: str, **updates: Any) -> bool:
+        self._count("update_reminder")
+        reminder = self.reminders.get(uuid)
+        if reminder is None:
+            return False
+        for key, value in updates.items():
+            if key == "calendar_id":
+                reminder.list_id = value
+                reminder.list_name = self.lists.get(value, reminder.list_name)
+            elif hasattr(reminder, key):
+                setattr(reminder, key, value)
+        reminder.modified_at = datetime.now(timezone.utc).isoformat()
+        return True
+
+    def delete_reminder(self, uuid: str) -> bool:
+        self._count("delete_reminder")
+        return self.reminders.pop(uuid, None) is not None
+
+
+_PRIORITY_NAMES = {Priority.HIGH: "high", Priority.MEDIUM: "medium", Priority.LOW: "low"}
+
+
+def _title(rng: random.Random, index: int) -> str:
+    # The trailing reference keeps titles distinct, like real task lists
+    return f"{rng.choice(_VERBS)} {rng.choice(_OBJECTS)} {index:06d}"
+
+
+def generate_workload(root: str, spec: Optional[VaultSpec] = None) -> SyntheticWorkload:
+    """Write a synthetic vault under ``root`` and build its Reminders data.
+
+    Args:
+        root: Empty directory to generate into
+        spec: Workload shape; defaults to :class:`VaultSpec`
+
+    Returns:
+        The generated workload
+    """
+    spec = spec or VaultSpec()
+    rng = random.Random(spec.seed)
+    today = date.today()
+    list_id = "bench-list"
+
+    vault_path = os.path.join(root, "BenchVault")
+    os.makedirs(os.path.join(vault_path, ".obsidian"), exist_ok=True)
+    gateway = SyntheticRemindersGateway({list_id: "Benchmark"})
+    workload = SyntheticWorkload(
+        root=root, vault_path=vault_path, list_id=list_id, gateway=gateway, spec=spec
+    )
+
+    now = datetime.now(timezone.utc).isoformat()
+    per_note = max(1, spec.tasks_per_note)
+    note_count = (spec.tasks + per_note - 1) // per_note
+    index = 0
+    for note_number in range(note_count):
+        folder = f"Area {note_number // max(1, spec.notes_per_folder):03d}"
+        relative = os.path.join(folder, f"Note {note_number:05d}.md")
+        lines = [f"# Note {note_number}", ""]
+
+        for _ in range(min(per_note, spec.tasks - index)):
+            title = _title(rng, index)
+            status = TaskStatus.DONE if rng.random() < spec.done_ratio else TaskStatus.TODO
+            due = None
+            if rng.random() < spec.due_ratio:
+                due = today + timedelta(days=rng.randint(-spec.due_window_days, spec.due_window_days))
+            priority: Optional[Priority] = None
+            if rng.random() < spec.priority_ratio:
+                priority = rng.choice((Priority.HIGH, Priority.MEDIUM, Priority.LOW))
+            tags: List[str] = []
+            if spec.tags and rng.random() < spec.tag_ratio:
+                tags = rng.sample(list(spec.tags), k=min(len(spec.tags), rng.choice((1, 2))))
+            block_id = f"t{index:06d}" if rng.random() < spec.block_id_ratio else None
+
+            prose = rng.choice(_PROSE)
+            if prose:
+                lines.append(prose)
+            lines.append(format_task_line(
+                title,
+                status=status,
+                due_date=due,
+                priority=priority,
+                tags=[f"#{tag}" for tag in tags],
+                block_id=block_id,
+            ))
+
+            if rng.random() < spec.paired_ratio:
+                gateway.add(ReminderData(
+                    uuid=f"rem-{index:06d}",
+                    title=title,
+                    completed=status == TaskStatus.DONE,
+                    due_date=due.isoformat() if due else None,
+                    priority=_PRIORITY_NAMES.get(priority) if priority else None,
+                    tags=list(tags),
+                    list_id=list_id,
+                    list_name="Benchmark",
+                    created_at=now,
+                    modified_at=now,
+                ))
+            index += 1
+
+        path = os.path.join(vault_path, relative)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("\n".join(lines) + "\n")
+        workload.notes.append(relative)
+
+    for extra in range(int(spec.tasks * spec.reminders_only_ratio)):
+        gateway.add(ReminderData(
+            uuid=f"rem-only-{extra:06d}",
+            title=f"Inbox item {rng.choice(_OBJECTS)} {extra:05d}",
+            completed=False,
+            list_id=list_id,
+            list_name="Benchmark",
+            created_at=now,
+            modified_at=now,
+        ))
+
+    return workload
+
+
+def apply_churn(workload: SyntheticWorkload, fraction: float = 0.01, seed: int = 2) -> int:
+    """Mutate roughly ``fraction`` of the tasks on both sides.
+
+    Alternates between toggling a task's checkbox in its note and editing a
+    reminder's due date, which is what day-to-day use looks like.
+
+    Returns:
+        Number of edits applied
+    """
+    rng = random.Random(seed)
+    target = max(1, int(workload.spec.tasks * fraction))
+    reminder_ids = sorted(workload.gateway.reminders)
+    edits = 0
+
+    for step in range(target):
+        if step % 2 == 0 and workload.notes:
+            path = os.path.join(workload.vault_path, rng.choice(workload.notes))
+            with open(path, "r", encoding="utf-8") as handle:
+                lines = handle.readlines()
+            task_lines = [i for i, line in enumerate(lines) if line.startswith("- [")]
+            if not task_lines:
+                continue
+            i = rng.choice(task_lines)
+            if lines[i].startswith("- [ ]"):
+                lines[i] = "- [x]" + lines[i][5:]
+            else:
+                lines[i] = "- [ ]" + lines[i][5:]
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.writelines(lines)
+            edits += 1
+        elif reminder_ids:
+            reminder = workload.gateway.reminders.get(rng.choice(reminder_ids))
+            if reminder is None:
+                continue
+            reminder.due_date = (date.today() + timedelta(days=rng.randint(1, 14))).isoformat()
+            reminder.modified_at = datetime.now(timezone.utc).isoformat()
+            edits += 1
+
+    return edits
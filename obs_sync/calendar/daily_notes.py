@@ -214,9 +214,10 @@ class DailyNoteManager:
         os.makedirs(os.path.dirname(note_path), exist_ok=True)
         
         # Read existing content or create new
+        original = None
         if os.path.exists(note_path):
             with open(note_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = original = f.read()
         else:
             content = self._create_new_daily_note(target_date)
         
@@ -230,9 +231,11 @@ class DailyNoteManager:
         # Append new insights section to the bottom for quick visibility of calendar events up top
         content = self._append_section_to_end(content, insights_markdown)
         
-        # Write back
-        with open(note_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write back only when the snapshot changed, so unchanged vaults keep
+        # their mtimes (no-op sync detection relies on them)
+        if content != original:
+            with open(note_path, 'w', encoding='utf-8') as f:
+                f.write(content)
         
         return note_path
     
@@ -1,25 +1,40 @@
 """
 Command implementations for obs-sync.
+
+Command classes are imported on first access so that starting the CLI (or
+printing ``--help``) does not load every command and its dependencies.
 """
 
-from .setup import SetupCommand
-from .sync import SyncCommand
-from .calendar import CalendarCommand
-from .install_deps import InstallDepsCommand
-from .migrate import MigrateCommand
-from .insights import InsightsCommand
-from .update import UpdateCommand
-from .process import ProcessCommand
-from .automation import AutomationCommand
-
-__all__ = [
-    'SetupCommand',
-    'SyncCommand',
-    'CalendarCommand',
-    'InstallDepsCommand',
-    'MigrateCommand',
-    'InsightsCommand',
-    'UpdateCommand',
-    'ProcessCommand',
-    'AutomationCommand',
-]
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+_COMMAND_MODULES = {
+    'SetupCommand': '.setup',
+    'SyncCommand': '.sync',
+    'CalendarCommand': '.calendar',
+    'InstallDepsCommand': '.install_deps',
+    'MigrateCommand': '.migrate',
+    'InsightsCommand': '.insights',
+    'UpdateCommand': '.update',
+    'ProcessCommand': '.process',
+    'AutomationCommand': '.automation',
+    'WatchCommand': '.watch',
+    'ServeCommand': '.serve',
+    'BenchCommand': '.bench',
+    'StatsCommand': '.stats',
+}
+
+__all__ = list(_COMMAND_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _COMMAND_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,339 @@
+"""Bench command - read-only timing probes against the user's own setup."""
+
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.config import SyncConfig
+from ..core.models import ObsidianTask, SyncLink, Vault
+from ..utils.io import safe_read_json, safe_write_json
+
+
+PROBES = ("vaults", "reminders", "links", "matcher")
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> Tuple[Any, List[float]]:
+    """Run ``func`` ``repeat`` times and return the last result and all durations."""
+    durations: List[float] = []
+    result = None
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - started)
+    return result, durations
+
+
+def _timing(durations: List[float]) -> Dict[str, Any]:
+    return {
+        "seconds": round(min(durations), 6),
+        "median_seconds": round(statistics.median(durations), 6),
+        "runs": len(durations),
+    }
+
+
+def _rate(count: int, seconds: float) -> Optional[float]:
+    return round(count / seconds, 1) if seconds > 0 else None
+
+
+class BenchCommand:
+    """Measure each sync subsystem on the configured vaults and lists.
+
+    Every probe is read-only: vaults are scanned, Reminders are fetched and
+    the links file is parsed, but nothing is written back. Persisting links is
+    timed against a temporary copy.
+    """
+
+    def __init__(self, config: SyncConfig, verbose: bool = False):
+        self.config = config
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.DEBUG)
+        # Optional Reminders gateway override (tests, synthetic data)
+        self.reminders_gateway = None
+
+    def run(
+        self,
+        probes: Optional[List[str]] = None,
+        repeat: int = 3,
+        sample: int = 500,
+        json_path: Optional[str] = None,
+    ) -> bool:
+        """
+        Run the timing probes and print a report.
+
+        Args:
+            probes: Subset of :data:`PROBES` to run (all by default)
+            repeat: Runs per probe; the report shows the fastest
+            sample: Maximum tasks per side fed to the matcher probe
+            json_path: Also write the report as JSON; ``-`` prints JSON
+                instead of the text report
+
+        Returns:
+            True if every requested probe ran
+        """
+        try:
+            report = self.collect(probes=probes, repeat=repeat, sample=sample)
+        except Exception as exc:
+            self.logger.error("Bench command failed: %s", exc)
+            if self.verbose:
+                import traceback
+                traceback.print_exc()
+            return False
+
+        if json_path == "-":
+            print(json.dumps(report, indent=2))
+        else:
+            print(format_bench_report(report))
+            if json_path:
+                path = os.path.abspath(os.path.expanduser(json_path))
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(path, "w", encoding="utf-8") as handle:
+                    json.dump(report, handle, indent=2)
+                print(f"\n📄 Report written to: {path}")
+
+        return not report["errors"]
+
+    def collect(
+        self,
+        probes: Optional[List[str]] = None,
+        repeat: int = 3,
+        sample: int = 500,
+    ) -> Dict[str, Any]:
+        """Run the probes and return the report as a dict."""
+        selected = list(probes or PROBES)
+        unknown = [name for name in selected if name not in PROBES]
+        if unknown:
+            raise ValueError(f"Unknown probe(s): {', '.join(unknown)}")
+
+        report: Dict[str, Any] = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": max(1, repeat),
+            "errors": [],
+        }
+
+        obs_tasks: List = []
+        rem_tasks: List = []
+
+        if "vaults" in selected or "matcher" in selected:
+            report["vaults"], obs_tasks = self._probe_vaults(repeat, report["errors"])
+        if "reminders" in selected or "matcher" in selected:
+            report["reminders"], rem_tasks = self._probe_reminders(repeat, report["errors"])
+        if "links" in selected:
+            report["links"] = self._probe_links(repeat, report["errors"])
+        if "matcher" in selected:
+            report["matcher"] = self._probe_matcher(obs_tasks, rem_tasks, sample, repeat)
+
+        for name in ("vaults", "reminders"):
+            if name not in selected:
+                report.pop(name, None)
+        return report
+
+    # ------------------------------------------------------------------ probes
+
+    def _probe_vaults(self, repeat: int, errors: List[str]) -> Tuple[List[Dict[str, Any]], List]:
+        from ..obsidian.tasks import ObsidianTaskManager
+
+        results: List[Dict[str, Any]] = []
+        all_tasks: List = []
+        for vault in self.config.vaults:
+            if not os.path.isdir(vault.path):
+                errors.append(f"Vault not found: {vault.path}")
+                continue
+
+            def scan(vault: Vault = vault) -> Tuple[int, List[ObsidianTask]]:
+                # A fresh manager per run so every scan parses from disk
+                manager = ObsidianTaskManager(logger=self.logger)
+                filters = self.config.get_vault_scan_filters(vault.vault_id)
+                manager.configure_scan(
+                    vault.path,
+                    exclude=filters["exclude"],
+                    include=filters["include"],
+                    respect_app_config=self.config.respect_obsidian_ignore,
+                )
+                files = sum(1 for _ in manager.get_ignore_matcher(vault.path).iter_markdown_files(vault.path))
+                return files, manager.list_tasks(vault.path, include_completed=True)
+
+            (files, tasks), durations = _timed(scan, repeat)
+            timing = _timing(durations)
+            results.append({
+                "vault": vault.name,
+                "vault_id": vault.vault_id,
+                "files": files,
+                "tasks": len(tasks),
+                **timing,
+                "files_per_second": _rate(files, timing["seconds"]),
+                "tasks_per_second": _rate(len(tasks), timing["seconds"]),
+            })
+            all_tasks.extend(tasks)
+        return results, all_tasks
+
+    def _probe_reminders(self, repeat: int, errors: List[str]) -> Tuple[List[Dict[str, Any]], List]:
+        from ..reminders.tasks import RemindersTaskManager
+
+        manager = RemindersTaskManager(gateway=self.reminders_gateway, logger=self.logger)
+        results: List[Dict[str, Any]] = []
+        all_tasks: List = []
+        for lst in self.config.reminders_lists:
+            if not lst.identifier:
+                continue
+            try:
+                reminders, fetch = _timed(lambda: manager.gateway.get_reminders([lst.identifier]), repeat)
+            except Exception as exc:
+                errors.append(f"Could not fetch list {lst.name}: {exc}")
+                continue
+            tasks, convert = _timed(lambda: [manager.convert_reminder(rem) for rem in reminders], repeat)
+            fetch_timing = _timing(fetch)
+            convert_timing = _timing(convert)
+            results.append({
+                "list": lst.name,
+                "list_id": lst.identifier,
+                "reminders": len(reminders),
+                "fetch": fetch_timing,
+                "convert": convert_timing,
+                "fetch_per_second": _rate(len(reminders), fetch_timing["seconds"]),
+                "convert_per_second": _rate(len(reminders), convert_timing["seconds"]),
+            })
+            all_tasks.extend(tasks)
+        return results, all_tasks
+
+    def _probe_links(self, repeat: int, errors: List[str]) -> Dict[str, Any]:
+        if not self.config.links_path:
+            return {"path": None, "links": 0, "exists": False}
+        links_path = os.path.expanduser(self.config.links_path)
+        if not os.path.exists(links_path):
+            return {"path": links_path, "links": 0, "exists": False}
+
+        def load() -> Tuple[Any, List[SyncLink]]:
+            data = safe_read_json(links_path, default={"links": []})
+            raw = data.get("links", []) if isinstance(data, dict) else []
+            links = []
+            for entry in raw:
+                try:
+                    links.append(SyncLink.from_dict(entry))
+                except Exception:
+                    continue
+            return data, links
+
+        (data, links), load_durations = _timed(load, repeat)
+
+        with tempfile.TemporaryDirectory(prefix="obs-sync-bench-") as tmp:
+            copy_path = os.path.join(tmp, "sync_links.json")
+
+            def persist() -> None:
+                payload = dict(data) if isinstance(data, dict) else {}
+                payload["links"] = [link.to_dict() for link in links]
+                if not safe_write_json(copy_path, payload):
+                    raise OSError(f"Could not write {copy_path}")
+
+            try:
+                _, persist_durations = _timed(persist, repeat)
+            except OSError as exc:
+                errors.append(str(exc))
+                persist_durations = []
+
+        result: Dict[str, Any] = {
+            "path": links_path,
+            "exists": True,
+            "links": len(links),
+            "bytes": os.path.getsize(links_path),
+            "load": _timing(load_durations),
+        }
+        if persist_durations:
+            result["persist"] = _timing(persist_durations)
+        return result
+
+    def _probe_matcher(self, obs_tasks: List, rem_tasks: List, sample: int, repeat: int) -> Dict[str, Any]:
+        from ..sync.matcher import TaskMatcher
+
+        obs_sample = obs_tasks[:sample] if sample else obs_tasks
+        rem_sample = rem_tasks[:sample] if sample else rem_tasks
+        pairs = len(obs_sample) * len(rem_sample)
+        result: Dict[str, Any] = {
+            "obs_tasks": len(obs_sample),
+            "rem_tasks": len(rem_sample),
+            "pairs": pairs,
+        }
+        if not pairs:
+            return result
+
+        def match() -> List[SyncLink]:
+            # A fresh matcher per run so token caches start cold
+            matcher = TaskMatcher(
+                min_score=self.config.min_score,
+                days_tolerance=self.config.days_tolerance,
+                logger=self.logger,
+            )
+            return matcher.find_matches(obs_sample, rem_sample)
+
+        links, durations = _timed(match, repeat)
+        timing = _timing(durations)
+        result.update(timing)
+        result["matches"] = len(links)
+        result["pairs_per_second"] = _rate(pairs, timing["seconds"])
+        return result
+
+
+def _fmt_rate(value: Optional[float], unit: str) -> str:
+    return f"{value:,.0f} {unit}/s" if value is not None else "n/a"
+
+
+def format_bench_report(report: Dict[str, Any]) -> str:
+    """Render a bench report as compact text."""
+    lines = [f"\n⏱️  obs-sync bench (read-only, best of {report['repeat']})", "=" * 60]
+
+    if "vaults" in report:
+        lines.append("\n📁 Vault scan")
+        if not report["vaults"]:
+            lines.append("  (no vaults configured)")
+        for entry in report["vaults"]:
+            lines.append(
+                f"  {entry['vault']}: {entry['files']:,} files, {entry['tasks']:,} tasks "
+                f"in {entry['seconds']:.3f}s ({_fmt_rate(entry['tasks_per_second'], 'tasks')})"
+            )
+
+    if "reminders" in report:
+        lines.append("\n🔔 Reminders")
+        if not report["reminders"]:
+            lines.append("  (no lists configured)")
+        for entry in report["reminders"]:
+            lines.append(
+                f"  {entry['list']}: {entry['reminders']:,} reminders, "
+                f"fetch {entry['fetch']['seconds']:.3f}s, convert {entry['convert']['seconds']:.4f}s"
+            )
+
+    if "links" in report:
+        links = report["links"]
+        lines.append("\n🔗 Links")
+        if not links.get("exists"):
+            lines.append(f"  No links file at {links['path']}")
+        else:
+            persist = links.get("persist")
+            persist_text = f", persist {persist['seconds']:.3f}s (temp copy)" if persist else ""
+            lines.append(
+                f"  {links['links']:,} links ({links['bytes'] / 1024:,.0f} KiB), "
+                f"load {links['load']['seconds']:.3f}s{persist_text}"
+            )
+
+    if "matcher" in report:
+        matcher = report["matcher"]
+        lines.append("\n🧮 Matcher")
+        if not matcher["pairs"]:
+            lines.append("  Nothing to match (need tasks on both sides)")
+        else:
+            lines.append(
+                f"  {matcher['obs_tasks']:,} × {matcher['rem_tasks']:,} tasks ({matcher['pairs']:,} pairs) "
+                f"in {matcher['seconds']:.3f}s ({_fmt_rate(matcher['pairs_per_second'], 'pairs')}), "
+                f"{matcher['matches']:,} matches"
+            )
+
+    for error in report.get("errors", []):
+        lines.append(f"\n⚠️  {error}")
+
+    return "\n".join(lines)
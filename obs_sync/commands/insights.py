@@ -2,9 +2,10 @@
 
 import json
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from ..core.config import SyncConfig
+from ..reminders.snapshot import RemindersSnapshot, SnapshotGateway, describe_age
 from ..reminders.tasks import RemindersTaskManager
 from ..analytics.hygiene import HygieneAnalyzer
 from ..utils.insights import format_hygiene_report_cli
@@ -20,12 +21,16 @@ class InsightsCommand:
         if verbose:
             self.logger.setLevel(logging.DEBUG)
     
-    def run(self, export_json: Optional[str] = None) -> bool:
+    def run(self, export_json: Optional[str] = None, live: bool = False) -> bool:
         """
         Run the insights command to analyze task hygiene.
         
+        Reads the Reminders snapshot saved by the last sync unless ``live`` is
+        set or no snapshot covers the configured lists.
+        
         Args:
             export_json: Optional path to export JSON report
+            live: Fetch from Reminders instead of using the snapshot
         
         Returns:
             True if successful, False otherwise
@@ -46,7 +51,11 @@ class InsightsCommand:
             print("=" * 60)
             
             # Fetch all tasks
-            rem_manager = RemindersTaskManager(logger=self.logger)
+            gateway = None if live else self._snapshot_gateway(list_ids)
+            if gateway is not None:
+                rem_manager = RemindersTaskManager(gateway=gateway, logger=self.logger)
+            else:
+                rem_manager = RemindersTaskManager(logger=self.logger)
             tasks = rem_manager.list_tasks(list_ids, include_completed=False)
             
             if not tasks:
@@ -58,7 +67,8 @@ class InsightsCommand:
             # Run hygiene analysis
             threshold = self.config.hygiene_stagnant_threshold
             analyzer = HygieneAnalyzer(stagnant_threshold_days=threshold)
-            analysis = analyzer.analyze(tasks)
+            summary = analyzer.summarize(tasks)
+            analysis = summary.hygiene
             
             # Display report
             stagnant = analysis.get('stagnant', [])
@@ -77,7 +87,7 @@ class InsightsCommand:
             
             # Export to JSON if requested
             if export_json:
-                self._export_json(analysis, export_json)
+                self._export_json(analysis, export_json, by_list=summary.by_list)
                 print(f"\n📄 Report exported to: {export_json}")
             
             return True
@@ -89,8 +99,23 @@ class InsightsCommand:
                 traceback.print_exc()
             return False
     
-    def _export_json(self, analysis: dict, output_path: str) -> None:
-        """Export analysis results to JSON file."""
+    def _snapshot_gateway(self, list_ids: List[str]) -> Optional[SnapshotGateway]:
+        """Gateway over the last sync's snapshot, reporting its age; None if unusable."""
+        snapshot = RemindersSnapshot.for_config(self.config, logger=self.logger)
+        fetched = snapshot.fetched_at(list_ids) if snapshot is not None else {}
+        stamps = [stamp for stamp in fetched.values() if stamp is not None]
+        if snapshot is None or not stamps:
+            print("ℹ️  No Reminders snapshot from a previous sync; fetching live.")
+            return None
+
+        print(f"📸 Using the Reminders snapshot from {describe_age(min(stamps))} (--live fetches current data)")
+        missing = len(fetched) - len(stamps)
+        if missing:
+            print(f"   ⚠️  {missing} configured list(s) are not in the snapshot yet; run a sync to include them.")
+        return SnapshotGateway(snapshot)
+
+    def _export_json(self, analysis: dict, output_path: str, by_list: Optional[dict] = None) -> None:
+        """Export analysis results (and per-list counts, when given) to JSON file."""
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump({
                 'stagnants': analysis.get('stagnant', []),
@@ -100,5 +125,6 @@ class InsightsCommand:
                     'total_stagnant': len(analysis.get('stagnant', [])),
                     'total_missing_due': len(analysis.get('missing_due', [])),
                     'total_overdue': len(analysis.get('overdue', []))
-                }
+                },
+                'by_list': by_list or {},
             }, f, indent=2)
@@ -0,0 +1,365 @@
+"""Serve command - long-running sync daemon with warm caches."""
+
+import contextlib
+import io
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from ..core.config import SyncConfig
+from ..core.paths import get_path_manager
+from ..reminders.gateway import RemindersGateway
+from ..utils.ipc import IPCError, IPCServer, send_request
+from .sync import SyncCommand
+
+try:  # resource is only available on POSIX platforms
+    import resource
+    _HAS_RESOURCE = True
+except ImportError:  # pragma: no cover - Windows fallback
+    _HAS_RESOURCE = False
+
+
+@contextlib.contextmanager
+def _captured_session(buffer: io.StringIO) -> Iterator[None]:
+    """Capture printed output and make prompts see a non-interactive stdin."""
+    original_stdin = sys.stdin
+    sys.stdin = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdin = original_stdin
+
+
+def _peak_rss_bytes() -> int:
+    if not _HAS_RESOURCE:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class SyncDaemon:
+    """Keeps sync state in memory and serves IPC requests.
+
+    One :class:`SyncCommand` with engine reuse enabled is held for the
+    lifetime of the process, so the EventKit store, per-vault Obsidian
+    indexes, parsed links and matcher token caches stay warm between syncs.
+    Syncs are serialized; status and metrics requests are answered while a
+    sync is running.
+    """
+
+    def __init__(
+        self,
+        config: SyncConfig,
+        config_path: Optional[str] = None,
+        verbose: bool = False,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.config = config
+        self.config_path = config_path
+        self.verbose = verbose
+        self.logger = logger or logging.getLogger(__name__)
+        self.command = SyncCommand(config, verbose=verbose, reuse_engines=True)
+        self.started_at = time.time()
+        self.server: Optional[IPCServer] = None
+
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._config_signature = self._read_config_signature()
+        self._running_since: Optional[float] = None
+        self.stats: Dict[str, Any] = {
+            "syncs": 0,
+            "failures": 0,
+            "total_seconds": 0.0,
+            "last_sync": None,
+        }
+        # One gateway means EventKit is imported and authorized only once
+        self.command.reminders_gateway = RemindersGateway(logger=self.logger)
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    def _read_config_signature(self) -> Optional[Tuple[int, int]]:
+        if not self.config_path:
+            return None
+        try:
+            file_stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (file_stat.st_mtime_ns, file_stat.st_size)
+
+    def _reload_config_if_changed(self) -> None:
+        signature = self._read_config_signature()
+        if not self.config_path or signature is None or signature == self._config_signature:
+            return
+        self.logger.info("Configuration changed on disk; reloading %s", self.config_path)
+        self.config = SyncConfig.load_from_file(self.config_path)
+        self.command.config = self.config
+        self.command.reset_engines()
+        self._config_signature = signature
+
+    # ------------------------------------------------------------------
+    # Operations
+    # ------------------------------------------------------------------
+    def run_sync(self, apply_changes: bool = False, direction: str = "both", trigger: str = "ipc") -> Dict[str, Any]:
+        """Run a full sync with the cached engines and capture its output."""
+        with self._sync_lock:
+            self._reload_config_if_changed()
+            output = io.StringIO()
+            self._running_since = time.monotonic()
+            started = self._running_since
+            try:
+                with _captured_session(output):
+                    success = self.command.run(apply_changes=apply_changes, direction=direction)
+            except Exception as exc:  # pragma: no cover - defensive
+                self.logger.exception("Daemon sync failed")
+                print(f"Error: Sync failed - {exc}", file=output)
+                success = False
+            finally:
+                self._running_since = None
+            duration = time.monotonic() - started
+
+            self.stats["syncs"] += 1
+            self.stats["total_seconds"] += duration
+            if not success:
+                self.stats["failures"] += 1
+            self.stats["last_sync"] = {
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "success": success,
+                "apply_changes": apply_changes,
+                "direction": direction,
+                "duration_seconds": round(duration, 3),
+                "trigger": trigger,
+            }
+
+        self.logger.info("Sync via %s finished in %.2fs (success=%s)", trigger, duration, success)
+        return {
+            "ok": success,
+            "duration_seconds": round(duration, 3),
+            "output": output.getvalue(),
+        }
+
+    def status(self) -> Dict[str, Any]:
+        running_for = None
+        if self._running_since is not None:
+            running_for = round(time.monotonic() - self._running_since, 3)
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "sync_running_seconds": running_for,
+            "syncs": self.stats["syncs"],
+            "last_sync": self.stats["last_sync"],
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        engines = []
+        for (vault_path, direction), engine in self.command.engines.items():
+            index = engine.obs_manager.get_index(vault_path)
+            engines.append({
+                "vault_path": vault_path,
+                "direction": direction,
+                "indexed_tasks": len(index),
+                "matcher_token_cache": engine.matcher.token_cache_size,
+            })
+        syncs = self.stats["syncs"]
+        return {
+            "ok": True,
+            "syncs": syncs,
+            "failures": self.stats["failures"],
+            "total_sync_seconds": round(self.stats["total_seconds"], 3),
+            "mean_sync_seconds": round(self.stats["total_seconds"] / syncs, 3) if syncs else None,
+            "last_sync": self.stats["last_sync"],
+            "peak_rss_bytes": _peak_rss_bytes(),
+            "engines": engines,
+        }
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch one IPC request."""
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "pid": os.getpid()}
+        if command == "status":
+            return self.status()
+        if command == "metrics":
+            return self.metrics()
+        if command == "sync":
+            direction = request.get("direction") or "both"
+            if direction not in ("both", "obs-to-rem", "rem-to-obs"):
+                return {"ok": False, "error": f"Invalid direction '{direction}'"}
+            return self.run_sync(
+                apply_changes=bool(request.get("apply_changes")),
+                direction=direction,
+                trigger=str(request.get("trigger") or "ipc"),
+            )
+        if command == "stop":
+            self.stop()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command '{command}'"}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def stop(self) -> None:
+        self._stop.set()
+        if self.server is not None:
+            self.server.shutdown()
+
+    def _interval_loop(self, interval_seconds: float, apply_changes: bool, direction: str) -> None:
+        while not self._stop.wait(interval_seconds):
+            self.run_sync(apply_changes=apply_changes, direction=direction, trigger="interval")
+
+    def serve(
+        self,
+        socket_path: str,
+        interval_minutes: Optional[float] = None,
+        apply_changes: bool = False,
+        direction: str = "both",
+    ) -> None:
+        """Serve requests until stopped by ``stop``, SIGTERM or Ctrl+C."""
+        self.server = IPCServer(socket_path, self.handle, logger=self.logger)
+        self.server.start()
+
+        if interval_minutes:
+            threading.Thread(
+                target=self._interval_loop,
+                args=(interval_minutes * 60, apply_changes, direction),
+                name="obs-sync-interval",
+                daemon=True,
+            ).start()
+
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
+
+        try:
+            self.server.serve_forever()
+        finally:
+            self._stop.set()
+            self.server.close()
+
+
+class ServeCommand:
+    """Command for running or talking to the obs-sync daemon."""
+
+    def __init__(self, config: SyncConfig, verbose: bool = False, config_path: Optional[str] = None):
+        self.config = config
+        self.verbose = verbose
+        self.config_path = config_path
+        self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.DEBUG)
+
+    def run(
+        self,
+        action: str = "run",
+        socket_path: Optional[str] = None,
+        apply_changes: bool = False,
+        direction: str = "both",
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """
+        Run the daemon or send it a request.
+
+        Args:
+            action: ``run`` to start the daemon, or one of ``status``,
+                ``sync``, ``metrics`` and ``stop`` to talk to a running one
+            socket_path: Override for the IPC socket location
+            apply_changes: For ``sync`` (and interval syncs), apply changes
+            direction: Sync direction for ``sync`` and interval syncs
+            interval: Minutes between automatic syncs while serving
+            timeout: Seconds to wait for a reply (``sync`` waits indefinitely
+                by default)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        socket_path = socket_path or str(get_path_manager().daemon_socket_path)
+
+        if action == "run":
+            return self._serve(socket_path, interval, apply_changes, direction)
+
+        try:
+            if action == "sync":
+                reply = send_request(
+                    socket_path,
+                    "sync",
+                    timeout=timeout,
+                    apply_changes=apply_changes,
+                    direction=direction,
+                    trigger="cli",
+                )
+            else:
+                reply = send_request(socket_path, action, timeout=timeout or 5.0)
+        except IPCError as exc:
+            print(f"⚠️  {exc}")
+            if action != "stop":
+                print("Start the daemon with 'obs-sync serve' or run 'obs-sync sync' directly.")
+            return False
+
+        if not reply.get("ok") and reply.get("error"):
+            print(f"❌ Daemon error: {reply['error']}")
+            return False
+
+        if action == "sync":
+            sys.stdout.write(reply.get("output", ""))
+            print(f"\n⚡ Synced via daemon in {reply.get('duration_seconds', 0):.2f}s")
+        elif action == "status":
+            self._print_status(reply)
+        elif action == "metrics":
+            self._print_metrics(reply)
+        elif action == "stop":
+            print("🛑 Daemon is shutting down.")
+        return bool(reply.get("ok"))
+
+    def _serve(self, socket_path: str, interval: Optional[float], apply_changes: bool, direction: str) -> bool:
+        daemon = SyncDaemon(self.config, config_path=self.config_path, verbose=self.verbose, logger=self.logger)
+        print(f"🚀 obs-sync daemon listening on {socket_path} (pid {os.getpid()})")
+        if interval:
+            mode = "applying changes" if apply_changes else "dry run"
+            print(f"   Automatic sync every {interval:g} minute(s) ({mode})")
+        try:
+            daemon.serve(socket_path, interval_minutes=interval, apply_changes=apply_changes, direction=direction)
+        except IPCError as exc:
+            print(f"⚠️  {exc}")
+            return False
+        except KeyboardInterrupt:
+            pass
+        print("👋 Daemon stopped.")
+        return True
+
+    @staticmethod
+    def _print_status(reply: Dict[str, Any]) -> None:
+        print(f"🟢 Daemon running (pid {reply.get('pid')}), up {reply.get('uptime_seconds', 0):.0f}s")
+        if reply.get("sync_running_seconds") is not None:
+            print(f"   Sync in progress for {reply['sync_running_seconds']:.1f}s")
+        last = reply.get("last_sync")
+        if last:
+            outcome = "succeeded" if last.get("success") else "failed"
+            print(
+                f"   Last sync {outcome} at {last.get('finished_at')} "
+                f"in {last.get('duration_seconds', 0):.2f}s ({last.get('trigger')})"
+            )
+        else:
+            print("   No syncs have run yet.")
+
+    @staticmethod
+    def _print_metrics(reply: Dict[str, Any]) -> None:
+        print("📈 Daemon metrics")
+        print(f"   Syncs: {reply.get('syncs', 0)} ({reply.get('failures', 0)} failed)")
+        if reply.get("mean_sync_seconds") is not None:
+            print(f"   Mean sync time: {reply['mean_sync_seconds']:.2f}s")
+        print(f"   Peak RSS: {reply.get('peak_rss_bytes', 0) / (1024 * 1024):.1f} MiB")
+        for engine in reply.get("engines", []):
+            print(
+                f"   • {os.path.basename(engine['vault_path'])} [{engine['direction']}]: "
+                f"{engine['indexed_tasks']} indexed tasks, "
+                f"{engine['matcher_token_cache']} cached titles"
+            )
@@ -1173,6 +1173,7 @@ class SetupCommand:
             return False
 
         self.config.vaults.extend(new_vaults)
+        self.config.invalidate_indexes()
         self._handle_default_vault_change(new_vaults)
 
         if not self.config.reminders_lists:
@@ -1258,6 +1259,7 @@ class SetupCommand:
             return False
 
         self.config.reminders_lists.extend(new_lists)
+        self.config.invalidate_indexes()
         self._handle_default_calendar_change(new_lists)
 
         if prompt_for_mapping:
@@ -1642,10 +1644,8 @@ class SetupCommand:
     def _get_list_name(self, identifier: Optional[str]) -> str:
         if not identifier:
             return "Unknown"
-        for lst in self.config.reminders_lists:
-            if lst.identifier == identifier:
-                return lst.name
-        return identifier
+        lst = self.config.get_reminders_list(identifier)
+        return lst.name if lst else identifier
     
     def _offer_vault_mapping_suggestions(
         self,
@@ -1856,6 +1856,7 @@ class SetupCommand:
         self.config.default_vault_id = vault_id
         for vault in self.config.vaults:
             vault.is_default = vault.vault_id == vault_id
+        self.config.invalidate_indexes()
 
     def _remove_vault(self) -> None:
         """Handle vault removal flow."""
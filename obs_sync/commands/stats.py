@@ -0,0 +1,128 @@
+"""Stats command - trends and percentiles from the run-history ledger."""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from ..core.config import SyncConfig
+from ..utils.ledger import RunLedger, summarize_runs
+
+
+# A tracked file growing by more than this factor over the window is flagged
+GROWTH_WARNING_FACTOR = 2.0
+
+_VOLUME_LABELS = {
+    "obs_tasks": "Obsidian tasks",
+    "rem_tasks": "Reminders tasks",
+    "links": "Linked pairs",
+    "files_read": "Notes read",
+    "eventkit_calls": "EventKit calls",
+    "writes": "Writes",
+    "links_file_bytes": "Links file",
+    "inbox_bytes": "Inbox note",
+}
+
+
+def _seconds(value: Optional[float]) -> str:
+    return f"{value:.2f}s" if value is not None else "n/a"
+
+
+def _amount(key: str, value: Optional[float]) -> str:
+    if value is None:
+        return "n/a"
+    if key.endswith("_bytes"):
+        return f"{value / 1024:,.0f} KiB"
+    return f"{value:,.0f}"
+
+
+class StatsCommand:
+    """Command for summarising recorded sync runs."""
+
+    def __init__(self, config: SyncConfig, verbose: bool = False):
+        self.config = config
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.DEBUG)
+
+    def run(self, last: int = 50, vault: Optional[str] = None, json_output: bool = False) -> bool:
+        """
+        Show trends over the most recent runs.
+
+        Args:
+            last: Number of runs to include
+            vault: Only include runs for this vault name
+            json_output: Print the summary as JSON
+
+        Returns:
+            True if successful, False otherwise
+        """
+        records: List[Dict[str, Any]] = []
+        if self.config.run_history_path:
+            ledger = RunLedger(self.config.run_history_path, max_bytes=self.config.run_history_max_bytes)
+            records = ledger.read()
+        if vault:
+            records = [record for record in records if record.get("vault") == vault]
+        if last:
+            records = records[-last:]
+
+        if not records:
+            if json_output:
+                print(json.dumps({"runs": 0}))
+            else:
+                print("No sync runs recorded yet.")
+                if not self.config.run_history_enabled:
+                    print("Run history is disabled ('run_history_enabled' in your config).")
+            return True
+
+        summary = summarize_runs(records)
+        if json_output:
+            print(json.dumps(summary, indent=2))
+        else:
+            print(format_stats_report(summary, vault=vault))
+        return True
+
+
+def format_stats_report(summary: Dict[str, Any], vault: Optional[str] = None) -> str:
+    """Render a run summary as text."""
+    scope = f" for {vault}" if vault else ""
+    lines = [
+        f"\n📈 Sync run history{scope}: last {summary['runs']} run(s)",
+        f"   {summary['first_ts']} → {summary['last_ts']}",
+        "=" * 60,
+        f"  Runs: {summary['runs']} ({summary['succeeded']} ok, {summary['failed']} failed, "
+        f"{summary['applied']} applied, {summary['skipped']} skipped unchanged)",
+    ]
+
+    duration = summary["duration"]
+    lines.append(
+        f"  Duration: p50 {_seconds(duration['p50'])} · p90 {_seconds(duration['p90'])} · "
+        f"p99 {_seconds(duration['p99'])} · max {_seconds(duration['max'])}"
+    )
+    trend = summary["trend"]
+    if trend["older_p50"] and trend["newer_p50"] is not None:
+        change = (trend["newer_p50"] - trend["older_p50"]) / trend["older_p50"] * 100
+        lines.append(
+            f"  Trend: median {_seconds(trend['older_p50'])} → {_seconds(trend['newer_p50'])} "
+            f"({change:+.0f}%, older vs newer half)"
+        )
+
+    if summary["phases"]:
+        lines.append("\n⏱️  Phases (p50 / p95):")
+        ranked = sorted(summary["phases"].items(), key=lambda item: item[1]["p95"] or 0, reverse=True)
+        for phase, values in ranked:
+            lines.append(f"  {phase:<22} {_seconds(values['p50']):>8} / {_seconds(values['p95'])}")
+
+    if summary["volume"]:
+        lines.append("\n📦 Volume (first → last, max):")
+        for key, values in summary["volume"].items():
+            label = _VOLUME_LABELS.get(key, key)
+            line = (
+                f"  {label:<16} {_amount(key, values['first'])} → {_amount(key, values['last'])} "
+                f"(max {_amount(key, values['max'])})"
+            )
+            if values["first"] and values["last"] / values["first"] >= GROWTH_WARNING_FACTOR:
+                line += f"  ⚠️  grew {values['last'] / values['first']:.1f}x"
+            lines.append(line)
+
+    return "\n".join(lines)
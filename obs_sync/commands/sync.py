@@ -1,13 +1,28 @@
 """Sync command - perform bidirectional task synchronization."""
 
+import contextvars
+import functools
+import io
 import os
-from typing import Dict, List, Optional
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, TextIO, Tuple, TypedDict
 import logging
 from datetime import date
 
 from ..core.config import SyncConfig
+from ..core.models import Vault
 from ..sync.engine import SyncEngine
 from ..sync.deduplicator import TaskDeduplicator
+from ..sync.dedup_index import DuplicateIndexStore
+from ..sync.near_duplicates import NearDuplicateFinder
+from ..reminders.shared import SharedRemindersFetch
+from ..reminders.snapshot import RemindersSnapshot
+from ..sync.cursor import SyncCursorStore, deferred_count
+from ..sync.fingerprint import FingerprintStore, compute_fingerprint, fingerprint_list_ids
+from ..sync.scope import SyncScope
 from ..utils.prompts import (
     confirm_deduplication,
     display_duplicate_cluster,
@@ -16,20 +31,265 @@ from ..utils.prompts import (
     is_interactive,
 )
 from ..utils.insights import aggregate_insights, format_insight_cli_summary
+from ..utils.runlock import RunLock
+from ..utils.tracing import Tracer, span, use_tracer
+
+
+# Passes one lock holder runs back to back before leaving requests to the next trigger
+MAX_COALESCED_PASSES = 3
+
+
+class _SyncOptions(TypedDict, total=False):
+    """Per-vault keyword arguments passed on to :func:`sync_command`."""
+
+    engine: SyncEngine
+    force: bool
+    max_seconds: float
+    scope: SyncScope
+    reminders_gateway: Any
+    interactive: bool
+
+
+# (index, vault, default calendar, list ids, vault path missing)
+_VaultJob = Tuple[int, Vault, Optional[str], Optional[List[str]], bool]
+
+
+class _ThreadOutput(io.TextIOBase):
+    """``sys.stdout`` stand-in that buffers writes from capturing threads.
+
+    Threads that called :meth:`capture` write to their own buffer; every other
+    thread writes straight through to ``fallback``.
+    """
+
+    def __init__(self, fallback: TextIO):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        buffer = io.StringIO()
+        self._local.buffer = buffer
+        return buffer
+
+    def release(self) -> None:
+        self._local.buffer = None
+
+    def _target(self) -> TextIO:
+        buffer: Optional[io.StringIO] = getattr(self._local, "buffer", None)
+        return buffer or self._fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
 
 
 class SyncCommand:
     """Command for synchronizing tasks between Obsidian and Reminders."""
 
-    def __init__(self, config: SyncConfig, verbose: bool = False):
+    def __init__(self, config: SyncConfig, verbose: bool = False, reuse_engines: bool = False):
         self.config = config
         self.verbose = verbose
         self.logger = logging.getLogger(__name__)
         if verbose:
             self.logger.setLevel(logging.DEBUG)
+        # Long-lived callers (the daemon) keep one engine per vault so the
+        # Obsidian index, link cache and matcher caches survive between runs
+        self._engines: Optional[Dict[Tuple[str, str], SyncEngine]] = {} if reuse_engines else None
+        # Optional Reminders gateway shared by every cached engine
+        self.reminders_gateway: Optional[Any] = None
+        # Bypass the unchanged-fingerprint fast exit for the current run
+        self._force = False
+        # What an applied run does while another one holds the run lock
+        self._if_busy = "wait"
+        # Vaults synced at once; None falls back to the ``parallel_vaults`` setting
+        self._parallel: Optional[int] = None
+        # Monotonic deadline shared by every vault in a time-boxed run
+        self._deadline: Optional[float] = None
+        # Notes/tags requested with --file/--tag, resolved per vault
+        self._target: Optional[SyncScope] = None
+
+    def _engine_kwargs(self, vault_path: str, direction: str) -> _SyncOptions:
+        if self._engines is None:
+            return {}
+        key = (os.path.abspath(vault_path), direction)
+        engine = self._engines.get(key)
+        if engine is None:
+            engine = build_sync_engine(self.config, direction=direction, logger=self.logger)
+            if self.reminders_gateway is not None:
+                engine.rem_manager.gateway = self.reminders_gateway
+            self._engines[key] = engine
+        return {"engine": engine}
+
+    @property
+    def engines(self) -> Dict[Tuple[str, str], SyncEngine]:
+        """Engines cached by ``(vault_path, direction)`` when reuse is enabled."""
+        return dict(self._engines or {})
+
+    def _sync_kwargs(self, vault_path: str, direction: str) -> _SyncOptions:
+        kwargs = self._engine_kwargs(vault_path, direction)
+        if self._force:
+            kwargs["force"] = True
+        if self._deadline is not None:
+            kwargs["max_seconds"] = max(0.0, self._deadline - time.monotonic())
+        if self._target is not None:
+            kwargs["scope"] = self._vault_scope(self._target, vault_path)
+        return kwargs
+
+    @staticmethod
+    def _vault_scope(target: SyncScope, vault_path: str) -> SyncScope:
+        """Resolve the requested notes against one vault.
 
-    def run(self, apply_changes: bool = False, direction: str = "both") -> bool:
-        """Run the sync command."""
+        Absolute paths count for the vault containing them; relative paths for
+        every vault where the note exists. An empty scope means none of the
+        requested notes live in this vault.
+        """
+        if not target.files:
+            return SyncScope(tags=set(target.tags))
+        vault_root = os.path.abspath(os.path.expanduser(vault_path))
+        files = set()
+        for path in target.files:
+            path = os.path.expanduser(path)
+            if os.path.isabs(path):
+                path = os.path.abspath(path)
+                if os.path.commonpath([vault_root, path]) != vault_root:
+                    continue
+                files.add(os.path.relpath(path, vault_root))
+            elif os.path.isfile(os.path.join(vault_root, path)):
+                files.add(os.path.normpath(path))
+        if not files:
+            return SyncScope()
+        return SyncScope(files=files, tags=set(target.tags))
+
+    def reset_engines(self) -> None:
+        """Drop cached engines, e.g. after the configuration changed."""
+        if self._engines is not None:
+            self._engines.clear()
+
+    def run(
+        self,
+        apply_changes: bool = False,
+        direction: str = "both",
+        trace_path: Optional[str] = None,
+        trace_memory: bool = False,
+        force: bool = False,
+        if_busy: str = "wait",
+        parallel: Optional[int] = None,
+        max_seconds: Optional[float] = None,
+        files: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+    ) -> bool:
+        """Run the sync command.
+
+        Args:
+            apply_changes: Apply changes instead of a dry run
+            direction: Sync direction
+            trace_path: Optional path for a Chrome trace of the run
+            trace_memory: Capture peak memory with tracemalloc
+            force: Sync even if nothing changed since the last no-op run
+            if_busy: When another applied sync is running, ``"wait"`` for it
+                and reuse its result, or ``"queue"`` a rerun and return
+            parallel: Number of vaults to sync at once (overrides ``parallel_vaults``)
+            max_seconds: Time budget for the whole run; leftover work is
+                resumed by the next run
+            files: Only sync tasks in these notes (vault-relative or absolute)
+            tags: Only sync tasks carrying one of these tags; combined with
+                ``files``, tasks must match both
+        """
+        self._force = force
+        self._if_busy = if_busy
+        self._parallel = parallel
+        self._deadline = time.monotonic() + max_seconds if max_seconds is not None else None
+        self._target = None
+        if files or tags:
+            self._target = SyncScope(files=set(files or []), tags=SyncScope.for_tags(tags or []).tags)
+        if not trace_path and not trace_memory:
+            return self._run_exclusive(apply_changes, direction)
+
+        tracer = Tracer(trace_memory=trace_memory)
+        with use_tracer(tracer):
+            with tracer.span("obs-sync sync", "command", apply_changes=apply_changes, direction=direction):
+                success = self._run_exclusive(apply_changes, direction)
+
+        if trace_path:
+            written = tracer.write(trace_path)
+            print(f"\n🧭 Trace written to {written} (open in chrome://tracing or ui.perfetto.dev)")
+        if tracer.memory_peak_bytes is not None:
+            print(f"🧠 Peak traced memory: {tracer.memory_peak_bytes / (1024 * 1024):.1f} MiB")
+        return success
+
+    def _run_exclusive(self, apply_changes: bool, direction: str) -> bool:
+        """Run under the process-level run lock, coalescing overlapping triggers.
+
+        Dry runs never write, so only applied runs take the lock. When the lock
+        is busy a rerun is requested from the holder; waiting callers then
+        reuse the result of a pass that started after their request, or run
+        themselves if the holder finished without one.
+        """
+        if not apply_changes or getattr(self.config, "run_lock_enabled", True) is not True:
+            return self._run(apply_changes, direction)
+
+        lock = RunLock.for_config(self.config, logger=self.logger)
+        if lock.acquire():
+            try:
+                return self._run_passes(lock, apply_changes, direction)
+            finally:
+                lock.release()
+
+        requested_at = time.time()
+        target = _target_state(self._target)
+        lock.request_rerun(direction, target)
+        if self._if_busy == "queue":
+            print("⏳ Another sync is running; it will do one more pass for this request.")
+            return True
+
+        print("⏳ Another sync is running; waiting for it to finish...")
+        if not lock.acquire(blocking=True, timeout=self.config.run_lock_timeout):
+            print(f"❌ Gave up waiting for the running sync after {self.config.run_lock_timeout}s.")
+            return False
+        try:
+            last = lock.last_pass()
+            if (last.get("direction") == direction and last.get("target") in (None, target)
+                    and (last.get("started_at") or 0) >= requested_at):
+                print("✅ Reused the result of the sync that just finished.")
+                return bool(last.get("success"))
+            return self._run_passes(lock, apply_changes, direction)
+        finally:
+            lock.release()
+
+    def _run_passes(self, lock: RunLock, apply_changes: bool, direction: str) -> bool:
+        """Run while holding ``lock``, then once more for each pass requested meanwhile.
+
+        Requested passes keep the direction and vault target of the caller that
+        asked for them; any left over after ``MAX_COALESCED_PASSES`` are queued
+        again for the next holder.
+        """
+        # Requests made before this pass starts are covered by it
+        lock.clear_rerun_request()
+        success = self._run_pass(lock, apply_changes, direction)
+        pending: List[Dict[str, Any]] = []
+        for _ in range(MAX_COALESCED_PASSES - 1):
+            pending = pending or lock.take_rerun_requests()
+            if not pending:
+                break
+            request = pending.pop(0)
+            print("\n🔁 Sync requested while running; doing one more pass...")
+            self._target = _scope_from_state(request.get("target"))
+            success = self._run_pass(lock, apply_changes, request.get("direction") or direction) and success
+        for request in pending:
+            lock.request_rerun(request.get("direction") or direction, request.get("target"))
+        return success
+
+    def _run_pass(self, lock: RunLock, apply_changes: bool, direction: str) -> bool:
+        started_at = time.time()
+        success = self._run(apply_changes, direction)
+        lock.record_pass(started_at, success, direction, target=_target_state(self._target))
+        return success
+
+    def _run(self, apply_changes: bool, direction: str) -> bool:
         try:
             # Get all vault mappings
             mappings = self.config.get_all_vault_mappings()
@@ -47,6 +307,9 @@ class SyncCommand:
 
                 list_ids = self.config.reminder_list_ids or None
                 print(f"\n📁 Syncing vault '{os.path.basename(vault_path)}'")
+                sync_kwargs = self._sync_kwargs(vault_path, direction)
+                if self._out_of_scope(sync_kwargs):
+                    return True
                 vault_result = sync_command(
                     vault_path=vault_path,
                     list_ids=list_ids,
@@ -54,11 +317,13 @@ class SyncCommand:
                     direction=direction,
                     config=self.config,
                     show_summary=True,  # Legacy single vault keeps full summary
+                    **sync_kwargs,
                 )
                 
                 # Run calendar import if enabled and sync was successful
                 self.logger.debug(f"Legacy calendar import check: apply_changes={apply_changes}, sync_success={vault_result['success']}, sync_calendar_events={getattr(self.config, 'sync_calendar_events', 'MISSING')}, has_default_vault={self.config.default_vault is not None}")
                 if (apply_changes and vault_result['success'] and self.config.sync_calendar_events and
+                    self._target is None and
                     self.config.default_vault):
                     self.logger.info(f"Running legacy calendar import for vault: {self.config.default_vault.name}")
                     self._run_calendar_import(self.config.default_vault, list_ids)
@@ -66,83 +331,18 @@ class SyncCommand:
                 return vault_result['success']
 
             # Process each vault mapping
-            all_success = True
             total_vaults = len(mappings)
-            vault_results = []
+            workers = self._vault_workers(total_vaults)
 
             print(f"\n🔄 Syncing {total_vaults} vault(s)...")
             print("=" * 50)
 
-            for idx, (vault, calendar_id) in enumerate(mappings, 1):
-                vault_path = vault.path
-
-                if not os.path.exists(vault_path):
-                    print(f"\n⚠️ Vault {idx}/{total_vaults}: {vault.name}")
-                    print(f"   Vault path not found at {vault_path}")
-                    all_success = False
-                    
-                    # Add failed vault to results for summary
-                    vault_results.append({
-                        'success': False,
-                        'vault_path': vault_path,
-                        'vault_name': vault.name,
-                        'error': f'Vault path does not exist: {vault_path}'
-                    })
-                    continue
-
-                list_ids = self._collect_list_ids_for_vault(vault, calendar_id)
-
-                print(f"\n📁 Vault {idx}/{total_vaults}: {vault.name}")
-
-                if calendar_id:
-                    list_name = self._get_list_name(calendar_id)
-                    print(f"   → Default Reminders list: {list_name}")
-                else:
-                    print("   → No default Reminders list mapped to this vault.")
-
-                tag_routes = self.config.get_tag_routes_for_vault(vault.vault_id)
-                if tag_routes:
-                    print("   Tag routes applied:")
-                    for route in tag_routes:
-                        route_list = self._get_list_name(route.get("calendar_id"))
-                        import_mode = route.get("import_mode", "existing_only")
-                        mode_text = "existing only" if import_mode == "existing_only" else "full import"
-                        print(f"     • {route['tag']} → {route_list} ({mode_text})")
-
-                print(f"   🔄 Running sync...")
-                
-                # Run sync for this vault with all relevant lists, suppress individual summary
-                vault_result = sync_command(
-                    vault_path=vault_path,
-                    list_ids=list_ids or None,
-                    dry_run=not apply_changes,
-                    direction=direction,
-                    config=self.config,
-                    show_summary=False,  # Suppress individual vault summaries
+            if workers > 1:
+                vault_results, all_success = self._sync_vaults_parallel(
+                    mappings, apply_changes, direction, workers
                 )
-
-                vault_results.append(vault_result)
-
-                if not vault_result['success']:
-                    all_success = False
-                    print(f"   ❌ Sync failed: {vault_result.get('error', 'Unknown error')} — review the details above.")
-                else:
-                    print("   ✅ Sync completed.")
-                    
-                    # Run calendar import if enabled and this is the default vault
-                    self.logger.debug(f"Calendar import check: apply_changes={apply_changes}, sync_calendar_events={getattr(self.config, 'sync_calendar_events', 'MISSING')}, has_default_vault={self.config.default_vault is not None}, vault_matches={vault.vault_id == self.config.default_vault.vault_id if self.config.default_vault else False}")
-                    if (apply_changes and self.config.sync_calendar_events and
-                        self.config.default_vault and vault.vault_id == self.config.default_vault.vault_id):
-                        self.logger.info(f"Running calendar import for vault: {vault.name}")
-                        self._run_calendar_import(vault, list_ids)
-                    
-                    # Inject insights into daily note if enabled
-                    if (apply_changes and self.config.insights_in_daily_notes and
-                        self.config.enable_insights):
-                        self._inject_insights_to_daily_note(vault, vault_result)
-
-                if idx < total_vaults:
-                    print("-" * 50)
+            else:
+                vault_results, all_success = self._sync_vaults_serial(mappings, apply_changes, direction)
 
             print("\n" + "=" * 50)
             
@@ -163,6 +363,222 @@ class SyncCommand:
                 traceback.print_exc()
             return False
 
+    def _vault_workers(self, total_vaults: int) -> int:
+        parallel = self._parallel if self._parallel is not None else getattr(self.config, "parallel_vaults", 1)
+        if not isinstance(parallel, int) or isinstance(parallel, bool):
+            return 1
+        return max(1, min(parallel, total_vaults))
+
+    def _sync_vaults_serial(
+        self, mappings: List[Tuple[Vault, str]], apply_changes: bool, direction: str
+    ) -> Tuple[List[dict], bool]:
+        all_success = True
+        vault_results = []
+        total_vaults = len(mappings)
+
+        for idx, (vault, calendar_id) in enumerate(mappings, 1):
+            if not os.path.exists(vault.path):
+                vault_results.append(self._missing_vault_result(idx, total_vaults, vault))
+                all_success = False
+                continue
+
+            list_ids = self._collect_list_ids_for_vault(vault, calendar_id)
+            vault_result = self._sync_vault(
+                idx, total_vaults, vault, calendar_id, list_ids, apply_changes, direction,
+                self._sync_kwargs(vault.path, direction),
+            )
+            vault_results.append(vault_result)
+            if not vault_result['success']:
+                all_success = False
+            elif not vault_result.get('skipped'):
+                self._after_vault_sync(vault, vault_result, list_ids, apply_changes)
+
+            if idx < total_vaults:
+                print("-" * 50)
+
+        return vault_results, all_success
+
+    def _sync_vaults_parallel(
+        self, mappings: List[Tuple[Vault, str]], apply_changes: bool, direction: str, workers: int
+    ) -> Tuple[List[dict], bool]:
+        """Sync vaults on a thread pool sharing one Reminders fetch.
+
+        Each vault's console output is buffered and printed in vault order once
+        every vault has finished; calendar import and daily-note insights then
+        run serially as in a serial run. Deduplication does not prompt here.
+        """
+        total_vaults = len(mappings)
+        jobs: List[_VaultJob] = []
+        shared_ids: Optional[set] = set()
+        for idx, (vault, calendar_id) in enumerate(mappings, 1):
+            if not os.path.exists(vault.path):
+                jobs.append((idx, vault, calendar_id, None, True))
+                continue
+            list_ids = self._collect_list_ids_for_vault(vault, calendar_id) or None
+            jobs.append((idx, vault, calendar_id, list_ids, False))
+            if list_ids is None:
+                shared_ids = None
+            elif shared_ids is not None:
+                shared_ids.update(list_ids)
+                shared_ids.update(fingerprint_list_ids(self.config, list_ids) or [])
+
+        gateway = self.reminders_gateway
+        if gateway is None:
+            from ..reminders.gateway import RemindersGateway
+            gateway = RemindersGateway(logger=self.logger)
+        shared = SharedRemindersFetch(gateway, shared_ids, logger=self.logger)
+        print(f"   ⚡ {workers} vaults at a time, sharing one Reminders fetch")
+
+        def sync_one(
+            idx: int, vault: Vault, calendar_id: Optional[str], list_ids: Optional[List[str]], missing: bool
+        ) -> Tuple[dict, io.StringIO]:
+            buffer = output.capture()
+            try:
+                if missing:
+                    return self._missing_vault_result(idx, total_vaults, vault), buffer
+                options = self._sync_kwargs(vault.path, direction)
+                options["reminders_gateway"] = shared.view()
+                options["interactive"] = False
+                try:
+                    result = self._sync_vault(
+                        idx, total_vaults, vault, calendar_id, list_ids, apply_changes, direction, options,
+                    )
+                except Exception as exc:  # pragma: no cover - defensive
+                    self.logger.error("Sync failed for vault %s: %s", vault.name, exc)
+                    print(f"   ❌ Sync failed: {exc}")
+                    result = {
+                        'success': False,
+                        'vault_path': vault.path,
+                        'vault_name': vault.name,
+                        'error': str(exc),
+                    }
+                return result, buffer
+            finally:
+                output.release()
+
+        output = _ThreadOutput(sys.stdout)
+        original_stdout, sys.stdout = sys.stdout, output
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="obs-sync-vault") as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, functools.partial(sync_one, *job))
+                    for job in jobs
+                ]
+                outcomes = [future.result() for future in futures]
+        finally:
+            sys.stdout = original_stdout
+
+        all_success = True
+        vault_results = []
+        for (idx, vault, _, list_ids, missing), (vault_result, buffer) in zip(jobs, outcomes):
+            print(buffer.getvalue(), end="")
+            vault_results.append(vault_result)
+            if not vault_result['success']:
+                all_success = False
+                if missing:
+                    continue
+            elif not vault_result.get('skipped'):
+                self._after_vault_sync(vault, vault_result, list_ids, apply_changes)
+            if idx < total_vaults:
+                print("-" * 50)
+
+        if apply_changes and self.config.enable_deduplication:
+            print("\nℹ️  Deduplication does not prompt during parallel syncs; run without --parallel to resolve duplicates.")
+        return vault_results, all_success
+
+    def _missing_vault_result(self, idx: int, total_vaults: int, vault: Vault) -> dict:
+        print(f"\n⚠️ Vault {idx}/{total_vaults}: {vault.name}")
+        print(f"   Vault path not found at {vault.path}")
+        return {
+            'success': False,
+            'vault_path': vault.path,
+            'vault_name': vault.name,
+            'error': f'Vault path does not exist: {vault.path}'
+        }
+
+    def _sync_vault(
+        self,
+        idx: int,
+        total_vaults: int,
+        vault: Vault,
+        calendar_id: Optional[str],
+        list_ids: Optional[List[str]],
+        apply_changes: bool,
+        direction: str,
+        sync_kwargs: _SyncOptions,
+    ) -> dict:
+        print(f"\n📁 Vault {idx}/{total_vaults}: {vault.name}")
+
+        if calendar_id:
+            list_name = self._get_list_name(calendar_id)
+            print(f"   → Default Reminders list: {list_name}")
+        else:
+            print("   → No default Reminders list mapped to this vault.")
+
+        tag_routes = self.config.get_tag_routes_for_vault(vault.vault_id)
+        if tag_routes:
+            print("   Tag routes applied:")
+            for route in tag_routes:
+                route_list = self._get_list_name(route.get("calendar_id"))
+                import_mode = route.get("import_mode", "existing_only")
+                mode_text = "existing only" if import_mode == "existing_only" else "full import"
+                print(f"     • {route['tag']} → {route_list} ({mode_text})")
+
+        if self._out_of_scope(sync_kwargs):
+            return {
+                'success': True,
+                'skipped': True,
+                'vault_path': vault.path,
+                'vault_name': vault.name,
+                'results': {},
+            }
+
+        print(f"   🔄 Running sync...")
+        
+        # Run sync for this vault with all relevant lists, suppress individual summary
+        vault_result = sync_command(
+            vault_path=vault.path,
+            list_ids=list_ids or None,
+            dry_run=not apply_changes,
+            direction=direction,
+            config=self.config,
+            show_summary=False,  # Suppress individual vault summaries
+            **sync_kwargs,
+        )
+
+        if not vault_result['success']:
+            print(f"   ❌ Sync failed: {vault_result.get('error', 'Unknown error')} — review the details above.")
+        elif vault_result.get('skipped'):
+            print("   ⏭️  No changes since the last run; skipped.")
+        elif vault_result.get('deferred'):
+            print(f"   ⏸️  Time budget reached; {vault_result['deferred']} operation(s) deferred to the next run.")
+        else:
+            print("   ✅ Sync completed.")
+        return vault_result
+
+    def _out_of_scope(self, sync_kwargs: _SyncOptions) -> bool:
+        scope = sync_kwargs.get("scope")
+        if scope is not None and scope.is_empty:
+            print("   ⏭️  None of the requested notes are in this vault; skipped.")
+            return True
+        return False
+
+    def _after_vault_sync(self, vault: Vault, vault_result: dict, list_ids: Optional[List[str]], apply_changes: bool) -> None:
+        # Targeted runs only touch the requested tasks
+        if self._target is not None:
+            return
+        # Run calendar import if enabled and this is the default vault
+        self.logger.debug(f"Calendar import check: apply_changes={apply_changes}, sync_calendar_events={getattr(self.config, 'sync_calendar_events', 'MISSING')}, has_default_vault={self.config.default_vault is not None}, vault_matches={vault.vault_id == self.config.default_vault.vault_id if self.config.default_vault else False}")
+        if (apply_changes and self.config.sync_calendar_events and
+            self.config.default_vault and vault.vault_id == self.config.default_vault.vault_id):
+            self.logger.info(f"Running calendar import for vault: {vault.name}")
+            self._run_calendar_import(vault, list_ids)
+        
+        # Inject insights into daily note if enabled
+        if (apply_changes and self.config.insights_in_daily_notes and
+            self.config.enable_insights):
+            self._inject_insights_to_daily_note(vault, vault_result)
+
     def _collect_list_ids_for_vault(
         self,
         vault,
@@ -182,10 +598,8 @@ class SyncCommand:
     def _get_list_name(self, identifier: Optional[str]) -> str:
         if not identifier:
             return "Unknown"
-        for lst in self.config.reminders_lists:
-            if lst.identifier == identifier:
-                return lst.name
-        return identifier
+        lst = self.config.get_reminders_list(identifier)
+        return lst.name if lst else identifier
     
     def _show_consolidated_summary(self, vault_results: List[dict], apply_changes: bool) -> None:
         """Show consolidated summary across all vaults."""
@@ -473,11 +887,13 @@ class SyncCommand:
                     print(f"   📊 No insights to inject for {vault.name}")
                 return
             
-            # Get streaks if enabled
+            # Get streaks if enabled; the sync already computed them when it recorded
             streaks_data = None
             if self.config.enable_streak_tracking:
-                tracker = StreakTracker()
-                streaks_data = tracker.get_all_streaks(vault.vault_id, min_current=1)
+                streaks_data = results.get('streaks')
+                if streaks_data is None:
+                    tracker = StreakTracker()
+                    streaks_data = tracker.get_all_streaks(vault.vault_id, min_current=1)
             
             # Inject into daily note
             note_manager = DailyNoteManager(vault.path)
@@ -492,6 +908,32 @@ class SyncCommand:
                 print(f"   ❌ Insights injection failed: {e}")
 
 
+def build_sync_engine(
+    config: SyncConfig,
+    direction: str = "both",
+    logger: Optional[logging.Logger] = None,
+) -> SyncEngine:
+    """Create a sync engine configured from the user's settings."""
+    engine_config = {
+        "min_score": config.min_score,
+        "days_tolerance": config.days_tolerance,
+        "include_completed": config.include_completed,
+        "obsidian_inbox_path": config.obsidian_inbox_path,
+        "inbox_rotation": config.inbox_rotation,
+        "inbox_max_bytes": config.inbox_max_bytes,
+        "default_calendar_id": config.default_calendar_id,
+        "links_path": config.links_path,
+    }
+    engine = SyncEngine(
+        engine_config,
+        logger or logging.getLogger(__name__),
+        direction=direction,
+        sync_config=config,
+    )
+    engine.rem_manager.snapshot = RemindersSnapshot.for_config(config, logger)
+    return engine
+
+
 def sync_command(
     vault_path: str,
     list_ids: Optional[List[str]] = None,
@@ -499,8 +941,39 @@ def sync_command(
     direction: str = "both",
     config: Optional[SyncConfig] = None,
     show_summary: bool = True,
+    scope: Optional[SyncScope] = None,
+    engine: Optional[SyncEngine] = None,
+    force: bool = False,
+    reminders_gateway: Optional[Any] = None,
+    interactive: Optional[bool] = None,
+    max_seconds: Optional[float] = None,
 ) -> dict:
-    """Execute sync between Obsidian and Reminders."""
+    """Execute sync between Obsidian and Reminders.
+
+    Args:
+        scope: Optional scope limiting the run to specific notes. Scoped runs
+            skip deduplication, which needs the whole vault.
+        engine: Optional engine to reuse across runs so its caches stay warm.
+        force: Run even when fingerprints show nothing changed since the last
+            run that found nothing to do.
+        reminders_gateway: Gateway used for this run instead of the engine's
+            own, e.g. a view onto a Reminders fetch shared between vaults.
+        interactive: Whether deduplication may prompt; None detects the terminal.
+        max_seconds: Time budget for the engine's writes. Work left over is
+            saved as a cursor that the next run of this vault resumes from.
+    """
+    if reminders_gateway is not None and engine is not None:
+        previous_gateway = engine.rem_manager.gateway
+        engine.rem_manager.gateway = reminders_gateway
+        try:
+            return sync_command(
+                vault_path, list_ids, dry_run=dry_run, direction=direction, config=config,
+                show_summary=show_summary, scope=scope, engine=engine, force=force,
+                reminders_gateway=None, interactive=interactive, max_seconds=max_seconds,
+            )
+        finally:
+            engine.rem_manager.gateway = previous_gateway
+
     logger = logging.getLogger(__name__)
 
     if not os.path.exists(vault_path):
@@ -517,20 +990,53 @@ def sync_command(
     if not config:
         config = SyncConfig()
 
-    engine_config = {
-        "min_score": config.min_score,
-        "days_tolerance": config.days_tolerance,
-        "include_completed": config.include_completed,
-        "obsidian_inbox_path": config.obsidian_inbox_path,
-        "default_calendar_id": config.default_calendar_id,
-        "links_path": config.links_path,
-    }
+    if engine is None:
+        engine = build_sync_engine(config, direction=direction, logger=logger)
+        if reminders_gateway is not None:
+            engine.rem_manager.gateway = reminders_gateway
 
-    engine = SyncEngine(engine_config, logger, direction=direction, sync_config=config)
+    run_started = time.perf_counter()
+
+    # Work left over by an earlier budget-limited run goes first this time
+    cursors = SyncCursorStore.for_config(config, logger) if scope is None else None
+    resume_from = cursors.get(vault_path, direction) if cursors is not None else None
+
+    # Cheap pre-check: skip the run when neither side changed since the last no-op
+    fingerprint = None
+    fingerprints: Optional[FingerprintStore] = None
+    if scope is None and getattr(config, "skip_unchanged_runs", False) is True:
+        fingerprints = FingerprintStore.for_config(config, logger)
+        try:
+            with span("sync.fingerprint", "phase"):
+                fingerprint = compute_fingerprint(
+                    config,
+                    vault_path,
+                    list_ids,
+                    direction,
+                    gateway=getattr(engine.rem_manager, "gateway", None),
+                    vault_id=_vault_id_for_path(config, vault_path),
+                )
+        except Exception as exc:
+            logger.debug("Could not fingerprint %s: %s", vault_path, exc)
+            fingerprint = None
+        if (not force and not resume_from and fingerprint is not None
+                and fingerprints.matches(vault_path, direction, fingerprint)):
+            return _skipped_result(config, vault_path, direction, dry_run, fingerprints, run_started, show_summary, logger)
 
     try:
         # Run initial sync to get tasks and perform regular sync operations
-        results = engine.sync(vault_path, list_ids, dry_run)
+        engine_options: Dict[str, Any] = {}
+        if scope is not None:
+            engine_options['scope'] = scope
+        if max_seconds is not None:
+            engine_options['max_seconds'] = max_seconds
+        if resume_from:
+            engine_options['resume'] = resume_from
+            if show_summary:
+                print(f"\n⏯️  Resuming {deferred_count(resume_from)} operation(s) left by the previous run.")
+        results = engine.sync(vault_path, list_ids, dry_run, **engine_options)
+        deferred = results.get('deferred') if isinstance(results.get('deferred'), dict) else None
+        remaining = deferred_count(deferred)
 
         created_obs_ids = results.get('created_obs_tasks', [])
         created_rem_ids = results.get('created_rem_tasks', [])
@@ -609,17 +1115,24 @@ def sync_command(
 
         # Run deduplication analysis if enabled
         dedup_stats = {"obs_deleted": 0, "rem_deleted": 0}
-        if config.enable_deduplication:
-            dedup_stats = _run_deduplication(
-                vault_path=vault_path,
-                list_ids=list_ids,
-                dry_run=dry_run,
-                config=config,
-                logger=logger,
-                show_summary=show_summary,
-                created_obs_ids=created_obs_ids,
-                created_rem_ids=created_rem_ids,
-            )
+        engine_timings = results.get('timings')
+        timings = dict(engine_timings) if isinstance(engine_timings, dict) else {}
+        if config.enable_deduplication and scope is None and not remaining:
+            dedup_started = time.perf_counter()
+            with span("sync.deduplication", "phase"):
+                dedup_stats = _run_deduplication(
+                    vault_path=vault_path,
+                    list_ids=list_ids,
+                    dry_run=dry_run,
+                    config=config,
+                    logger=logger,
+                    show_summary=show_summary,
+                    created_obs_ids=created_obs_ids,
+                    created_rem_ids=created_rem_ids,
+                    gateway=reminders_gateway,
+                    interactive=interactive,
+                )
+            timings['deduplication'] = round(time.perf_counter() - dedup_started, 6)
             
             # Add deduplication stats to changes
             if dedup_stats["obs_deleted"] or dedup_stats["rem_deleted"]:
@@ -633,9 +1146,33 @@ def sync_command(
             if dedup_stats["rem_deleted"]:
                 print(f"  Reminders deletions: {dedup_stats['rem_deleted']}")
 
+        if remaining and show_summary:
+            print(f"\n⏸️  Time budget reached: {remaining} operation(s) deferred to the next run.")
+        if cursors is not None and not dry_run:
+            if deferred is not None and remaining:
+                cursors.record(vault_path, direction, deferred)
+            elif resume_from:
+                cursors.clear(vault_path, direction)
+
         if show_summary and dry_run:
             print("\nDry run only—rerun with --apply to apply changes.")
 
+        timings['total'] = round(time.perf_counter() - run_started, 6)
+        _record_run(config, vault_path, direction, dry_run, results, timings, logger=logger)
+
+        # Remember the pre-run fingerprint only when an applied run had nothing to
+        # do and left nothing over; anything edited while this run was in flight
+        # then still triggers a full run. A dry run writes nothing, so it never
+        # vouches for the next applied run
+        any_changes = has_changes or dedup_stats["obs_deleted"] or dedup_stats["rem_deleted"]
+        if (fingerprints is not None and fingerprint is not None and not dry_run
+                and not any_changes and not remaining):
+            fingerprints.record(vault_path, direction, fingerprint, counts={
+                'obs_tasks': results.get('obs_tasks', 0),
+                'rem_tasks': results.get('rem_tasks', 0),
+                'links': results.get('links', 0),
+            })
+
         # Return comprehensive results
         return {
             'success': True,
@@ -643,6 +1180,8 @@ def sync_command(
             'vault_name': os.path.basename(vault_path),
             'results': results,
             'dedup_stats': dedup_stats,
+            'timings': timings,
+            'deferred': remaining,
             'has_changes': has_changes or dedup_stats["obs_deleted"] or dedup_stats["rem_deleted"]
         }
 
@@ -650,6 +1189,11 @@ def sync_command(
         logger.error("Sync failed: %s", exc)
         if show_summary:
             print(f"Error: Sync failed - {exc}")
+        _record_run(
+            config, vault_path, direction, dry_run, {},
+            {'total': round(time.perf_counter() - run_started, 6)},
+            error=str(exc), logger=logger,
+        )
         return {
             'success': False,
             'vault_path': vault_path,
@@ -658,6 +1202,102 @@ def sync_command(
         }
 
 
+def _target_state(scope: Optional[SyncScope]) -> Optional[Dict[str, List[str]]]:
+    """JSON form of a run's vault target for the run lock state."""
+    if scope is None:
+        return None
+    return {"files": sorted(scope.files), "tags": sorted(scope.tags)}
+
+
+def _scope_from_state(target: Any) -> Optional[SyncScope]:
+    if not isinstance(target, dict):
+        return None
+    return SyncScope(files=set(target.get("files") or []), tags=set(target.get("tags") or []))
+
+
+def _vault_id_for_path(config: SyncConfig, vault_path: str) -> Optional[str]:
+    target = os.path.normcase(os.path.abspath(os.path.expanduser(vault_path)))
+    for vault in config.vaults:
+        if os.path.normcase(os.path.abspath(os.path.expanduser(vault.path))) == target:
+            return vault.vault_id
+    return None
+
+
+def _skipped_result(
+    config: SyncConfig,
+    vault_path: str,
+    direction: str,
+    dry_run: bool,
+    fingerprints: FingerprintStore,
+    run_started: float,
+    show_summary: bool,
+    logger: logging.Logger,
+) -> dict:
+    """Result for a run skipped because the fingerprints matched."""
+    entry = fingerprints.get(vault_path, direction) or {}
+    counts = entry.get('counts', {})
+    elapsed = round(time.perf_counter() - run_started, 6)
+    results = {
+        'success': True,
+        'skipped': True,
+        'obs_tasks': counts.get('obs_tasks', 0),
+        'rem_tasks': counts.get('rem_tasks', 0),
+        'links': counts.get('links', 0),
+        'changes': {},
+        'timings': {'fingerprint': elapsed},
+        'dry_run': dry_run,
+    }
+    timings = {'fingerprint': elapsed, 'total': elapsed}
+    logger.info("Fingerprints unchanged since %s; skipping sync of %s", entry.get('recorded_at'), vault_path)
+    if show_summary:
+        print("\nNo changes since the last run (vault and Reminders fingerprints match); skipped.")
+        print("Run with --force to sync anyway.")
+    _record_run(config, vault_path, direction, dry_run, results, timings, logger=logger)
+    return {
+        'success': True,
+        'skipped': True,
+        'vault_path': vault_path,
+        'vault_name': os.path.basename(vault_path),
+        'results': results,
+        'dedup_stats': {'obs_deleted': 0, 'rem_deleted': 0},
+        'timings': timings,
+        'has_changes': False,
+    }
+
+
+def _record_run(
+    config: SyncConfig,
+    vault_path: str,
+    direction: str,
+    dry_run: bool,
+    results: dict,
+    timings: dict,
+    error: Optional[str] = None,
+    logger: Optional[logging.Logger] = None,
+) -> None:
+    """Append the run to the run-history ledger read by ``obs-sync stats``."""
+    ledger_path = getattr(config, "run_history_path", None)
+    if getattr(config, "run_history_enabled", False) is not True or not isinstance(ledger_path, str):
+        return
+    from ..utils.ledger import RunLedger, build_run_record
+
+    inbox_path = None
+    if isinstance(config.obsidian_inbox_path, str) and config.obsidian_inbox_path:
+        inbox_path = os.path.join(vault_path, config.obsidian_inbox_path)
+    record = build_run_record(
+        vault_name=os.path.basename(os.path.normpath(vault_path)),
+        vault_path=vault_path,
+        direction=direction,
+        dry_run=dry_run,
+        sync_result=results if isinstance(results, dict) else {},
+        timings=timings,
+        links_path=config.links_path,
+        inbox_path=inbox_path,
+        error=error,
+    )
+    RunLedger(ledger_path, max_bytes=config.run_history_max_bytes, logger=logger).append(record)
+
+
 def _run_deduplication(
     vault_path: str,
     list_ids: Optional[List[str]] = None,
@@ -667,6 +1307,8 @@ def _run_deduplication(
     show_summary: bool = True,
     created_obs_ids: Optional[List[str]] = None,
     created_rem_ids: Optional[List[str]] = None,
+    gateway: Optional[Any] = None,
+    interactive: Optional[bool] = None,
 ) -> dict:
     """
     Run deduplication analysis and optionally apply deletions.
@@ -677,6 +1319,8 @@ def _run_deduplication(
         dry_run: If True, don't actually delete tasks
         config: Sync configuration
         logger: Logger instance
+        gateway: Reminders gateway to read from instead of a new one
+        interactive: Whether prompting is possible; None detects the terminal
         
     Returns:
         Dict with deletion statistics
@@ -692,8 +1336,34 @@ def _run_deduplication(
     from ..reminders.tasks import RemindersTaskManager
     
     obs_manager = ObsidianTaskManager(logger=logger)
-    rem_manager = RemindersTaskManager(logger=logger)
+    if gateway is not None:
+        rem_manager = RemindersTaskManager(gateway=gateway, logger=logger)
+    else:
+        rem_manager = RemindersTaskManager(logger=logger)
+    # Right after a sync only the reminders it touched need converting
+    rem_manager.snapshot = RemindersSnapshot.for_config(config, logger)
+
+    # Scan the vault with the same filters the sync used
+    vault = next((v for v in config.vaults if v.path == vault_path), None)
+    if vault is not None:
+        scan_filters = config.get_vault_scan_filters(vault.vault_id)
+        respect_app_config = config.respect_obsidian_ignore
+        if scan_filters["exclude"] or scan_filters["include"] or not respect_app_config:
+            obs_manager.configure_scan(
+                vault_path,
+                exclude=scan_filters["exclude"],
+                include=scan_filters["include"],
+                respect_app_config=respect_app_config,
+            )
     deduplicator = TaskDeduplicator(obs_manager, rem_manager, logger, links_path=config.links_path)
+    # Carry the duplicate index and earlier reviews over from the last run;
+    # dry runs use it but leave the stored copy untouched
+    index_store = DuplicateIndexStore.for_config(config, logger)
+    deduplicator.index = index_store.load(vault_path)
+    if getattr(config, "dedup_near_duplicates", False) is True:
+        deduplicator.near_finder = NearDuplicateFinder(
+            threshold=config.dedup_similarity_threshold, logger=logger
+        )
     
     try:
         # Get current tasks
@@ -733,6 +1403,10 @@ def _run_deduplication(
         
         # Analyze for duplicates, excluding already-synced pairs
         dedup_results = deduplicator.analyze_duplicates(obs_tasks, rem_tasks, existing_links)
+        if not dry_run:
+            index_store.save(vault_path, deduplicator.index)
+        if dedup_results.kept_clusters and show_summary:
+            print(f"\n📝 {dedup_results.kept_clusters} duplicate cluster(s) you kept before were not shown again.")
         
         if dedup_results.duplicate_clusters == 0:
             logger.info("No duplicate tasks found")
@@ -755,7 +1429,7 @@ def _run_deduplication(
                 print(f"  Would interactively resolve {total_would_delete} duplicate(s)")
             return {"obs_deleted": 0, "rem_deleted": 0}
         
-        interactive_session = is_interactive()
+        interactive_session = is_interactive() if interactive is None else interactive
         if not dry_run and not interactive_session:
             if show_summary:
                 print("\n⏭️ Skipping deduplication for automated run (no interactive terminal).")
@@ -775,6 +1449,7 @@ def _run_deduplication(
         
         # Interactive deduplication
         total_stats = {"obs_deleted": 0, "rem_deleted": 0}
+        kept_any = False
         
         for i, cluster in enumerate(duplicate_clusters, 1):
             try:
@@ -814,8 +1489,12 @@ def _run_deduplication(
                 kept_count = len(all_tasks) - len(tasks_to_delete)
                 print(f"   ✅ Kept {kept_count} task(s), deleted {len(tasks_to_delete)} task(s)")
             else:
-                print("   📝 Kept every task in this cluster.")
+                deduplicator.mark_kept(cluster)
+                kept_any = True
+                print("   📝 Kept every task in this cluster; it won't be shown again unless it changes.")
         
+        if kept_any:
+            index_store.save(vault_path, deduplicator.index)
         return total_stats
         
     except Exception as exc:
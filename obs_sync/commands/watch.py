@@ -0,0 +1,209 @@
+"""Watch command - keep vaults in sync by reacting to note changes."""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from ..core.config import SyncConfig
+from ..obsidian.ignore import IgnoreMatcher
+from ..obsidian.watcher import ChangeDebouncer, VaultWatcher, create_watcher
+from ..sync.engine import SyncEngine
+from ..sync.scope import SyncScope
+from .sync import SyncCommand, build_sync_engine, sync_command
+
+
+@dataclass
+class _WatchedVault:
+    """Per-vault state kept for the lifetime of a watch session."""
+
+    name: str
+    path: str
+    list_ids: Optional[List[str]]
+    watcher: VaultWatcher
+    engine: SyncEngine
+
+
+class WatchCommand:
+    """Command that watches vaults and syncs only the notes that changed.
+
+    Note edits trigger a scoped sync limited to the edited files, reusing one
+    engine per vault so manager caches stay warm between batches. Changes made
+    on the Reminders side, imports of new reminders and deduplication are left
+    to regular ``obs-sync sync`` runs (or ``--full-every``).
+    """
+
+    def __init__(self, config: SyncConfig, verbose: bool = False):
+        self.config = config
+        self.verbose = verbose
+        self.logger = logging.getLogger(__name__)
+        if verbose:
+            self.logger.setLevel(logging.DEBUG)
+        self._sync = SyncCommand(config, verbose=verbose)
+
+    def run(
+        self,
+        apply_changes: bool = False,
+        direction: str = "both",
+        debounce: float = 1.5,
+        max_delay: float = 10.0,
+        backend: str = "auto",
+        poll_interval: float = 2.0,
+        initial_sync: bool = True,
+        full_every: Optional[float] = None,
+        max_batches: Optional[int] = None,
+    ) -> bool:
+        """
+        Watch configured vaults until interrupted.
+
+        Args:
+            apply_changes: Apply changes instead of reporting them (dry-run)
+            direction: Sync direction passed through to each run
+            debounce: Seconds of quiet required before a batch is synced
+            max_delay: Upper bound in seconds between the first change of a
+                batch and its sync, even if edits keep arriving
+            backend: Watcher backend (auto, inotify, fsevents or polling)
+            poll_interval: Rescan interval for the polling backend
+            initial_sync: Run a full sync before watching starts
+            full_every: Optional interval in minutes for periodic full syncs
+            max_batches: Stop after this many synced batches (used by tests)
+
+        Returns:
+            True if the watch session ended without sync errors
+        """
+        vaults = self._prepare_vaults(direction, backend, poll_interval)
+        if not vaults:
+            return False
+
+        all_success = True
+        try:
+            if initial_sync:
+                all_success = self._sync.run(apply_changes=apply_changes, direction=direction)
+
+            mode = "applying changes" if apply_changes else "dry run"
+            print(f"\n👀 Watching {len(vaults)} vault(s) ({mode}). Press Ctrl+C to stop.")
+            for vault in vaults:
+                print(f"   • {vault.name} [{vault.watcher.backend_name}]")
+
+            debouncer = ChangeDebouncer(quiet=debounce, max_delay=max_delay)
+            by_key: Dict[Hashable, _WatchedVault] = {index: vault for index, vault in enumerate(vaults)}
+            full_interval = full_every * 60 if full_every else None
+            last_full = time.monotonic()
+            tick = max(0.05, min(0.5, debounce / 2)) / len(vaults)
+            batches = 0
+
+            while max_batches is None or batches < max_batches:
+                for index, vault in enumerate(vaults):
+                    debouncer.add(index, vault.watcher.poll(tick))
+
+                if full_interval and not debouncer and time.monotonic() - last_full >= full_interval:
+                    all_success = self._sync.run(apply_changes=apply_changes, direction=direction) and all_success
+                    last_full = time.monotonic()
+                    continue
+
+                if not debouncer.ready():
+                    continue
+
+                for key, changed in debouncer.drain().items():
+                    all_success = self._sync_batch(by_key[key], changed, apply_changes, direction) and all_success
+                batches += 1
+
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching.")
+        finally:
+            for vault in vaults:
+                vault.watcher.close()
+
+        return all_success
+
+    def _prepare_vaults(self, direction: str, backend: str, poll_interval: float) -> List[_WatchedVault]:
+        targets: List[Tuple[str, str, Optional[str], Optional[List[str]]]] = []
+        mappings = self.config.get_all_vault_mappings()
+        if mappings:
+            for vault, calendar_id in mappings:
+                vault_list_ids = self._sync._collect_list_ids_for_vault(vault, calendar_id)
+                targets.append((vault.name, vault.path, vault.vault_id, vault_list_ids or None))
+        elif self.config.default_vault_path:
+            vault_path = self.config.default_vault_path
+            default_vault = self.config.default_vault
+            targets.append((
+                os.path.basename(vault_path),
+                vault_path,
+                default_vault.vault_id if default_vault else None,
+                self.config.reminder_list_ids or None,
+            ))
+        else:
+            print("No Obsidian vault is configured. Run 'obs-sync setup' before watching.")
+            return []
+
+        vaults: List[_WatchedVault] = []
+        for name, path, vault_id, list_ids in targets:
+            if not os.path.exists(path):
+                print(f"⚠️ Skipping {name}: vault path not found at {path}")
+                continue
+            filters = self.config.get_vault_scan_filters(vault_id) if vault_id else {}
+            matcher = IgnoreMatcher.for_vault(
+                path,
+                exclude=filters.get("exclude", []),
+                include=filters.get("include", []),
+                respect_app_config=self.config.respect_obsidian_ignore,
+            )
+            watcher = create_watcher(
+                path, matcher, backend=backend, poll_interval=poll_interval, logger=self.logger
+            )
+            engine = build_sync_engine(self.config, direction=direction, logger=self.logger)
+            vaults.append(_WatchedVault(name, path, list_ids, watcher, engine))
+
+        if not vaults:
+            print("No configured vault could be watched.")
+        return vaults
+
+    def _sync_batch(
+        self,
+        vault: _WatchedVault,
+        changed: Optional[Set[str]],
+        apply_changes: bool,
+        direction: str,
+    ) -> bool:
+        if changed is None:
+            print(f"\n🔄 {vault.name}: change tracking was interrupted, running full sync...")
+            scope = None
+        else:
+            scope = SyncScope.for_files(changed)
+            label = next(iter(scope.files)) if len(scope.files) == 1 else f"{len(scope.files)} notes"
+            print(f"\n✏️  {vault.name}: {label} changed")
+
+        started = time.monotonic()
+        result = sync_command(
+            vault_path=vault.path,
+            list_ids=vault.list_ids,
+            dry_run=not apply_changes,
+            direction=direction,
+            config=self.config,
+            show_summary=False,
+            scope=scope,
+            engine=vault.engine,
+        )
+        elapsed = time.monotonic() - started
+
+        if not result.get("success"):
+            print(f"   ❌ Sync failed: {result.get('error', 'Unknown error')}")
+            return False
+
+        changes = result.get("results", {}).get("changes", {})
+        parts = [
+            f"{label} {changes[key]}"
+            for key, label in (
+                ("obs_updated", "obs updated"),
+                ("rem_updated", "rem updated"),
+                ("obs_created", "obs created"),
+                ("rem_created", "rem created"),
+                ("links_created", "links created"),
+            )
+            if changes.get(key)
+        ]
+        summary = ", ".join(parts) if parts else "no changes"
+        suffix = "" if apply_changes else " (dry run)"
+        print(f"   ✅ {summary} in {elapsed:.2f}s{suffix}")
+        return True
@@ -10,13 +10,34 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 import os
 import json
+import sys
 from .paths import get_path_manager
 
 
+# Task and link objects are created per task, so drop their per-instance
+# __dict__ where dataclasses support it (Python 3.10+). Timestamps keep their
+# ISO string and datetime types, because the resolver and insights compare
+# them directly; storing them as integers is left for a follow-up.
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings repeated across many tasks (vault, list, file and tag names)."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_tags(tags: Any) -> Any:
+    # In place: swapping a tag for an equal interned string is invisible to callers
+    if type(tags) is list:
+        for index, tag in enumerate(tags):
+            tags[index] = _intern(tag)
+    return tags
+
+
 def _normalize_path(path: str) -> str:
     """Expand user and convert to absolute path."""
     return os.path.abspath(os.path.expanduser(path))
@@ -501,26 +522,125 @@ class RemindersList:
     allows_modification: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
+class VaultRef:
+    """Vault identity shared by every task parsed from one vault."""
+
+    vault_id: str
+    name: str
+    path: str
+
+
+_NO_VAULT = VaultRef("", "", "")
+
+# Cleared when full; a process normally sees only a handful of vaults
+VAULT_REF_CACHE_SIZE = 256
+_VAULT_REFS: Dict[Tuple[str, str, str], VaultRef] = {}
+
+
+def _vault_ref(vault_id: str, name: str, path: str) -> VaultRef:
+    """The shared :class:`VaultRef` for these values."""
+    key = (vault_id, name, path)
+    ref = _VAULT_REFS.get(key)
+    if ref is None:
+        if len(_VAULT_REFS) >= VAULT_REF_CACHE_SIZE:
+            _VAULT_REFS.clear()
+        ref = _VAULT_REFS.setdefault(key, VaultRef(_intern(vault_id), _intern(name), _intern(path)))
+    return ref
+
+
+@dataclass(init=False, **_SLOTS)
 class ObsidianTask:
-    """Represents a task parsed from Obsidian."""
+    """Represents a task parsed from Obsidian.
+
+    The vault id, name and path live in one :class:`VaultRef` shared by all
+    tasks of a vault and are exposed as the ``vault_id``, ``vault_name`` and
+    ``vault_path`` properties.
+    """
 
     uuid: str
-    vault_id: str
-    vault_name: str
-    vault_path: str
+    vault: VaultRef
     file_path: str
     line_number: int
     block_id: Optional[str]
     status: TaskStatus
     description: str
     raw_line: str
-    due_date: Optional[date] = None
-    completion_date: Optional[date] = None
-    priority: Optional[Priority] = None
-    tags: List[str] = field(default_factory=list)
-    created_at: Optional[str] = None
-    modified_at: Optional[str] = None
+    due_date: Optional[date]
+    completion_date: Optional[date]
+    priority: Optional[Priority]
+    tags: List[str]
+    created_at: Optional[str]
+    modified_at: Optional[str]
+
+    def __init__(
+        self,
+        uuid: str,
+        vault_id: Optional[str] = None,
+        vault_name: Optional[str] = None,
+        vault_path: Optional[str] = None,
+        file_path: str = "",
+        line_number: int = 0,
+        block_id: Optional[str] = None,
+        status: TaskStatus = TaskStatus.TODO,
+        description: str = "",
+        raw_line: str = "",
+        due_date: Optional[date] = None,
+        completion_date: Optional[date] = None,
+        priority: Optional[Priority] = None,
+        tags: Optional[List[str]] = None,
+        created_at: Optional[str] = None,
+        modified_at: Optional[str] = None,
+        vault: Optional[VaultRef] = None,
+    ) -> None:
+        self.uuid = uuid
+        # dataclasses.replace() passes the existing ``vault`` through, together
+        # with any vault_id/vault_name/vault_path given as changes
+        if vault is not None and vault_id is None and vault_name is None and vault_path is None:
+            self.vault = vault
+        else:
+            base = vault or _NO_VAULT
+            self.vault = _vault_ref(
+                base.vault_id if vault_id is None else vault_id,
+                base.name if vault_name is None else vault_name,
+                base.path if vault_path is None else vault_path,
+            )
+        self.file_path = _intern(file_path)
+        self.line_number = line_number
+        self.block_id = block_id
+        self.status = status
+        self.description = description
+        self.raw_line = raw_line
+        self.due_date = due_date
+        self.completion_date = completion_date
+        self.priority = priority
+        self.tags = _intern_tags(tags if tags is not None else [])
+        self.created_at = created_at
+        self.modified_at = modified_at
+
+    @property
+    def vault_id(self) -> str:
+        return self.vault.vault_id
+
+    @vault_id.setter
+    def vault_id(self, value: str) -> None:
+        self.vault = _vault_ref(value, self.vault.name, self.vault.path)
+
+    @property
+    def vault_name(self) -> str:
+        return self.vault.name
+
+    @vault_name.setter
+    def vault_name(self, value: str) -> None:
+        self.vault = _vault_ref(self.vault.vault_id, value, self.vault.path)
+
+    @property
+    def vault_path(self) -> str:
+        return self.vault.path
+
+    @vault_path.setter
+    def vault_path(self, value: str) -> None:
+        self.vault = _vault_ref(self.vault.vault_id, self.vault.name, value)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -580,7 +700,7 @@ class ObsidianTask:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class RemindersTask:
     """Represents a task from Apple Reminders."""
 
@@ -599,6 +719,11 @@ class RemindersTask:
     modified_at: Optional[datetime] = None
     completion_date: Optional[date] = None
 
+    def __post_init__(self) -> None:
+        self.calendar_id = _intern(self.calendar_id)
+        self.list_name = _intern(self.list_name)
+        self.tags = _intern_tags(self.tags)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "uuid": self.uuid,
@@ -693,7 +818,7 @@ class RemindersTask:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SyncLink:
     """Represents a sync link between Obsidian and Reminders tasks."""
 
@@ -706,6 +831,9 @@ class SyncLink:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
 
+    def __post_init__(self) -> None:
+        self.vault_id = _intern(self.vault_id)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "obs_uuid": self.obs_uuid,
@@ -731,9 +859,48 @@ class SyncLink:
         )
 
 
+_INDEXED_FIELDS = frozenset({"vaults", "default_vault_id", "reminders_lists", "vault_mappings", "tag_routes"})
+
+
+class _ConfigIndex:
+    """Dict views over a :class:`SyncConfig`'s vault, list and route entries.
+
+    Each view keeps the first entry per key, matching the linear scans it
+    replaces.
+    """
+
+    def __init__(self, config: "SyncConfig"):
+        self.vaults: Dict[str, Vault] = {}
+        for vault in config.vaults:
+            self.vaults.setdefault(vault.vault_id, vault)
+        self.lists: Dict[str, RemindersList] = {}
+        for lst in config.reminders_lists:
+            if lst.identifier:
+                self.lists.setdefault(lst.identifier, lst)
+        self.mappings: Dict[Optional[str], Optional[str]] = {}
+        for mapping in config.vault_mappings:
+            self.mappings.setdefault(mapping.get("vault_id"), mapping.get("calendar_id"))
+        self.routes_by_vault: Dict[Optional[str], List[Dict[str, str]]] = {}
+        self.routes: Dict[Tuple[Optional[str], Optional[str]], Dict[str, str]] = {}
+        self.route_tags: Dict[Tuple[Optional[str], Optional[str]], Optional[str]] = {}
+        for route in config.tag_routes:
+            vault_id = route.get("vault_id")
+            self.routes_by_vault.setdefault(vault_id, []).append(route)
+            self.routes.setdefault((vault_id, route.get("tag")), route)
+            self.route_tags.setdefault((vault_id, route.get("calendar_id")), route.get("tag"))
+        self.default_vault = config._find_default_vault()
+
+
 @dataclass
 class SyncConfig:
-    """Configuration for sync operations."""
+    """Configuration for sync operations.
+
+    Vault, list, mapping and tag-route lookups go through dict indexes that
+    are rebuilt lazily after the config changes through its methods or by
+    assigning those fields (or ``default_vault_id``). Code that edits the
+    lists in place (appending, replacing or editing an entry, or flipping a
+    vault's ``is_default``) must call :meth:`invalidate_indexes` afterwards.
+    """
 
     vaults: List[Vault] = field(default_factory=list)
     default_vault_id: Optional[str] = None
@@ -742,17 +909,39 @@ class SyncConfig:
     calendar_ids: List[str] = field(default_factory=list)
     vault_mappings: List[Dict[str, str]] = field(default_factory=list)
     tag_routes: List[Dict[str, str]] = field(default_factory=list)
+    # Per-vault scan filters: {"vault_id", "exclude": [globs], "include": [globs]}
+    vault_scan_filters: List[Dict[str, Any]] = field(default_factory=list)
+    respect_obsidian_ignore: bool = True  # Honour "Excluded files" from .obsidian/app.json
     document_processing: DocumentProcessingConfig = field(default_factory=DocumentProcessingConfig)
     min_score: float = 0.75
     days_tolerance: int = 1
     include_completed: bool = False
     obsidian_inbox_path: str = "AppleRemindersInbox.md"
+    # Inbox rotation: "none", "dated" or "per-list" once the inbox reaches inbox_max_bytes
+    inbox_rotation: str = "none"
+    inbox_max_bytes: int = 512 * 1024
     obsidian_index_path: Optional[str] = None
     reminders_index_path: Optional[str] = None
+    # Refresh the Reminders snapshot at reminders_index_path on every fetch
+    reminders_snapshot_enabled: bool = True
     links_path: Optional[str] = None
+    # Run-history ledger (NDJSON, rotated at run_history_max_bytes)
+    run_history_path: Optional[str] = None
+    run_history_enabled: bool = True
+    run_history_max_bytes: int = 1024 * 1024
+    # Exit early when fingerprints show nothing changed since the last no-op run
+    skip_unchanged_runs: bool = True
+    # Serialise applied syncs; overlapping triggers wait (up to the timeout) or coalesce
+    run_lock_enabled: bool = True
+    run_lock_timeout: int = 900
+    # Vaults synced concurrently in a multi-vault run (1 keeps runs serial)
+    parallel_vaults: int = 1
     # Deduplication settings
     enable_deduplication: bool = True
     dedup_auto_apply: bool = False
+    # Also cluster similar descriptions (MinHash/LSH candidates, Dice-scored)
+    dedup_near_duplicates: bool = False
+    dedup_similarity_threshold: float = 0.6
     # Calendar integration settings
     sync_calendar_events: bool = False
     # Automation settings (macOS LaunchAgent)
@@ -793,6 +982,11 @@ class SyncConfig:
         else:
             self.links_path = _normalize_path(self.links_path)
 
+        if self.run_history_path is None:
+            self.run_history_path = str(manager.run_history_path)
+        else:
+            self.run_history_path = _normalize_path(self.run_history_path)
+
         self._normalize_tag_routes()
 
         if self.document_processing is None:
@@ -800,11 +994,33 @@ class SyncConfig:
         else:
             self.document_processing.apply_path_defaults()
 
+        self._index: Optional[_ConfigIndex] = None
+
+    # ------------------------------------------------------------------
+    # Lookup indexes
+    # ------------------------------------------------------------------
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _INDEXED_FIELDS:
+            object.__setattr__(self, "_index", None)
+
+    def _indexes(self) -> _ConfigIndex:
+        if self._index is None:
+            self._index = _ConfigIndex(self)
+        return self._index
+
+    def invalidate_indexes(self) -> None:
+        """Drop the lookup indexes after editing the indexed lists in place."""
+        self._index = None
+
     # ------------------------------------------------------------------
     # Convenience helpers
     # ------------------------------------------------------------------
     @property
     def default_vault(self) -> Optional[Vault]:
+        return self._indexes().default_vault
+
+    def _find_default_vault(self) -> Optional[Vault]:
         if not self.vaults:
             return None
         for vault in self.vaults:
@@ -833,6 +1049,18 @@ class SyncConfig:
     def has_reminder_lists(self) -> bool:
         return bool(self.reminders_lists)
 
+    def get_vault(self, vault_id: Optional[str]) -> Optional[Vault]:
+        """Return the configured vault with ``vault_id``, if any."""
+        if not vault_id:
+            return None
+        return self._indexes().vaults.get(vault_id)
+
+    def get_reminders_list(self, identifier: Optional[str]) -> Optional[RemindersList]:
+        """Return the configured Reminders list with ``identifier``, if any."""
+        if not identifier:
+            return None
+        return self._indexes().lists.get(identifier)
+
     def get_vault_mapping(self, vault_id: str) -> Optional[str]:
         """Get calendar ID mapped to a specific vault.
 
@@ -842,10 +1070,7 @@ class SyncConfig:
         Returns:
             Calendar ID if mapped, None otherwise
         """
-        for mapping in self.vault_mappings:
-            if mapping.get("vault_id") == vault_id:
-                return mapping.get("calendar_id")
-        return None
+        return self._indexes().mappings.get(vault_id)
 
     def set_vault_mapping(self, vault_id: str, calendar_id: str) -> None:
         """Set or update vault to calendar mapping.
@@ -864,6 +1089,7 @@ class SyncConfig:
             "vault_id": vault_id,
             "calendar_id": calendar_id
         })
+        self.invalidate_indexes()
 
     def get_all_vault_mappings(self) -> List[tuple[Vault, str]]:
         """Get all vault to calendar mappings as tuples.
@@ -872,32 +1098,27 @@ class SyncConfig:
             List of (Vault, calendar_id) tuples for configured mappings
         """
         result = []
+        vaults = self._indexes().vaults
         for mapping in self.vault_mappings:
             vault_id = mapping.get("vault_id")
             calendar_id = mapping.get("calendar_id")
-            if vault_id and calendar_id:
-                # Find the vault object
-                for vault in self.vaults:
-                    if vault.vault_id == vault_id:
-                        result.append((vault, calendar_id))
-                        break
+            if vault_id and calendar_id and vault_id in vaults:
+                result.append((vaults[vault_id], calendar_id))
         return result
 
     def get_tag_routes_for_vault(self, vault_id: str) -> List[Dict[str, str]]:
         """Return configured tag routing rules for a vault."""
         if not vault_id:
             return []
-        return [route.copy() for route in self.tag_routes if route.get("vault_id") == vault_id]
+        return [route.copy() for route in self._indexes().routes_by_vault.get(vault_id, [])]
 
     def get_tag_route(self, vault_id: str, tag: str) -> Optional[str]:
         """Look up calendar mapping for a specific tag within a vault."""
         normalized_tag = self._normalize_tag_value(tag)
         if not vault_id or not normalized_tag:
             return None
-        for route in self.tag_routes:
-            if route.get("vault_id") == vault_id and route.get("tag") == normalized_tag:
-                return route.get("calendar_id")
-        return None
+        route = self._indexes().routes.get((vault_id, normalized_tag))
+        return route.get("calendar_id") if route else None
 
     def set_tag_route(self, vault_id: str, tag: str, calendar_id: str, import_mode: str = "existing_only") -> None:
         """Create or update a tag routing rule for a vault."""
@@ -921,6 +1142,7 @@ class SyncConfig:
                 "import_mode": import_mode,
             }
         )
+        self.invalidate_indexes()
 
     def remove_tag_route(self, vault_id: str, tag: str) -> None:
         """Remove an existing tag routing rule for a vault."""
@@ -934,16 +1156,15 @@ class SyncConfig:
                 route.get("vault_id") == vault_id and route.get("tag") == normalized_tag
             )
         ]
+        self.invalidate_indexes()
 
     def get_tag_route_import_mode(self, vault_id: str, tag: str) -> str:
         """Get the import mode for a tag route, defaults to 'existing_only'."""
         normalized_tag = self._normalize_tag_value(tag)
         if not vault_id or not normalized_tag:
             return "existing_only"
-        for route in self.tag_routes:
-            if route.get("vault_id") == vault_id and route.get("tag") == normalized_tag:
-                return route.get("import_mode", "existing_only")
-        return "existing_only"
+        route = self._indexes().routes.get((vault_id, normalized_tag))
+        return route.get("import_mode", "existing_only") if route else "existing_only"
 
     def set_tag_route_import_mode(self, vault_id: str, tag: str, import_mode: str) -> None:
         """Update the import mode for an existing tag route."""
@@ -952,10 +1173,42 @@ class SyncConfig:
             return
         if import_mode not in ["existing_only", "full_import"]:
             import_mode = "existing_only"
-        for route in self.tag_routes:
-            if route.get("vault_id") == vault_id and route.get("tag") == normalized_tag:
-                route["import_mode"] = import_mode
-                break
+        route = self._indexes().routes.get((vault_id, normalized_tag))
+        if route is not None:
+            route["import_mode"] = import_mode
+            self.invalidate_indexes()
+
+    def get_vault_scan_filters(self, vault_id: str) -> Dict[str, List[str]]:
+        """Return the include/exclude globs configured for a vault."""
+        for entry in self.vault_scan_filters:
+            if entry.get("vault_id") == vault_id:
+                return {
+                    "exclude": list(entry.get("exclude", [])),
+                    "include": list(entry.get("include", [])),
+                }
+        return {"exclude": [], "include": []}
+
+    def set_vault_scan_filters(
+        self,
+        vault_id: str,
+        exclude: Optional[List[str]] = None,
+        include: Optional[List[str]] = None,
+    ) -> None:
+        """Create, update or clear the scan filters for a vault."""
+        if not vault_id:
+            return
+        self.vault_scan_filters = [
+            entry for entry in self.vault_scan_filters
+            if entry.get("vault_id") != vault_id
+        ]
+        exclude = [pattern for pattern in (exclude or []) if pattern]
+        include = [pattern for pattern in (include or []) if pattern]
+        if exclude or include:
+            self.vault_scan_filters.append({
+                "vault_id": vault_id,
+                "exclude": exclude,
+                "include": include,
+            })
 
     def remove_vault(self, vault_id: str) -> bool:
         """Remove a vault and all its associated data.
@@ -993,6 +1246,12 @@ class SyncConfig:
             route for route in self.tag_routes
             if route.get("vault_id") != vault_id
         ]
+
+        # Clear scan filters for this vault
+        self.vault_scan_filters = [
+            entry for entry in self.vault_scan_filters
+            if entry.get("vault_id") != vault_id
+        ]
         
         # Handle default vault changes
         if self.default_vault_id == vault_id:
@@ -1005,6 +1264,7 @@ class SyncConfig:
         # Update is_default flags for remaining vaults
         for vault in self.vaults:
             vault.is_default = (vault.vault_id == self.default_vault_id)
+        self.invalidate_indexes()
             
         return True
 
@@ -1058,6 +1318,7 @@ class SyncConfig:
             # Set first remaining list as default if any exist
             if self.reminders_lists:
                 self.default_calendar_id = self.reminders_lists[0].identifier
+        self.invalidate_indexes()
                 
         return True
 
@@ -1162,13 +1423,7 @@ class SyncConfig:
         """Return the configured tag for a vault/calendar combination if present."""
         if not vault_id or not calendar_id:
             return None
-        for route in self.tag_routes:
-            if (
-                route.get("vault_id") == vault_id
-                and route.get("calendar_id") == calendar_id
-            ):
-                return route.get("tag")
-        return None
+        return self._indexes().route_tags.get((vault_id, calendar_id))
 
     @staticmethod
     def _normalize_tag_value(tag: Optional[str]) -> Optional[str]:
@@ -1282,6 +1537,8 @@ class SyncConfig:
             calendar_ids=data.get("calendar_ids", []),
             vault_mappings=vault_mappings,
             tag_routes=data.get("tag_routes", []),
+            vault_scan_filters=data.get("vault_scan_filters", []),
+            respect_obsidian_ignore=sync_settings.get("respect_obsidian_ignore", True),
             document_processing=document_processing,
             min_score=min_score,
             days_tolerance=days_tolerance,
@@ -1289,6 +1546,17 @@ class SyncConfig:
             obsidian_inbox_path=sync_settings.get(
                 "obsidian_inbox_path", data.get("obsidian_inbox_path", "AppleRemindersInbox.md")
             ),
+            inbox_rotation=sync_settings.get("inbox_rotation", "none"),
+            inbox_max_bytes=sync_settings.get("inbox_max_bytes", 512 * 1024),
+            reminders_snapshot_enabled=sync_settings.get("reminders_snapshot_enabled", True),
+            run_history_enabled=sync_settings.get("run_history_enabled", True),
+            run_history_max_bytes=sync_settings.get("run_history_max_bytes", 1024 * 1024),
+            skip_unchanged_runs=sync_settings.get("skip_unchanged_runs", True),
+            run_lock_enabled=sync_settings.get("run_lock_enabled", True),
+            run_lock_timeout=sync_settings.get("run_lock_timeout", 900),
+            parallel_vaults=sync_settings.get("parallel_vaults", 1),
+            dedup_near_duplicates=sync_settings.get("dedup_near_duplicates", False),
+            dedup_similarity_threshold=sync_settings.get("dedup_similarity_threshold", 0.6),
             sync_calendar_events=sync_settings.get("sync_calendar_events", False),
             automation_enabled=sync_settings.get("automation_enabled", False),
             automation_interval=sync_settings.get("automation_interval", 3600),
@@ -1307,6 +1575,7 @@ class SyncConfig:
             links_path=paths.get(
                 "links", data.get("links_path", None)
             ),
+            run_history_path=paths.get("run_history"),
         )
 
         # Ensure a default vault id is recorded if one is marked.
@@ -1327,6 +1596,7 @@ class SyncConfig:
             # Ensure exactly one default by picking the first if none selected
             self.vaults[0].is_default = True
             self.default_vault_id = self.vaults[0].vault_id
+        self.invalidate_indexes()
 
         if self.document_processing is None:
             self.document_processing = DocumentProcessingConfig()
@@ -1358,12 +1628,25 @@ class SyncConfig:
             "calendar_ids": self.calendar_ids,
             "vault_mappings": self.vault_mappings,
             "tag_routes": self.tag_routes,
+            "vault_scan_filters": self.vault_scan_filters,
             "documents": self.document_processing.to_dict(),
             "sync": {
                 "min_score": self.min_score,
                 "days_tolerance": self.days_tolerance,
                 "include_completed": self.include_completed,
+                "respect_obsidian_ignore": self.respect_obsidian_ignore,
                 "obsidian_inbox_path": self.obsidian_inbox_path,
+                "inbox_rotation": self.inbox_rotation,
+                "inbox_max_bytes": self.inbox_max_bytes,
+                "reminders_snapshot_enabled": self.reminders_snapshot_enabled,
+                "run_history_enabled": self.run_history_enabled,
+                "run_history_max_bytes": self.run_history_max_bytes,
+                "skip_unchanged_runs": self.skip_unchanged_runs,
+                "run_lock_enabled": self.run_lock_enabled,
+                "run_lock_timeout": self.run_lock_timeout,
+                "parallel_vaults": self.parallel_vaults,
+                "dedup_near_duplicates": self.dedup_near_duplicates,
+                "dedup_similarity_threshold": self.dedup_similarity_threshold,
                 "sync_calendar_events": self.sync_calendar_events,
                 "automation_enabled": self.automation_enabled,
                 "automation_interval": self.automation_interval,
@@ -1378,6 +1661,7 @@ class SyncConfig:
                 "obsidian_index": self.obsidian_index_path,
                 "reminders_index": self.reminders_index_path,
                 "links": self.links_path,
+                "run_history": self.run_history_path,
             },
         }
 
@@ -25,6 +25,11 @@ class PathManager:
     SYNC_LINKS_FILE = "sync_links.json"
     OBSIDIAN_INDEX_FILE = "obsidian_tasks_index.json"
     REMINDERS_INDEX_FILE = "reminders_tasks_index.json"
+    RUN_HISTORY_FILE = "run_history.ndjson"
+    DAEMON_SOCKET_FILE = "obs-sync.sock"
+
+    # AF_UNIX socket paths are limited to ~104 bytes on macOS
+    MAX_SOCKET_PATH_LENGTH = 100
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         """Initialize path manager."""
@@ -275,6 +280,25 @@ class PathManager:
         """Get the Reminders tasks index file path."""
         return self.data_dir / self.REMINDERS_INDEX_FILE
     
+    @property
+    def run_history_path(self) -> Path:
+        """Get the run-history ledger path (one JSON record per sync)."""
+        return self.data_dir / self.RUN_HISTORY_FILE
+    
+    @property
+    def daemon_socket_path(self) -> Path:
+        """Get the IPC socket path used by ``obs-sync serve``.
+
+        Falls back to the temp directory when the working directory would
+        produce a socket path longer than the platform allows.
+        """
+        socket_path = self.working_dir / self.DAEMON_SOCKET_FILE
+        if len(str(socket_path)) <= self.MAX_SOCKET_PATH_LENGTH:
+            return socket_path
+        import tempfile
+        uid = os.getuid() if hasattr(os, "getuid") else "user"
+        return Path(tempfile.gettempdir()) / f"obs-sync-{uid}.sock"
+    
     def get_file_with_fallback(self, filename: str) -> Optional[Path]:
         """
         Get file path with fallback to legacy location if it exists there.
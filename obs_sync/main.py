@@ -9,26 +9,26 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import Any, List, Optional
 
-from obs_sync.core import SyncConfig
-from obs_sync.utils.macos import set_process_name
+from obs_sync import commands
 from obs_sync.core.config import load_config, save_config, get_default_config_path
-from obs_sync.commands import (
-    SetupCommand,
-    SyncCommand,
-    CalendarCommand,
-    InstallDepsCommand,
-    MigrateCommand,
-    UpdateCommand,
-    InsightsCommand,
-    ProcessCommand,
-    AutomationCommand,
-)
 
 
-def main(argv=None):
+def __getattr__(name: str) -> Any:
+    # Command classes (e.g. ``obs_sync.main.SyncCommand``) resolve lazily
+    if name in commands.__all__:
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _command(name: str) -> Any:
+    """Return a command class, importing its module on first use."""
+    return globals().get(name) or getattr(commands, name)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for obs-sync."""
-    set_process_name("obs-sync")
 
     parser = argparse.ArgumentParser(
         description="Bidirectional task sync between Obsidian and Apple Reminders",
@@ -39,6 +39,15 @@ Examples:
   obs-sync install-deps          # Install optional dependencies
   obs-sync sync                   # Run sync (dry-run by default)
   obs-sync sync --apply           # Apply sync changes
+  obs-sync sync --apply --if-busy queue  # Coalesce with a sync already running
+  obs-sync sync --apply --parallel 4    # Sync up to four vaults at once
+  obs-sync sync --apply --max-seconds 60  # Time-boxed run that resumes next time
+  obs-sync sync --apply --file Projects/Alpha.md  # Sync only one note's tasks
+  obs-sync watch --apply          # Sync notes as they are edited
+  obs-sync serve                  # Run the background sync daemon
+  obs-sync serve sync --apply     # Trigger a sync through the daemon
+  obs-sync bench                  # Time each sync subsystem on your setup
+  obs-sync stats --last 100       # Trends and percentiles from recent runs
   obs-sync calendar               # Sync calendar events to daily note
   obs-sync update                 # Update to latest version
         """
@@ -115,6 +124,188 @@ Examples:
         action='store_true',
         help='Automatically apply deduplication without prompting'
     )
+    sync_parser.add_argument(
+        '--near-duplicates',
+        action='store_true',
+        help='Also flag tasks with similar (not only identical) descriptions as duplicates'
+    )
+    sync_parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Sync even if nothing changed since the last run that found nothing to do'
+    )
+    sync_parser.add_argument(
+        '--if-busy',
+        choices=['wait', 'queue'],
+        default='wait',
+        help='If another applied sync is running: wait and reuse its result (default), '
+             'or queue one more pass for it and exit'
+    )
+    sync_parser.add_argument(
+        '--parallel',
+        type=int,
+        metavar='N',
+        help='Sync up to N vaults at once, sharing one Reminders fetch (default: parallel_vaults setting)'
+    )
+    sync_parser.add_argument(
+        '--max-seconds',
+        type=float,
+        metavar='SECONDS',
+        help='Stop applying changes after this long; the next run resumes the remaining work'
+    )
+    sync_parser.add_argument(
+        '--file',
+        dest='files',
+        action='append',
+        metavar='PATH',
+        help='Only sync tasks in this note (vault-relative or absolute); repeatable'
+    )
+    sync_parser.add_argument(
+        '--tag',
+        dest='tags',
+        action='append',
+        metavar='TAG',
+        help='Only sync tasks carrying this tag; repeatable'
+    )
+    sync_parser.add_argument(
+        '--trace',
+        metavar='PATH',
+        help='Write a Chrome trace (JSON) of sync phases, Reminders calls and file writes'
+    )
+    sync_parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Record peak memory per phase with tracemalloc (slower)'
+    )
+    
+    # Watch command
+    watch_parser = subparsers.add_parser('watch', help='Watch vaults and sync notes as they change')
+    watch_parser.add_argument(
+        '--apply',
+        action='store_true',
+        help='Apply changes (default is dry-run)'
+    )
+    watch_parser.add_argument(
+        '--direction',
+        choices=['both', 'obs-to-rem', 'rem-to-obs'],
+        default='both',
+        help='Sync direction'
+    )
+    watch_parser.add_argument(
+        '--debounce',
+        type=float,
+        default=1.5,
+        help='Seconds without further edits before changed notes are synced (default: 1.5)'
+    )
+    watch_parser.add_argument(
+        '--backend',
+        choices=['auto', 'inotify', 'fsevents', 'polling'],
+        default='auto',
+        help='File watching backend (default: auto)'
+    )
+    watch_parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=2.0,
+        help='Rescan interval in seconds for the polling backend (default: 2)'
+    )
+    watch_parser.add_argument(
+        '--no-initial-sync',
+        action='store_true',
+        help='Skip the full sync that normally runs before watching starts'
+    )
+    watch_parser.add_argument(
+        '--full-every',
+        type=float,
+        metavar='MINUTES',
+        help='Also run a full sync every N minutes to pick up Reminders-side changes'
+    )
+    
+    # Serve command (background daemon)
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Run the sync daemon or send it a request'
+    )
+    serve_parser.add_argument(
+        'action',
+        nargs='?',
+        choices=['run', 'status', 'sync', 'metrics', 'stop'],
+        default='run',
+        help='Run the daemon (default) or talk to a running one'
+    )
+    serve_parser.add_argument(
+        '--socket',
+        help='Path of the daemon IPC socket (default: inside the obs-sync working directory)'
+    )
+    serve_parser.add_argument(
+        '--apply',
+        action='store_true',
+        help='Apply changes for daemon syncs (default is dry-run)'
+    )
+    serve_parser.add_argument(
+        '--direction',
+        choices=['both', 'obs-to-rem', 'rem-to-obs'],
+        default='both',
+        help='Sync direction for daemon syncs'
+    )
+    serve_parser.add_argument(
+        '--interval',
+        type=float,
+        metavar='MINUTES',
+        help='While running, also sync automatically every N minutes'
+    )
+    serve_parser.add_argument(
+        '--timeout',
+        type=float,
+        help='Seconds to wait for the daemon to reply'
+    )
+    
+    # Bench command
+    bench_parser = subparsers.add_parser(
+        'bench',
+        help='Time vault scans, Reminders fetches, links and matching (read-only)'
+    )
+    bench_parser.add_argument(
+        '--probe',
+        action='append',
+        choices=['vaults', 'reminders', 'links', 'matcher'],
+        help='Only run this probe (repeatable; default: all)'
+    )
+    bench_parser.add_argument(
+        '--repeat',
+        type=int,
+        default=3,
+        help='Runs per probe; the fastest is reported (default: 3)'
+    )
+    bench_parser.add_argument(
+        '--sample',
+        type=int,
+        default=500,
+        help='Maximum tasks per side for the matcher probe (default: 500, 0 for all)'
+    )
+    bench_parser.add_argument(
+        '--json',
+        metavar='PATH',
+        help="Also write the report as JSON ('-' prints JSON instead of the text report)"
+    )
+    
+    # Stats command
+    stats_parser = subparsers.add_parser('stats', help='Show trends and percentiles from recent sync runs')
+    stats_parser.add_argument(
+        '--last',
+        type=int,
+        default=50,
+        help='Number of recent runs to include (default: 50)'
+    )
+    stats_parser.add_argument(
+        '--vault',
+        help='Only include runs for this vault name'
+    )
+    stats_parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print the summary as JSON'
+    )
     
     # Calendar command
     calendar_parser = subparsers.add_parser('calendar', help='Sync calendar to daily notes')
@@ -135,6 +326,11 @@ Examples:
         metavar='PATH',
         help='Export hygiene report to JSON file'
     )
+    insights_parser.add_argument(
+        '--live',
+        action='store_true',
+        help='Fetch from Reminders instead of the snapshot saved by the last sync'
+    )
     
     # Document processing command
     process_parser = subparsers.add_parser(
@@ -230,6 +426,10 @@ Examples:
     if not args.command:
         parser.print_help()
         return 1
+
+    # Deferred until a command actually runs: on macOS this loads PyObjC
+    from obs_sync.utils.macos import set_process_name
+    set_process_name("obs-sync")
     
     # Load configuration
     config = load_config(args.config)
@@ -242,13 +442,13 @@ Examples:
     # Execute command
     try:
         if args.command == 'setup':
-            cmd = SetupCommand(config, verbose=args.verbose)
+            cmd = _command('SetupCommand')(config, verbose=args.verbose)
             success = cmd.run(reconfigure=args.reconfigure, add=getattr(args, 'add', False))
             if success:
                 save_config(config, args.config)
             
         elif args.command == 'install-deps':
-            cmd = InstallDepsCommand(verbose=args.verbose)
+            cmd = _command('InstallDepsCommand')(verbose=args.verbose)
             success = cmd.run(
                 group=args.group,
                 auto=args.auto,
@@ -261,20 +461,80 @@ Examples:
                 config.enable_deduplication = False
             if hasattr(args, 'dedup_auto_apply') and args.dedup_auto_apply:
                 config.dedup_auto_apply = True
+            if getattr(args, 'near_duplicates', False):
+                config.dedup_near_duplicates = True
                 
-            cmd = SyncCommand(config, verbose=args.verbose)
-            success = cmd.run(apply_changes=args.apply, direction=args.direction)
+            cmd = _command('SyncCommand')(config, verbose=args.verbose)
+            run_options = {}
+            if getattr(args, 'trace', None):
+                run_options['trace_path'] = args.trace
+            if getattr(args, 'trace_memory', False):
+                run_options['trace_memory'] = True
+            if getattr(args, 'force', False):
+                run_options['force'] = True
+            if getattr(args, 'if_busy', 'wait') != 'wait':
+                run_options['if_busy'] = args.if_busy
+            if getattr(args, 'parallel', None):
+                run_options['parallel'] = args.parallel
+            if getattr(args, 'max_seconds', None) is not None:
+                run_options['max_seconds'] = args.max_seconds
+            if getattr(args, 'files', None):
+                run_options['files'] = args.files
+            if getattr(args, 'tags', None):
+                run_options['tags'] = args.tags
+            success = cmd.run(apply_changes=args.apply, direction=args.direction, **run_options)
+            
+        elif args.command == 'watch':
+            cmd = _command('WatchCommand')(config, verbose=args.verbose)
+            success = cmd.run(
+                apply_changes=args.apply,
+                direction=args.direction,
+                debounce=args.debounce,
+                backend=args.backend,
+                poll_interval=args.poll_interval,
+                initial_sync=not args.no_initial_sync,
+                full_every=args.full_every,
+            )
+            
+        elif args.command == 'serve':
+            cmd = _command('ServeCommand')(
+                config,
+                verbose=args.verbose,
+                config_path=str(args.config if args.config else get_default_config_path()),
+            )
+            success = cmd.run(
+                action=args.action,
+                socket_path=args.socket,
+                apply_changes=args.apply,
+                direction=args.direction,
+                interval=args.interval,
+                timeout=args.timeout,
+            )
+            
+        elif args.command == 'bench':
+            cmd = _command('BenchCommand')(config, verbose=args.verbose)
+            success = cmd.run(
+                probes=args.probe,
+                repeat=args.repeat,
+                sample=args.sample,
+                json_path=args.json,
+            )
+            
+        elif args.command == 'stats':
+            cmd = _command('StatsCommand')(config, verbose=args.verbose)
+            success = cmd.run(last=args.last, vault=args.vault, json_output=args.json)
             
         elif args.command == 'calendar':
-            cmd = CalendarCommand(config, verbose=args.verbose)
+            cmd = _command('CalendarCommand')(config, verbose=args.verbose)
             success = cmd.run(date_str=args.date, dry_run=args.dry_run)
             
         elif args.command == 'insights':
-            cmd = InsightsCommand(config, verbose=args.verbose)
-            success = cmd.run(export_json=args.export)
+            cmd = _command('InsightsCommand')(config, verbose=args.verbose)
+            insights_options = {'live': True} if getattr(args, 'live', False) else {}
+            success = cmd.run(export_json=args.export, **insights_options)
             
         elif args.command == 'process':
-            cmd = ProcessCommand(config, verbose=args.verbose)
+            cmd = _command('ProcessCommand')(config, verbose=args.verbose)
             success = cmd.run(
                 apply_changes=args.apply,
                 dry_run=True if getattr(args, 'dry_run', False) else None,
@@ -284,14 +544,14 @@ Examples:
             )
             
         elif args.command == 'update':
-            cmd = UpdateCommand(config, verbose=args.verbose)
+            cmd = _command('UpdateCommand')(config, verbose=args.verbose)
             success = cmd.run(extras=args.extras, channel=args.channel)
             if success:
                 save_config(config, args.config)
             
         elif args.command == 'migrate':
             # Migrate command doesn't need config
-            cmd = MigrateCommand(verbose=args.verbose)
+            cmd = _command('MigrateCommand')(verbose=args.verbose)
             if args.check:
                 success = cmd.run(check_only=True)
             elif args.apply or args.force:
@@ -303,7 +563,7 @@ Examples:
                     print("\n💡 Run 'obs-sync migrate --apply' to perform the migration.")
 
         elif args.command == 'automation':
-            cmd = AutomationCommand(config, verbose=args.verbose)
+            cmd = _command('AutomationCommand')(config, verbose=args.verbose)
             success = cmd.run(
                 action=args.action,
                 force=getattr(args, 'force', False)
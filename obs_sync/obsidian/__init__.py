@@ -5,11 +5,16 @@ Obsidian integration module for obs-sync.
 from .vault import VaultManager, find_vaults
 from .tasks import ObsidianTaskManager
 from .parser import parse_markdown_task, format_task_line
+from .index import VaultIndex, TaskLocation
+from .ignore import IgnoreMatcher
 
 __all__ = [
     'VaultManager',
     'find_vaults',
     'ObsidianTaskManager',
     'parse_markdown_task',
-    'format_task_line'
+    'format_task_line',
+    'VaultIndex',
+    'TaskLocation',
+    'IgnoreMatcher'
 ]
\ No newline at end of file
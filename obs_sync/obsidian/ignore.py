@@ -0,0 +1,211 @@
+"""
+Vault scan filters for Obsidian vaults.
+
+Combines the built-in system folder skip list, Obsidian's "Excluded files"
+setting (``userIgnoreFilters`` in ``.obsidian/app.json``) and per-vault
+include/exclude globs from the obs-sync config into a single matcher that is
+consulted while walking a vault, so excluded directories are pruned before
+``os.walk`` descends into them.
+"""
+
+import json
+import logging
+import os
+import re
+from typing import Iterable, Iterator, List, Pattern, Tuple
+
+# Directories that never contain user notes worth scanning
+DEFAULT_SKIP_DIRS = frozenset({'.obsidian', '.trash', '.git', 'node_modules'})
+
+APP_CONFIG_RELATIVE_PATH = os.path.join('.obsidian', 'app.json')
+
+_GLOB_CHARS = frozenset('*?[')
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a vault-relative glob into a regex fragment.
+
+    ``**`` matches across directory separators, ``*`` and ``?`` stay within a
+    single path segment.
+    """
+    parts: List[str] = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == '*':
+            if pattern[i:i + 3] == '**/':
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif char == '?':
+            parts.append('[^/]')
+        elif char == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return ''.join(parts)
+
+
+def load_obsidian_ignore_filters(vault_path: str) -> List[str]:
+    """Read ``userIgnoreFilters`` from a vault's ``.obsidian/app.json``."""
+    app_config = os.path.join(vault_path, APP_CONFIG_RELATIVE_PATH)
+    try:
+        with open(app_config, 'r', encoding='utf-8') as handle:
+            data = json.load(handle)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as exc:
+        logging.getLogger(__name__).debug("Could not read %s: %s", app_config, exc)
+        return []
+
+    filters = data.get('userIgnoreFilters') if isinstance(data, dict) else None
+    if not isinstance(filters, list):
+        return []
+    return [entry for entry in filters if isinstance(entry, str) and entry.strip()]
+
+
+class IgnoreMatcher:
+    """Compiled include/exclude rules for walking a vault.
+
+    Exclude patterns accept three forms:
+
+    * ``/regex/`` - a regular expression searched against the relative path,
+      as in Obsidian's "Excluded files" setting
+    * globs containing ``*``, ``?`` or ``[`` - matched against the full
+      relative path, or against the basename when the glob has no ``/``
+    * anything else - a plain path prefix, again mirroring Obsidian
+
+    Include patterns are globs; when present, only markdown files matching at
+    least one of them are returned.
+    """
+
+    def __init__(
+        self,
+        exclude: Iterable[str] = (),
+        include: Iterable[str] = (),
+        skip_dirs: Iterable[str] = DEFAULT_SKIP_DIRS,
+    ):
+        self.skip_dirs = frozenset(skip_dirs)
+        self.exclude_patterns: Tuple[str, ...] = tuple(p.strip() for p in exclude if p and p.strip())
+        self.include_patterns: Tuple[str, ...] = tuple(p.strip() for p in include if p and p.strip())
+
+        path_fragments: List[str] = []
+        name_fragments: List[str] = []
+        self._regexes: List[Pattern[str]] = []
+
+        for pattern in self.exclude_patterns:
+            if len(pattern) > 2 and pattern.startswith('/') and pattern.endswith('/'):
+                try:
+                    self._regexes.append(re.compile(pattern[1:-1]))
+                except re.error:
+                    logging.getLogger(__name__).warning("Ignoring invalid exclude regex: %s", pattern)
+                continue
+
+            normalized = pattern.replace('\\', '/').lstrip('/')
+            if _GLOB_CHARS.intersection(normalized):
+                if '/' in normalized.rstrip('/'):
+                    path_fragments.append(_glob_to_regex(normalized.rstrip('/')) + r'(?:/.*)?\Z')
+                else:
+                    name_fragments.append(_glob_to_regex(normalized.rstrip('/')) + r'\Z')
+            else:
+                path_fragments.append(re.escape(normalized))
+
+        self._exclude_path = re.compile('|'.join(f'(?:{f})' for f in path_fragments)) if path_fragments else None
+        self._exclude_name = re.compile('|'.join(f'(?:{f})' for f in name_fragments)) if name_fragments else None
+
+        include_fragments = []
+        for pattern in self.include_patterns:
+            normalized = pattern.replace('\\', '/').lstrip('/')
+            fragment = _glob_to_regex(normalized)
+            if '/' not in normalized:
+                fragment = '(?:.*/)?' + fragment
+            include_fragments.append(fragment + r'\Z')
+        self._include = re.compile('|'.join(f'(?:{f})' for f in include_fragments)) if include_fragments else None
+
+    @classmethod
+    def for_vault(
+        cls,
+        vault_path: str,
+        exclude: Iterable[str] = (),
+        include: Iterable[str] = (),
+        respect_app_config: bool = True,
+    ) -> "IgnoreMatcher":
+        """Build a matcher for a vault from app.json plus configured globs."""
+        patterns = list(exclude)
+        if respect_app_config:
+            patterns = load_obsidian_ignore_filters(vault_path) + patterns
+        return cls(exclude=patterns, include=include)
+
+    def _is_excluded(self, rel_path: str, name: str) -> bool:
+        if self._exclude_name is not None and self._exclude_name.match(name):
+            return True
+        if self._exclude_path is not None and self._exclude_path.match(rel_path):
+            return True
+        for regex in self._regexes:
+            if regex.search(rel_path):
+                return True
+        return False
+
+    def is_dir_excluded(self, rel_dir: str) -> bool:
+        """Return True when a vault-relative directory should not be walked."""
+        rel_dir = rel_dir.replace(os.sep, '/').strip('/')
+        name = rel_dir.rsplit('/', 1)[-1]
+        if name in self.skip_dirs:
+            return True
+        return self._is_excluded(rel_dir + '/', name)
+
+    def is_file_included(self, rel_path: str) -> bool:
+        """Return True when a vault-relative markdown file should be scanned."""
+        rel_path = rel_path.replace(os.sep, '/')
+        if not rel_path.endswith('.md'):
+            return False
+        if self._is_excluded(rel_path, rel_path.rsplit('/', 1)[-1]):
+            return False
+        if self._include is not None and not self._include.match(rel_path):
+            return False
+        return True
+
+    def should_scan(self, rel_path: str) -> bool:
+        """Return True when a note passes the filters, including its parent folders.
+
+        Used for paths that did not come from :meth:`iter_markdown_files`,
+        such as file-system events or explicitly requested notes.
+        """
+        rel_path = rel_path.replace(os.sep, '/').lstrip('/')
+        parts = rel_path.split('/')
+        for depth in range(1, len(parts)):
+            if self.is_dir_excluded('/'.join(parts[:depth])):
+                return False
+        return self.is_file_included(rel_path)
+
+    def iter_markdown_files(self, vault_path: str) -> Iterator[str]:
+        """Yield vault-relative paths of markdown files that pass the filters."""
+        for root, dirs, files in os.walk(vault_path):
+            rel_root = os.path.relpath(root, vault_path)
+            prefix = '' if rel_root == os.curdir else rel_root + os.sep
+
+            # Prune in place so os.walk never descends into excluded trees
+            dirs[:] = [d for d in dirs if not self.is_dir_excluded(prefix + d)]
+
+            for filename in files:
+                if not filename.endswith('.md'):
+                    continue
+                rel_path = prefix + filename
+                if self.is_file_included(rel_path):
+                    yield rel_path
+
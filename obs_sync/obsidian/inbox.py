@@ -0,0 +1,192 @@
+"""
+Buffered writer for the Reminders inbox note.
+
+Every Reminders → Obsidian creation lands in the inbox file. Instead of
+re-reading the note for each new task, the writer keeps the line count, byte
+size and block-ID set of each inbox file cached for the run, buffers the new
+task lines and appends them with a single write. Once an inbox grows past a
+configurable size, new tasks can be rotated into dated or per-list inbox files.
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Set, Tuple
+
+from .parser import parse_markdown_task
+from ..utils.tracing import traced
+
+INBOX_ROTATION_MODES = ("none", "dated", "per-list")
+
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|#^\[\]]+')
+
+
+@dataclass
+class InboxFileState:
+    """Cached view of one inbox file plus the lines waiting to be appended."""
+
+    rel_path: str
+    line_count: int = 0
+    size: int = 0
+    block_ids: Set[str] = field(default_factory=set)
+    ends_with_newline: bool = True
+    pending: List[str] = field(default_factory=list)
+    pending_tasks: int = 0
+    signature: Optional[Tuple[int, int]] = None
+
+    @property
+    def next_line_number(self) -> int:
+        return self.line_count + 1
+
+
+class InboxWriter:
+    """Appends new tasks to inbox files of a single vault.
+
+    Args:
+        vault_path: Path to the vault that owns the inbox files
+        rotation: One of ``INBOX_ROTATION_MODES``
+        max_bytes: Size at which new tasks are redirected to rotated files;
+            0 disables rotation
+        logger: Optional logger
+    """
+
+    def __init__(
+        self,
+        vault_path: str,
+        rotation: str = "none",
+        max_bytes: int = 0,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.vault_path = vault_path
+        self.rotation = rotation if rotation in INBOX_ROTATION_MODES else "none"
+        self.max_bytes = max(0, int(max_bytes or 0))
+        self.logger = logger or logging.getLogger(__name__)
+        self._files: Dict[str, InboxFileState] = {}
+
+    @property
+    def pending_count(self) -> int:
+        return sum(state.pending_tasks for state in self._files.values())
+
+    def _full_path(self, rel_path: str) -> str:
+        return os.path.join(self.vault_path, rel_path)
+
+    def _load(self, rel_path: str) -> InboxFileState:
+        full_path = self._full_path(rel_path)
+        state = InboxFileState(rel_path=rel_path)
+        try:
+            with open(full_path, "rb") as handle:
+                data = handle.read()
+                file_stat = os.fstat(handle.fileno())
+        except FileNotFoundError:
+            # New inbox: the heading is written together with the first task
+            title = os.path.basename(rel_path).replace(".md", "")
+            state.pending = [f"# {title}", ""]
+            state.line_count = 2
+            state.size = len(f"# {title}\n\n".encode("utf-8"))
+            return state
+
+        state.signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        state.size = len(data)
+        state.ends_with_newline = not data or data.endswith(b"\n")
+        state.line_count = data.count(b"\n") + (0 if state.ends_with_newline else 1)
+        for raw_line in data.splitlines():
+            if b"^" not in raw_line:
+                continue
+            task_data = parse_markdown_task(raw_line.decode("utf-8", errors="replace").rstrip())
+            if task_data and task_data.get("block_id"):
+                state.block_ids.add(task_data["block_id"])
+        return state
+
+    def state_for(self, rel_path: str) -> InboxFileState:
+        """Return the cached state for an inbox file, reloading it if it changed on disk."""
+        state = self._files.get(rel_path)
+        if state is not None and not state.pending_tasks:
+            try:
+                file_stat = os.stat(self._full_path(rel_path))
+                on_disk: Optional[Tuple[int, int]] = (file_stat.st_mtime_ns, file_stat.st_size)
+            except OSError:
+                on_disk = None
+            if on_disk != state.signature:
+                state = None
+        if state is None:
+            state = self._load(rel_path)
+            self._files[rel_path] = state
+        return state
+
+    def resolve_path(
+        self,
+        base_path: str,
+        list_name: Optional[str] = None,
+        today: Optional[date] = None,
+    ) -> str:
+        """Pick the inbox file for a new task, applying rotation if the base is full."""
+        if self.rotation == "none" or not self.max_bytes:
+            return base_path
+        if self.state_for(base_path).size < self.max_bytes:
+            return base_path
+
+        stem, ext = os.path.splitext(base_path)
+        ext = ext or ".md"
+        if self.rotation == "dated":
+            rotated_stem = f"{stem} {(today or date.today()).isoformat()}"
+        else:
+            safe_list = _UNSAFE_FILENAME_CHARS.sub("-", list_name or "Reminders").strip(" -") or "Reminders"
+            rotated_stem = f"{stem} - {safe_list}"
+
+        candidate = f"{rotated_stem}{ext}"
+        counter = 2
+        while self.state_for(candidate).size >= self.max_bytes:
+            candidate = f"{rotated_stem} ({counter}){ext}"
+            counter += 1
+        return candidate
+
+    def append(self, rel_path: str, line: str, block_id: Optional[str] = None) -> int:
+        """Buffer a task line for an inbox file.
+
+        Returns:
+            The line number the task will occupy once flushed
+        """
+        state = self.state_for(rel_path)
+        state.pending.append(line)
+        state.pending_tasks += 1
+        state.line_count += 1
+        state.size += len(line.encode("utf-8")) + 1
+        if block_id:
+            state.block_ids.add(block_id)
+        return state.line_count
+
+    @traced("obsidian.flush_inbox", "obsidian.write")
+    def flush(self) -> int:
+        """Write all buffered lines, one append per file.
+
+        Returns:
+            Number of task lines written
+        """
+        written = 0
+        for state in self._files.values():
+            if not state.pending_tasks:
+                continue
+            full_path = self._full_path(state.rel_path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+
+            payload = "\n".join(state.pending) + "\n"
+            if not state.ends_with_newline:
+                payload = "\n" + payload
+                state.size += 1
+            with open(full_path, "a", encoding="utf-8") as handle:
+                handle.write(payload)
+                handle.flush()
+                file_stat = os.fstat(handle.fileno())
+
+            written += state.pending_tasks
+            state.signature = (file_stat.st_mtime_ns, file_stat.st_size)
+            state.size = file_stat.st_size
+            state.ends_with_newline = True
+            state.pending = []
+            state.pending_tasks = 0
+
+        if written:
+            self.logger.debug("Appended %d task(s) to inbox files", written)
+        return written
@@ -0,0 +1,183 @@
+"""
+Line and byte-offset index for Obsidian tasks.
+
+The index records where every parsed task lives on disk (file, line number,
+byte offset and byte length) together with a cheap stat signature for each
+file. Write paths use it to jump straight to a task's line and patch it in
+place instead of re-reading and re-splitting the whole note.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+
+@dataclass
+class TaskLocation:
+    """Physical location of a task line inside a markdown file."""
+
+    uuid: str
+    file_path: str
+    line_number: int
+    offset: int
+    length: int
+    block_id: Optional[str] = None
+
+
+@dataclass
+class FileEntry:
+    """Stat signature and task membership for one indexed file."""
+
+    mtime_ns: int
+    size: int
+    task_uuids: List[str] = field(default_factory=list)
+    block_ids: Set[str] = field(default_factory=set)
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Return True when the on-disk file still matches this signature."""
+        return stat_result.st_mtime_ns == self.mtime_ns and stat_result.st_size == self.size
+
+
+class VaultIndex:
+    """Maps task UUIDs to byte-accurate locations within a vault.
+
+    Entries are only trusted while the owning file's ``(mtime_ns, size)``
+    signature is unchanged; any mismatch makes :meth:`lookup` return None so
+    callers fall back to a full scan of the file.
+    """
+
+    def __init__(self, vault_path: Optional[str] = None):
+        self.vault_path = vault_path
+        self._files: Dict[str, FileEntry] = {}
+        self._tasks: Dict[str, TaskLocation] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._tasks
+
+    # ------------------------------------------------------------------
+    # Population
+    # ------------------------------------------------------------------
+    def record_file(
+        self,
+        rel_path: str,
+        stat_result: os.stat_result,
+        locations: List[TaskLocation],
+    ) -> None:
+        """Replace all entries for a file with freshly parsed locations."""
+        self.forget_file(rel_path)
+        entry = FileEntry(mtime_ns=stat_result.st_mtime_ns, size=stat_result.st_size)
+        for location in locations:
+            entry.task_uuids.append(location.uuid)
+            if location.block_id:
+                entry.block_ids.add(location.block_id)
+            self._tasks[location.uuid] = location
+        self._files[rel_path] = entry
+
+    def forget_file(self, rel_path: str) -> None:
+        """Drop a file and every task location that belongs to it."""
+        entry = self._files.pop(rel_path, None)
+        if not entry:
+            return
+        for uuid in entry.task_uuids:
+            location = self._tasks.get(uuid)
+            if location and location.file_path == rel_path:
+                del self._tasks[uuid]
+
+    def clear(self) -> None:
+        self._files.clear()
+        self._tasks.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def files(self) -> Iterator[Tuple[str, FileEntry]]:
+        return iter(self._files.items())
+
+    def get_file(self, rel_path: str) -> Optional[FileEntry]:
+        return self._files.get(rel_path)
+
+    def block_ids_for(self, rel_path: str) -> Optional[Set[str]]:
+        """Return the block IDs known for a file if its entry is still fresh."""
+        entry = self._files.get(rel_path)
+        if not entry or not self._is_fresh(rel_path, entry):
+            return None
+        return set(entry.block_ids)
+
+    def lookup(self, uuid: str, vault_path: Optional[str] = None) -> Optional[TaskLocation]:
+        """Return the location for a task if the owning file is unchanged."""
+        location = self._tasks.get(uuid)
+        if not location:
+            return None
+        entry = self._files.get(location.file_path)
+        if not entry or not self._is_fresh(location.file_path, entry, vault_path):
+            return None
+        return location
+
+    def _is_fresh(self, rel_path: str, entry: FileEntry, vault_path: Optional[str] = None) -> bool:
+        root = vault_path or self.vault_path
+        if not root:
+            return False
+        try:
+            return entry.matches(os.stat(os.path.join(root, rel_path)))
+        except OSError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Mutation after in-place writes
+    # ------------------------------------------------------------------
+    def apply_patch(
+        self,
+        location: TaskLocation,
+        new_length: Optional[int],
+        stat_result: os.stat_result,
+        new_uuid: Optional[str] = None,
+        new_block_id: Optional[str] = None,
+    ) -> None:
+        """Shift sibling offsets after a line was rewritten or removed.
+
+        Args:
+            location: Location of the line that was patched
+            new_length: Byte length of the replacement line, or None if the
+                line was deleted
+            stat_result: Stat of the file after the write
+            new_uuid: Replacement UUID when the task identity changed
+            new_block_id: Replacement block ID when one was assigned
+        """
+        entry = self._files.get(location.file_path)
+        if entry is None:
+            return
+
+        delta = (new_length if new_length is not None else 0) - location.length
+        line_delta = 0 if new_length is not None else -1
+
+        for uuid in entry.task_uuids:
+            sibling = self._tasks.get(uuid)
+            if sibling is None or sibling is location:
+                continue
+            if sibling.offset > location.offset:
+                sibling.offset += delta
+                sibling.line_number += line_delta
+
+        if new_length is None:
+            entry.task_uuids = [uuid for uuid in entry.task_uuids if uuid != location.uuid]
+            if location.block_id:
+                entry.block_ids.discard(location.block_id)
+            self._tasks.pop(location.uuid, None)
+        else:
+            location.length = new_length
+            if new_block_id and new_block_id != location.block_id:
+                if location.block_id:
+                    entry.block_ids.discard(location.block_id)
+                location.block_id = new_block_id
+                entry.block_ids.add(new_block_id)
+            if new_uuid and new_uuid != location.uuid:
+                self._tasks.pop(location.uuid, None)
+                entry.task_uuids = [new_uuid if uuid == location.uuid else uuid for uuid in entry.task_uuids]
+                location.uuid = new_uuid
+                self._tasks[new_uuid] = location
+
+        entry.mtime_ns = stat_result.st_mtime_ns
+        entry.size = stat_result.st_size
@@ -5,19 +5,140 @@ import uuid
 import hashlib
 import base64
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 import logging
 
 from ..core.models import ObsidianTask, Priority, TaskStatus
+from ..utils.tracing import traced
+from .ignore import APP_CONFIG_RELATIVE_PATH, IgnoreMatcher
+from .inbox import InboxWriter
+from .index import TaskLocation, VaultIndex
 from .parser import format_task_line, parse_markdown_task
 
 
+def _line_terminator(raw: bytes) -> bytes:
+    """Return the line ending carried by a raw line (empty for the last line)."""
+    if raw.endswith(b"\r\n"):
+        return b"\r\n"
+    if raw.endswith(b"\n") or raw.endswith(b"\r"):
+        return raw[-1:]
+    return b""
+
+
 class ObsidianTaskManager:
     """Manages CRUD operations for Obsidian tasks."""
 
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
         self.include_completed = True  # Default to including completed tasks
+        self._indexes: Dict[str, VaultIndex] = {}
+        self._scan_settings: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], bool]] = {}
+        self._matchers: Dict[str, Tuple[Optional[int], IgnoreMatcher]] = {}
+        self._inbox_writers: Dict[str, InboxWriter] = {}
+        self.inbox_rotation = "none"
+        self.inbox_max_bytes = 0
+        # When True, create_task buffers lines until flush_appends() is called
+        self.defer_appends = False
+        # Notes read from disk over the manager's lifetime, for run statistics
+        self.files_read = 0
+
+    def get_index(self, vault_path: str) -> VaultIndex:
+        """Return the task location index for a vault, creating it on demand."""
+        index = self._indexes.get(vault_path)
+        if index is None:
+            index = VaultIndex(vault_path)
+            self._indexes[vault_path] = index
+        return index
+
+    def configure_inbox(self, rotation: str = "none", max_bytes: int = 0) -> None:
+        """Configure inbox rotation for tasks created by the sync.
+
+        Args:
+            rotation: "none", "dated" or "per-list"
+            max_bytes: Inbox size at which new tasks go to a rotated file
+        """
+        self.flush_appends()
+        self.inbox_rotation = rotation
+        self.inbox_max_bytes = max_bytes
+        self._inbox_writers.clear()
+
+    def get_inbox_writer(self, vault_path: str) -> InboxWriter:
+        """Return the inbox writer for a vault, creating it on demand."""
+        writer = self._inbox_writers.get(vault_path)
+        if writer is None:
+            writer = InboxWriter(
+                vault_path,
+                rotation=self.inbox_rotation,
+                max_bytes=self.inbox_max_bytes,
+                logger=self.logger,
+            )
+            self._inbox_writers[vault_path] = writer
+        return writer
+
+    def resolve_inbox_path(
+        self,
+        vault_path: str,
+        inbox_path: str,
+        list_name: Optional[str] = None,
+    ) -> str:
+        """Return the inbox file a new task should go to after rotation."""
+        return self.get_inbox_writer(vault_path).resolve_path(inbox_path, list_name=list_name)
+
+    def flush_appends(self) -> int:
+        """Write any task lines buffered by create_task.
+
+        Returns:
+            Number of task lines written
+        """
+        return sum(writer.flush() for writer in self._inbox_writers.values())
+
+    def configure_scan(
+        self,
+        vault_path: str,
+        exclude: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+        respect_app_config: bool = True,
+    ) -> None:
+        """Set the per-vault include/exclude globs used when listing tasks.
+
+        Args:
+            vault_path: Path to the vault
+            exclude: Additional exclude patterns from the obs-sync config
+            include: Include globs; when given only matching notes are scanned
+            respect_app_config: Whether to honour Obsidian's "Excluded files"
+        """
+        self._scan_settings[vault_path] = (
+            tuple(exclude or ()),
+            tuple(include or ()),
+            respect_app_config,
+        )
+        self._matchers.pop(vault_path, None)
+
+    def get_ignore_matcher(self, vault_path: str) -> IgnoreMatcher:
+        """Return the compiled scan filter for a vault.
+
+        The matcher is rebuilt only when ``.obsidian/app.json`` changes.
+        """
+        try:
+            app_mtime: Optional[int] = os.stat(
+                os.path.join(vault_path, APP_CONFIG_RELATIVE_PATH)
+            ).st_mtime_ns
+        except OSError:
+            app_mtime = None
+
+        cached = self._matchers.get(vault_path)
+        if cached is not None and cached[0] == app_mtime:
+            return cached[1]
+
+        exclude, include, respect_app_config = self._scan_settings.get(vault_path, ((), (), True))
+        matcher = IgnoreMatcher.for_vault(
+            vault_path,
+            exclude=exclude,
+            include=include,
+            respect_app_config=respect_app_config,
+        )
+        self._matchers[vault_path] = (app_mtime, matcher)
+        return matcher
 
     def _stable_uuid_for_task(
         self,
@@ -65,22 +186,36 @@ class ObsidianTaskManager:
         
         return block_id
 
-    def list_tasks(self, vault_path: str, include_completed: Optional[bool] = None) -> List[ObsidianTask]:
+    def list_tasks(
+        self,
+        vault_path: str,
+        include_completed: Optional[bool] = None,
+        files: Optional[Iterable[str]] = None,
+    ) -> List[ObsidianTask]:
         """List all tasks in a vault.
         
         Args:
             vault_path: Path to the vault
             include_completed: Whether to include completed tasks. If None, uses instance default.
+            files: Optional vault-relative note paths to restrict the scan to.
+                Paths that no longer exist or are excluded are skipped.
         """
         tasks: List[ObsidianTask] = []
 
-        for root, _dirs, files in os.walk(vault_path):
-            for filename in files:
-                if not filename.endswith(".md"):
-                    continue
-                file_path = os.path.join(root, filename)
-                rel_path = os.path.relpath(file_path, vault_path)
-                tasks.extend(self._parse_file(vault_path, rel_path))
+        # Make buffered inbox appends visible before scanning
+        self.flush_appends()
+
+        matcher = self.get_ignore_matcher(vault_path)
+        if files is None:
+            rel_paths: Iterable[str] = matcher.iter_markdown_files(vault_path)
+        else:
+            rel_paths = sorted(
+                rel_path for rel_path in {os.path.normpath(f) for f in files}
+                if matcher.should_scan(rel_path)
+                and os.path.isfile(os.path.join(vault_path, rel_path))
+            )
+        for rel_path in rel_paths:
+            tasks.extend(self._parse_file(vault_path, rel_path))
         
         # Filter out completed tasks if requested
         if include_completed is None:
@@ -92,28 +227,38 @@ class ObsidianTaskManager:
 
         return tasks
 
+    @traced("obsidian.parse_file", "obsidian.read", detail=lambda self, vault_path, rel_file_path: {"file": rel_file_path})
     def _parse_file(self, vault_path: str, rel_file_path: str) -> List[ObsidianTask]:
-        """Parse tasks from a single markdown file."""
+        """Parse tasks from a single markdown file and index their locations."""
         tasks: List[ObsidianTask] = []
         full_path = os.path.join(vault_path, rel_file_path)
 
         try:
-            # Get file modification time for timestamp initialization
-            file_stat = os.stat(full_path)
+            with open(full_path, "rb") as handle:
+                data = handle.read()
+                # Stat the open handle so the index signature matches what was read
+                file_stat = os.fstat(handle.fileno())
+            self.files_read += 1
             file_modified_time = datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc)
-            
-            with open(full_path, "r", encoding="utf-8") as handle:
-                lines = handle.readlines()
+
+            raw_lines = data.splitlines(keepends=True)
+            lines = [raw.decode("utf-8") for raw in raw_lines]
+            parsed_lines = [parse_markdown_task(line.rstrip()) for line in lines]
 
             # Collect existing block IDs to avoid collisions
-            existing_block_ids: Set[str] = set()
-            for line in lines:
-                task_data = parse_markdown_task(line.rstrip())
-                if task_data and task_data.get("block_id"):
-                    existing_block_ids.add(task_data["block_id"])
-
-            for line_num, raw_line in enumerate(lines, 1):
-                task_data = parse_markdown_task(raw_line.rstrip())
+            existing_block_ids: Set[str] = {
+                task_data["block_id"]
+                for task_data in parsed_lines
+                if task_data and task_data.get("block_id")
+            }
+
+            locations: List[TaskLocation] = []
+            offset = 0
+            for line_num, (raw_bytes, raw_line, task_data) in enumerate(
+                zip(raw_lines, lines, parsed_lines), 1
+            ):
+                line_offset = offset
+                offset += len(raw_bytes)
                 if not task_data:
                     continue
 
@@ -140,7 +285,7 @@ class ObsidianTaskManager:
                     block_id=block_id,
                     status=task_data["status"],
                     description=task_data["description"],
-                    raw_line=raw_line.rstrip("\n"),
+                    raw_line=raw_line.rstrip("\r\n"),
                     due_date=task_data.get("due_date"),
                     completion_date=task_data.get("completion_date"),
                     priority=task_data.get("priority"),
@@ -149,57 +294,50 @@ class ObsidianTaskManager:
                     modified_at=file_modified_time.isoformat(),
                 )
                 tasks.append(task)
+                locations.append(TaskLocation(
+                    uuid=task.uuid,
+                    file_path=rel_file_path,
+                    line_number=line_num,
+                    offset=line_offset,
+                    length=len(raw_bytes),
+                    block_id=block_id,
+                ))
+
+            self.get_index(vault_path).record_file(rel_file_path, file_stat, locations)
 
         except Exception as exc:  # pragma: no cover - defensive
             self.logger.error("Error parsing %s: %s", rel_file_path, exc)
 
         return tasks
     
+    @traced("obsidian.create_task", "obsidian.write")
     def create_task(
         self,
         vault_path: str,
         file_path: str,
         task: ObsidianTask,
     ) -> Optional[ObsidianTask]:
-        """Create a new task in a markdown file."""
-        full_path = os.path.join(vault_path, file_path)
-
-        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        """Create a new task in a markdown file.
 
-        if not os.path.exists(full_path):
-            with open(full_path, "w", encoding="utf-8") as handle:
-                title = os.path.basename(file_path).replace(".md", "")
-                handle.write(f"# {title}\n\n")
+        The line is appended straight away unless ``defer_appends`` is set, in
+        which case it is buffered until :meth:`flush_appends`.
+        """
+        writer = self.get_inbox_writer(vault_path)
+        state = writer.state_for(file_path)
 
         # Generate stable block ID if not provided
         if not task.block_id:
-            # Read existing file to collect existing block IDs for collision avoidance
-            existing_block_ids: Set[str] = set()
-            if os.path.exists(full_path):
-                with open(full_path, "r", encoding="utf-8") as handle:
-                    lines = handle.readlines()
-                for line in lines:
-                    task_data = parse_markdown_task(line.rstrip())
-                    if task_data and task_data.get("block_id"):
-                        existing_block_ids.add(task_data["block_id"])
-            
-            # Calculate line number where new task will be added
-            next_line_num = self._count_lines(full_path) + 1
-            
-            # Generate stable UUID based on task attributes
+            # Generate stable UUID based on where the task will be appended
             task.block_id = self._stable_uuid_for_task(
                 vault_path=vault_path,
                 file_path=file_path,
-                line_number=next_line_num,
+                line_number=state.next_line_number,
                 description=task.description,
-                existing_ids=existing_block_ids
+                existing_ids=state.block_ids
             )
-            # Update UUID to match the canonical format that list_tasks will generate
-            task.uuid = f"obs-{task.block_id}"
         
         # Always ensure UUID aligns with block_id, whether generated or provided
-        if task.block_id:
-            task.uuid = f"obs-{task.block_id}"
+        task.uuid = f"obs-{task.block_id}"
 
         new_line = format_task_line(
             description=task.description,
@@ -211,42 +349,114 @@ class ObsidianTaskManager:
             block_id=task.block_id,
         )
 
-        with open(full_path, "a", encoding="utf-8") as handle:
-            handle.write(f"{new_line}\n")
+        line_number = writer.append(file_path, new_line, task.block_id)
+        if not self.defer_appends:
+            writer.flush()
 
         current_time = datetime.now(timezone.utc).isoformat()
         task.vault_path = vault_path
         task.file_path = file_path
         task.raw_line = new_line
-        task.line_number = self._count_lines(full_path)
+        task.line_number = line_number
         task.created_at = current_time
         task.modified_at = current_time
 
         return task
 
-    def _count_lines(self, path: str) -> int:
-        with open(path, "r", encoding="utf-8") as handle:
-            return sum(1 for _ in handle)
+    def _lookup_location(self, task: ObsidianTask) -> Optional[TaskLocation]:
+        """Return the indexed location of a task if the index is still fresh.
+
+        A location recorded for another note (the task was moved, or its UUID
+        now belongs to a different line) is ignored.
+        """
+        index = self._indexes.get(task.vault_path)
+        if index is None:
+            return None
+        location = index.lookup(task.uuid)
+        if location is None or os.path.normpath(location.file_path) != os.path.normpath(task.file_path):
+            return None
+        return location
+
+    def _read_indexed_line(self, full_path: str, location: TaskLocation) -> bytes:
+        with open(full_path, "rb") as handle:
+            handle.seek(location.offset)
+            return handle.read(location.length)
+
+    def _location_matches(self, task: ObsidianTask, line: str) -> bool:
+        """Verify that an indexed line still holds the expected task."""
+        block_id = getattr(task, "block_id", None)
+        if block_id:
+            return f"^{block_id}" in line
+        parsed = parse_markdown_task(line)
+        if not parsed:
+            return False
+        raw_line = getattr(task, "raw_line", None)
+        if raw_line and " ".join(raw_line.split()) == " ".join(line.split()):
+            return True
+        return parsed.get("description") == getattr(task, "description", None)
 
+    def _patch_line(
+        self,
+        full_path: str,
+        location: TaskLocation,
+        new_bytes: Optional[bytes],
+    ) -> os.stat_result:
+        """Rewrite (or remove, when ``new_bytes`` is None) one indexed line.
+
+        Same-length replacements are written over the old bytes; otherwise only
+        the tail of the file after the line is rewritten.
+        """
+        with open(full_path, "r+b") as handle:
+            if new_bytes is not None and len(new_bytes) == location.length:
+                handle.seek(location.offset)
+                handle.write(new_bytes)
+            else:
+                handle.seek(location.offset + location.length)
+                tail = handle.read()
+                handle.seek(location.offset)
+                if new_bytes:
+                    handle.write(new_bytes)
+                handle.write(tail)
+                handle.truncate()
+            handle.flush()
+            return os.fstat(handle.fileno())
+
+    @traced("obsidian.update_task", "obsidian.write", detail=lambda self, task, changes: {"file": task.file_path})
     def update_task(self, task: ObsidianTask, changes: Dict) -> Optional[ObsidianTask]:
         """Update an existing task."""
+        self.flush_appends()
         file_path = os.path.join(task.vault_path, task.file_path)
 
         if not os.path.exists(file_path):
             self.logger.error("File not found for task update: %s", file_path)
             return None
 
-        with open(file_path, "r", encoding="utf-8") as handle:
-            lines = handle.readlines()
+        # Read only when the index cannot be used or block IDs must be collected
+        lines: List[str] = []
+        raw_bytes = b""
+        location = self._lookup_location(task)
+        if location is not None:
+            raw_bytes = self._read_indexed_line(file_path, location)
+            try:
+                current_line = raw_bytes.decode("utf-8").rstrip("\r\n")
+            except UnicodeDecodeError:
+                current_line = ""
+            if self._location_matches(task, current_line):
+                task.line_number = location.line_number
+            else:
+                location = None
 
-        if task.line_number <= 0 or task.line_number > len(lines):
-            return None
+        if location is None:
+            with open(file_path, "r", encoding="utf-8") as handle:
+                lines = handle.readlines()
 
-        line_index = task.line_number - 1
-        current_line = lines[line_index].rstrip("\n")
+            if task.line_number <= 0 or task.line_number > len(lines):
+                return None
 
-        if task.block_id and f"^{task.block_id}" not in current_line:
-            return None
+            current_line = lines[task.line_number - 1].rstrip("\n")
+
+            if task.block_id and f"^{task.block_id}" not in current_line:
+                return None
 
         parsed = parse_markdown_task(current_line)
         if not parsed:
@@ -278,11 +488,18 @@ class ObsidianTaskManager:
         # Generate stable block ID if task doesn't have one (helps with migration)
         if not task.block_id:
             # Collect existing block IDs to avoid collisions
-            existing_block_ids: Set[str] = set()
-            for line in lines:
-                task_data = parse_markdown_task(line.rstrip())
-                if task_data and task_data.get("block_id"):
-                    existing_block_ids.add(task_data["block_id"])
+            existing_block_ids: Optional[Set[str]] = None
+            if location is not None:
+                existing_block_ids = self.get_index(task.vault_path).block_ids_for(task.file_path)
+            if existing_block_ids is None:
+                if location is not None:
+                    with open(file_path, "r", encoding="utf-8") as handle:
+                        lines = handle.readlines()
+                existing_block_ids = set()
+                for line in lines:
+                    task_data = parse_markdown_task(line.rstrip())
+                    if task_data and task_data.get("block_id"):
+                        existing_block_ids.add(task_data["block_id"])
             
             # Generate stable UUID for this task
             task.block_id = self._stable_uuid_for_task(
@@ -307,24 +524,55 @@ class ObsidianTaskManager:
             indent=indent,
         )
 
-        lines[line_index] = f"{new_line}\n"
+        if location is not None:
+            new_bytes = new_line.encode("utf-8") + _line_terminator(raw_bytes)
+            file_stat = self._patch_line(file_path, location, new_bytes)
+            self.get_index(task.vault_path).apply_patch(
+                location,
+                len(new_bytes),
+                file_stat,
+                new_uuid=task.uuid,
+                new_block_id=task.block_id,
+            )
+        else:
+            lines[task.line_number - 1] = f"{new_line}\n"
 
-        with open(file_path, "w", encoding="utf-8") as handle:
-            handle.writelines(lines)
+            with open(file_path, "w", encoding="utf-8") as handle:
+                handle.writelines(lines)
+
+            # The full rewrite invalidated every offset recorded for this file
+            index = self._indexes.get(task.vault_path)
+            if index is not None:
+                index.forget_file(task.file_path)
 
         task.raw_line = new_line
         task.modified_at = datetime.now(timezone.utc).isoformat()
 
         return task
     
+    @traced("obsidian.delete_task", "obsidian.write", detail=lambda self, task: {"file": task.file_path})
     def delete_task(self, task: ObsidianTask) -> bool:
         """Delete a task from a markdown file."""
+        self.flush_appends()
         vault_path = task.vault_path
         file_path = os.path.join(vault_path, task.file_path)
         
         if not os.path.exists(file_path):
             return False
-        
+
+        # Fast path: remove the indexed line without re-reading the note
+        location = self._lookup_location(task)
+        if location is not None:
+            raw_bytes = self._read_indexed_line(file_path, location)
+            try:
+                current_line = raw_bytes.decode("utf-8").rstrip("\r\n")
+            except UnicodeDecodeError:
+                current_line = ""
+            if self._location_matches(task, current_line):
+                file_stat = self._patch_line(file_path, location, None)
+                self.get_index(vault_path).apply_patch(location, None, file_stat)
+                return True
+
         # Read file
         with open(file_path, 'r', encoding='utf-8') as handle:
             lines = handle.readlines()
@@ -342,6 +590,10 @@ class ObsidianTaskManager:
         
         with open(file_path, 'w', encoding='utf-8') as handle:
             handle.writelines(lines)
+
+        index = self._indexes.get(vault_path)
+        if index is not None:
+            index.forget_file(task.file_path)
         
         return True
 
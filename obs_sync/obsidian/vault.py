@@ -8,6 +8,7 @@ from typing import List, Optional
 from uuid import uuid4
 
 from obs_sync.core.models import Vault
+from obs_sync.obsidian.ignore import IgnoreMatcher
 
 
 def find_vaults(search_paths: Optional[List[str]] = None, max_depth: int = 2) -> List[Vault]:
@@ -103,28 +104,24 @@ class VaultManager:
         # Return first vault if no default set
         return self.vaults[0] if self.vaults else None
     
-    def iter_markdown_files(self, vault: Vault) -> List[str]:
+    def iter_markdown_files(self, vault: Vault, matcher: Optional[IgnoreMatcher] = None) -> List[str]:
         """
         Iterate through all markdown files in a vault.
         
+        System folders and Obsidian's "Excluded files" are skipped unless a
+        custom matcher is supplied.
+        
         Args:
             vault: Vault to search
+            matcher: Optional pre-built scan filter for the vault
         
         Returns:
             List of absolute paths to markdown files
         """
-        markdown_files = []
-        
-        # Directories to skip
-        skip_dirs = {'.obsidian', '.trash', '.git', 'node_modules'}
-        
-        for root, dirs, files in os.walk(vault.path):
-            # Filter out directories to skip
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
-            
-            # Find markdown files
-            for file in files:
-                if file.endswith('.md'):
-                    markdown_files.append(os.path.join(root, file))
+        if matcher is None:
+            matcher = IgnoreMatcher.for_vault(vault.path)
         
-        return markdown_files
\ No newline at end of file
+        return [
+            os.path.join(vault.path, rel_path)
+            for rel_path in matcher.iter_markdown_files(vault.path)
+        ]
\ No newline at end of file
@@ -0,0 +1,467 @@
+"""
+File-system watchers for Obsidian vaults.
+
+Three backends report which notes changed so a sync can be limited to them:
+
+* ``inotify`` on Linux, driven through ctypes (no extra dependencies)
+* ``fsevents`` on macOS, using PyObjC's FSEvents bindings when installed
+* ``polling``, a portable fallback that diffs ``(mtime, size)`` snapshots
+
+Every backend filters paths through the vault's :class:`IgnoreMatcher`, so
+excluded folders never trigger a sync. ``poll`` returns a set of
+vault-relative note paths, or None when events were lost and a full sync is
+needed.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import platform
+import queue
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .ignore import IgnoreMatcher
+
+WATCH_BACKENDS = ("auto", "inotify", "fsevents", "polling")
+
+
+class VaultWatcher:
+    """Base class for vault watchers."""
+
+    backend_name = "base"
+
+    def __init__(self, vault_path: str, matcher: Optional[IgnoreMatcher] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.vault_path = os.path.abspath(vault_path)
+        self.matcher = matcher or IgnoreMatcher.for_vault(vault_path)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def __enter__(self) -> "VaultWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Begin watching. Must be called before :meth:`poll`."""
+
+    def close(self) -> None:
+        """Release any OS resources held by the watcher."""
+
+    def poll(self, timeout: float) -> Optional[Set[str]]:
+        """Wait up to ``timeout`` seconds for changes.
+
+        Returns:
+            Vault-relative paths of changed notes (possibly empty), or None if
+            the backend lost track of events and the whole vault must be rescanned
+        """
+        raise NotImplementedError
+
+    def _accept(self, rel_path: str) -> bool:
+        return rel_path.endswith(".md") and self.matcher.should_scan(rel_path)
+
+    def _relative(self, path: str, root: Optional[str] = None) -> Optional[str]:
+        rel_path = os.path.relpath(path, root or self.vault_path)
+        if rel_path.startswith(os.pardir):
+            return None
+        return rel_path
+
+
+class PollingWatcher(VaultWatcher):
+    """Portable watcher that rescans note stats at a fixed interval."""
+
+    backend_name = "polling"
+
+    def __init__(self, vault_path: str, matcher: Optional[IgnoreMatcher] = None,
+                 interval: float = 2.0, logger: Optional[logging.Logger] = None):
+        super().__init__(vault_path, matcher, logger)
+        self.interval = max(0.1, interval)
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._last_scan = 0.0
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for rel_path in self.matcher.iter_markdown_files(self.vault_path):
+            try:
+                file_stat = os.stat(os.path.join(self.vault_path, rel_path))
+            except OSError:
+                continue
+            snapshot[rel_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+        return snapshot
+
+    def start(self) -> None:
+        self._snapshot = self._scan()
+        self._last_scan = time.monotonic()
+
+    def poll(self, timeout: float) -> Optional[Set[str]]:
+        wait = self._last_scan + self.interval - time.monotonic()
+        if wait > timeout:
+            time.sleep(max(0.0, timeout))
+            return set()
+        if wait > 0:
+            time.sleep(wait)
+
+        current = self._scan()
+        self._last_scan = time.monotonic()
+        previous = self._snapshot
+        self._snapshot = current
+
+        changed = {path for path, signature in current.items() if previous.get(path) != signature}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+
+# inotify constants from <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE
+    | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher(VaultWatcher):
+    """Linux watcher using one inotify watch per non-excluded directory."""
+
+    backend_name = "inotify"
+
+    def __init__(self, vault_path: str, matcher: Optional[IgnoreMatcher] = None,
+                 logger: Optional[logging.Logger] = None):
+        super().__init__(vault_path, matcher, logger)
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, str] = {}
+        self._libc: Optional[ctypes.CDLL] = None
+
+    @staticmethod
+    def is_supported() -> bool:
+        return sys.platform.startswith("linux")
+
+    def start(self) -> None:
+        library = ctypes.util.find_library("c") or "libc.so.6"
+        libc = self._libc = ctypes.CDLL(library, use_errno=True)
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        for root, dirs, _files in os.walk(self.vault_path):
+            rel_root = self._relative(root)
+            prefix = "" if rel_root is None or rel_root == os.curdir else rel_root + os.sep
+            dirs[:] = [d for d in dirs if not self.matcher.is_dir_excluded(prefix + d)]
+            self._add_watch(root)
+
+    def _add_watch(self, directory: str) -> None:
+        if self._libc is None or self._fd is None:
+            raise RuntimeError("Watcher has not been started")
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK | _IN_ONLYDIR
+        )
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR):
+                return
+            raise OSError(err, f"inotify_add_watch failed for {directory}: {os.strerror(err)}")
+        self._watches[wd] = directory
+
+    def _watch_new_tree(self, directory: str, changed: Set[str]) -> None:
+        """Watch a directory created after start and report notes already inside it."""
+        for root, dirs, files in os.walk(directory):
+            rel_root = self._relative(root)
+            prefix = "" if rel_root is None or rel_root == os.curdir else rel_root + os.sep
+            dirs[:] = [d for d in dirs if not self.matcher.is_dir_excluded(prefix + d)]
+            self._add_watch(root)
+            for filename in files:
+                rel_path = prefix + filename
+                if self._accept(rel_path):
+                    changed.add(rel_path)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+
+    def poll(self, timeout: float) -> Optional[Set[str]]:
+        if self._fd is None:
+            raise RuntimeError("Watcher has not been started")
+
+        readable, _, _ = select.select([self._fd], [], [], max(0.0, timeout))
+        if not readable:
+            return set()
+
+        changed: Set[str] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                wd, mask, _cookie, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & _IN_Q_OVERFLOW:
+                    self.logger.warning("inotify queue overflowed; requesting full sync")
+                    return None
+                if mask & _IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                rel_path = self._relative(path)
+                if rel_path is None:
+                    continue
+
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        if not self.matcher.is_dir_excluded(rel_path):
+                            self._watch_new_tree(path, changed)
+                    elif mask & _IN_MOVED_FROM:
+                        # A folder moved away: its notes are gone from this vault
+                        return None
+                    continue
+
+                if self._accept(rel_path):
+                    changed.add(rel_path)
+
+        return changed
+
+
+class FSEventsWatcher(VaultWatcher):
+    """macOS watcher backed by an FSEvents stream on a background run loop."""
+
+    backend_name = "fsevents"
+
+    # FSEvents flags (CoreServices/FSEvents.h)
+    _CREATE_FLAG_NO_DEFER = 0x00000002
+    _CREATE_FLAG_FILE_EVENTS = 0x00000010
+    _EVENT_FLAG_MUST_SCAN_SUBDIRS = 0x00000001
+    _EVENT_FLAG_USER_DROPPED = 0x00000002
+    _EVENT_FLAG_KERNEL_DROPPED = 0x00000004
+
+    def __init__(self, vault_path: str, matcher: Optional[IgnoreMatcher] = None,
+                 latency: float = 0.3, logger: Optional[logging.Logger] = None):
+        super().__init__(vault_path, matcher, logger)
+        self.latency = latency
+        self._events: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._run_loop: Any = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._real_root = os.path.realpath(self.vault_path)
+
+    @staticmethod
+    def is_supported() -> bool:
+        if platform.system() != "Darwin":
+            return False
+        try:
+            import FSEvents  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _callback(
+        self, _stream: Any, _info: Any, num_events: int, paths: Any, flags: Any, _ids: Any
+    ) -> None:
+        drop_mask = (
+            self._EVENT_FLAG_MUST_SCAN_SUBDIRS
+            | self._EVENT_FLAG_USER_DROPPED
+            | self._EVENT_FLAG_KERNEL_DROPPED
+        )
+        for index in range(num_events):
+            if flags[index] & drop_mask:
+                self._events.put(None)
+                continue
+            self._events.put(os.fsdecode(paths[index]))
+
+    def _run(self) -> None:
+        try:
+            import FSEvents
+            from CoreFoundation import CFRunLoopGetCurrent, CFRunLoopRun, kCFRunLoopDefaultMode
+
+            stream = FSEvents.FSEventStreamCreate(
+                None,
+                self._callback,
+                None,
+                [self.vault_path],
+                FSEvents.kFSEventStreamEventIdSinceNow,
+                self.latency,
+                self._CREATE_FLAG_NO_DEFER | self._CREATE_FLAG_FILE_EVENTS,
+            )
+            if stream is None:
+                raise OSError("FSEventStreamCreate returned NULL")
+            self._run_loop = CFRunLoopGetCurrent()
+            FSEvents.FSEventStreamScheduleWithRunLoop(stream, self._run_loop, kCFRunLoopDefaultMode)
+            if not FSEvents.FSEventStreamStart(stream):
+                raise OSError("FSEventStreamStart failed")
+        except BaseException as exc:  # surfaced to start()
+            self._error = exc
+            self._ready.set()
+            return
+
+        self._ready.set()
+        try:
+            CFRunLoopRun()
+        finally:
+            FSEvents.FSEventStreamStop(stream)
+            FSEvents.FSEventStreamInvalidate(stream)
+            FSEvents.FSEventStreamRelease(stream)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="obs-sync-fsevents", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=10)
+        if self._error is not None:
+            raise OSError(f"FSEvents watcher failed to start: {self._error}")
+
+    def close(self) -> None:
+        if self._run_loop is not None:
+            from CoreFoundation import CFRunLoopStop
+
+            CFRunLoopStop(self._run_loop)
+            self._run_loop = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def poll(self, timeout: float) -> Optional[Set[str]]:
+        try:
+            first = self._events.get(timeout=max(0.0, timeout))
+        except queue.Empty:
+            return set()
+
+        changed: Set[str] = set()
+        pending = [first]
+        while True:
+            try:
+                pending.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+
+        for path in pending:
+            if path is None:
+                self.logger.warning("FSEvents dropped events; requesting full sync")
+                return None
+            rel_path = self._relative(os.path.realpath(path), self._real_root)
+            if rel_path is not None and self._accept(rel_path):
+                changed.add(rel_path)
+        return changed
+
+
+def create_watcher(
+    vault_path: str,
+    matcher: Optional[IgnoreMatcher] = None,
+    backend: str = "auto",
+    poll_interval: float = 2.0,
+    logger: Optional[logging.Logger] = None,
+) -> VaultWatcher:
+    """Create and start the best available watcher for a vault.
+
+    With ``backend="auto"`` the native backend for the platform is tried first
+    and polling is used if it is unavailable or fails to start (for example
+    when the inotify watch limit is exhausted).
+    """
+    logger = logger or logging.getLogger(__name__)
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"Unknown watch backend '{backend}' (expected one of {', '.join(WATCH_BACKENDS)})")
+
+    candidates: List[Callable[[], VaultWatcher]] = []
+    if backend in ("auto", "inotify") and InotifyWatcher.is_supported():
+        candidates.append(lambda: InotifyWatcher(vault_path, matcher, logger=logger))
+    if backend in ("auto", "fsevents") and FSEventsWatcher.is_supported():
+        candidates.append(lambda: FSEventsWatcher(vault_path, matcher, logger=logger))
+    if backend in ("inotify", "fsevents") and not candidates:
+        logger.warning("Watch backend '%s' is not available here; falling back to polling", backend)
+
+    for factory in candidates:
+        watcher = factory()
+        try:
+            watcher.start()
+            return watcher
+        except OSError as exc:
+            logger.warning("%s watcher unavailable (%s); falling back", watcher.backend_name, exc)
+            watcher.close()
+
+    polling = PollingWatcher(vault_path, matcher, interval=poll_interval, logger=logger)
+    polling.start()
+    return polling
+
+
+class ChangeDebouncer:
+    """Coalesces bursts of change events per key.
+
+    A batch becomes ready once no new events arrived for ``quiet`` seconds, or
+    ``max_delay`` seconds after its first event, whichever comes first. A value
+    of None for a key means "full sync required" and absorbs any paths.
+    """
+
+    def __init__(self, quiet: float = 1.5, max_delay: float = 10.0):
+        self.quiet = quiet
+        self.max_delay = max(quiet, max_delay)
+        self._pending: Dict[Hashable, Optional[Set[str]]] = {}
+        self._first_event: Optional[float] = None
+        self._last_event: Optional[float] = None
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def add(self, key: Hashable, paths: Optional[Iterable[str]], now: Optional[float] = None) -> None:
+        if paths is not None:
+            paths = set(paths)
+            if not paths:
+                return
+        now = time.monotonic() if now is None else now
+        if paths is None:
+            self._pending[key] = None
+        elif key not in self._pending:
+            self._pending[key] = set(paths)
+        else:
+            pending = self._pending[key]
+            if pending is not None:
+                pending.update(paths)
+        if self._first_event is None:
+            self._first_event = now
+        self._last_event = now
+
+    def ready(self, now: Optional[float] = None) -> bool:
+        if not self._pending or self._first_event is None or self._last_event is None:
+            return False
+        now = time.monotonic() if now is None else now
+        return (now - self._last_event >= self.quiet) or (now - self._first_event >= self.max_delay)
+
+    def drain(self) -> Dict[Hashable, Optional[Set[str]]]:
+        pending = self._pending
+        self._pending = {}
+        self._first_event = None
+        self._last_event = None
+        return pending
@@ -3,7 +3,7 @@
 import threading
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Protocol, Tuple
 from dataclasses import dataclass, field
 import logging
 
@@ -13,6 +13,7 @@ from obs_sync.core.exceptions import (
     EventKitImportError
 )
 from obs_sync.utils.tags import decode_tags_from_notes, encode_tags_in_notes
+from obs_sync.utils.tracing import traced
 
 
 @dataclass
@@ -32,6 +33,17 @@ class ReminderData:
     modified_at: Optional[str] = None
 
 
+class ReminderSource(Protocol):
+    """What :class:`~obs_sync.reminders.tasks.RemindersTaskManager` reads reminders from.
+
+    :class:`RemindersGateway` and read-only stand-ins such as
+    :class:`~obs_sync.reminders.snapshot.SnapshotGateway` both qualify; managers
+    that write also need the gateway's create/update/delete methods.
+    """
+
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]: ...
+
+
 class RemindersGateway:
     """Simplified gateway for Apple Reminders via EventKit."""
     
@@ -39,6 +51,11 @@ class RemindersGateway:
         self.logger = logger or logging.getLogger(__name__)
         self._store = None
         self._authorized = False
+        # EventKit round trips per operation, for run statistics
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
         
     def _ensure_eventkit(self):
         """Import and initialize EventKit with specific error handling."""
@@ -215,8 +232,10 @@ class RemindersGateway:
 
         return self._store
     
+    @traced("reminders.get_lists", "reminders")
     def get_lists(self) -> List[Dict[str, str]]:
         """Get all reminder lists."""
+        self._count("get_lists")
         try:
             store = self._get_store()
         except (EventKitImportError, AuthorizationError, RemindersError) as e:
@@ -243,8 +262,8 @@ class RemindersGateway:
                 "The EventKit store may be in an invalid state."
             )
     
-    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
-        """Get reminders from specified lists."""
+    def _fetch_raw_reminders(self, list_ids: Optional[List[str]] = None) -> List[Any]:
+        """Fetch EKReminder objects from the given lists (all lists if None)."""
         try:
             store = self._get_store()
         except (EventKitImportError, AuthorizationError, RemindersError) as e:
@@ -313,131 +332,233 @@ class RemindersGateway:
                 f"Failed to fetch reminders: {e}\n"
                 "The EventKit fetch operation encountered an unexpected error."
             )
-        
+
+        return reminders
+
+    @traced("reminders.get_reminders", "reminders")
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
+        """Get reminders from specified lists."""
+        self._count("get_reminders")
+        reminders = self._fetch_raw_reminders(list_ids)
+
         # Convert to ReminderData
         result = []
         for rem in reminders:
+            data = self._to_reminder_data(rem)
+            if data is not None:
+                result.append(data)
+
+        return result
+
+    @traced("reminders.get_changed_reminders", "reminders")
+    def get_changed_reminders(
+        self, list_ids: Optional[List[str]], known: Dict[str, str]
+    ) -> Tuple[List[ReminderData], List[str]]:
+        """Get reminders from specified lists, converting only modified ones.
+
+        Args:
+            list_ids: Lists to fetch (all lists if None)
+            known: ``{uuid: modified_at}`` recorded by the last fetch
+
+        Returns:
+            Converted reminders that are new or whose ``lastModifiedDate``
+            differs from ``known``, and the identifiers of the rest
+        """
+        self._count("get_changed_reminders")
+        changed: List[ReminderData] = []
+        unchanged: List[str] = []
+        for rem in self._fetch_raw_reminders(list_ids):
             try:
-                # Extract data
                 uuid = str(rem.calendarItemIdentifier())
-                title = str(rem.title() or '')
-                completed = bool(rem.isCompleted())
-                
-                # Due date
-                due_date = None
-                due_components = rem.dueDateComponents()
-                if due_components:
-                    try:
-                        year = due_components.year()
-                        month = due_components.month()
-                        day = due_components.day()
-                        if year and month and day:
-                            due_date = f"{year:04d}-{month:02d}-{day:02d}"
-                    except:
-                        pass
-                
-                # Priority
-                priority = None
-                try:
-                    prio_num = int(rem.priority())
-                    if prio_num == 0:
-                        priority = None  # No priority set
-                    elif prio_num == 1:
-                        priority = "high"
-                    elif prio_num <= 5:
-                        priority = "medium"
-                    elif prio_num >= 9:
-                        priority = "low"
-                except:
-                    pass
-                
-                # Notes and Tags
-                notes = None
-                tags = []
-                try:
-                    if rem.notes():
-                        raw_notes = str(rem.notes())
-                        # Decode tags from notes field
-                        notes, tags = decode_tags_from_notes(raw_notes)
-                except:
-                    pass
-                
-                # URL (preserve dedicated reminder links)
-                url = None
-                try:
-                    url_obj = None
-                    if hasattr(rem, "URL"):
-                        url_obj = rem.URL()
-                    elif hasattr(rem, "url"):
-                        url_obj = rem.url()
-                    elif hasattr(rem, "valueForKey_"):
-                        url_obj = rem.valueForKey_("URL")
-                    if url_obj:
-                        if hasattr(url_obj, "absoluteString"):
-                            url_value = str(url_obj.absoluteString())
-                        else:
-                            url_value = str(url_obj)
-                        url_value = url_value.strip()
-                        url = url_value if url_value else None
-                except Exception:
-                    pass
-                
-                # List info
-                list_id = None
-                list_name = None
-                try:
-                    cal = rem.calendar()
-                    if cal:
-                        list_id = str(cal.calendarIdentifier())
-                        list_name = str(cal.title() or 'Untitled')
-                except:
-                    pass
-                
-                # Timestamps
-                created_at = None
-                modified_at = None
-                try:
-                    if rem.creationDate():
-                        created_at = datetime.fromtimestamp(
-                            rem.creationDate().timeIntervalSince1970(),
-                            tz=timezone.utc
-                        ).isoformat()
-                except:
-                    pass
-                
+                recorded = known.get(uuid)
+                modified = rem.lastModifiedDate() if recorded else None
+                if modified and datetime.fromtimestamp(
+                    modified.timeIntervalSince1970(), tz=timezone.utc
+                ).isoformat() == recorded:
+                    unchanged.append(uuid)
+                    continue
+            except Exception as e:
+                self.logger.debug(f"Converting reminder without change check: {e}")
+            data = self._to_reminder_data(rem)
+            if data is not None:
+                changed.append(data)
+        return changed, unchanged
+
+    def _to_reminder_data(self, rem: Any) -> Optional[ReminderData]:
+        """Convert an ``EKReminder`` into :class:`ReminderData`."""
+        try:
+            # Extract data
+            uuid = str(rem.calendarItemIdentifier())
+            title = str(rem.title() or '')
+            completed = bool(rem.isCompleted())
+            
+            # Due date
+            due_date = None
+            due_components = rem.dueDateComponents()
+            if due_components:
                 try:
-                    if rem.lastModifiedDate():
-                        modified_at = datetime.fromtimestamp(
-                            rem.lastModifiedDate().timeIntervalSince1970(),
-                            tz=timezone.utc
-                        ).isoformat()
+                    year = due_components.year()
+                    month = due_components.month()
+                    day = due_components.day()
+                    if year and month and day:
+                        due_date = f"{year:04d}-{month:02d}-{day:02d}"
                 except:
                     pass
-                
-                result.append(ReminderData(
-                    uuid=uuid,
-                    title=title,
-                    completed=completed,
-                    due_date=due_date,
-                    priority=priority,
-                    url=url,
-                    notes=notes,
-                    tags=tags,  # Include decoded tags
-                    list_id=list_id,
-                    list_name=list_name,
-                    created_at=created_at,
-                    modified_at=modified_at
-                ))
-                
+            
+            # Priority
+            priority = None
+            try:
+                prio_num = int(rem.priority())
+                if prio_num == 0:
+                    priority = None  # No priority set
+                elif prio_num == 1:
+                    priority = "high"
+                elif prio_num <= 5:
+                    priority = "medium"
+                elif prio_num >= 9:
+                    priority = "low"
+            except:
+                pass
+            
+            # Notes and Tags
+            notes = None
+            tags = []
+            try:
+                if rem.notes():
+                    raw_notes = str(rem.notes())
+                    # Decode tags from notes field
+                    notes, tags = decode_tags_from_notes(raw_notes)
+            except:
+                pass
+            
+            # URL (preserve dedicated reminder links)
+            url = None
+            try:
+                url_obj = None
+                if hasattr(rem, "URL"):
+                    url_obj = rem.URL()
+                elif hasattr(rem, "url"):
+                    url_obj = rem.url()
+                elif hasattr(rem, "valueForKey_"):
+                    url_obj = rem.valueForKey_("URL")
+                if url_obj:
+                    if hasattr(url_obj, "absoluteString"):
+                        url_value = str(url_obj.absoluteString())
+                    else:
+                        url_value = str(url_obj)
+                    url_value = url_value.strip()
+                    url = url_value if url_value else None
+            except Exception:
+                pass
+            
+            # List info
+            list_id = None
+            list_name = None
+            try:
+                cal = rem.calendar()
+                if cal:
+                    list_id = str(cal.calendarIdentifier())
+                    list_name = str(cal.title() or 'Untitled')
+            except:
+                pass
+            
+            # Timestamps
+            created_at = None
+            modified_at = None
+            try:
+                if rem.creationDate():
+                    created_at = datetime.fromtimestamp(
+                        rem.creationDate().timeIntervalSince1970(),
+                        tz=timezone.utc
+                    ).isoformat()
+            except:
+                pass
+            
+            try:
+                if rem.lastModifiedDate():
+                    modified_at = datetime.fromtimestamp(
+                        rem.lastModifiedDate().timeIntervalSince1970(),
+                        tz=timezone.utc
+                    ).isoformat()
+            except:
+                pass
+            
+            return ReminderData(
+                uuid=uuid,
+                title=title,
+                completed=completed,
+                due_date=due_date,
+                priority=priority,
+                url=url,
+                notes=notes,
+                tags=tags,  # Include decoded tags
+                list_id=list_id,
+                list_name=list_name,
+                created_at=created_at,
+                modified_at=modified_at
+            )
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to process reminder: {e}")
+            return None
+
+    @traced("reminders.get_reminders_by_ids", "reminders")
+    def get_reminders_by_ids(self, uuids: List[str]) -> List[ReminderData]:
+        """Get specific reminders by identifier, without fetching their lists.
+
+        Identifiers that no longer resolve (deleted reminders) are skipped.
+        """
+        self._count("get_reminders_by_ids")
+        store = self._get_store()
+        result = []
+        for uuid in uuids:
+            try:
+                rem = store.calendarItemWithIdentifier_(uuid)
             except Exception as e:
-                self.logger.warning(f"Failed to process reminder: {e}")
+                self.logger.debug(f"Failed to look up reminder {uuid}: {e}")
                 continue
-        
+            if rem is None:
+                continue
+            data = self._to_reminder_data(rem)
+            if data is not None:
+                result.append(data)
         return result
-    
+
+    @traced("reminders.get_list_fingerprints", "reminders")
+    def get_list_fingerprints(self, list_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Summarise lists without converting their reminders.
+
+        Returns ``{list_id: {"count": n, "max_modified": iso | None}}``. Only
+        the identifier, list and modification date of each reminder are read,
+        which is far cheaper than building full :class:`ReminderData` records.
+        """
+        self._count("get_list_fingerprints")
+        summary: Dict[str, Dict[str, Any]] = {
+            list_id: {"count": 0, "max_modified": None} for list_id in (list_ids or [])
+        }
+        latest: Dict[str, float] = {}
+        for rem in self._fetch_raw_reminders(list_ids):
+            try:
+                cal = rem.calendar()
+                list_id = str(cal.calendarIdentifier()) if cal else ""
+                entry = summary.setdefault(list_id, {"count": 0, "max_modified": None})
+                entry["count"] += 1
+                modified = rem.lastModifiedDate()
+                if modified:
+                    stamp = modified.timeIntervalSince1970()
+                    if stamp > latest.get(list_id, float("-inf")):
+                        latest[list_id] = stamp
+            except Exception as e:
+                self.logger.debug(f"Skipping reminder in fingerprint: {e}")
+        for list_id, stamp in latest.items():
+            summary[list_id]["max_modified"] = datetime.fromtimestamp(stamp, tz=timezone.utc).isoformat()
+        return summary
+
+    @traced("reminders.create_reminder", "reminders")
     def create_reminder(self, title: str, list_id: Optional[str] = None,
                        **properties) -> Optional[str]:
         """Create a new reminder."""
+        self._count("create_reminder")
         try:
             from EventKit import EKReminder
             from Foundation import NSDateComponents, NSURL
@@ -521,8 +642,10 @@ class RemindersGateway:
         
         return None
     
+    @traced("reminders.update_reminder", "reminders")
     def update_reminder(self, uuid: str, **updates) -> bool:
         """Update an existing reminder."""
+        self._count("update_reminder")
         try:
             from Foundation import NSDateComponents, NSURL
             
@@ -631,8 +754,10 @@ class RemindersGateway:
             self.logger.error(f"Failed to update reminder: {e}")
             return False
     
+    @traced("reminders.delete_reminder", "reminders")
     def delete_reminder(self, uuid: str) -> bool:
         """Delete a reminder."""
+        self._count("delete_reminder")
         try:
             store = self._get_store()
             
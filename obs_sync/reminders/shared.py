@@ -0,0 +1,221 @@
+"""
+One Reminders fetch shared by several vault syncs.
+
+Syncing vaults in parallel would otherwise fetch the same lists once per vault
+and drive EventKit from several threads at once. :class:`SharedRemindersFetch`
+fetches the union of the vaults' lists once, serves each vault a filtered
+copy through a :class:`SharedGatewayView`, and funnels every EventKit call
+through a single lock.
+
+Lists written to during the run are marked dirty; a vault reading a dirty
+list afterwards gets a fresh fetch, so later vaults see earlier vaults' writes
+just as they would in a serial run.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .gateway import ReminderData
+
+
+class SharedRemindersFetch:
+    """Snapshot of Reminders lists shared between concurrent vault syncs.
+
+    Args:
+        gateway: The underlying gateway (EventKit or a test stand-in)
+        list_ids: Lists to prefetch; None prefetches every list
+    """
+
+    def __init__(self, gateway: Any, list_ids: Optional[Iterable[str]] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.gateway = gateway
+        self.list_ids: Optional[Set[str]] = set(list_ids) if list_ids is not None else None
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._reminders: Optional[Dict[str, ReminderData]] = None
+        self._summary: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty: Set[str] = set()
+        self._all_dirty = False
+
+    # ------------------------------------------------------------------ fetch
+
+    def _ids(self) -> Optional[List[str]]:
+        return sorted(self.list_ids) if self.list_ids is not None else None
+
+    def _fetch_summary(self, list_ids: Optional[List[str]]) -> Optional[Dict[str, Dict[str, Any]]]:
+        summarise = getattr(self.gateway, "get_list_fingerprints", None)
+        if not callable(summarise):
+            return None
+        summary = summarise(list_ids)
+        return summary if isinstance(summary, dict) else None
+
+    def prefetch(self) -> None:
+        """Fetch the shared lists once; later calls are no-ops."""
+        with self._lock:
+            if self._reminders is not None:
+                return
+            ids = self._ids()
+            # Summarise before fetching, like a serial run fingerprinting first
+            self._summary = self._fetch_summary(ids)
+            self._reminders = {rem.uuid: rem for rem in self.gateway.get_reminders(ids)}
+            self.logger.debug("Prefetched %d reminders for shared use", len(self._reminders))
+
+    def _covers(self, list_ids: Optional[List[str]]) -> bool:
+        if self.list_ids is None:
+            return True
+        return list_ids is not None and set(list_ids) <= self.list_ids
+
+    def _is_dirty(self, list_ids: Optional[List[str]]) -> bool:
+        if self._all_dirty:
+            return True
+        if list_ids is None:
+            return bool(self._dirty)
+        return bool(self._dirty.intersection(list_ids))
+
+    def _refresh(self, list_ids: Optional[List[str]]) -> None:
+        """Refetch dirty lists so readers see writes made earlier in the run."""
+        if self._all_dirty:
+            list_ids = self._ids()
+        elif list_ids is None:
+            list_ids = sorted(self._dirty)
+        else:
+            list_ids = sorted(self._dirty.intersection(list_ids))
+
+        summary = self._fetch_summary(list_ids)
+        fresh = self.gateway.get_reminders(list_ids)
+        wanted = set(list_ids) if list_ids is not None else None
+        self._reminders = {
+            uuid: rem for uuid, rem in (self._reminders or {}).items()
+            if wanted is not None and rem.list_id not in wanted
+        }
+        self._reminders.update((rem.uuid, rem) for rem in fresh)
+        if summary is not None and self._summary is not None:
+            self._summary.update(summary)
+        else:
+            self._summary = None
+
+        if wanted is None:
+            self._dirty.clear()
+            self._all_dirty = False
+        else:
+            self._dirty.difference_update(wanted)
+
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
+        with self._lock:
+            if not self._covers(list_ids):
+                fetched: List[ReminderData] = self.gateway.get_reminders(list_ids)
+                return fetched
+            self.prefetch()
+            if self._is_dirty(list_ids):
+                self._refresh(list_ids)
+            wanted = set(list_ids) if list_ids is not None else None
+            # Copies, so one vault's engine cannot alter what another reads
+            return [
+                ReminderData(**vars(rem))
+                for rem in (self._reminders or {}).values()
+                if wanted is None or rem.list_id in wanted
+            ]
+
+    def get_reminders_by_ids(self, uuids: List[str]) -> List[ReminderData]:
+        with self._lock:
+            reminders: List[ReminderData] = self.gateway.get_reminders_by_ids(uuids)
+            return reminders
+
+    def get_list_fingerprints(self, list_ids: Optional[List[str]] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        with self._lock:
+            if not self._covers(list_ids):
+                return self._fetch_summary(list_ids)
+            self.prefetch()
+            if self._is_dirty(list_ids):
+                self._refresh(list_ids)
+            if self._summary is None:
+                return None
+            if list_ids is None:
+                return {key: dict(value) for key, value in self._summary.items()}
+            return {
+                list_id: dict(self._summary.get(list_id) or {"count": 0, "max_modified": None})
+                for list_id in list_ids
+            }
+
+    # ----------------------------------------------------------------- writes
+
+    def _mark_dirty(self, list_id: Optional[str]) -> None:
+        if list_id:
+            self._dirty.add(list_id)
+        else:
+            self._all_dirty = True
+
+    def _list_of(self, uuid: str) -> Optional[str]:
+        rem = (self._reminders or {}).get(uuid)
+        return rem.list_id if rem else None
+
+    def create_reminder(self, title: str, list_id: Optional[str] = None, **properties: Any) -> Optional[str]:
+        with self._lock:
+            self._mark_dirty(list_id)
+            created: Optional[str] = self.gateway.create_reminder(title, list_id=list_id, **properties)
+            return created
+
+    def update_reminder(self, uuid: str, **updates: Any) -> bool:
+        with self._lock:
+            self._mark_dirty(self._list_of(uuid))
+            if updates.get("calendar_id"):
+                self._mark_dirty(updates["calendar_id"])
+            return bool(self.gateway.update_reminder(uuid, **updates))
+
+    def delete_reminder(self, uuid: str) -> bool:
+        with self._lock:
+            self._mark_dirty(self._list_of(uuid))
+            return bool(self.gateway.delete_reminder(uuid))
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """Call any other gateway method under the shared lock."""
+        with self._lock:
+            return getattr(self.gateway, name)(*args, **kwargs)
+
+    def view(self) -> "SharedGatewayView":
+        return SharedGatewayView(self)
+
+
+class SharedGatewayView:
+    """Per-vault gateway backed by a :class:`SharedRemindersFetch`.
+
+    Keeps its own :attr:`calls` so each vault's run statistics count only the
+    requests made on its behalf.
+    """
+
+    def __init__(self, shared: SharedRemindersFetch):
+        self._shared = shared
+        self.calls: Dict[str, int] = {}
+
+    def _count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def get_lists(self) -> List[Dict[str, str]]:
+        self._count("get_lists")
+        lists: List[Dict[str, str]] = self._shared.call("get_lists")
+        return lists
+
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
+        self._count("get_reminders")
+        return self._shared.get_reminders(list_ids)
+
+    def get_reminders_by_ids(self, uuids: List[str]) -> List[ReminderData]:
+        self._count("get_reminders_by_ids")
+        return self._shared.get_reminders_by_ids(uuids)
+
+    def get_list_fingerprints(self, list_ids: Optional[List[str]] = None) -> Optional[Dict[str, Dict[str, Any]]]:
+        self._count("get_list_fingerprints")
+        return self._shared.get_list_fingerprints(list_ids)
+
+    def create_reminder(self, title: str, list_id: Optional[str] = None, **properties: Any) -> Optional[str]:
+        self._count("create_reminder")
+        return self._shared.create_reminder(title, list_id=list_id, **properties)
+
+    def update_reminder(self, uuid: str, **updates: Any) -> bool:
+        self._count("update_reminder")
+        return self._shared.update_reminder(uuid, **updates)
+
+    def delete_reminder(self, uuid: str) -> bool:
+        self._count("delete_reminder")
+        return self._shared.delete_reminder(uuid)
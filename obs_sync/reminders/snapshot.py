@@ -0,0 +1,277 @@
+"""
+Snapshot of the Reminders data seen by the last fetch.
+
+Every list fetch made through :class:`~obs_sync.reminders.tasks.RemindersTaskManager`
+during a sync replaces those lists' entries in a JSON snapshot at
+``reminders_index_path``. Each entry carries a content hash next to the
+reminder's ``modified_at``, so the next fetch only converts reminders whose
+modification date moved and reports what actually changed as a
+:class:`ReminderDelta`; the sync engine uses its ``touched`` set to decide which
+unmatched reminders need matching again (see :mod:`obs_sync.sync.match_memo`).
+The snapshot parsed to look up modification dates is handed to the merge, so
+a fetch parses the file once unless another process rewrote it meanwhile.
+Commands that only read Reminders (``obs-sync
+insights``) can work from the snapshot through a :class:`SnapshotGateway`
+instead of EventKit, which makes them instant and lets them run on machines
+without Reminders access that share the data directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..utils.io import file_signature, safe_read_json, update_json
+from .gateway import ReminderData
+
+
+SNAPSHOT_VERSION = 2
+
+# Fields whose changes matter to a sync; timestamps and list names do not
+HASHED_FIELDS = ("title", "completed", "due_date", "priority", "url", "notes", "tags", "list_id")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def content_hash(reminder: ReminderData) -> str:
+    """Short digest of the fields a sync compares."""
+    payload = [getattr(reminder, name) for name in HASHED_FIELDS]
+    encoded = json.dumps(payload, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ReminderDelta:
+    """How one fetch differs from the snapshot it replaced."""
+
+    added: Set[str] = field(default_factory=set)
+    changed: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    unchanged: Set[str] = field(default_factory=set)
+
+    @property
+    def touched(self) -> Set[str]:
+        """Reminders that are new or whose content changed."""
+        return self.added | self.changed
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "changed": len(self.changed),
+            "removed": len(self.removed),
+            "unchanged": len(self.unchanged),
+        }
+
+
+class RemindersSnapshot:
+    """Reminders keyed by identifier, plus when each list was last fetched."""
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+        # (file signature, data) of the last read, reused by the next merge
+        # when the file has not changed in between
+        self._loaded: Optional[Tuple[Any, Any]] = None
+
+    @classmethod
+    def for_config(cls, config: Any, logger: Optional[logging.Logger] = None) -> Optional["RemindersSnapshot"]:
+        """The configured snapshot, or None when disabled or unset."""
+        path = getattr(config, "reminders_index_path", None)
+        if not path or getattr(config, "reminders_snapshot_enabled", True) is not True:
+            return None
+        return cls(path, logger=logger)
+
+    def _read(self) -> Dict[str, Any]:
+        signature = file_signature(self.path)
+        data = safe_read_json(self.path, default={})
+        self._loaded = (signature, data)
+        if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION:
+            return {}
+        return data
+
+    def exists(self) -> bool:
+        return bool(self._read())
+
+    def known_modified(self, list_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """``{uuid: modified_at}`` for snapshot reminders that have a modification date."""
+        wanted = set(list_ids) if list_ids is not None else None
+        return {
+            uuid: entry["modified_at"]
+            for uuid, entry in self._read().get("reminders", {}).items()
+            if entry.get("modified_at") and (wanted is None or entry.get("list_id") in wanted)
+        }
+
+    def record(self, list_ids: Optional[Iterable[str]], reminders: List[ReminderData]) -> ReminderDelta:
+        """Replace the fetched lists' entries with ``reminders``.
+
+        Args:
+            list_ids: Lists the fetch covered; None means every list
+            reminders: Everything the fetch returned
+
+        Returns:
+            What changed compared with the previous snapshot
+        """
+        delta, _ = self._merge(list_ids, reminders, ())
+        return delta
+
+    def apply(
+        self,
+        list_ids: Optional[Iterable[str]],
+        fetched: List[ReminderData],
+        unchanged_ids: Iterable[str],
+    ) -> Optional[Tuple[List[ReminderData], ReminderDelta]]:
+        """Merge a fetch that skipped reminders the snapshot already holds.
+
+        Args:
+            list_ids: Lists the fetch covered; None means every list
+            fetched: Reminders that were converted because they are new or modified
+            unchanged_ids: Reminders the fetch saw with their recorded ``modified_at``
+
+        Returns:
+            Every reminder in the fetched lists and the delta, or None when
+            some unchanged reminder is no longer in the snapshot (for example
+            after a concurrent rewrite) and the caller must fetch in full
+        """
+        delta, kept = self._merge(list_ids, fetched, unchanged_ids)
+        if kept is None:
+            return None
+        reminders = list(fetched)
+        for uuid, entry in kept.items():
+            reminder = self._to_reminder(uuid, entry)
+            if reminder is not None:
+                reminders.append(reminder)
+        return reminders, delta
+
+    def _merge(
+        self,
+        list_ids: Optional[Iterable[str]],
+        fetched: List[ReminderData],
+        unchanged_ids: Iterable[str],
+    ) -> Tuple[ReminderDelta, Optional[Dict[str, Dict[str, Any]]]]:
+        fetched_at = _now()
+        wanted = set(list_ids) if list_ids is not None else None
+        unchanged = set(unchanged_ids)
+        entries = {}
+        fetched_lists: Dict[str, Dict[str, Any]] = {}
+        for rem in fetched:
+            entry = asdict(rem)
+            entry["hash"] = content_hash(rem)
+            entries[entry.pop("uuid")] = entry
+            if rem.list_id:
+                fetched_lists.setdefault(rem.list_id, {"name": rem.list_name, "fetched_at": fetched_at})
+        for list_id in wanted or ():
+            fetched_lists.setdefault(list_id, {"name": None, "fetched_at": fetched_at})
+
+        delta = ReminderDelta()
+        outcome: Dict[str, Any] = {}
+
+        def merge(data: Any) -> Dict[str, Any]:
+            current: Dict[str, Any] = data if isinstance(data, dict) else {}
+            if current.get("version") != SNAPSHOT_VERSION:
+                current = {"version": SNAPSHOT_VERSION, "lists": {}, "reminders": {}}
+            previous = current.get("reminders", {})
+            if wanted is None:
+                replaced = previous
+                stored: Dict[str, Any] = {}
+                lists = {}
+            else:
+                replaced = {}
+                stored = {}
+                for uuid, entry in previous.items():
+                    (replaced if entry.get("list_id") in wanted else stored)[uuid] = entry
+                lists = {key: value for key, value in current.get("lists", {}).items() if key not in wanted}
+            for list_id, info in fetched_lists.items():
+                old = current.get("lists", {}).get(list_id) or {}
+                lists[list_id] = {"name": info["name"] or old.get("name"), "fetched_at": info["fetched_at"]}
+
+            kept = {uuid: replaced[uuid] for uuid in unchanged if uuid in replaced}
+            if len(kept) != len(unchanged):
+                outcome["kept"] = None
+                return current
+            outcome["kept"] = kept
+
+            delta.unchanged.update(kept)
+            for uuid, entry in entries.items():
+                old = previous.get(uuid)
+                if old is None:
+                    delta.added.add(uuid)
+                elif old.get("hash") != entry["hash"]:
+                    delta.changed.add(uuid)
+                else:
+                    delta.unchanged.add(uuid)
+            delta.removed = set(replaced) - set(entries) - set(kept)
+
+            stored.update(kept)
+            stored.update(entries)
+            return {"version": SNAPSHOT_VERSION, "saved_at": fetched_at, "lists": lists, "reminders": stored}
+
+        loaded, self._loaded = self._loaded, None
+        if not update_json(self.path, merge, indent=None, loaded=loaded):
+            self.logger.warning("Could not save the Reminders snapshot to %s", self.path)
+        if "kept" not in outcome:
+            # The file could not be locked, so nothing was compared
+            return ReminderDelta(added={rem.uuid for rem in fetched}), {} if not unchanged else None
+        return delta, outcome["kept"]
+
+    @staticmethod
+    def _to_reminder(uuid: str, entry: Dict[str, Any]) -> Optional[ReminderData]:
+        values = {key: value for key, value in entry.items() if key != "hash"}
+        try:
+            return ReminderData(uuid=uuid, **values)
+        except TypeError:
+            return None
+
+    def reminders(self, list_ids: Optional[Iterable[str]] = None) -> List[ReminderData]:
+        """Snapshot reminders, optionally limited to some lists."""
+        wanted = set(list_ids) if list_ids is not None else None
+        result = []
+        for uuid, entry in self._read().get("reminders", {}).items():
+            if wanted is not None and entry.get("list_id") not in wanted:
+                continue
+            reminder = self._to_reminder(uuid, entry)
+            if reminder is not None:
+                result.append(reminder)
+        return result
+
+    def fetched_at(self, list_ids: Optional[Iterable[str]] = None) -> Dict[str, Optional[datetime]]:
+        """When each list was last fetched; None for lists the snapshot lacks."""
+        lists = self._read().get("lists", {})
+        ids = list(list_ids) if list_ids is not None else list(lists)
+        result: Dict[str, Optional[datetime]] = {}
+        for list_id in ids:
+            stamp = (lists.get(list_id) or {}).get("fetched_at")
+            try:
+                result[list_id] = datetime.fromisoformat(stamp) if stamp else None
+            except ValueError:
+                result[list_id] = None
+        return result
+
+
+class SnapshotGateway:
+    """Read-only gateway serving reminders from a :class:`RemindersSnapshot`."""
+
+    def __init__(self, snapshot: RemindersSnapshot):
+        self.snapshot = snapshot
+        self.calls: Dict[str, int] = {}
+
+    def get_reminders(self, list_ids: Optional[List[str]] = None) -> List[ReminderData]:
+        self.calls["get_reminders"] = self.calls.get("get_reminders", 0) + 1
+        return self.snapshot.reminders(list_ids)
+
+
+def describe_age(fetched_at: datetime, now: Optional[datetime] = None) -> str:
+    """Human-friendly age such as ``"5 min ago"`` or ``"3 days ago"``."""
+    seconds = max(0, int(((now or datetime.now(timezone.utc)) - fetched_at).total_seconds()))
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{seconds // 60} min ago"
+    if seconds < 86400:
+        return f"{seconds // 3600} h ago"
+    days = seconds // 86400
+    return f"{days} day{'s' if days != 1 else ''} ago"
@@ -6,7 +6,8 @@ import logging
 
 from ..core.models import Priority, RemindersTask, TaskStatus
 from ..utils.date import format_date, parse_date
-from .gateway import RemindersGateway
+from .gateway import ReminderData, RemindersGateway, ReminderSource
+from .snapshot import ReminderDelta, RemindersSnapshot
 
 
 class RemindersTaskManager:
@@ -14,12 +15,17 @@ class RemindersTaskManager:
 
     def __init__(
         self,
-        gateway: Optional[RemindersGateway] = None,
+        gateway: Optional[ReminderSource] = None,
         logger: Optional[logging.Logger] = None,
     ):
-        self.gateway = gateway or RemindersGateway(logger=logger)
+        # Write methods are looked up on the gateway only when a task is written
+        self.gateway: Any = gateway or RemindersGateway(logger=logger)
         self.logger = logger or logging.getLogger(__name__)
         self.include_completed = True  # Default to including completed tasks
+        # Optional RemindersSnapshot refreshed by every list fetch
+        self.snapshot: Optional[RemindersSnapshot] = None
+        # ReminderDelta of the last list fetch made with a snapshot
+        self.last_delta: Optional[ReminderDelta] = None
 
     def list_tasks(self, list_ids: Optional[List[str]] = None, include_completed: Optional[bool] = None) -> List[RemindersTask]:
         """List all tasks from specified lists.
@@ -28,57 +34,8 @@ class RemindersTaskManager:
             list_ids: Optional list of calendar IDs to fetch from
             include_completed: Whether to include completed tasks. If None, uses instance default.
         """
-        reminders = self.gateway.get_reminders(list_ids)
-
-        tasks: List[RemindersTask] = []
-        for rem in reminders:
-            status = TaskStatus.DONE if rem.completed else TaskStatus.TODO
-
-            priority = None
-            if rem.priority == "high":
-                priority = Priority.HIGH
-            elif rem.priority == "medium":
-                priority = Priority.MEDIUM
-            elif rem.priority == "low":
-                priority = Priority.LOW
-
-            # Parse datetime fields from ISO strings
-            created_at_dt = None
-            if rem.created_at:
-                try:
-                    created_at_dt = datetime.fromisoformat(rem.created_at)
-                except (ValueError, TypeError):
-                    pass
-            
-            modified_at_dt = None
-            if rem.modified_at:
-                try:
-                    modified_at_dt = datetime.fromisoformat(rem.modified_at)
-                except (ValueError, TypeError):
-                    pass
-            
-            # For completed tasks, use modified_at as completion_date proxy
-            completion_date = None
-            if status == TaskStatus.DONE and modified_at_dt:
-                completion_date = modified_at_dt.date()
-            
-            task = RemindersTask(
-                uuid=rem.uuid,
-                item_id=rem.uuid,
-                calendar_id=rem.list_id or "",
-                list_name=rem.list_name or "Reminders",
-                status=status,
-                title=rem.title,
-                due_date=parse_date(rem.due_date),
-                priority=priority,
-                url=rem.url,
-                notes=rem.notes,
-                tags=rem.tags,  # Include tags from gateway
-                created_at=created_at_dt,
-                modified_at=modified_at_dt,
-                completion_date=completion_date,
-            )
-            tasks.append(task)
+        reminders = self._fetch_reminders(list_ids)
+        tasks: List[RemindersTask] = [self.convert_reminder(rem) for rem in reminders]
         
         # Filter out completed tasks if requested
         if include_completed is None:
@@ -90,6 +47,88 @@ class RemindersTaskManager:
 
         return tasks
     
+    def _fetch_reminders(self, list_ids: Optional[List[str]]) -> List[ReminderData]:
+        """Fetch reminders, converting only those modified since the snapshot."""
+        self.last_delta = None
+        if self.snapshot is None:
+            fetched_all: List[ReminderData] = self.gateway.get_reminders(list_ids)
+            return fetched_all
+
+        fetch_changed = getattr(self.gateway, "get_changed_reminders", None)
+        if callable(fetch_changed):
+            known = self.snapshot.known_modified(list_ids)
+            fetched, unchanged_ids = fetch_changed(list_ids, known)
+            merged = self.snapshot.apply(list_ids, fetched, unchanged_ids)
+            if merged is not None:
+                reminders, self.last_delta = merged
+                self.logger.debug("Reminders delta since the last fetch: %s", self.last_delta.to_dict())
+                return reminders
+            self.logger.debug("Reminders snapshot changed during the fetch; fetching in full")
+
+        fetched_all = self.gateway.get_reminders(list_ids)
+        self.last_delta = self.snapshot.record(list_ids, fetched_all)
+        return fetched_all
+
+    def get_tasks_by_ids(self, uuids: List[str]) -> Optional[List[RemindersTask]]:
+        """Fetch specific tasks by reminder identifier.
+
+        Returns None when the gateway cannot look reminders up by identifier,
+        so callers can fall back to :meth:`list_tasks`.
+        """
+        fetch = getattr(self.gateway, "get_reminders_by_ids", None)
+        if not callable(fetch):
+            return None
+        return [self.convert_reminder(rem) for rem in fetch(list(uuids))]
+
+    def convert_reminder(self, rem: ReminderData) -> RemindersTask:
+        """Convert a gateway reminder into a :class:`RemindersTask`."""
+        status = TaskStatus.DONE if rem.completed else TaskStatus.TODO
+
+        priority = None
+        if rem.priority == "high":
+            priority = Priority.HIGH
+        elif rem.priority == "medium":
+            priority = Priority.MEDIUM
+        elif rem.priority == "low":
+            priority = Priority.LOW
+
+        # Parse datetime fields from ISO strings
+        created_at_dt = None
+        if rem.created_at:
+            try:
+                created_at_dt = datetime.fromisoformat(rem.created_at)
+            except (ValueError, TypeError):
+                pass
+        
+        modified_at_dt = None
+        if rem.modified_at:
+            try:
+                modified_at_dt = datetime.fromisoformat(rem.modified_at)
+            except (ValueError, TypeError):
+                pass
+        
+        # For completed tasks, use modified_at as completion_date proxy
+        completion_date = None
+        if status == TaskStatus.DONE and modified_at_dt:
+            completion_date = modified_at_dt.date()
+        
+        return RemindersTask(
+            uuid=rem.uuid,
+            item_id=rem.uuid,
+            calendar_id=rem.list_id or "",
+            list_name=rem.list_name or "Reminders",
+            status=status,
+            title=rem.title,
+            due_date=parse_date(rem.due_date),
+            priority=priority,
+            url=rem.url,
+            notes=rem.notes,
+            tags=rem.tags,  # Include tags from gateway
+            created_at=created_at_dt,
+            modified_at=modified_at_dt,
+            completion_date=completion_date,
+        )
+    
     def create_task(
         self, list_id: str, task: RemindersTask
     ) -> Optional[RemindersTask]:
@@ -210,4 +249,4 @@ class RemindersTaskManager:
     
     def delete_task(self, task: RemindersTask) -> bool:
         """Delete a task from Reminders."""
-        return self.gateway.delete_reminder(task.uuid)
+        return bool(self.gateway.delete_reminder(task.uuid))
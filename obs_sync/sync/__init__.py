@@ -3,6 +3,7 @@
 from .engine import SyncEngine
 from .matcher import TaskMatcher
 from .resolver import ConflictResolver
+from .scope import SyncScope
 from .deduplicator import TaskDeduplicator, DuplicateCluster, DeduplicationResults
 
-__all__ = ['SyncEngine', 'TaskMatcher', 'ConflictResolver', 'TaskDeduplicator', 'DuplicateCluster', 'DeduplicationResults']
\ No newline at end of file
+__all__ = ['SyncEngine', 'TaskMatcher', 'ConflictResolver', 'SyncScope', 'TaskDeduplicator', 'DuplicateCluster', 'DeduplicationResults']
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Time budgets and resume cursors for long sync runs.
+
+A sync started with ``max_seconds`` applies its writes in order of value:
+status changes first, then overdue or soon-due tasks, then everything else.
+Whatever is left when the budget runs out is recorded as a cursor next to the
+links file, and the next run of the same vault and direction resumes with
+those operations first. Matches found by a cut-short run are still persisted,
+so the expensive first-time matching is never repeated.
+"""
+
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..utils.io import safe_read_json, update_json
+
+
+CURSOR_FILE = "sync_cursor.json"
+
+# Tasks due within this many days (or overdue) rank just below status changes
+URGENT_WINDOW_DAYS = 3
+
+# Work priorities, lowest first
+PRIORITY_STATUS = 0
+PRIORITY_URGENT = 1
+PRIORITY_OTHER = 2
+
+DEFERRED_KINDS = ("updates", "create_rem", "create_obs")
+
+
+class RunBudget:
+    """Wall-clock budget for one sync run; unlimited when ``max_seconds`` is None."""
+
+    def __init__(self, max_seconds: Optional[float] = None):
+        self.max_seconds = max_seconds
+        self._deadline = time.monotonic() + max(0.0, max_seconds) if max_seconds is not None else None
+        self.exhausted = False
+
+    @property
+    def limited(self) -> bool:
+        return self._deadline is not None
+
+    def spent(self) -> bool:
+        """True once the budget has run out; stays True for the rest of the run."""
+        if not self.exhausted and self._deadline is not None and time.monotonic() >= self._deadline:
+            self.exhausted = True
+        return self.exhausted
+
+
+def empty_deferred() -> Dict[str, List[str]]:
+    return {kind: [] for kind in DEFERRED_KINDS}
+
+
+def deferred_count(deferred: Optional[Dict[str, Any]]) -> int:
+    return sum(len((deferred or {}).get(kind) or []) for kind in DEFERRED_KINDS)
+
+
+def link_key(obs_uuid: str, rem_uuid: str) -> str:
+    return f"{obs_uuid}:{rem_uuid}"
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+def work_priority(*tasks: Any, status_changed: bool = False, today: Optional[date] = None) -> int:
+    """Rank an operation on ``tasks``: status changes, then urgent due dates, then the rest."""
+    if status_changed:
+        return PRIORITY_STATUS
+    horizon = (today or date.today()) + timedelta(days=URGENT_WINDOW_DAYS)
+    for task in tasks:
+        due = _as_date(getattr(task, "due_date", None))
+        if due is not None and due <= horizon:
+            return PRIORITY_URGENT
+    return PRIORITY_OTHER
+
+
+class SyncCursorStore:
+    """Remaining work per ``(vault, direction)`` left by budget-limited runs.
+
+    Stored next to the links file, like the fingerprint store.
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+
+    @classmethod
+    def for_config(cls, config: Any, logger: Optional[logging.Logger] = None) -> "SyncCursorStore":
+        directory = os.path.dirname(os.path.expanduser(config.links_path or "")) or "."
+        return cls(os.path.join(directory, CURSOR_FILE), logger=logger)
+
+    @staticmethod
+    def key(vault_path: str, direction: str) -> str:
+        return f"{os.path.abspath(vault_path)}|{direction}"
+
+    def get(self, vault_path: str, direction: str) -> Optional[Dict[str, List[str]]]:
+        """The deferred operations for a vault, or None when nothing is pending."""
+        data = safe_read_json(self.path, default={})
+        entry = data.get(self.key(vault_path, direction)) if isinstance(data, dict) else None
+        if not isinstance(entry, dict):
+            return None
+        remaining = entry.get("remaining") or {}
+        cursor = {kind: list(remaining.get(kind) or []) for kind in DEFERRED_KINDS}
+        return cursor if deferred_count(cursor) else None
+
+    def record(self, vault_path: str, direction: str, deferred: Dict[str, Iterable[str]]) -> None:
+        entry = {
+            "remaining": {kind: list(deferred.get(kind) or []) for kind in DEFERRED_KINDS},
+            "saved_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+        def store(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            stored[self.key(vault_path, direction)] = entry
+            return stored
+
+        if not update_json(self.path, store):
+            self.logger.warning("Could not save the sync cursor to %s", self.path)
+
+    def clear(self, vault_path: str, direction: str) -> None:
+        key = self.key(vault_path, direction)
+
+        def drop(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            stored.pop(key, None)
+            return stored
+
+        if os.path.exists(self.path):
+            update_json(self.path, drop)
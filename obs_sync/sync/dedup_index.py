@@ -0,0 +1,172 @@
+"""
+Incremental duplicate index for task deduplication.
+
+Maps every task's normalized description to the tasks sharing it, so a
+deduplication pass only re-normalizes tasks whose text or list changed since
+the last pass and only builds clusters for descriptions that more than one
+task shares. The index is stored per vault next to the links file, together
+with the clusters the user reviewed and chose to keep, so those are not
+presented again until their membership changes.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import RemindersTask
+from ..utils.io import safe_read_json, update_json
+
+
+DEDUP_INDEX_FILE = "dedup_index.json"
+INDEX_VERSION = 1
+
+OBS_PREFIX = "obs:"
+REM_PREFIX = "rem:"
+
+
+def member_id(task: Any) -> str:
+    """Index identifier of an Obsidian or Reminders task."""
+    prefix = REM_PREFIX if isinstance(task, RemindersTask) else OBS_PREFIX
+    return prefix + str(task.uuid)
+
+
+def _text_and_list(task: Any) -> Tuple[str, Optional[str]]:
+    if isinstance(task, RemindersTask):
+        return task.title or "", task.calendar_id
+    return task.description or "", None
+
+
+class DuplicateIndex:
+    """Normalized description -> member tasks, updated from one pass to the next.
+
+    Members are ``"obs:<uuid>"`` / ``"rem:<uuid>"`` identifiers mapped to
+    ``(key, text, list_id)``; :attr:`buckets` is the inverse map.
+    """
+
+    def __init__(
+        self,
+        members: Optional[Dict[str, Tuple[str, str, Optional[str]]]] = None,
+        kept: Optional[Dict[str, List[str]]] = None,
+    ):
+        self.members: Dict[str, Tuple[str, str, Optional[str]]] = dict(members or {})
+        self.buckets: Dict[str, Set[str]] = {}
+        for mid, (key, _, _) in self.members.items():
+            self.buckets.setdefault(key, set()).add(mid)
+        self.shared: Set[str] = {key for key, bucket in self.buckets.items() if len(bucket) > 1}
+        self.kept: Dict[str, List[str]] = dict(kept or {})
+
+    def _add(self, mid: str, entry: Tuple[str, str, Optional[str]]) -> None:
+        self.members[mid] = entry
+        bucket = self.buckets.setdefault(entry[0], set())
+        bucket.add(mid)
+        if len(bucket) > 1:
+            self.shared.add(entry[0])
+
+    def _discard(self, mid: str) -> None:
+        key = self.members.pop(mid)[0]
+        bucket = self.buckets[key]
+        bucket.discard(mid)
+        if len(bucket) < 2:
+            self.shared.discard(key)
+        if not bucket:
+            del self.buckets[key]
+
+    def update(self, tasks: Iterable[Any], normalize: Callable[[Optional[str]], str]) -> Dict[str, int]:
+        """Make the index mirror ``tasks``, normalizing only new or edited ones.
+
+        Returns:
+            Counts of members ``added``, ``changed`` and ``removed``
+        """
+        stats = {"added": 0, "changed": 0, "removed": 0}
+        seen: Set[str] = set()
+        for task in tasks:
+            mid = member_id(task)
+            seen.add(mid)
+            text, list_id = _text_and_list(task)
+            entry = self.members.get(mid)
+            if entry is not None and entry[1] == text and entry[2] == list_id:
+                continue
+            if entry is not None:
+                self._discard(mid)
+                stats["changed"] += 1
+            else:
+                stats["added"] += 1
+            self._add(mid, (normalize(text), text, list_id))
+        for mid in [mid for mid in self.members if mid not in seen]:
+            self._discard(mid)
+            stats["removed"] += 1
+        return stats
+
+    # ------------------------------------------------------------ reviews
+
+    def is_kept(self, cluster_key: str, member_ids: Iterable[str]) -> bool:
+        """True if the user kept exactly these members under ``cluster_key`` before."""
+        return self.kept.get(cluster_key) == sorted(member_ids)
+
+    def mark_kept(self, cluster_key: str, member_ids: Iterable[str]) -> None:
+        self.kept[cluster_key] = sorted(member_ids)
+
+    def prune_kept(self) -> None:
+        """Forget reviews whose members are no longer all indexed."""
+        self.kept = {
+            key: mids for key, mids in self.kept.items()
+            if all(mid in self.members for mid in mids)
+        }
+
+    # ------------------------------------------------------------ storage
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "members": {mid: list(entry) for mid, entry in self.members.items()},
+            "kept": self.kept,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "DuplicateIndex":
+        if not isinstance(data, dict):
+            return cls()
+        members = {}
+        for mid, entry in (data.get("members") or {}).items():
+            if isinstance(entry, list) and len(entry) == 3:
+                members[mid] = (entry[0], entry[1], entry[2])
+        kept = {key: list(mids) for key, mids in (data.get("kept") or {}).items() if isinstance(mids, list)}
+        return cls(members, kept)
+
+
+class DuplicateIndexStore:
+    """Duplicate indexes per vault, stored next to the links file."""
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+
+    @classmethod
+    def for_config(cls, config: Any, logger: Optional[logging.Logger] = None) -> "DuplicateIndexStore":
+        directory = os.path.dirname(os.path.expanduser(config.links_path or "")) or "."
+        return cls(os.path.join(directory, DEDUP_INDEX_FILE), logger=logger)
+
+    @staticmethod
+    def key(vault_path: str) -> str:
+        return os.path.abspath(vault_path)
+
+    def load(self, vault_path: str) -> DuplicateIndex:
+        data = safe_read_json(self.path, default={})
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return DuplicateIndex()
+        return DuplicateIndex.from_dict((data.get("vaults") or {}).get(self.key(vault_path)))
+
+    def save(self, vault_path: str, index: DuplicateIndex) -> None:
+        index.prune_kept()
+        entry = index.to_dict()
+        entry["saved_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        def store(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            if stored.get("version") != INDEX_VERSION:
+                stored = {"version": INDEX_VERSION, "vaults": {}}
+            stored.setdefault("vaults", {})[self.key(vault_path)] = entry
+            return stored
+
+        if not update_json(self.path, store, indent=None):
+            self.logger.warning("Could not save the duplicate index to %s", self.path)
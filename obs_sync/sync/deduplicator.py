@@ -5,7 +5,8 @@ Duplicates are defined as tasks with identical description text.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Union, Tuple
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Set, Union, Tuple
 import logging
 from collections import defaultdict
 import json
@@ -13,6 +14,14 @@ import os
 
 from ..core.models import ObsidianTask, RemindersTask, TaskStatus, SyncLink
 from ..utils.io import safe_read_json, safe_write_json
+from .dedup_index import DuplicateIndex, member_id
+from .near_duplicates import NearDuplicateFinder
+
+
+def _all_tasks(obs_tasks: List[ObsidianTask],
+               rem_tasks: List[RemindersTask]) -> Iterator[Union[ObsidianTask, RemindersTask]]:
+    """Obsidian tasks followed by Reminders tasks, as one typed stream."""
+    return chain(obs_tasks, rem_tasks)
 
 
 @dataclass
@@ -22,6 +31,8 @@ class DuplicateCluster:
     obsidian_tasks: List[ObsidianTask]
     reminders_tasks: List[RemindersTask]
     linked_counterparts: Optional[Dict[str, str]] = field(default_factory=dict)  # Maps task UUID to its linked counterpart UUID
+    key: str = ""  # Normalized description, prefixed with the list ID for same-list clusters
+    similarity: Optional[float] = None  # Lowest Dice score of a near-duplicate member against the first
     
     @property
     def total_count(self) -> int:
@@ -56,6 +67,10 @@ class DuplicateCluster:
         """Get all tasks in the cluster."""
         return list(self.obsidian_tasks) + list(self.reminders_tasks)
     
+    def member_ids(self) -> List[str]:
+        """Duplicate index identifiers of the tasks in this cluster."""
+        return [member_id(task) for task in self.get_all_tasks()]
+    
     def get_task_by_index(self, index: int) -> Optional[Union[ObsidianTask, RemindersTask]]:
         """Get task by its display index (0-based)."""
         all_tasks = self.get_all_tasks()
@@ -66,11 +81,16 @@ class DuplicateCluster:
 
 @dataclass 
 class DeduplicationResults:
-    """Results from deduplication analysis."""
+    """Results from deduplication analysis.
+    
+    ``clusters`` holds the tasks grouped under every description that more
+    than one task shares; tasks with a unique description are not clustered.
+    """
     clusters: List[DuplicateCluster]
     total_tasks: int
     duplicate_tasks: int
     duplicate_clusters: int
+    kept_clusters: int = 0  # Duplicate clusters skipped because an earlier review kept them
     
     def get_duplicate_clusters(self) -> List[DuplicateCluster]:
         """Get only clusters that have duplicates."""
@@ -81,10 +101,12 @@ class TaskDeduplicator:
     """Detects and manages task duplicates."""
     
     def __init__(self, 
-                 obs_manager=None,
-                 rem_manager=None,
+                 obs_manager: Any = None,
+                 rem_manager: Any = None,
                  logger: Optional[logging.Logger] = None,
-                 links_path: Optional[str] = None):
+                 links_path: Optional[str] = None,
+                 index: Optional[DuplicateIndex] = None,
+                 near_finder: Optional[NearDuplicateFinder] = None):
         # Use lazy imports to avoid circular dependencies
         if obs_manager is None:
             from ..obsidian.tasks import ObsidianTaskManager
@@ -97,6 +119,10 @@ class TaskDeduplicator:
         self.rem_manager = rem_manager
         self.logger = logger or logging.getLogger(__name__)
         self.links_path = links_path
+        # Persistent DuplicateIndex; without one every analysis starts empty
+        self.index = index
+        # Optional NearDuplicateFinder joining similar, not just identical, descriptions
+        self.near_finder = near_finder
     
     def analyze_duplicates(self, 
                           obs_tasks: List[ObsidianTask],
@@ -105,6 +131,12 @@ class TaskDeduplicator:
         """
         Analyze tasks for duplicates across both systems.
         
+        With a persistent :attr:`index`, only tasks added or edited since the
+        previous analysis are re-normalized, and clusters an earlier review
+        kept in full are left out until their membership changes. With a
+        :attr:`near_finder`, clusters whose descriptions are similar are
+        joined into near-duplicate clusters.
+        
         Args:
             obs_tasks: List of Obsidian tasks
             rem_tasks: List of Reminders tasks
@@ -134,117 +166,153 @@ class TaskDeduplicator:
             self.logger.info("Excluding %d already-synced Obsidian and %d Reminders tasks",
                            len(linked_obs_uuids), len(linked_rem_uuids))
         
-        # Filter out already-linked Obsidian tasks (they have legitimate sync counterparts)
-        obs_tasks_filtered = [t for t in obs_tasks if t.uuid not in linked_obs_uuids]
-        
-        # For Reminders: we need to detect duplicates within the same list even if they have links
-        # So we'll separate them into two groups:
-        # 1. Reminders with links - only check for same-list duplicates
-        # 2. Reminders without links - check for all duplicates
-        rem_tasks_with_links = [t for t in rem_tasks if t.uuid in linked_rem_uuids]
-        rem_tasks_without_links = [t for t in rem_tasks if t.uuid not in linked_rem_uuids]
-        
-        self.logger.info("After filtering: %d Obsidian, %d unlinked Reminders, %d linked Reminders for duplicate analysis",
-                        len(obs_tasks_filtered), len(rem_tasks_without_links), len(rem_tasks_with_links))
-        
-        # Group tasks by normalized description
-        clusters_dict: Dict[str, DuplicateCluster] = defaultdict(
-            lambda: DuplicateCluster("", [], [])
-        )
-        
-        # First, group reminders by list to detect same-list duplicates
-        # This includes both linked and unlinked reminders
-        reminders_by_list: Dict[str, List[RemindersTask]] = defaultdict(list)
-        for task in rem_tasks:
-            reminders_by_list[task.calendar_id].append(task)
-        
-        # Track which reminders are part of same-list duplicate groups
+        # Bring the index up to date; only new or edited tasks are normalized
+        index = self.index if self.index is not None else DuplicateIndex()
+        stats = index.update(_all_tasks(obs_tasks, rem_tasks), self._normalize_description)
+        self.logger.debug("Duplicate index updated: %s", stats)
+        
+        # Position of every task in the input, so clusters keep the input order
+        positions: Dict[str, Tuple[int, Union[ObsidianTask, RemindersTask]]] = {}
+        for position, task in enumerate(_all_tasks(obs_tasks, rem_tasks)):
+            positions.setdefault(member_id(task), (position, task))
+        
+        # Already-linked Obsidian tasks have legitimate sync counterparts.
+        # Reminders are checked for same-list duplicates even when linked, and
+        # for cross-system duplicates only when unlinked.
+        obs_filtered_count = sum(1 for t in obs_tasks if t.uuid not in linked_obs_uuids)
+        
+        # Only descriptions shared by two or more tasks can form duplicates
+        shared_groups = []
+        for key in index.shared:
+            members = sorted(
+                (positions[mid] for mid in index.buckets[key] if mid in positions),
+                key=lambda item: item[0],
+            )
+            if members:
+                shared_groups.append((key, members))
+        shared_groups.sort(key=lambda group: group[1][0][0])
+        
+        clusters: List[DuplicateCluster] = []
+        same_list_clusters: List[DuplicateCluster] = []
+        kept_clusters = 0
         same_list_duplicates: Set[str] = set()
-        same_list_clusters: Dict[str, DuplicateCluster] = {}
-        
-        # Find duplicates within each reminders list
-        for list_id, list_tasks in reminders_by_list.items():
-            if len(list_tasks) < 2:
-                continue
-                
-            # Group by normalized title within this list
-            list_groups: Dict[str, List[RemindersTask]] = defaultdict(list)
-            for task in list_tasks:
-                normalized = self._normalize_description(task.title)
-                list_groups[normalized].append(task)
+        for key, members in shared_groups:
+            obs_group = [task for _, task in members
+                         if isinstance(task, ObsidianTask) and task.uuid not in linked_obs_uuids]
+            rem_group = [task for _, task in members if isinstance(task, RemindersTask)]
+            
+            # Duplicates within one Reminders list, linked or not; the list ID
+            # in the key prevents cross-list merging
+            by_list: Dict[str, List[RemindersTask]] = defaultdict(list)
+            for task in rem_group:
+                by_list[task.calendar_id].append(task)
+            for list_id, group in by_list.items():
+                if len(group) < 2:
+                    continue
+                linked_map = {
+                    task.uuid: rem_to_obs_links[task.uuid]
+                    for task in group if task.uuid in rem_to_obs_links
+                }
+                same_list_clusters.append(DuplicateCluster(
+                    group[0].title, [], group,
+                    linked_counterparts=linked_map if linked_map else None,
+                    key=f"{list_id}:{key}",
+                ))
+                same_list_duplicates.update(task.uuid for task in group)
             
-            # Add duplicate groups from this list
-            for normalized, group in list_groups.items():
-                if len(group) > 1:
-                    # This is a same-list duplicate group
-                    # Use a unique key that includes the list ID to prevent cross-list merging
-                    cluster_key = f"{list_id}:{normalized}"
-                    
-                    # Build linked counterparts map for this cluster
-                    linked_map = {}
-                    for task in group:
-                        if task.uuid in rem_to_obs_links:
-                            linked_map[task.uuid] = rem_to_obs_links[task.uuid]
-                    
-                    same_list_clusters[cluster_key] = DuplicateCluster(
-                        group[0].title, [], group, linked_counterparts=linked_map if linked_map else None
-                    )
-                    # Mark these reminders as same-list duplicates
-                    for task in group:
-                        same_list_duplicates.add(task.uuid)
-        
-        # Process filtered Obsidian tasks
-        for task in obs_tasks_filtered:
-            normalized_desc = self._normalize_description(task.description)
-            if normalized_desc not in clusters_dict:
-                clusters_dict[normalized_desc] = DuplicateCluster(
-                    task.description, [], [], linked_counterparts={}
-                )
-            clusters_dict[normalized_desc].obsidian_tasks.append(task)
-            # Track if this task has a linked counterpart
-            if task.uuid in obs_to_rem_links:
-                if clusters_dict[normalized_desc].linked_counterparts is None:
-                    clusters_dict[normalized_desc].linked_counterparts = {}
-                clusters_dict[normalized_desc].linked_counterparts[task.uuid] = obs_to_rem_links[task.uuid]
-        
-        # Process unlinked Reminders tasks that aren't already in same-list duplicate groups
-        for task in rem_tasks_without_links:
-            if task.uuid not in same_list_duplicates:
-                # Use title for Reminders tasks
-                normalized_desc = self._normalize_description(task.title)
-                if normalized_desc not in clusters_dict:
-                    clusters_dict[normalized_desc] = DuplicateCluster(
-                        task.title, [], [], linked_counterparts={}
-                    )
-                # Only add if not already added as part of same-list duplicate
-                if task not in clusters_dict[normalized_desc].reminders_tasks:
-                    clusters_dict[normalized_desc].reminders_tasks.append(task)
-        
-        # Merge same-list clusters with cross-system clusters
-        # Add same-list clusters that don't have cross-system matches
-        for cluster_key, cluster in same_list_clusters.items():
-            clusters_dict[cluster_key] = cluster
-        
-        # Convert to list and calculate stats
-        clusters = list(clusters_dict.values())
+            unlinked_rem = [task for task in rem_group
+                            if task.uuid not in linked_rem_uuids and task.uuid not in same_list_duplicates]
+            if obs_group or unlinked_rem:
+                first = (obs_group or unlinked_rem)[0]
+                description = first.description if isinstance(first, ObsidianTask) else first.title
+                clusters.append(DuplicateCluster(
+                    description, obs_group, unlinked_rem, linked_counterparts={}, key=key,
+                ))
+        
+        if self.near_finder is not None:
+            clusters = self._merge_near_duplicates(
+                clusters,
+                [t for t in obs_tasks if t.uuid not in linked_obs_uuids],
+                [t for t in rem_tasks if t.uuid not in linked_rem_uuids and t.uuid not in same_list_duplicates],
+                index,
+            )
+        
+        # Clusters the user already reviewed and kept are not presented again
+        candidates = []
+        for cluster in clusters + same_list_clusters:
+            if cluster.has_duplicates and index.is_kept(cluster.key, cluster.member_ids()):
+                kept_clusters += 1
+                continue
+            candidates.append(cluster)
+        clusters = candidates
         duplicate_clusters = [c for c in clusters if c.has_duplicates]
         duplicate_task_count = sum(c.total_count for c in duplicate_clusters)
         
         # Total unique tasks analyzed (avoiding double-counting)
-        unique_tasks_analyzed = len(obs_tasks_filtered) + len(rem_tasks)
+        unique_tasks_analyzed = obs_filtered_count + len(rem_tasks)
         
         results = DeduplicationResults(
             clusters=clusters,
             total_tasks=unique_tasks_analyzed,
             duplicate_tasks=duplicate_task_count,
-            duplicate_clusters=len(duplicate_clusters)
+            duplicate_clusters=len(duplicate_clusters),
+            kept_clusters=kept_clusters,
         )
         
         self.logger.info("Found %d duplicate clusters affecting %d tasks", 
                         results.duplicate_clusters, results.duplicate_tasks)
+        if kept_clusters:
+            self.logger.info("Skipped %d duplicate cluster(s) kept in an earlier review", kept_clusters)
         
         return results
     
+    def _merge_near_duplicates(
+        self,
+        clusters: List[DuplicateCluster],
+        obs_tasks: List[ObsidianTask],
+        rem_tasks: List[RemindersTask],
+        index: DuplicateIndex,
+    ) -> List[DuplicateCluster]:
+        """Join exact clusters and single tasks whose descriptions are near duplicates.
+        
+        Each exact cross-system cluster is compared as one unit, so identical
+        descriptions never need comparing again.
+        """
+        if self.near_finder is None:
+            return clusters
+        clustered = {mid for cluster in clusters for mid in cluster.member_ids()}
+        units = list(clusters)
+        for task in _all_tasks(obs_tasks, rem_tasks):
+            mid = member_id(task)
+            if mid in clustered:
+                continue
+            if isinstance(task, ObsidianTask):
+                units.append(DuplicateCluster(task.description, [task], [], key=index.members[mid][0]))
+            else:
+                units.append(DuplicateCluster(task.title, [], [task], key=index.members[mid][0]))
+        
+        merged: Set[int] = set()
+        near_clusters: List[DuplicateCluster] = []
+        for group, similarity in self.near_finder.find(units, text=lambda unit: unit.description):
+            near_clusters.append(DuplicateCluster(
+                group[0].description,
+                [task for unit in group for task in unit.obsidian_tasks],
+                [task for unit in group for task in unit.reminders_tasks],
+                linked_counterparts={},
+                key=f"~{group[0].key}",
+                similarity=similarity,
+            ))
+            merged.update(id(unit) for unit in group)
+        
+        if near_clusters:
+            self.logger.info("Found %d near-duplicate cluster(s)", len(near_clusters))
+        return [cluster for cluster in clusters if id(cluster) not in merged] + near_clusters
+    
+    def mark_kept(self, cluster: DuplicateCluster) -> None:
+        """Remember that the user reviewed ``cluster`` and kept every task in it."""
+        if self.index is not None:
+            self.index.mark_kept(cluster.key, cluster.member_ids())
+    
     def _normalize_description(self, description: Optional[str]) -> str:
         """
         Normalize task description for duplicate detection.
@@ -8,12 +8,31 @@ import os
 from ..core.models import ObsidianTask, RemindersTask, SyncLink, TaskStatus, SyncConfig
 from ..core.paths import get_path_manager
 from ..obsidian.tasks import ObsidianTaskManager
+from ..reminders.snapshot import ReminderDelta
 from ..reminders.tasks import RemindersTaskManager
+from ..analytics.aggregator import InsightsAggregator, InsightsSummary
+from .match_memo import MatchMemo, MatchMemoStore
 from .matcher import TaskMatcher
 from .resolver import ConflictResolver
+from .scope import SyncScope
+from .routing import RoutingTable
+from .cursor import (
+    DEFERRED_KINDS,
+    PRIORITY_URGENT,
+    RunBudget,
+    empty_deferred,
+    link_key,
+    work_priority,
+)
 from ..utils.tags import merge_tags
-from ..utils.io import safe_read_json, safe_write_json
+from ..utils.io import safe_read_json, update_json
+from ..utils.tracing import PhaseTimer
 import logging
+import threading
+
+
+# Streak data is one shared file; vaults synced in parallel record into it in turn
+_STREAKS_LOCK = threading.Lock()
 
 
 class SyncEngine:
@@ -63,6 +82,11 @@ class SyncEngine:
         # Track tasks created during the current sync run
         self.created_obs_task_ids: Set[str] = set()
         self.created_rem_task_ids: Set[str] = set()
+
+        # Time budget for the current run and the work it had to leave over
+        self.budget = RunBudget()
+        self.deferred: Dict[str, List[str]] = empty_deferred()
+        self._resume_keys: Dict[str, Set[str]] = {kind: set() for kind in DEFERRED_KINDS}
         
         # Track insights data
         self.insights_data = {
@@ -82,6 +106,12 @@ class SyncEngine:
         self.vault_name = None
         self.vault_default_calendar = None
         self.inbox_path = config.get("obsidian_inbox_path", "AppleRemindersInbox.md")
+        self.inbox_rotation = config.get("inbox_rotation", "none")
+        if self.inbox_rotation != "none":
+            self.obs_manager.configure_inbox(
+                rotation=self.inbox_rotation,
+                max_bytes=config.get("inbox_max_bytes", 0),
+            )
         self.default_calendar_id = config.get("default_calendar_id")
         
         # Use PathManager for default links_path
@@ -92,6 +122,13 @@ class SyncEngine:
         # Flag to track when links need persisting due to normalization
         self._links_need_persist = False
 
+        # Raw link records keyed by the links file's stat signature
+        self._links_cache: Optional[Tuple[Tuple[str, int, int], List[Dict[str, Any]]]] = None
+
+        # Tag routes of the current vault, compiled on first use
+        self._routing: Optional[RoutingTable] = None
+        self._routing_vault: Optional[str] = None
+
     @staticmethod
     def _datetime_to_iso(value: Optional[datetime]) -> Optional[str]:
         """Convert a datetime object to a UTC ISO string."""
@@ -101,6 +138,14 @@ class SyncEngine:
             value = value.replace(tzinfo=timezone.utc)
         return value.astimezone(timezone.utc).isoformat()
 
+    @property
+    def routing(self) -> RoutingTable:
+        """Tag routes of the current vault, compiled once per vault."""
+        if self._routing is None or self._routing_vault != self.vault_id:
+            self._routing = RoutingTable.compile(self.sync_config, self.vault_id)
+            self._routing_vault = self.vault_id
+        return self._routing
+
     def _resolve_vault_for_path(self, vault_path: str) -> Optional[Any]:
         """Resolve vault configuration for a given path with improved normalization.
 
@@ -146,14 +191,36 @@ class SyncEngine:
         vault_path: str,
         list_ids: Optional[List[str]] = None,
         dry_run: bool = True,
+        scope: Optional[SyncScope] = None,
+        max_seconds: Optional[float] = None,
+        resume: Optional[Dict[str, List[str]]] = None,
     ) -> Dict:
         """
         Perform bidirectional sync between Obsidian and Reminders.
 
+        Args:
+            vault_path: Path to the vault to sync
+            list_ids: Reminders list identifiers to sync against
+            dry_run: If True, report changes without applying them
+            scope: Optional scope restricting the run to a set of notes and
+                their linked reminders (see :class:`SyncScope`)
+            max_seconds: Time budget for the run. Writes are applied in order
+                of value and whatever is left is reported under ``deferred``.
+            resume: Operations deferred by an earlier budget-limited run; they
+                go first within their priority
+
         Returns dict with sync results and statistics.
         """
         self.logger.info("Starting sync (dry_run=%s, direction=%s)", dry_run, self.direction)
 
+        # Per-phase timings; trace spans only when a tracer is active
+        phases = PhaseTimer()
+        phases.start("prepare")
+
+        # Snapshot I/O counters so the result reports this run only
+        files_read_before = self._files_read()
+        eventkit_calls_before = self._eventkit_calls()
+
         # Reset counters for this run
         self.changes_made = {
             "obs_updated": 0,
@@ -167,6 +234,11 @@ class SyncEngine:
             "conflicts_resolved": 0,
         }
         self.skipped_rem_count = 0
+        self.budget = RunBudget(max_seconds)
+        self.deferred = empty_deferred()
+        self._resume_keys = {
+            kind: set((resume or {}).get(kind) or []) for kind in DEFERRED_KINDS
+        }
         self.created_obs_task_ids = set()
         self.created_rem_task_ids = set()
         self.rem_to_obs_creations = []
@@ -210,12 +282,13 @@ class SyncEngine:
             elif self.default_calendar_id and self.default_calendar_id not in list_ids:
                 list_ids.append(self.default_calendar_id)
 
+        # Routes may have changed since the last run; compile them afresh
+        self._routing = None
+
         # Add calendars from tag routes to ensure routed tasks are always queried
-        if self.sync_config and self.vault_id:
-            for route in self.sync_config.get_tag_routes_for_vault(self.vault_id):
-                calendar_id = route.get("calendar_id")
-                if calendar_id and calendar_id not in list_ids:
-                    list_ids.append(calendar_id)
+        for calendar_id in self.routing.calendars:
+            if calendar_id not in list_ids:
+                list_ids.append(calendar_id)
 
         if requested_list_ids and list_ids != list(requested_list_ids):
             self.logger.debug(
@@ -224,15 +297,56 @@ class SyncEngine:
                 list_ids,
             )
 
+        # Apply configured scan filters before walking the vault
+        if self.sync_config and self.vault_id:
+            scan_filters = self.sync_config.get_vault_scan_filters(self.vault_id)
+            respect_app_config = self.sync_config.respect_obsidian_ignore
+            if scan_filters["exclude"] or scan_filters["include"] or not respect_app_config:
+                self.obs_manager.configure_scan(
+                    vault_path,
+                    exclude=scan_filters["exclude"],
+                    include=scan_filters["include"],
+                    respect_app_config=respect_app_config,
+                )
+
         # 1. Collect tasks from both systems
         # Always include completed tasks for matching to detect status changes
         user_include_completed = self.config.get("include_completed", True)
         
-        self.logger.info("Collecting Obsidian tasks (including completed for matching)...")
-        obs_tasks_all = self.obs_manager.list_tasks(vault_path, include_completed=True)
+        phases.start("collect_obsidian")
+        if scope is not None:
+            if scope.files:
+                self.logger.info("Collecting Obsidian tasks from %d scoped file(s)...", len(scope.files))
+            else:
+                self.logger.info("Collecting Obsidian tasks tagged %s...", ", ".join(sorted(scope.tags)))
+            obs_tasks_all = self.obs_manager.list_tasks(
+                vault_path, include_completed=True, files=scope.files or None
+            )
+            if scope.tags:
+                obs_tasks_all = [task for task in obs_tasks_all if scope.matches(task)]
+        else:
+            self.logger.info("Collecting Obsidian tasks (including completed for matching)...")
+            obs_tasks_all = self.obs_manager.list_tasks(vault_path, include_completed=True)
         
-        self.logger.info("Collecting Reminders tasks (including completed for matching)...")
-        rem_tasks_all = self.rem_manager.list_tasks(list_ids, include_completed=True)
+        phases.start("collect_reminders")
+        rem_tasks_all = None
+        rem_delta = None
+        if scope is not None:
+            rem_tasks_all = self._collect_linked_reminders(obs_tasks_all, list_ids)
+        if rem_tasks_all is None:
+            self.logger.info("Collecting Reminders tasks (including completed for matching)...")
+            rem_tasks_all = self.rem_manager.list_tasks(list_ids, include_completed=True)
+            # Set when the manager keeps a snapshot: what changed since the last fetch
+            rem_delta = getattr(self.rem_manager, "last_delta", None)
+            if isinstance(rem_delta, ReminderDelta):
+                self.logger.info(
+                    "Reminders changed since the last sync: %d new, %d modified, %d removed",
+                    len(rem_delta.added),
+                    len(rem_delta.changed),
+                    len(rem_delta.removed),
+                )
+            else:
+                rem_delta = None
         
         # Filter for display purposes based on user preference
         if user_include_completed:
@@ -250,6 +364,7 @@ class SyncEngine:
         # Track current vault task UUIDs for persistence and tagging
         current_obs_uuids = {task.uuid for task in obs_tasks_all}
 
+        phases.start("load_links")
         # 2. Load existing links and find matches
         self.logger.info("Loading existing links...")
         existing_links = self._load_existing_links()
@@ -290,25 +405,65 @@ class SyncEngine:
         for link in existing_links:
             if not getattr(link, "vault_id", None) and link.obs_uuid in current_obs_uuids:
                 link.vault_id = self.vault_id
+
+        # Scoped runs only handle links whose Obsidian task was collected; the
+        # rest are carried through untouched and their reminders left alone
+        out_of_scope_links: List[SyncLink] = []
+        if scope is not None:
+            in_scope_links = []
+            for link in existing_links:
+                if link.obs_uuid in current_obs_uuids:
+                    in_scope_links.append(link)
+                else:
+                    out_of_scope_links.append(link)
+            existing_links = in_scope_links
+            foreign_rem_uuids = {link.rem_uuid for link in out_of_scope_links}
+            rem_tasks_all = [task for task in rem_tasks_all if task.uuid not in foreign_rem_uuids]
+            rem_tasks = [task for task in rem_tasks if task.uuid not in foreign_rem_uuids]
+            self.logger.debug(
+                "Scoped sync: %d in-scope links, %d out-of-scope links kept as-is",
+                len(existing_links),
+                len(out_of_scope_links),
+            )
         
+        phases.start("normalize_links")
         # 2.1 Normalize existing links to fix stale UUID references
         existing_links = self._normalize_links(existing_links, obs_tasks_all, rem_tasks_all)
         
         # Persist normalized links if any were updated (even in dry-run to fix data)
         if hasattr(self, '_links_need_persist') and self._links_need_persist:
             self.logger.info("Persisting normalized links to fix stale UUID references...")
-            self._persist_links(existing_links, current_obs_uuids=current_obs_uuids)
+            self._persist_links(existing_links + out_of_scope_links, current_obs_uuids=current_obs_uuids)
             self._links_need_persist = False
 
+        phases.start("match")
         self.logger.info("Finding task matches...")
         # Pass normalized existing_links to matcher
-        links = self.matcher.find_matches(obs_tasks_all, rem_tasks_all, existing_links)
+        # With a Reminders delta, pairs left unmatched last time that changed
+        # on neither side are not scored again
+        memo_store = None
+        settled = None
+        if rem_delta is not None and scope is None:
+            memo_store = MatchMemoStore.beside(self.links_path, self.logger)
+            settled = memo_store.load(vault_path).settled(
+                obs_tasks_all, rem_tasks_all, self._matcher_settings(), touched=rem_delta.touched
+            )
+        links = self.matcher.find_matches(obs_tasks_all, rem_tasks_all, existing_links, settled=settled)
+        if memo_store is not None and not dry_run:
+            linked_obs = {link.obs_uuid for link in links}
+            linked_rem = {link.rem_uuid for link in links}
+            memo_store.save(vault_path, MatchMemo.from_tasks(
+                [task for task in obs_tasks_all if task.uuid not in linked_obs],
+                [task for task in rem_tasks_all if task.uuid not in linked_rem],
+                self._matcher_settings(),
+            ))
 
         # Ensure all links are tagged with the current vault identifier
         for link in links:
             if not getattr(link, "vault_id", None):
                 link.vault_id = self.vault_id
 
+        phases.start("detect_orphans")
         # 2.5 Detect orphaned tasks (tasks whose counterpart was deleted) *after* matching
         orphaned_rem_uuids, orphaned_obs_uuids = self._detect_orphaned_tasks(
             existing_links,
@@ -327,6 +482,7 @@ class SyncEngine:
         
         self.logger.info(f"Found {len(links)} matched pairs")
         
+        phases.start("plan_creations")
         # 3. Identify unmatched tasks
         matched_obs_uuids = {link.obs_uuid for link in links}
         matched_rem_uuids = {link.rem_uuid for link in links}
@@ -350,21 +506,12 @@ class SyncEngine:
         filtered_rem = []
         if self.sync_config and self.vault_id:
             existing_link_rem_uuids = {link.rem_uuid for link in existing_links if link.vault_id == self.vault_id}
+            routing = self.routing
             for rem_task in unmatched_rem:
-                # Find which route applies to this task based on calendar
-                route_applies = False
-                import_mode = None
+                # A route applies if the task is in the routed calendar
+                import_mode = routing.import_mode_for_calendar(rem_task.calendar_id)
                 
-                for route in self.sync_config.get_tag_routes_for_vault(self.vault_id):
-                    route_calendar = route.get("calendar_id")
-                    
-                    # A route applies if the task is in the routed calendar
-                    if route_calendar == rem_task.calendar_id:
-                        route_applies = True
-                        import_mode = route.get("import_mode", "existing_only")
-                        break
-                
-                if route_applies and import_mode == "existing_only":
+                if import_mode == "existing_only":
                     # Only include if already linked to this vault
                     if rem_task.uuid in existing_link_rem_uuids:
                         filtered_rem.append(rem_task)
@@ -386,6 +533,30 @@ class SyncEngine:
                     f"Filtered {self.skipped_rem_count} Reminders tasks due to existing_only import mode"
                 )
         
+        if scope is not None and unmatched_rem:
+            # Importing new reminders into the vault is left to full runs
+            self.logger.debug(
+                "Scoped sync: deferring %d unmatched Reminders tasks to the next full sync",
+                len(unmatched_rem),
+            )
+            unmatched_rem = []
+
+        # Budget-limited runs apply status changes and urgent updates before
+        # spending time on creations
+        processed_links: Set[str] = set()
+        if self.budget.limited:
+            phases.start("apply_priority")
+            for link, obs_task, rem_task, priority in self._ordered_links(links, obs_tasks_all, rem_tasks_all):
+                if priority > PRIORITY_URGENT or self.budget.spent():
+                    break
+                self._process_link(obs_task, rem_task, dry_run)
+                processed_links.add(link_key(link.obs_uuid, link.rem_uuid))
+
+        if self.budget.limited or any(self._resume_keys.values()):
+            unmatched_obs = self._ordered_tasks(unmatched_obs, "create_rem")
+            unmatched_rem = self._ordered_tasks(unmatched_rem, "create_obs")
+
+        phases.start("create_counterparts")
         # 4. Create counterpart tasks for unmatched items
         new_links, created_obs_tasks, created_rem_tasks = self._create_counterparts(
             unmatched_obs,
@@ -416,6 +587,7 @@ class SyncEngine:
                         [t for t in created_rem_tasks if t.status != TaskStatus.DONE]
                     )
 
+        phases.start("resolve_orphans")
         # Re-evaluate orphaned tasks now that new counterparts may have been created
         final_orphaned_rem_uuids, final_orphaned_obs_uuids = self._detect_orphaned_tasks(
             existing_links,
@@ -484,52 +656,28 @@ class SyncEngine:
                 links = [link for link in links if link.obs_uuid != obs_uuid]
                 self.changes_made["links_deleted"] = self.changes_made.get("links_deleted", 0) + 1
 
+        phases.start("apply_changes")
         # 5. Process each link
-        for link in links:
-            obs_task = self._find_task(obs_tasks_all, link.obs_uuid)
-            rem_task = self._find_task(rem_tasks_all, link.rem_uuid)
-            
-            if not obs_task or not rem_task:
-                continue
-            
-            # Resolve conflicts
-            conflicts = self.resolver.resolve_conflicts(obs_task, rem_task)
-            
-            # Apply changes based on conflict resolution
-            self._apply_sync_changes(obs_task, rem_task, conflicts, dry_run)
-            
-            # Check for tag-based rerouting (independent of conflict resolution)
-            # Only evaluate if task has tags that could match a route
-            if self.direction in ("both", "obs-to-rem") and obs_task.tags:
-                # Check if any tag matches a configured route for this vault
-                has_routing_tag = False
-                if self.sync_config and self.vault_id:
-                    vault_routes = self.sync_config.get_tag_routes_for_vault(self.vault_id)
-                    if vault_routes:
-                        routing_tags = {route['tag'] for route in vault_routes}
-                        normalized_obs_tags = {
-                            SyncConfig._normalize_tag_value(t)
-                            for t in (obs_task.tags or [])
-                        }
-                        has_routing_tag = any(tag in routing_tags for tag in normalized_obs_tags if tag)
-                
-                if has_routing_tag:
-                    target_calendar = self._should_reroute_task(obs_task, rem_task.calendar_id)
-                    if target_calendar:
-                        list_name = self._get_list_name(target_calendar)
-                        self.logger.info(
-                            f"Rerouting task '{obs_task.description}' from {self._get_list_name(rem_task.calendar_id)} to {list_name}"
-                        )
-                        if not dry_run:
-                            if self.rem_manager.update_task(rem_task, {"calendar_id": target_calendar}):
-                                rem_task.calendar_id = target_calendar
-                                rem_task.list_name = list_name
-                                self.changes_made["rem_rerouted"] = self.changes_made.get("rem_rerouted", 0) + 1
-                            else:
-                                self.logger.warning(f"Failed to reroute task '{obs_task.description}' to {list_name}")
-                        else:
-                            self.changes_made["rem_rerouted"] = self.changes_made.get("rem_rerouted", 0) + 1
+        if self.budget.limited or self._resume_keys["updates"]:
+            for link, obs_task, rem_task, _ in self._ordered_links(links, obs_tasks_all, rem_tasks_all):
+                key = link_key(link.obs_uuid, link.rem_uuid)
+                if key in processed_links:
+                    continue
+                if self.budget.spent():
+                    self.deferred["updates"].append(key)
+                    continue
+                self._process_link(obs_task, rem_task, dry_run)
+        else:
+            for link in links:
+                obs_task = self._find_task(obs_tasks_all, link.obs_uuid)
+                rem_task = self._find_task(rem_tasks_all, link.rem_uuid)
+
+                if not obs_task or not rem_task:
+                    continue
+
+                self._process_link(obs_task, rem_task, dry_run)
         
+        phases.start("persist_links")
         # 6. Save links to persistent storage
         if not dry_run:
             # Clean up links for deleted tasks
@@ -567,20 +715,33 @@ class SyncEngine:
                         f"Removing stale link (both tasks missing): {link.obs_uuid} <-> {link.rem_uuid}"
                     )
 
+            cleaned_links.extend(out_of_scope_links)
             if cleaned_links:
                 self._persist_links(cleaned_links, current_obs_uuids=current_obs_uuids)
 
+        phases.start("summarize")
         # Collect tag routing summary
         tag_summary = self._collect_tag_routing_summary(obs_tasks, rem_tasks, links)
         
-        # Collect insights (completions, overdue, new tasks)
-        self._collect_insights(obs_tasks_all, rem_tasks_all, links)
-        
-        # Record streaks if enabled and not in dry-run
+        # Insights and streaks describe the whole vault, so scoped runs skip them
         streaks_data = None
-        if self.sync_config and self.sync_config.enable_streak_tracking and not dry_run:
-            streaks_data = self._record_streaks(obs_tasks_all, rem_tasks_all, links)
+        if scope is None:
+            # One pass over the tasks feeds both insights and streaks
+            summary = InsightsAggregator().run(
+                rem_tasks_all,
+                obs_tasks_all,
+                links,
+                created_rem_ids=self.created_rem_task_ids,
+                created_obs_ids=self.created_obs_task_ids,
+            )
+            self._collect_insights(summary)
+            
+            # Record streaks if enabled and not in dry-run
+            if self.sync_config and self.sync_config.enable_streak_tracking and not dry_run:
+                streaks_data = self._record_streaks(summary)
         
+        phases.stop()
+
         # Return results
         return {
             'success': True,
@@ -595,8 +756,119 @@ class SyncEngine:
             'skipped_rem_count': self.skipped_rem_count,
             'insights': self.insights_data,
             'streaks': streaks_data,
+            'scope': scope.to_dict() if scope is not None else None,
+            'reminders_delta': rem_delta.to_dict() if rem_delta is not None else None,
+            'deferred': self.deferred,
+            'timings': phases.summary(),
+            'io': {
+                'files_read': self._files_read() - files_read_before,
+                'eventkit_calls': self._eventkit_calls() - eventkit_calls_before,
+            },
             'dry_run': dry_run
         }
+
+    def _matcher_settings(self) -> List[Any]:
+        return [self.matcher.min_score, self.matcher.days_tolerance]
+
+    def _collect_linked_reminders(
+        self, obs_tasks: List[ObsidianTask], list_ids: Optional[List[str]]
+    ) -> Optional[List[RemindersTask]]:
+        """Fetch only the reminders linked to a scoped run's Obsidian tasks.
+
+        Returns None when any task is still unlinked (the matcher then needs
+        the full lists to avoid creating duplicates) or when the gateway cannot
+        look reminders up by identifier.
+        """
+        fetch = getattr(self.rem_manager, "get_tasks_by_ids", None)
+        if not callable(fetch):
+            return None
+        linked = {link.obs_uuid: link.rem_uuid for link in self._load_existing_links()}
+        if any(task.uuid not in linked for task in obs_tasks):
+            return None
+        rem_uuids = sorted({linked[task.uuid] for task in obs_tasks})
+        tasks = fetch(rem_uuids) if rem_uuids else []
+        if not isinstance(tasks, list):
+            return None
+        if list_ids:
+            # Same view as a list fetch: reminders moved out of the synced lists are missing
+            wanted = set(list_ids)
+            tasks = [task for task in tasks if task.calendar_id in wanted]
+        self.logger.info("Fetched %d linked Reminders tasks by identifier", len(tasks))
+        return tasks
+
+    def _process_link(self, obs_task: ObsidianTask, rem_task: RemindersTask, dry_run: bool) -> None:
+        """Resolve conflicts for one linked pair and apply the winning values."""
+        # Resolve conflicts
+        conflicts = self.resolver.resolve_conflicts(obs_task, rem_task)
+        
+        # Apply changes based on conflict resolution
+        self._apply_sync_changes(obs_task, rem_task, conflicts, dry_run)
+        
+        # Check for tag-based rerouting (independent of conflict resolution)
+        # Only evaluate if task has tags that could match a route
+        if self.direction in ("both", "obs-to-rem") and obs_task.tags:
+            # Check if any tag matches a configured route for this vault
+            if self.routing.matching_routes(obs_task.tags):
+                target_calendar = self._should_reroute_task(obs_task, rem_task.calendar_id)
+                if target_calendar:
+                    list_name = self._get_list_name(target_calendar)
+                    self.logger.info(
+                        f"Rerouting task '{obs_task.description}' from {self._get_list_name(rem_task.calendar_id)} to {list_name}"
+                    )
+                    if not dry_run:
+                        if self.rem_manager.update_task(rem_task, {"calendar_id": target_calendar}):
+                            rem_task.calendar_id = target_calendar
+                            rem_task.list_name = list_name
+                            self.changes_made["rem_rerouted"] = self.changes_made.get("rem_rerouted", 0) + 1
+                        else:
+                            self.logger.warning(f"Failed to reroute task '{obs_task.description}' to {list_name}")
+                    else:
+                        self.changes_made["rem_rerouted"] = self.changes_made.get("rem_rerouted", 0) + 1
+
+    def _ordered_links(
+        self,
+        links: List[SyncLink],
+        obs_tasks: List[ObsidianTask],
+        rem_tasks: List[RemindersTask],
+    ) -> List[Tuple[SyncLink, ObsidianTask, RemindersTask, int]]:
+        """Linked pairs with both tasks present, most valuable work first.
+
+        Status changes come first, then overdue or soon-due tasks; pairs left
+        over from a previous budget-limited run go first within their rank.
+        """
+        obs_by_uuid = {task.uuid: task for task in obs_tasks}
+        rem_by_uuid = {task.uuid: task for task in rem_tasks}
+        resume = self._resume_keys["updates"]
+        ranked = []
+        for index, link in enumerate(links):
+            obs_task = obs_by_uuid.get(link.obs_uuid)
+            rem_task = rem_by_uuid.get(link.rem_uuid)
+            if not obs_task or not rem_task:
+                continue
+            priority = work_priority(
+                obs_task, rem_task, status_changed=obs_task.status != rem_task.status
+            )
+            resumed = 0 if link_key(link.obs_uuid, link.rem_uuid) in resume else 1
+            ranked.append(((priority, resumed, index), (link, obs_task, rem_task, priority)))
+        ranked.sort(key=lambda item: item[0])
+        return [entry for _, entry in ranked]
+
+    def _ordered_tasks(self, tasks: List, kind: str) -> List:
+        """Unmatched tasks ordered by due-date urgency, resumed ones first within a rank."""
+        resume = self._resume_keys[kind]
+        ranked = sorted(
+            enumerate(tasks),
+            key=lambda item: (work_priority(item[1]), 0 if item[1].uuid in resume else 1, item[0]),
+        )
+        return [task for _, task in ranked]
+
+    def _files_read(self) -> int:
+        count = getattr(self.obs_manager, "files_read", 0)
+        return count if isinstance(count, int) else 0
+
+    def _eventkit_calls(self) -> int:
+        calls = getattr(getattr(self.rem_manager, "gateway", None), "calls", None)
+        return sum(calls.values()) if isinstance(calls, dict) else 0
     
     def _find_task(self, tasks: List, uuid: str):
         """Find task by UUID."""
@@ -733,47 +1005,20 @@ class SyncEngine:
         Returns:
             Calendar ID for the task
         """
-        if self.sync_config and self.vault_id:
-            normalized_tags = {
-                tag
-                for tag in (
-                    SyncConfig._normalize_tag_value(t)
-                    for t in (getattr(obs_task, "tags", None) or [])
-                )
-                if tag
-            }
-            if normalized_tags:
-                routes = self.sync_config.get_tag_routes_for_vault(self.vault_id)
-                # Sort routes by tag specificity (longer tags first) for deterministic matching
-                sorted_routes = sorted(routes, key=lambda r: len(r.get("tag", "")), reverse=True)
-
-                for route in sorted_routes:
-                    route_tag = route.get("tag")
-                    calendar_id = route.get("calendar_id")
-                    if (
-                        route_tag
-                        and calendar_id
-                        and route_tag in normalized_tags
-                        and (not list_ids or calendar_id in list_ids)
-                    ):
-                        self.logger.debug(
-                            f"Task matches route: {route_tag} -> {calendar_id}"
-                        )
-                        return calendar_id
+        # The most specific route wins, so #work/clienta beats #work
+        calendar_id = self.routing.calendar_for_tags(getattr(obs_task, "tags", None), list_ids)
+        if calendar_id:
+            self.logger.debug(f"Task '{obs_task.description}' matches route -> {calendar_id}")
+            return calendar_id
         return default_calendar
 
     def _get_route_tag_for_calendar(self, calendar_id: Optional[str]) -> Optional[str]:
-        if not (self.sync_config and self.vault_id and calendar_id):
-            return None
-        return self.sync_config.get_route_tag_for_calendar(self.vault_id, calendar_id)
+        return self.routing.route_tag_for_calendar(calendar_id)
 
     def _get_list_name(self, calendar_id: Optional[str]) -> str:
-        if not self.sync_config or not calendar_id:
+        if not self.sync_config:
             return "Reminders"
-        for lst in getattr(self.sync_config, "reminders_lists", []):
-            if getattr(lst, "identifier", None) == calendar_id:
-                return getattr(lst, "name", calendar_id)
-        return calendar_id
+        return self.routing.list_name(calendar_id)
 
     def _should_reroute_task(self, obs_task: ObsidianTask, current_calendar_id: str) -> Optional[str]:
         """Check if a task should be moved to a different calendar based on its tags.
@@ -824,6 +1069,9 @@ class SyncEngine:
                 self.logger.warning("No calendar ID available for creating Reminders tasks")
 
             for obs_task in unmatched_obs:
+                if self.budget.spent():
+                    self.deferred["create_rem"].append(obs_task.uuid)
+                    continue
                 target_calendar = self._select_calendar_for_obs_task(
                     obs_task,
                     default_calendar,
@@ -885,91 +1133,108 @@ class SyncEngine:
         
         # Create Obsidian tasks for unmatched Reminders tasks
         if self.direction in ("both", "rem-to-obs") and unmatched_rem:
-            for rem_task in unmatched_rem:
-                list_name = self._get_list_name(rem_task.calendar_id)
-                self.logger.debug(
-                    "Creating Obsidian task for '%s' from Reminders list '%s' (calendar_id=%s, rem_uuid=%s)",
-                    rem_task.title,
-                    list_name,
-                    rem_task.calendar_id,
-                    rem_task.uuid,
-                )
-
-                route_tag = self._get_route_tag_for_calendar(rem_task.calendar_id)
-                obs_tags = list(rem_task.tags) if rem_task.tags else []
-                if route_tag and route_tag not in obs_tags:
-                    obs_tags.append(route_tag)
-                if "#from-reminders" not in obs_tags:
-                    obs_tags.append("#from-reminders")
+            # Buffer inbox appends so the whole batch lands in one write
+            if not dry_run:
+                self.obs_manager.defer_appends = True
+            try:
+                for rem_task in unmatched_rem:
+                    if self.budget.spent():
+                        self.deferred["create_obs"].append(rem_task.uuid)
+                        continue
+                    list_name = self._get_list_name(rem_task.calendar_id)
+                    self.logger.debug(
+                        "Creating Obsidian task for '%s' from Reminders list '%s' (calendar_id=%s, rem_uuid=%s)",
+                        rem_task.title,
+                        list_name,
+                        rem_task.calendar_id,
+                        rem_task.uuid,
+                    )
 
-                vault_id = self.vault_id or os.path.basename(self.vault_path)
-                vault_name = self.vault_name or os.path.basename(self.vault_path)
+                    route_tag = self._get_route_tag_for_calendar(rem_task.calendar_id)
+                    obs_tags = list(rem_task.tags) if rem_task.tags else []
+                    if route_tag and route_tag not in obs_tags:
+                        obs_tags.append(route_tag)
+                    if "#from-reminders" not in obs_tags:
+                        obs_tags.append("#from-reminders")
+
+                    vault_id = self.vault_id or os.path.basename(self.vault_path)
+                    vault_name = self.vault_name or os.path.basename(self.vault_path)
+                    inbox_path = self.inbox_path
+                    if self.inbox_rotation != "none":
+                        inbox_path = self.obs_manager.resolve_inbox_path(
+                            self.vault_path, self.inbox_path, list_name=list_name
+                        )
 
-                description_text = rem_task.display_title()
-                created_at_iso = (
-                    self._datetime_to_iso(rem_task.created_at)
-                    or datetime.now(timezone.utc).isoformat()
-                )
-                modified_at_iso = (
-                    self._datetime_to_iso(rem_task.modified_at) or created_at_iso
-                )
+                    description_text = rem_task.display_title()
+                    created_at_iso = (
+                        self._datetime_to_iso(rem_task.created_at)
+                        or datetime.now(timezone.utc).isoformat()
+                    )
+                    modified_at_iso = (
+                        self._datetime_to_iso(rem_task.modified_at) or created_at_iso
+                    )
 
-                obs_task = ObsidianTask(
-                    uuid=f"obs-{uuid.uuid4().hex[:8]}",
-                    vault_id=vault_id,
-                    vault_name=vault_name,
-                    vault_path=self.vault_path,
-                    file_path=self.inbox_path,
-                    line_number=0,  # Will be set when created
-                    block_id=None,  # Will be set when created
-                    status=rem_task.status,
-                    description=description_text,
-                    raw_line="",  # Will be set when created
-                    due_date=rem_task.due_date,
-                    completion_date=None,
-                    priority=rem_task.priority,
-                    tags=obs_tags,
-                    created_at=created_at_iso,
-                    modified_at=modified_at_iso,
-                )
+                    obs_task = ObsidianTask(
+                        uuid=f"obs-{uuid.uuid4().hex[:8]}",
+                        vault_id=vault_id,
+                        vault_name=vault_name,
+                        vault_path=self.vault_path,
+                        file_path=inbox_path,
+                        line_number=0,  # Will be set when created
+                        block_id=None,  # Will be set when created
+                        status=rem_task.status,
+                        description=description_text,
+                        raw_line="",  # Will be set when created
+                        due_date=rem_task.due_date,
+                        completion_date=None,
+                        priority=rem_task.priority,
+                        tags=obs_tags,
+                        created_at=created_at_iso,
+                        modified_at=modified_at_iso,
+                    )
                 
-                # Track metadata for verbose output
-                creation_metadata = {
-                    "title": rem_task.title,
-                    "rem_uuid": rem_task.uuid,
-                    "list_name": list_name,
-                    "calendar_id": rem_task.calendar_id,
-                    "url": rem_task.url,
-                    "obs_uuid": None,  # Will be set after creation if not dry_run
-                }
+                    # Track metadata for verbose output
+                    creation_metadata = {
+                        "title": rem_task.title,
+                        "rem_uuid": rem_task.uuid,
+                        "list_name": list_name,
+                        "calendar_id": rem_task.calendar_id,
+                        "url": rem_task.url,
+                        "obs_uuid": None,  # Will be set after creation if not dry_run
+                    }
                 
-                if not dry_run:
-                    # Actually create the task
-                    created_task = self.obs_manager.create_task(
-                        self.vault_path, self.inbox_path, obs_task
-                    )
-                    if created_task:
-                        created_obs_tasks.append(created_task)
-                        self.created_obs_task_ids.add(created_task.uuid)
-                        creation_metadata["obs_uuid"] = created_task.uuid
-                        # Create a link for the new pair
-                        link = SyncLink(
-                            obs_uuid=created_task.uuid,
-                            rem_uuid=rem_task.uuid,
-                            score=1.0,  # Perfect match as it's a copy
-                            vault_id=self.vault_id,
-                            last_synced=datetime.now(timezone.utc).isoformat(),
+                    if not dry_run:
+                        # Actually create the task
+                        created_task = self.obs_manager.create_task(
+                            self.vault_path, inbox_path, obs_task
                         )
-                        new_links.append(link)
-                else:
-                    # In dry run, use the planned obs_task UUID
-                    creation_metadata["obs_uuid"] = obs_task.uuid
+                        if created_task:
+                            created_obs_tasks.append(created_task)
+                            self.created_obs_task_ids.add(created_task.uuid)
+                            creation_metadata["obs_uuid"] = created_task.uuid
+                            # Create a link for the new pair
+                            link = SyncLink(
+                                obs_uuid=created_task.uuid,
+                                rem_uuid=rem_task.uuid,
+                                score=1.0,  # Perfect match as it's a copy
+                                vault_id=self.vault_id,
+                                last_synced=datetime.now(timezone.utc).isoformat(),
+                            )
+                            new_links.append(link)
+                    else:
+                        # In dry run, use the planned obs_task UUID
+                        creation_metadata["obs_uuid"] = obs_task.uuid
                 
-                self.rem_to_obs_creations.append(creation_metadata)
+                    self.rem_to_obs_creations.append(creation_metadata)
                 
-                # Count both actual and planned creations
-                self.changes_made["obs_created"] += 1
-                self.changes_made["links_created"] += 1
+                    # Count both actual and planned creations
+                    self.changes_made["obs_created"] += 1
+                    self.changes_made["links_created"] += 1
+            finally:
+                # Flush even when a creation fails so buffered tasks are not lost
+                if not dry_run:
+                    self.obs_manager.defer_appends = False
+                    self.obs_manager.flush_appends()
         
         return new_links, created_obs_tasks, created_rem_tasks
     
@@ -1039,12 +1304,20 @@ class SyncEngine:
             if not os.path.exists(links_path):
                 return []
 
-            data = safe_read_json(links_path, default={'links': []})
-            if not isinstance(data, dict):
-                data = {'links': []}
+            # Long-lived engines reuse the parsed file until it changes on disk
+            file_stat = os.stat(links_path)
+            signature = (links_path, file_stat.st_mtime_ns, file_stat.st_size)
+            if self._links_cache is not None and self._links_cache[0] == signature:
+                raw_links = self._links_cache[1]
+            else:
+                data = safe_read_json(links_path, default={'links': []})
+                if not isinstance(data, dict):
+                    data = {'links': []}
+                raw_links = data.get('links', [])
+                self._links_cache = (signature, raw_links)
 
             links = []
-            for link_data in data.get('links', []):
+            for link_data in raw_links:
                 try:
                     link = SyncLink.from_dict(link_data)
                 except Exception as exc:
@@ -1221,253 +1494,71 @@ class SyncEngine:
         Returns:
             Dict mapping tags to list names and their task counts
         """
-        if not self.sync_config or not self.vault_id:
-            return {}
-            
-        tag_routes = self.sync_config.get_tag_routes_for_vault(self.vault_id)
-        if not tag_routes:
+        routing = self.routing
+        if not routing:
             return {}
             
         summary: Dict[str, Dict[str, int]] = {}
         
-        # Create a map of task UUIDs that are linked
-        linked_obs_uuids = {link.obs_uuid for link in links}
-        linked_rem_uuids = {link.rem_uuid for link in links}
+        # Linked Reminders calendar per Obsidian task (first link wins)
+        rem_calendars = {task.uuid: task.calendar_id for task in rem_tasks}
+        linked_calendars: Dict[str, Optional[str]] = {}
+        for link in links:
+            linked_calendars.setdefault(link.obs_uuid, rem_calendars.get(link.rem_uuid))
         
-        # Process each configured tag route
-        for route in tag_routes:
-            tag = route.get('tag')
-            calendar_id = route.get('calendar_id')
-            if not tag or not calendar_id:
+        # Count Obsidian tasks per route tag that are synced to the routed list
+        counts: Dict[str, int] = {}
+        for obs_task in obs_tasks:
+            calendar_id = linked_calendars.get(obs_task.uuid)
+            if calendar_id is None:
                 continue
-                
-            list_name = self._get_list_name(calendar_id)
-            
-            # Count Obsidian tasks with this tag that are synced to the target list
-            count = 0
-            for obs_task in obs_tasks:
-                if obs_task.uuid not in linked_obs_uuids:
-                    continue
-                    
-                # Check if task has the tag
-                normalized_tags = {
-                    SyncConfig._normalize_tag_value(t)
-                    for t in (obs_task.tags or [])
-                    if SyncConfig._normalize_tag_value(t)
-                }
-                
-                if tag in normalized_tags:
-                    # Find the linked Reminders task to verify it's in the right list
-                    for link in links:
-                        if link.obs_uuid == obs_task.uuid:
-                            rem_task = self._find_task(rem_tasks, link.rem_uuid)
-                            if rem_task and rem_task.calendar_id == calendar_id:
-                                count += 1
-                                break
-            
-            if count > 0:
-                if tag not in summary:
-                    summary[tag] = {}
-                summary[tag][list_name] = count
+            for route in routing.matching_routes(obs_task.tags):
+                if route["calendar_id"] == calendar_id:
+                    counts[route["tag"]] = counts.get(route["tag"], 0) + 1
+        
+        for route in routing.routes:
+            count = counts.get(route["tag"])
+            if count:
+                summary[route["tag"]] = {self._get_list_name(route["calendar_id"]): count}
         
         return summary
     
-    def _collect_insights(
-        self,
-        obs_tasks: List[ObsidianTask],
-        rem_tasks: List[RemindersTask],
-        links: List[SyncLink]
-    ) -> None:
+    def _collect_insights(self, summary: InsightsSummary) -> None:
         """
-        Collect insight data from current sync: completions, overdue, new tasks.
+        Store insight data from current sync: completions, overdue, new tasks.
         Updates self.insights_data with aggregated counts by list and tag.
         """
-        today = date.today()
-        
-        # Build a map of linked tasks
-        obs_uuid_to_rem = {link.obs_uuid: link.rem_uuid for link in links}
-        rem_uuid_to_obs = {link.rem_uuid: link.obs_uuid for link in links}
-        
-        # Track completions (tasks marked done recently)
-        for rem_task in rem_tasks:
-            if rem_task.status == TaskStatus.DONE:
-                # Check if completion is recent (within last 7 days for insights)
-                if rem_task.completion_date:
-                    days_since_completion = (today - rem_task.completion_date).days
-                    if days_since_completion <= 7:
-                        self.insights_data["completions"] += 1
-                        
-                        # By list
-                        list_name = rem_task.list_name or "Unknown"
-                        if list_name not in self.insights_data["by_list"]:
-                            self.insights_data["by_list"][list_name] = {
-                                "completions": 0, "overdue": 0, "new_tasks": 0
-                            }
-                        self.insights_data["by_list"][list_name]["completions"] += 1
-                        
-                        # By tag (get from linked Obsidian task)
-                        if rem_task.uuid in rem_uuid_to_obs:
-                            obs_uuid = rem_uuid_to_obs[rem_task.uuid]
-                            obs_task = self._find_task(obs_tasks, obs_uuid)
-                            if obs_task and obs_task.tags:
-                                for tag in obs_task.tags:
-                                    normalized_tag = SyncConfig._normalize_tag_value(tag)
-                                    if normalized_tag:
-                                        if normalized_tag not in self.insights_data["by_tag"]:
-                                            self.insights_data["by_tag"][normalized_tag] = {
-                                                "completions": 0, "overdue": 0, "new_tasks": 0
-                                            }
-                                        self.insights_data["by_tag"][normalized_tag]["completions"] += 1
-        
-        # Track overdue tasks
-        for rem_task in rem_tasks:
-            if rem_task.status != TaskStatus.DONE and rem_task.due_date:
-                if rem_task.due_date < today:
-                    self.insights_data["overdue"] += 1
-                    
-                    # By list
-                    list_name = rem_task.list_name or "Unknown"
-                    if list_name not in self.insights_data["by_list"]:
-                        self.insights_data["by_list"][list_name] = {
-                            "completions": 0, "overdue": 0, "new_tasks": 0
-                        }
-                    self.insights_data["by_list"][list_name]["overdue"] += 1
-                    
-                    # By tag
-                    if rem_task.uuid in rem_uuid_to_obs:
-                        obs_uuid = rem_uuid_to_obs[rem_task.uuid]
-                        obs_task = self._find_task(obs_tasks, obs_uuid)
-                        if obs_task and obs_task.tags:
-                            for tag in obs_task.tags:
-                                normalized_tag = SyncConfig._normalize_tag_value(tag)
-                                if normalized_tag:
-                                    if normalized_tag not in self.insights_data["by_tag"]:
-                                        self.insights_data["by_tag"][normalized_tag] = {
-                                            "completions": 0, "overdue": 0, "new_tasks": 0
-                                        }
-                                    self.insights_data["by_tag"][normalized_tag]["overdue"] += 1
-        
-        # Track new tasks created during this sync (both directions)
-        # New Reminders tasks
-        for task_id in self.created_rem_task_ids:
-            rem_task = self._find_task(rem_tasks, task_id)
-            if rem_task:
-                self.insights_data["new_tasks"] += 1
-                
-                # By list
-                list_name = rem_task.list_name or "Unknown"
-                if list_name not in self.insights_data["by_list"]:
-                    self.insights_data["by_list"][list_name] = {
-                        "completions": 0, "overdue": 0, "new_tasks": 0
-                    }
-                self.insights_data["by_list"][list_name]["new_tasks"] += 1
-                
-                # By tag
-                if rem_task.uuid in rem_uuid_to_obs:
-                    obs_uuid = rem_uuid_to_obs[rem_task.uuid]
-                    obs_task = self._find_task(obs_tasks, obs_uuid)
-                    if obs_task and obs_task.tags:
-                        for tag in obs_task.tags:
-                            normalized_tag = SyncConfig._normalize_tag_value(tag)
-                            if normalized_tag:
-                                if normalized_tag not in self.insights_data["by_tag"]:
-                                    self.insights_data["by_tag"][normalized_tag] = {
-                                        "completions": 0, "overdue": 0, "new_tasks": 0
-                                    }
-                                self.insights_data["by_tag"][normalized_tag]["new_tasks"] += 1
-        
-        # New Obsidian tasks
-        for task_id in self.created_obs_task_ids:
-            obs_task = self._find_task(obs_tasks, task_id)
-            if obs_task:
-                self.insights_data["new_tasks"] += 1
-                
-                # By tag
-                if obs_task.tags:
-                    for tag in obs_task.tags:
-                        normalized_tag = SyncConfig._normalize_tag_value(tag)
-                        if normalized_tag:
-                            if normalized_tag not in self.insights_data["by_tag"]:
-                                self.insights_data["by_tag"][normalized_tag] = {
-                                    "completions": 0, "overdue": 0, "new_tasks": 0
-                                }
-                            self.insights_data["by_tag"][normalized_tag]["new_tasks"] += 1
-                
-                # By list (get from linked Reminders task)
-                if obs_task.uuid in obs_uuid_to_rem:
-                    rem_uuid = obs_uuid_to_rem[obs_task.uuid]
-                    rem_task = self._find_task(rem_tasks, rem_uuid)
-                    if rem_task:
-                        list_name = rem_task.list_name or "Unknown"
-                        if list_name not in self.insights_data["by_list"]:
-                            self.insights_data["by_list"][list_name] = {
-                                "completions": 0, "overdue": 0, "new_tasks": 0
-                            }
-                        self.insights_data["by_list"][list_name]["new_tasks"] += 1
+        self.insights_data = summary.insights()
     
-    def _record_streaks(
-        self,
-        obs_tasks: List[ObsidianTask],
-        rem_tasks: List[RemindersTask],
-        links: List[SyncLink]
-    ) -> Optional[Dict[str, Any]]:
+    def _record_streaks(self, summary: InsightsSummary) -> Optional[Dict[str, Any]]:
         """Record completion streaks using StreakTracker.
         
         Args:
-            obs_tasks: All Obsidian tasks in this sync
-            rem_tasks: All Reminders tasks in this sync
-            links: All sync links
+            summary: Aggregated insights holding completions grouped by day
         
         Returns:
             Dict with current streaks if tracking is enabled, None otherwise.
         """
         from ..analytics.streaks import StreakTracker
-        from collections import defaultdict
         
         try:
-            tracker = StreakTracker()
-            
-            # Build a map of linked tasks
-            rem_uuid_to_obs = {link.rem_uuid: link.obs_uuid for link in links}
-            
-            # Group completions by their actual completion date
-            completions_by_date = defaultdict(lambda: {"by_tag": defaultdict(int), "by_list": defaultdict(int)})
+            with _STREAKS_LOCK:
+                tracker = StreakTracker()
             
-            # Only process tasks completed within the last 7 days
-            today = date.today()
-            
-            for rem_task in rem_tasks:
-                if rem_task.status == TaskStatus.DONE and rem_task.completion_date:
-                    days_since = (today - rem_task.completion_date).days
-                    if days_since <= 7:
-                        completion_date = rem_task.completion_date
-                        
-                        # Count by list
-                        list_name = rem_task.list_name or "Unknown"
-                        completions_by_date[completion_date]["by_list"][list_name] += 1
-                        
-                        # Count by tag (get from linked Obsidian task)
-                        if rem_task.uuid in rem_uuid_to_obs:
-                            obs_uuid = rem_uuid_to_obs[rem_task.uuid]
-                            obs_task = self._find_task(obs_tasks, obs_uuid)
-                            if obs_task and obs_task.tags:
-                                for tag in obs_task.tags:
-                                    normalized_tag = SyncConfig._normalize_tag_value(tag)
-                                    if normalized_tag:
-                                        completions_by_date[completion_date]["by_tag"][normalized_tag] += 1
-            
-            # Record completions for each date
-            for completion_date, counts in completions_by_date.items():
-                tracker.record_completions(
-                    vault_id=self.vault_id,
-                    target_date=completion_date,
-                    by_tag=dict(counts["by_tag"]),
-                    by_list=dict(counts["by_list"])
-                )
+                # Record completions for each date, written once for the batch
+                with tracker.batch():
+                    for completion_date in sorted(summary.completions_by_date):
+                        counts = summary.completions_by_date[completion_date]
+                        tracker.record_completions(
+                            vault_id=self.vault_id,
+                            target_date=completion_date,
+                            by_tag=counts["by_tag"],
+                            by_list=counts["by_list"]
+                        )
             
-            # Get all current streaks
-            streaks = tracker.get_all_streaks(vault_id=self.vault_id, min_current=1)
-            return streaks
+                # Get all current streaks
+                streaks = tracker.get_all_streaks(vault_id=self.vault_id, min_current=1)
+                return streaks
             
         except Exception as e:
             self.logger.warning(f"Failed to record streaks: {e}")
@@ -1483,12 +1574,11 @@ class SyncEngine:
         """
         try:
             links_path = os.path.expanduser(self.links_path)
-            existing_map: Dict[str, Dict[str, Any]] = {}
             current_obs_uuids = set(current_obs_uuids or [])
+            totals = {}
 
-            # Load existing links if the file already exists
-            if os.path.exists(links_path):
-                data = safe_read_json(links_path, default={'links': []})
+            def merge(data: Any) -> Dict[str, Any]:
+                existing_map: Dict[str, Dict[str, Any]] = {}
                 if isinstance(data, dict):
                     for entry in data.get('links', []):
                         if not isinstance(entry, dict):
@@ -1497,32 +1587,35 @@ class SyncEngine:
                         if entry.get('obs_uuid') and entry.get('rem_uuid'):
                             existing_map[key] = entry
 
-            # Remove entries belonging to this vault so we can replace them
-            filtered_map: Dict[str, Dict[str, Any]] = {}
-            for key, entry in existing_map.items():
-                entry_vault = entry.get('vault_id')
-                entry_obs_uuid = entry.get('obs_uuid')
+                # Remove entries belonging to this vault so we can replace them
+                filtered_map: Dict[str, Dict[str, Any]] = {}
+                for key, entry in existing_map.items():
+                    entry_vault = entry.get('vault_id')
+                    entry_obs_uuid = entry.get('obs_uuid')
 
-                belongs_to_current = False
-                if entry_vault and self.vault_id and entry_vault == self.vault_id:
-                    belongs_to_current = True
-                elif not entry_vault and entry_obs_uuid in current_obs_uuids:
-                    belongs_to_current = True
+                    belongs_to_current = False
+                    if entry_vault and self.vault_id and entry_vault == self.vault_id:
+                        belongs_to_current = True
+                    elif not entry_vault and entry_obs_uuid in current_obs_uuids:
+                        belongs_to_current = True
 
-                if not belongs_to_current:
-                    filtered_map[key] = entry
+                    if not belongs_to_current:
+                        filtered_map[key] = entry
 
-            # Add/replace with the current vault's links
-            for link in links:
-                key = f"{link.obs_uuid}:{link.rem_uuid}"
-                filtered_map[key] = link.to_dict()
+                # Add/replace with the current vault's links
+                for link in links:
+                    key = f"{link.obs_uuid}:{link.rem_uuid}"
+                    filtered_map[key] = link.to_dict()
+
+                totals['links'] = len(filtered_map)
+                return {'links': list(filtered_map.values())}
 
-            # Persist the merged set back to disk
-            payload = {'links': list(filtered_map.values())}
-            if not safe_write_json(links_path, payload):
+            # Read and write under one lock so vaults synced in parallel
+            # cannot drop each other's entries
+            if not update_json(links_path, merge, default={'links': []}):
                 self.logger.error("Failed to persist links to %s", links_path)
                 return
 
-            self.logger.debug(f"Persisted {len(links)} active links (total {len(filtered_map)}) to {links_path}")
+            self.logger.debug(f"Persisted {len(links)} active links (total {totals.get('links')}) to {links_path}")
         except Exception as e:
             self.logger.error(f"Failed to persist links: {e}")
@@ -0,0 +1,224 @@
+"""
+Change fingerprints for skipping no-op sync runs.
+
+A fingerprint summarises both sides cheaply: the vault as a digest of
+``(path, mtime, size)`` for every note that would be scanned, Reminders as a
+per-list count plus latest modification date, and the settings that shape a
+sync together with the current date. When all three match the fingerprint
+stored after the last applied run that found nothing to do, the next run can exit
+without scanning, fetching or matching anything. The date is part of the
+settings digest because a run also does daily work (daily-note insights,
+streaks, overdue counts, calendar import) even when no task changed.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..core.config import SyncConfig
+from ..obsidian.ignore import IgnoreMatcher
+from ..utils.io import safe_read_json, update_json
+
+
+FINGERPRINTS_FILE = "sync_fingerprints.json"
+
+
+@dataclass
+class SyncFingerprint:
+    """Digests describing one vault/direction pair at a point in time."""
+
+    vault: str
+    reminders: str
+    settings: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+def _digest(payload: Any) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def vault_fingerprint(vault_path: str, matcher: IgnoreMatcher) -> str:
+    """Digest of the stat summary of every note the sync would scan."""
+    entries: List[str] = []
+    for rel_path in matcher.iter_markdown_files(vault_path):
+        try:
+            stat = os.stat(os.path.join(vault_path, rel_path))
+        except OSError:
+            continue
+        entries.append(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}")
+    entries.sort()
+
+    digest = hashlib.sha1()
+    for entry in entries:
+        digest.update(entry.encode("utf-8", "surrogateescape"))
+        digest.update(b"\n")
+    # Changing Obsidian's excluded-files setting changes what gets scanned
+    try:
+        app_stat = os.stat(os.path.join(vault_path, ".obsidian", "app.json"))
+        digest.update(f"app.json\0{app_stat.st_mtime_ns}\0{app_stat.st_size}".encode("utf-8"))
+    except OSError:
+        pass
+    return digest.hexdigest()
+
+
+def reminders_fingerprint(gateway: Any, list_ids: Optional[List[str]]) -> Optional[str]:
+    """Digest of per-list reminder counts and latest modification dates.
+
+    Returns None when the gateway cannot summarise lists, in which case the
+    run must not be skipped.
+    """
+    summarise = getattr(gateway, "get_list_fingerprints", None)
+    if not callable(summarise):
+        return None
+    summary = summarise(list_ids)
+    if not isinstance(summary, dict):
+        return None
+    return _digest(summary)
+
+
+def fingerprint_list_ids(config: SyncConfig, list_ids: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Every list a sync of ``list_ids`` could read: requested, default, mapped and routed."""
+    ids = set(list_ids or [])
+    if config.default_calendar_id:
+        ids.add(config.default_calendar_id)
+    for mapping in config.vault_mappings:
+        if mapping.get("calendar_id"):
+            ids.add(mapping["calendar_id"])
+    for route in config.tag_routes:
+        if route.get("calendar_id"):
+            ids.add(route["calendar_id"])
+    return sorted(ids) or None
+
+
+def settings_fingerprint(config: SyncConfig, list_ids: Optional[List[str]], direction: str) -> str:
+    """Digest of the configuration that influences what a sync does, and the date."""
+    return _digest({
+        # The first run of a day must not be skipped: daily work depends on it
+        "date": date.today().isoformat(),
+        "direction": direction,
+        "list_ids": list_ids,
+        "vaults": [(vault.vault_id, vault.path) for vault in config.vaults],
+        "vault_mappings": config.vault_mappings,
+        "tag_routes": config.tag_routes,
+        "vault_scan_filters": config.vault_scan_filters,
+        "respect_obsidian_ignore": config.respect_obsidian_ignore,
+        "min_score": config.min_score,
+        "days_tolerance": config.days_tolerance,
+        "include_completed": config.include_completed,
+        "obsidian_inbox_path": config.obsidian_inbox_path,
+        "inbox_rotation": config.inbox_rotation,
+        "inbox_max_bytes": config.inbox_max_bytes,
+        "enable_deduplication": config.enable_deduplication,
+        "dedup_auto_apply": config.dedup_auto_apply,
+        "dedup_near_duplicates": config.dedup_near_duplicates,
+        "dedup_similarity_threshold": config.dedup_similarity_threshold,
+        "sync_calendar_events": config.sync_calendar_events,
+        "enable_insights": config.enable_insights,
+        "enable_streak_tracking": config.enable_streak_tracking,
+        "insights_in_daily_notes": config.insights_in_daily_notes,
+        "enable_hygiene_assistant": config.enable_hygiene_assistant,
+        "hygiene_stagnant_threshold": config.hygiene_stagnant_threshold,
+        # A deleted links file must force a full run
+        "links_present": bool(config.links_path and os.path.exists(os.path.expanduser(config.links_path))),
+    })
+
+
+def compute_fingerprint(
+    config: SyncConfig,
+    vault_path: str,
+    list_ids: Optional[Iterable[str]],
+    direction: str,
+    gateway: Any,
+    vault_id: Optional[str] = None,
+) -> Optional[SyncFingerprint]:
+    """Fingerprint both sides of a sync, or None if Reminders cannot be summarised."""
+    lists = fingerprint_list_ids(config, list_ids)
+    reminders = reminders_fingerprint(gateway, lists)
+    if reminders is None:
+        return None
+
+    filters = config.get_vault_scan_filters(vault_id) if vault_id else {"exclude": [], "include": []}
+    matcher = IgnoreMatcher.for_vault(
+        vault_path,
+        exclude=filters["exclude"],
+        include=filters["include"],
+        respect_app_config=config.respect_obsidian_ignore,
+    )
+    return SyncFingerprint(
+        vault=vault_fingerprint(vault_path, matcher),
+        reminders=reminders,
+        settings=settings_fingerprint(config, lists, direction),
+    )
+
+
+class FingerprintStore:
+    """Fingerprints of the last no-op run per ``(vault, direction)``.
+
+    Stored next to the links file so test and alternate data directories keep
+    their own state.
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+
+    @classmethod
+    def for_config(cls, config: SyncConfig, logger: Optional[logging.Logger] = None) -> "FingerprintStore":
+        directory = os.path.dirname(os.path.expanduser(config.links_path or "")) or "."
+        return cls(os.path.join(directory, FINGERPRINTS_FILE), logger=logger)
+
+    @staticmethod
+    def key(vault_path: str, direction: str) -> str:
+        return f"{os.path.abspath(vault_path)}|{direction}"
+
+    def _load(self) -> Dict[str, Any]:
+        data = safe_read_json(self.path, default={})
+        return data if isinstance(data, dict) else {}
+
+    def get(self, vault_path: str, direction: str) -> Optional[Dict[str, Any]]:
+        entry = self._load().get(self.key(vault_path, direction))
+        return entry if isinstance(entry, dict) else None
+
+    def matches(self, vault_path: str, direction: str, fingerprint: SyncFingerprint) -> bool:
+        entry = self.get(vault_path, direction)
+        return entry is not None and entry.get("fingerprint") == fingerprint.to_dict()
+
+    def record(
+        self,
+        vault_path: str,
+        direction: str,
+        fingerprint: SyncFingerprint,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> None:
+        entry = {
+            "fingerprint": fingerprint.to_dict(),
+            "counts": counts or {},
+            "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        }
+
+        def store(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            stored[self.key(vault_path, direction)] = entry
+            return stored
+
+        if not update_json(self.path, store):
+            self.logger.debug("Could not store sync fingerprints at %s", self.path)
+
+    def forget(self, vault_path: str, direction: str) -> None:
+        key = self.key(vault_path, direction)
+        if key not in self._load():
+            return
+
+        def drop(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            stored.pop(key, None)
+            return stored
+
+        update_json(self.path, drop)
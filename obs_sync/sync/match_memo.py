@@ -0,0 +1,129 @@
+"""
+Tasks left unmatched by the last full match, per vault.
+
+After matching, the engine remembers every task that stayed unmatched
+together with a signature of the fields the matcher scores (text, due date,
+priority). Two such tasks were already scored against each other and fell
+below the match threshold, so when neither changed since, the next match
+skips the pair: an unchanged unmatched reminder is only compared against new
+or edited Obsidian tasks, and the other way round. Reminders reported as
+touched by the snapshot's :class:`~obs_sync.reminders.snapshot.ReminderDelta`
+are never considered settled. The memo is stored per vault next to the links
+file and is only used when a Reminders snapshot supplies a delta.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.models import RemindersTask
+from ..utils.io import safe_read_json, update_json
+
+
+MATCH_MEMO_FILE = "match_memo.json"
+MEMO_VERSION = 1
+
+
+def match_signature(task: Any) -> str:
+    """Short digest of the fields :class:`~obs_sync.sync.matcher.TaskMatcher` scores."""
+    text = task.display_title() if isinstance(task, RemindersTask) else task.description
+    priority = getattr(task.priority, "value", task.priority)
+    payload = [text or "", str(task.due_date) if task.due_date else None, priority]
+    encoded = json.dumps(payload, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+class MatchMemo:
+    """Signatures of the tasks one match left unmatched, and the matcher settings it used."""
+
+    def __init__(
+        self,
+        obsidian: Optional[Dict[str, str]] = None,
+        reminders: Optional[Dict[str, str]] = None,
+        settings: Optional[List[Any]] = None,
+    ):
+        self.obsidian: Dict[str, str] = dict(obsidian or {})
+        self.reminders: Dict[str, str] = dict(reminders or {})
+        self.settings: Optional[List[Any]] = list(settings) if settings is not None else None
+
+    @classmethod
+    def from_tasks(cls, obs_tasks: Iterable[Any], rem_tasks: Iterable[Any], settings: List[Any]) -> "MatchMemo":
+        return cls(
+            {task.uuid: match_signature(task) for task in obs_tasks},
+            {task.uuid: match_signature(task) for task in rem_tasks},
+            settings,
+        )
+
+    def settled(
+        self,
+        obs_tasks: Iterable[Any],
+        rem_tasks: Iterable[Any],
+        settings: List[Any],
+        touched: Iterable[str] = (),
+    ) -> Tuple[Set[str], Set[str]]:
+        """Obsidian and Reminders uuids still unmatched and unchanged since the memo.
+
+        Args:
+            obs_tasks: Obsidian tasks about to be matched
+            rem_tasks: Reminders tasks about to be matched
+            settings: Current matcher settings; the memo is ignored if they differ
+            touched: Reminders the snapshot reports as new or changed
+        """
+        if self.settings != list(settings):
+            return set(), set()
+        touched = set(touched)
+        obs = {task.uuid for task in obs_tasks if self.obsidian.get(task.uuid) == match_signature(task)}
+        rem = {
+            task.uuid for task in rem_tasks
+            if task.uuid not in touched and self.reminders.get(task.uuid) == match_signature(task)
+        }
+        return obs, rem
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"obsidian": self.obsidian, "reminders": self.reminders, "settings": self.settings}
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "MatchMemo":
+        if not isinstance(data, dict):
+            return cls()
+        return cls(data.get("obsidian"), data.get("reminders"), data.get("settings"))
+
+
+class MatchMemoStore:
+    """Match memos per vault, stored next to the links file."""
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.logger = logger or logging.getLogger(__name__)
+
+    @classmethod
+    def beside(cls, links_path: str, logger: Optional[logging.Logger] = None) -> "MatchMemoStore":
+        directory = os.path.dirname(os.path.expanduser(links_path or "")) or "."
+        return cls(os.path.join(directory, MATCH_MEMO_FILE), logger=logger)
+
+    @staticmethod
+    def key(vault_path: str) -> str:
+        return os.path.abspath(vault_path)
+
+    def load(self, vault_path: str) -> MatchMemo:
+        data = safe_read_json(self.path, default={})
+        if not isinstance(data, dict) or data.get("version") != MEMO_VERSION:
+            return MatchMemo()
+        return MatchMemo.from_dict((data.get("vaults") or {}).get(self.key(vault_path)))
+
+    def save(self, vault_path: str, memo: MatchMemo) -> None:
+        entry = memo.to_dict()
+        entry["saved_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+        def store(data: Any) -> Dict[str, Any]:
+            stored: Dict[str, Any] = data if isinstance(data, dict) else {}
+            if stored.get("version") != MEMO_VERSION:
+                stored = {"version": MEMO_VERSION, "vaults": {}}
+            stored.setdefault("vaults", {})[self.key(vault_path)] = entry
+            return stored
+
+        if not update_json(self.path, store, indent=None):
+            self.logger.warning("Could not save the match memo to %s", self.path)
@@ -1,6 +1,7 @@
 """Task matching with Hungarian algorithm for optimal pairing."""
 
-from typing import Dict, List, Optional, Tuple
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 import logging
 
 from ..core.models import ObsidianTask, RemindersTask, SyncLink
@@ -10,26 +11,52 @@ from ..utils.text import dice_similarity, normalize_text_for_similarity
 
 class TaskMatcher:
     """Matches tasks between Obsidian and Reminders using Hungarian algorithm."""
+
+    TOKEN_CACHE_SIZE = 50000
     
     def __init__(self, min_score: float = 0.75, days_tolerance: int = 1,
                  logger: Optional[logging.Logger] = None):
         self.min_score = min_score
         self.days_tolerance = days_tolerance
         self.logger = logger or logging.getLogger(__name__)
-        
-        # Try to import scipy for Hungarian algorithm
-        try:
-            from scipy.optimize import linear_sum_assignment
-            self.linear_sum_assignment = linear_sum_assignment
-            self.has_scipy = True
-        except ImportError:
-            self.has_scipy = False
-            self.logger.warning("scipy not available, falling back to greedy matching")
+
+        # Normalized title tokens, kept across runs by long-lived engines
+        self._token_cache: Dict[str, List[str]] = {}
+
+        # scipy is imported on first use: runs where every task is already
+        # linked never need the Hungarian solver
+        self._linear_sum_assignment: Optional[Callable[..., Any]] = None
+        self._scipy_checked = False
+
+    @property
+    def has_scipy(self) -> bool:
+        """Whether scipy's Hungarian solver is available (imported lazily)."""
+        if not self._scipy_checked:
+            self._scipy_checked = True
+            try:
+                from scipy.optimize import linear_sum_assignment
+                self._linear_sum_assignment = linear_sum_assignment
+            except ImportError:
+                self.logger.warning("scipy not available, falling back to greedy matching")
+        return self._linear_sum_assignment is not None
+
+    @property
+    def linear_sum_assignment(self) -> Optional[Callable[..., Any]]:
+        return self._linear_sum_assignment if self.has_scipy else None
     
     def find_matches(self, obs_tasks: List[ObsidianTask],
                     rem_tasks: List[RemindersTask],
-                    existing_links: Optional[List[SyncLink]] = None) -> List[SyncLink]:
-        """Find optimal matches between task lists, prioritizing existing links."""
+                    existing_links: Optional[List[SyncLink]] = None,
+                    settled: Optional[Tuple[Set[str], Set[str]]] = None) -> List[SyncLink]:
+        """Find optimal matches between task lists, prioritizing existing links.
+
+        Args:
+            obs_tasks: Obsidian tasks
+            rem_tasks: Reminders tasks
+            existing_links: Links restored before new matches are searched
+            settled: Obsidian and Reminders uuids already scored against each
+                other below the threshold; those pairs are not scored again
+        """
         if not obs_tasks or not rem_tasks:
             return []
         
@@ -56,22 +83,58 @@ class TaskMatcher:
         unmatched_obs = [t for t in obs_tasks if t.uuid not in used_obs_uuids]
         unmatched_rem = [t for t in rem_tasks if t.uuid not in used_rem_uuids]
         
+        skip: Optional[Callable[[ObsidianTask, RemindersTask], bool]] = None
+        if settled and settled[0] and settled[1]:
+            settled_obs, settled_rem = settled
+            fresh_obs = [t for t in unmatched_obs if t.uuid not in settled_obs]
+            fresh_rem = [t for t in unmatched_rem if t.uuid not in settled_rem]
+            self.logger.debug(
+                "Matching %d new or edited Obsidian and %d Reminders tasks against settled ones",
+                len(fresh_obs),
+                len(fresh_rem),
+            )
+            # Settled tasks can only pair with fresh tasks on the other side
+            if not fresh_obs:
+                unmatched_rem = fresh_rem
+            if not fresh_rem:
+                unmatched_obs = fresh_obs
+
+            def is_settled(obs_task: ObsidianTask, rem_task: RemindersTask) -> bool:
+                return obs_task.uuid in settled_obs and rem_task.uuid in settled_rem
+
+            skip = is_settled
+
         # Find new matches for unmatched tasks
         if unmatched_obs and unmatched_rem:
-            if self.has_scipy and len(unmatched_obs) * len(unmatched_rem) < 10000:
-                new_links = self._hungarian_matching(unmatched_obs, unmatched_rem)
+            if len(unmatched_obs) * len(unmatched_rem) < 10000 and self.has_scipy:
+                new_links = self._hungarian_matching(unmatched_obs, unmatched_rem, skip)
             else:
-                new_links = self._greedy_matching(unmatched_obs, unmatched_rem)
+                new_links = self._greedy_matching(unmatched_obs, unmatched_rem, skip)
             validated_links.extend(new_links)
         
         return validated_links
     
+    def _tokens(self, text: Optional[str]) -> List[str]:
+        """Return normalized tokens for a title, memoized per matcher."""
+        key = text or ""
+        tokens = self._token_cache.get(key)
+        if tokens is None:
+            if len(self._token_cache) >= self.TOKEN_CACHE_SIZE:
+                self._token_cache.clear()
+            tokens = normalize_text_for_similarity(text)
+            self._token_cache[key] = tokens
+        return tokens
+
+    @property
+    def token_cache_size(self) -> int:
+        return len(self._token_cache)
+
     def _calculate_similarity(self, obs_task: ObsidianTask,
                             rem_task: RemindersTask) -> float:
         """Calculate similarity score between two tasks."""
         # Title similarity (70% weight)
-        obs_tokens = normalize_text_for_similarity(obs_task.description)
-        rem_tokens = normalize_text_for_similarity(rem_task.display_title())
+        obs_tokens = self._tokens(obs_task.description)
+        rem_tokens = self._tokens(rem_task.display_title())
         
         # Special case: If both normalize to empty but raw strings match ignoring case/whitespace
         # This handles cases like URL-only tasks or single "#" tasks
@@ -89,8 +152,9 @@ class TaskMatcher:
         
         # Due date similarity (25% weight)
         date_score = 0.0
-        obs_due = obs_task.due_date
-        rem_due = rem_task.due_date
+        # Dates may still be strings on tasks built from older payloads
+        obs_due: Union[date, str, None] = obs_task.due_date
+        rem_due: Union[date, str, None] = rem_task.due_date
 
         if isinstance(obs_due, str):
             obs_due = parse_date(obs_due)
@@ -118,16 +182,23 @@ class TaskMatcher:
         return min(score, 1.0)
     
     def _hungarian_matching(self, obs_tasks: List[ObsidianTask],
-                          rem_tasks: List[RemindersTask]) -> List[SyncLink]:
+                          rem_tasks: List[RemindersTask],
+                          skip: Optional[Callable[[ObsidianTask, RemindersTask], bool]] = None) -> List[SyncLink]:
         """Use Hungarian algorithm for optimal matching."""
+        solve = self.linear_sum_assignment
+        if solve is None:
+            return self._greedy_matching(obs_tasks, rem_tasks, skip)
         n_obs = len(obs_tasks)
         n_rem = len(rem_tasks)
         
         # Build cost matrix (negative scores since Hungarian minimizes)
         cost_matrix = []
         for i, obs_task in enumerate(obs_tasks):
-            row = []
+            row: List[float] = []
             for j, rem_task in enumerate(rem_tasks):
+                if skip is not None and skip(obs_task, rem_task):
+                    row.append(1000)
+                    continue
                 score = self._calculate_similarity(obs_task, rem_task)
                 if score >= self.min_score:
                     cost = -score  # Negative for minimization
@@ -137,7 +208,7 @@ class TaskMatcher:
             cost_matrix.append(row)
         
         # Run Hungarian algorithm
-        row_ind, col_ind = self.linear_sum_assignment(cost_matrix)
+        row_ind, col_ind = solve(cost_matrix)
         
         # Extract valid matches
         links = []
@@ -155,12 +226,15 @@ class TaskMatcher:
         return links
     
     def _greedy_matching(self, obs_tasks: List[ObsidianTask],
-                        rem_tasks: List[RemindersTask]) -> List[SyncLink]:
+                        rem_tasks: List[RemindersTask],
+                        skip: Optional[Callable[[ObsidianTask, RemindersTask], bool]] = None) -> List[SyncLink]:
         """Fallback greedy matching algorithm."""
         # Calculate all pair scores
         candidates = []
         for obs_task in obs_tasks:
             for rem_task in rem_tasks:
+                if skip is not None and skip(obs_task, rem_task):
+                    continue
                 score = self._calculate_similarity(obs_task, rem_task)
                 if score >= self.min_score:
                     candidates.append((obs_task.uuid, rem_task.uuid, score))
@@ -0,0 +1,145 @@
+"""
+Near-duplicate detection with MinHash signatures and LSH buckets.
+
+Exact deduplication only groups tasks whose normalized descriptions are
+identical, so "Call dentist re: cleaning" and "call the dentist about
+cleaning" are never compared. Comparing every pair with a fuzzy score is
+quadratic; instead each task's title tokens (the matcher's tokenization) get a
+MinHash signature, signatures are split into bands, and only tasks sharing a
+band bucket become candidate pairs. Candidates are scored with the matcher's
+Dice similarity and grouped around the first task of each cluster, which
+keeps the work close to linear in the number of tasks.
+"""
+
+import logging
+import random
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..utils.text import dice_similarity, normalize_text_for_similarity
+
+
+# Mersenne prime larger than any 32-bit token hash
+_PRIME = (1 << 61) - 1
+
+DEFAULT_THRESHOLD = 0.6
+
+
+class NearDuplicateFinder:
+    """Groups tasks whose titles are similar but not identical.
+
+    Args:
+        threshold: Minimum Dice similarity for two tasks to be near duplicates
+        bands: LSH bands; more bands find more candidates at lower similarity
+        rows: MinHash values per band; more rows make buckets stricter
+        max_bucket: Buckets larger than this (tokens shared by many tasks,
+            such as "call" or "the") are skipped rather than compared pairwise
+        tokenize: Title tokenizer; defaults to the matcher's normalization
+        seed: Seed for the MinHash permutations, so results are reproducible
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        bands: int = 16,
+        rows: int = 2,
+        max_bucket: int = 50,
+        tokenize: Optional[Callable[[Optional[str]], List[str]]] = None,
+        seed: int = 1,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_bucket = max_bucket
+        self.tokenize = tokenize or normalize_text_for_similarity
+        self.logger = logger or logging.getLogger(__name__)
+        rng = random.Random(seed)
+        self._coefficients = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(bands * rows)
+        ]
+        self._token_hashes: Dict[str, Tuple[int, ...]] = {}
+
+    def _hashes(self, token: str) -> Tuple[int, ...]:
+        hashes = self._token_hashes.get(token)
+        if hashes is None:
+            base = zlib.crc32(token.encode("utf-8"))
+            hashes = tuple((a * base + b) % _PRIME for a, b in self._coefficients)
+            self._token_hashes[token] = hashes
+        return hashes
+
+    def signature(self, tokens: Sequence[str]) -> Tuple[int, ...]:
+        """MinHash signature of a token set."""
+        return tuple(map(min, zip(*(self._hashes(token) for token in set(tokens)))))
+
+    def candidate_pairs(self, signatures: List[Tuple[int, ...]]) -> Set[Tuple[int, int]]:
+        """Index pairs that share at least one LSH bucket."""
+        pairs: Set[Tuple[int, int]] = set()
+        skipped = 0
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[Tuple[int, ...], List[int]] = {}
+            for index, signature in enumerate(signatures):
+                buckets.setdefault(signature[start:start + self.rows], []).append(index)
+            for members in buckets.values():
+                if len(members) < 2:
+                    continue
+                if len(members) > self.max_bucket:
+                    skipped += 1
+                    continue
+                for offset, first in enumerate(members):
+                    for second in members[offset + 1:]:
+                        pairs.add((first, second))
+        if skipped:
+            self.logger.debug("Skipped %d oversized LSH buckets", skipped)
+        return pairs
+
+    def find(
+        self,
+        tasks: Sequence[Any],
+        text: Callable[[Any], Optional[str]],
+    ) -> List[Tuple[List[Any], float]]:
+        """Cluster near-duplicate tasks.
+
+        Clusters are anchored rather than chained: taking tasks in input
+        order, each task not yet clustered collects the unclustered tasks that
+        score at least :attr:`threshold` against it, so every member is
+        similar to the cluster's first member and not merely to some other
+        member.
+
+        Args:
+            tasks: Tasks to compare
+            text: Returns the title to compare for a task
+
+        Returns:
+            ``(members, similarity)`` per cluster of two or more tasks, in
+            input order, where similarity is the lowest score of a member
+            against the first member
+        """
+        token_sets = [self.tokenize(text(task)) for task in tasks]
+        indexed = [index for index, tokens in enumerate(token_sets) if tokens]
+        signatures = [self.signature(token_sets[index]) for index in indexed]
+
+        neighbours: Dict[int, Dict[int, float]] = {}
+        for first, second in self.candidate_pairs(signatures):
+            a, b = indexed[first], indexed[second]
+            score = dice_similarity(token_sets[a], token_sets[b])
+            if score < self.threshold:
+                continue
+            neighbours.setdefault(a, {})[b] = score
+            neighbours.setdefault(b, {})[a] = score
+
+        clustered: Set[int] = set()
+        clusters: List[Tuple[List[Any], float]] = []
+        for anchor in sorted(neighbours):
+            if anchor in clustered:
+                continue
+            # Earlier unclustered neighbours would have claimed the anchor already
+            joined = sorted(index for index in neighbours[anchor] if index not in clustered)
+            if not joined:
+                continue
+            clustered.add(anchor)
+            clustered.update(joined)
+            similarity = min(neighbours[anchor][index] for index in joined)
+            clusters.append(([tasks[anchor]] + [tasks[index] for index in joined], similarity))
+        return clusters
@@ -0,0 +1,138 @@
+"""
+Compiled tag routing for one vault.
+
+Tag routes live in ``SyncConfig.tag_routes`` as a flat list shared by every
+vault, and each routing decision used to scan that list. :class:`RoutingTable`
+compiles a vault's routes once into lookup dicts (calendar -> route tag,
+calendar -> import mode, list names) and a trie over tag segments, so a task
+tag such as ``#work/clienta`` also routes by its parent ``#work`` route and
+every decision costs time proportional to the task's tags only.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..core.models import SyncConfig
+
+
+DEFAULT_IMPORT_MODE = "existing_only"
+
+
+class _TagNode:
+    __slots__ = ("children", "routes")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TagNode"] = {}
+        # (configuration rank, route) for every route on exactly this tag
+        self.routes: List[Tuple[int, Dict[str, Any]]] = []
+
+
+class RoutingTable:
+    """Tag routes of one vault, compiled for constant-time lookups.
+
+    Args:
+        routes: The vault's route dicts (``tag``, ``calendar_id``,
+            ``import_mode``) in configuration order
+        list_names: Reminders list identifier -> display name
+    """
+
+    def __init__(self, routes: Iterable[Dict[str, Any]] = (), list_names: Optional[Dict[str, str]] = None):
+        self.routes: List[Dict[str, Any]] = []
+        self.list_names: Dict[str, str] = dict(list_names or {})
+        self.calendar_tags: Dict[str, str] = {}
+        self.import_modes: Dict[str, str] = {}
+        self._root = _TagNode()
+
+        for route in routes:
+            tag = SyncConfig._normalize_tag_value(route.get("tag"))
+            calendar_id = route.get("calendar_id")
+            if not tag or not calendar_id:
+                continue
+            route = dict(route, tag=tag)
+            node = self._root
+            for segment in tag[1:].split("/"):
+                node = node.children.setdefault(segment, _TagNode())
+            # Routes sharing a tag are all kept; lookups rank them by order
+            node.routes.append((len(self.routes), route))
+            self.routes.append(route)
+            # The first route for a calendar decides its tag and import mode
+            self.calendar_tags.setdefault(calendar_id, tag)
+            self.import_modes.setdefault(calendar_id, route.get("import_mode", DEFAULT_IMPORT_MODE))
+
+    @classmethod
+    def compile(cls, sync_config: Any, vault_id: Optional[str]) -> "RoutingTable":
+        """Build the table for ``vault_id`` from a :class:`SyncConfig`.
+
+        List names are compiled even without a vault, which then has no routes.
+        """
+        if not sync_config:
+            return cls()
+        list_names = {}
+        for lst in getattr(sync_config, "reminders_lists", None) or []:
+            identifier = getattr(lst, "identifier", None)
+            if identifier and identifier not in list_names:
+                list_names[identifier] = getattr(lst, "name", identifier)
+        routes = sync_config.get_tag_routes_for_vault(vault_id) if vault_id else []
+        return cls(routes, list_names)
+
+    def __bool__(self) -> bool:
+        return bool(self.routes)
+
+    @property
+    def calendars(self) -> List[str]:
+        """Routed calendar ids in configuration order."""
+        return list(self.import_modes)
+
+    def matching_routes(self, tags: Optional[Iterable[str]]) -> List[Dict[str, Any]]:
+        """Routes matched by any of ``tags``, most specific first.
+
+        A tag matches its own route and the route of every parent tag, so
+        ``#work/clienta`` matches both ``#work/clienta`` and ``#work``. Longer
+        route tags come first; equally long ones, including several routes on
+        the same tag, keep configuration order.
+        """
+        if not self.routes or not tags:
+            return []
+        matched: Dict[int, Dict[str, Any]] = {}
+        for tag in tags:
+            normalized = SyncConfig._normalize_tag_value(tag)
+            if not normalized:
+                continue
+            node = self._root
+            for segment in normalized[1:].split("/"):
+                child = node.children.get(segment)
+                if child is None:
+                    break
+                node = child
+                matched.update(node.routes)
+        ranked = sorted(matched.items(), key=lambda item: (-len(item[1]["tag"]), item[0]))
+        return [route for _, route in ranked]
+
+    def calendar_for_tags(
+        self,
+        tags: Optional[Iterable[str]],
+        list_ids: Optional[Iterable[str]] = None,
+    ) -> Optional[str]:
+        """Calendar of the most specific route matched by ``tags``.
+
+        Args:
+            tags: Task tags
+            list_ids: Only consider routes to these calendars, if given
+        """
+        allowed = set(list_ids) if list_ids else None
+        for route in self.matching_routes(tags):
+            calendar_id: str = route["calendar_id"]
+            if allowed is None or calendar_id in allowed:
+                return calendar_id
+        return None
+
+    def route_tag_for_calendar(self, calendar_id: Optional[str]) -> Optional[str]:
+        return self.calendar_tags.get(calendar_id) if calendar_id else None
+
+    def import_mode_for_calendar(self, calendar_id: Optional[str]) -> Optional[str]:
+        """Import mode of the route into ``calendar_id``, or None if it is not routed."""
+        return self.import_modes.get(calendar_id) if calendar_id else None
+
+    def list_name(self, calendar_id: Optional[str]) -> str:
+        if not calendar_id:
+            return "Reminders"
+        return self.list_names.get(calendar_id, calendar_id)
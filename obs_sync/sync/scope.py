@@ -0,0 +1,65 @@
+"""Scoping for partial sync runs."""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+def _normalize_tag(tag: str) -> str:
+    tag = tag.strip().lower()
+    return tag if tag.startswith("#") else f"#{tag}"
+
+
+@dataclass
+class SyncScope:
+    """Restricts a sync run to a subset of the vault.
+
+    A scoped run only collects Obsidian tasks from ``files`` (the whole vault
+    when empty) carrying one of ``tags`` (any task when empty), and only
+    touches the Reminders linked to them. When every collected task is
+    already linked, those reminders are fetched by identifier instead of
+    listing whole calendars. Otherwise unlinked Reminders are still offered to
+    the matcher so new Obsidian tasks do not duplicate existing reminders, but
+    no Obsidian counterparts are created for them and links outside the scope
+    are left untouched. A regular full sync remains responsible for everything
+    else.
+    """
+
+    files: Set[str] = field(default_factory=set)
+    tags: Set[str] = field(default_factory=set)
+
+    @classmethod
+    def for_files(cls, files: Iterable[str]) -> "SyncScope":
+        """Build a scope from vault-relative note paths."""
+        return cls(files={os.path.normpath(path) for path in files if path})
+
+    @classmethod
+    def for_tags(cls, tags: Iterable[str]) -> "SyncScope":
+        """Build a scope from tags; ``work`` and ``#Work`` are equivalent."""
+        return cls(tags={_normalize_tag(tag) for tag in tags if tag and tag.strip("# ")})
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.files and not self.tags
+
+    def matches(self, task: Any) -> bool:
+        """Whether ``task`` carries one of the scope's tags (or a nested tag under one)."""
+        if not self.tags:
+            return True
+        for tag in getattr(task, "tags", None) or []:
+            tag = tag.lower()
+            if tag in self.tags or any(tag.startswith(f"{wanted}/") for wanted in self.tags):
+                return True
+        return False
+
+    def merge(self, other: Optional["SyncScope"]) -> "SyncScope":
+        """Combine two scopes (used when coalescing change batches)."""
+        if other is None:
+            return SyncScope(files=set(self.files), tags=set(self.tags))
+        return SyncScope(files=self.files | other.files, tags=self.tags | other.tags)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"files": sorted(self.files)}
+        if self.tags:
+            data["tags"] = sorted(self.tags)
+        return data
@@ -2,21 +2,66 @@
 Utility functions for obs-sync.
 """
 
-from .io import safe_read_json, safe_write_json, atomic_write
-from .date import parse_date, format_date, dates_equal
-from .text import normalize_text, calculate_similarity
-from .prompts import (
-    format_task_for_display, display_duplicate_cluster,
-    confirm_deduplication, prompt_for_keeps, show_deduplication_summary
-)
-from .launchd import (
-    is_macos, get_launchagent_path, install_agent, uninstall_agent,
-    load_agent, unload_agent, is_agent_loaded, get_obs_sync_executable,
-    describe_interval, describe_schedule, get_agent_status, repair_agent,
-    compute_plist_checksum, CalendarSchedule, AgentStatus, SCHEDULE_PRESETS,
-    PLIST_VERSION, AGENT_LABEL
-)
-from .macos import set_process_name
+import importlib
+from typing import Any, List
+
+# Exported names are resolved lazily: importing one helper (for example
+# ``set_process_name`` at CLI start-up) must not pull in launchd, prompts and
+# the rest of the utilities.
+_EXPORTS = {
+    # I/O utilities
+    'safe_read_json': '.io',
+    'safe_write_json': '.io',
+    'atomic_write': '.io',
+    # Date utilities
+    'parse_date': '.date',
+    'format_date': '.date',
+    'dates_equal': '.date',
+    # Text utilities
+    'normalize_text': '.text',
+    'calculate_similarity': '.text',
+    # Prompt utilities
+    'format_task_for_display': '.prompts',
+    'display_duplicate_cluster': '.prompts',
+    'confirm_deduplication': '.prompts',
+    'prompt_for_keeps': '.prompts',
+    'show_deduplication_summary': '.prompts',
+    # LaunchAgent utilities (macOS)
+    'is_macos': '.launchd',
+    'get_launchagent_path': '.launchd',
+    'install_agent': '.launchd',
+    'uninstall_agent': '.launchd',
+    'load_agent': '.launchd',
+    'unload_agent': '.launchd',
+    'is_agent_loaded': '.launchd',
+    'get_obs_sync_executable': '.launchd',
+    'describe_interval': '.launchd',
+    'describe_schedule': '.launchd',
+    'get_agent_status': '.launchd',
+    'repair_agent': '.launchd',
+    'compute_plist_checksum': '.launchd',
+    'CalendarSchedule': '.launchd',
+    'AgentStatus': '.launchd',
+    'SCHEDULE_PRESETS': '.launchd',
+    'PLIST_VERSION': '.launchd',
+    'AGENT_LABEL': '.launchd',
+    # macOS helpers
+    'set_process_name': '.macos',
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # I/O utilities
@@ -9,7 +9,9 @@ import os
 import tempfile
 import time
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .tracing import traced
 
 try:  # fcntl is only available on POSIX platforms
     import fcntl  # type: ignore
@@ -62,6 +64,18 @@ def _file_lock(target_path: Path, exclusive: bool, timeout: float = DEFAULT_LOCK
             fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
 
 
+def file_signature(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """``(inode, mtime_ns, size)`` of a file, or None when it cannot be stat'ed.
+
+    Atomic writes replace the file, so any write changes the inode.
+    """
+    try:
+        stat_result = os.stat(os.path.expanduser(file_path))
+    except OSError:
+        return None
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
+
 def safe_read_json(file_path: str, default: Optional[Dict] = None, *, lock_timeout: float = DEFAULT_LOCK_TIMEOUT) -> Dict[str, Any]:
     """
     Safely read JSON from file with error handling.
@@ -94,6 +108,7 @@ def safe_read_json(file_path: str, default: Optional[Dict] = None, *, lock_timeo
         return default
 
 
+@traced("io.write_json", "io", detail=lambda file_path, *args, **kwargs: {"file": str(file_path)})
 def safe_write_json(file_path: str, data: Dict[str, Any], indent: int = 2, *, lock_timeout: float = DEFAULT_LOCK_TIMEOUT) -> bool:
     """
     Safely write JSON to file with atomic write.
@@ -112,27 +127,35 @@ def safe_write_json(file_path: str, data: Dict[str, Any], indent: int = 2, *, lo
     # Ensure directory exists
     path_obj.parent.mkdir(parents=True, exist_ok=True)
 
-    tmp_path = None
     try:
         with _file_lock(path_obj, exclusive=True, timeout=lock_timeout):
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                dir=str(path_obj.parent),
-                prefix='.tmp_',
-                suffix='.json',
-                delete=False,
-                encoding='utf-8'
-            ) as tmp_file:
-                json.dump(data, tmp_file, indent=indent, ensure_ascii=False, sort_keys=True)
-                tmp_path = Path(tmp_file.name)
-
-            os.replace(str(tmp_path), str(path_obj))
+            _replace_json(path_obj, data, indent)
         return True
 
     except TimeoutError as exc:
         print(f"Error writing to {file_path}: {exc}")
     except Exception as exc:
         print(f"Error writing to {file_path}: {exc}")
+
+    return False
+
+
+def _replace_json(path_obj: Path, data: Dict[str, Any], indent: int) -> None:
+    """Write JSON to a temporary file and move it over ``path_obj``; caller holds the lock."""
+    tmp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode='w',
+            dir=str(path_obj.parent),
+            prefix='.tmp_',
+            suffix='.json',
+            delete=False,
+            encoding='utf-8'
+        ) as tmp_file:
+            json.dump(data, tmp_file, indent=indent, ensure_ascii=False, sort_keys=True)
+            tmp_path = Path(tmp_file.name)
+
+        os.replace(str(tmp_path), str(path_obj))
     finally:
         if tmp_path and tmp_path.exists():
             try:
@@ -140,9 +163,62 @@ def safe_write_json(file_path: str, data: Dict[str, Any], indent: int = 2, *, lo
             except OSError:
                 pass
 
+
+@traced("io.write_json", "io", detail=lambda file_path, *args, **kwargs: {"file": str(file_path)})
+def update_json(
+    file_path: str,
+    update: Callable[[Dict[str, Any]], Dict[str, Any]],
+    default: Optional[Dict] = None,
+    indent: int = 2,
+    *,
+    lock_timeout: float = DEFAULT_LOCK_TIMEOUT,
+    loaded: Optional[Tuple[Optional[Tuple[int, int, int]], Any]] = None,
+) -> bool:
+    """
+    Read, modify and write a JSON file under one exclusive lock.
+
+    Unlike a ``safe_read_json``/``safe_write_json`` pair, concurrent writers
+    cannot lose each other's changes between the read and the write.
+
+    Args:
+        file_path: Path to the JSON file
+        update: Called with the current data (or ``default``); returns the data to write
+        default: Data used when the file is missing or unreadable
+        indent: JSON indentation level
+        loaded: ``(file_signature, data)`` from an earlier read; ``data`` is
+            passed to ``update`` instead of re-reading the file when the file
+            still has that signature under the lock
+
+    Returns:
+        True if successful, False otherwise
+    """
+    file_path = os.path.expanduser(file_path)
+    path_obj = Path(file_path)
+    path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with _file_lock(path_obj, exclusive=True, timeout=lock_timeout):
+            data = dict(default or {})
+            if loaded is not None and loaded[0] is not None and file_signature(file_path) == loaded[0]:
+                data = loaded[1]
+            elif path_obj.exists():
+                try:
+                    with path_obj.open('r', encoding='utf-8') as handle:
+                        data = json.load(handle)
+                except (json.JSONDecodeError, OSError) as exc:
+                    print(f"Warning: Failed to read {file_path}: {exc}")
+            _replace_json(path_obj, update(data), indent)
+        return True
+
+    except TimeoutError as exc:
+        print(f"Error writing to {file_path}: {exc}")
+    except Exception as exc:
+        print(f"Error writing to {file_path}: {exc}")
+
     return False
 
 
+@traced("io.atomic_write", "io", detail=lambda file_path, *args, **kwargs: {"file": str(file_path)})
 def atomic_write(file_path: str, content: str, *, lock_timeout: float = DEFAULT_LOCK_TIMEOUT) -> bool:
     """
     Atomically write content to file.
@@ -0,0 +1,157 @@
+"""
+Local IPC for the obs-sync daemon.
+
+Requests and responses are single JSON objects terminated by a newline and
+exchanged over a Unix domain socket that only the current user can access.
+"""
+
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import stat
+import threading
+from typing import Any, Callable, Dict, Optional
+
+MAX_MESSAGE_BYTES = 1024 * 1024
+
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class IPCError(Exception):
+    """Raised when the daemon cannot be reached or returns an invalid reply."""
+
+
+def _read_message(stream: io.BufferedIOBase) -> Dict[str, Any]:
+    line = stream.readline(MAX_MESSAGE_BYTES + 1)
+    if not line:
+        raise IPCError("Connection closed before a message was received")
+    if len(line) > MAX_MESSAGE_BYTES:
+        raise IPCError("Message exceeds the maximum allowed size")
+    try:
+        message = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as exc:
+        raise IPCError(f"Malformed message: {exc}") from exc
+    if not isinstance(message, dict):
+        raise IPCError("Messages must be JSON objects")
+    return message
+
+
+def _encode_message(message: Dict[str, Any]) -> bytes:
+    return (json.dumps(message, default=str) + "\n").encode("utf-8")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        server: "IPCServer" = self.server.ipc_server  # type: ignore[attr-defined]
+        try:
+            request = _read_message(self.rfile)
+            response = server.handler(request)
+        except IPCError as exc:
+            response = {"ok": False, "error": str(exc)}
+        except Exception as exc:  # pragma: no cover - defensive
+            server.logger.exception("IPC request failed")
+            response = {"ok": False, "error": str(exc)}
+        try:
+            self.wfile.write(_encode_message(response))
+        except OSError:
+            server.logger.debug("Client disconnected before the reply was sent")
+
+
+class _ThreadingUnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class IPCServer:
+    """Serves JSON requests on a Unix socket, one thread per connection.
+
+    Args:
+        socket_path: Filesystem path of the socket
+        handler: Callable turning a request dict into a response dict
+        logger: Optional logger
+    """
+
+    def __init__(self, socket_path: str, handler: Handler, logger: Optional[logging.Logger] = None):
+        self.socket_path = socket_path
+        self.handler = handler
+        self.logger = logger or logging.getLogger(__name__)
+        self._server: Optional[_ThreadingUnixServer] = None
+
+    def start(self) -> None:
+        """Bind the socket, replacing a stale one left by a crashed daemon."""
+        if os.path.exists(self.socket_path):
+            if is_listening(self.socket_path):
+                raise IPCError(f"Another obs-sync daemon is already listening on {self.socket_path}")
+            os.unlink(self.socket_path)
+
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = _ThreadingUnixServer(self.socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self.socket_path, stat.S_IRUSR | stat.S_IWUSR)
+        self._server.ipc_server = self  # type: ignore[attr-defined]
+        self.logger.debug("IPC server listening on %s", self.socket_path)
+
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        if self._server is None:
+            self.start()
+        server = self._server
+        if server is not None:
+            server.serve_forever(poll_interval=poll_interval)
+
+    def shutdown(self) -> None:
+        """Stop serving. Safe to call from a request handler thread."""
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def send_request(
+    socket_path: str,
+    command: str,
+    timeout: Optional[float] = 5.0,
+    **params: Any,
+) -> Dict[str, Any]:
+    """Send a command to the daemon and return its reply.
+
+    Raises:
+        IPCError: If the daemon is not running or the reply is invalid
+    """
+    request = {"command": command}
+    request.update(params)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(socket_path)
+            client.sendall(_encode_message(request))
+            with client.makefile("rb") as stream:
+                return _read_message(stream)
+    except (FileNotFoundError, ConnectionRefusedError) as exc:
+        raise IPCError(f"No obs-sync daemon is listening on {socket_path}") from exc
+    except socket.timeout as exc:
+        raise IPCError(f"Timed out waiting for the daemon to answer '{command}'") from exc
+    except OSError as exc:
+        raise IPCError(f"Could not talk to the daemon: {exc}") from exc
+
+
+def is_listening(socket_path: str) -> bool:
+    """Return True when a daemon accepts connections on ``socket_path``."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(1.0)
+            client.connect(socket_path)
+        return True
+    except OSError:
+        return False
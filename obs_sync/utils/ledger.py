@@ -0,0 +1,244 @@
+"""
+Run-history ledger.
+
+Every sync appends one compact JSON record to an NDJSON file in the data
+directory. When the file reaches ``max_bytes`` it is rotated to ``.1``,
+``.2`` ... so the ledger stays bounded. :func:`summarize_runs` turns the
+records into the percentiles and trends shown by ``obs-sync stats``.
+"""
+
+import json
+import logging
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .io import _file_lock
+
+
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 3
+
+# Record fields that are tracked over time by ``obs-sync stats``
+VOLUME_FIELDS = (
+    "obs_tasks",
+    "rem_tasks",
+    "links",
+    "files_read",
+    "eventkit_calls",
+    "writes",
+    "links_file_bytes",
+    "inbox_bytes",
+)
+
+
+class RunLedger:
+    """Append-only NDJSON log of sync runs with size-based rotation.
+
+    Args:
+        path: Ledger file path
+        max_bytes: Size at which the file is rotated; 0 disables rotation
+        backups: Number of rotated files to keep
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.path = Path(os.path.expanduser(path))
+        self.max_bytes = max_bytes
+        self.backups = max(0, backups)
+        self.logger = logger or logging.getLogger(__name__)
+
+    def _rotated(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def _rotate(self) -> None:
+        if self.backups == 0:
+            self.path.unlink()
+            return
+        oldest = self._rotated(self.backups)
+        if oldest.exists():
+            oldest.unlink()
+        for index in range(self.backups - 1, 0, -1):
+            source = self._rotated(index)
+            if source.exists():
+                os.replace(source, self._rotated(index + 1))
+        os.replace(self.path, self._rotated(1))
+
+    def append(self, record: Dict[str, Any]) -> bool:
+        """Append one record; returns False if the ledger could not be written."""
+        line = json.dumps(record, separators=(",", ":"), sort_keys=True, default=str) + "\n"
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with _file_lock(self.path, exclusive=True):
+                if self.max_bytes and self.path.exists() and self.path.stat().st_size >= self.max_bytes:
+                    self._rotate()
+                with open(self.path, "a", encoding="utf-8") as handle:
+                    handle.write(line)
+            return True
+        except (OSError, TimeoutError) as exc:
+            self.logger.warning("Could not append to run history %s: %s", self.path, exc)
+            return False
+
+    def read(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return records oldest first, newest last; malformed lines are skipped.
+
+        Args:
+            limit: Only return the most recent ``limit`` records
+        """
+        files = [self._rotated(index) for index in range(self.backups, 0, -1)] + [self.path]
+        records: List[Dict[str, Any]] = []
+        for path in files:
+            if not path.exists():
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    for line in handle:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if isinstance(record, dict):
+                            records.append(record)
+            except OSError as exc:
+                self.logger.debug("Could not read run history %s: %s", path, exc)
+        if limit is not None and limit >= 0:
+            records = records[-limit:] if limit else []
+        return records
+
+
+def build_run_record(
+    vault_name: str,
+    vault_path: str,
+    direction: str,
+    dry_run: bool,
+    sync_result: Dict[str, Any],
+    timings: Optional[Dict[str, float]] = None,
+    links_path: Optional[str] = None,
+    inbox_path: Optional[str] = None,
+    error: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build a ledger record from a sync engine result.
+
+    Args:
+        sync_result: The dict returned by ``SyncEngine.sync`` (may be empty
+            when the run failed early)
+        timings: Phase durations in seconds, including ``total``
+        links_path: Links file whose size is recorded
+        inbox_path: Inbox note whose size is recorded
+        error: Error message for failed runs
+    """
+    changes = sync_result.get("changes") or {}
+    deferred = sync_result.get("deferred") or {}
+    io_stats = sync_result.get("io") or {}
+    timings = dict(timings or {})
+
+    def _size(path: Optional[str]) -> Optional[int]:
+        if not path:
+            return None
+        try:
+            return os.path.getsize(os.path.expanduser(path))
+        except OSError:
+            return None
+
+    record: Dict[str, Any] = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "vault": vault_name,
+        "vault_path": vault_path,
+        "direction": direction,
+        "dry_run": bool(dry_run),
+        "success": error is None,
+        "duration": timings.pop("total", None),
+        "phases": timings,
+        "obs_tasks": sync_result.get("obs_tasks"),
+        "rem_tasks": sync_result.get("rem_tasks"),
+        "links": sync_result.get("links"),
+        "files_read": io_stats.get("files_read"),
+        "eventkit_calls": io_stats.get("eventkit_calls"),
+        "writes": sum(
+            int(changes.get(key, 0) or 0)
+            for key in ("obs_updated", "rem_updated", "obs_created", "rem_created", "obs_deleted", "rem_deleted")
+        ),
+        "links_created": int(changes.get("links_created", 0) or 0),
+        "links_deleted": int(changes.get("links_deleted", 0) or 0),
+        "links_file_bytes": _size(links_path),
+        "inbox_bytes": _size(inbox_path),
+        "scoped": bool(sync_result.get("scope")),
+        "skipped": bool(sync_result.get("skipped")),
+        "deferred": sum(len(items or []) for items in deferred.values()) if isinstance(deferred, dict) else 0,
+    }
+    if error is not None:
+        record["error"] = error
+    return record
+
+
+def percentile(values: Iterable[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile; ``None`` for an empty sequence."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _numbers(records: Iterable[Dict[str, Any]], key: str) -> List[float]:
+    return [record[key] for record in records if isinstance(record.get(key), (int, float))]
+
+
+def _distribution(values: List[float]) -> Dict[str, Optional[float]]:
+    return {
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+
+def summarize_runs(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate ledger records into percentiles and older-vs-newer trends."""
+    durations = _numbers(records, "duration")
+    half = len(durations) // 2
+    older, newer = durations[:half], durations[half:]
+
+    phase_values: Dict[str, List[float]] = {}
+    for record in records:
+        for phase, seconds in (record.get("phases") or {}).items():
+            if isinstance(seconds, (int, float)):
+                phase_values.setdefault(phase, []).append(seconds)
+
+    volume: Dict[str, Dict[str, Any]] = {}
+    for key in VOLUME_FIELDS:
+        values = _numbers(records, key)
+        if not values:
+            continue
+        volume[key] = {"first": values[0], "last": values[-1], "p50": percentile(values, 50), "max": max(values)}
+
+    summary: Dict[str, Any] = {
+        "runs": len(records),
+        "succeeded": sum(1 for record in records if record.get("success")),
+        "failed": sum(1 for record in records if record.get("success") is False),
+        "applied": sum(1 for record in records if record.get("dry_run") is False),
+        "skipped": sum(1 for record in records if record.get("skipped")),
+        "first_ts": records[0].get("ts") if records else None,
+        "last_ts": records[-1].get("ts") if records else None,
+        "duration": _distribution(durations),
+        "trend": {
+            "older_p50": percentile(older, 50),
+            "newer_p50": percentile(newer, 50),
+        },
+        "phases": {
+            phase: {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+            for phase, values in phase_values.items()
+        },
+        "volume": volume,
+    }
+    return summary
@@ -101,7 +101,11 @@ def display_duplicate_cluster(cluster, obs_tasks_map=None, rem_tasks_map=None) -
         obs_tasks_map: Optional dict mapping Obsidian UUIDs to tasks
         rem_tasks_map: Optional dict mapping Reminders UUIDs to tasks
     """
-    print(f"\n🔍 Duplicate tasks detected for '{cluster.description}'.")
+    similarity = getattr(cluster, "similarity", None)
+    if similarity is not None:
+        print(f"\n🔍 Similar tasks detected for '{cluster.description}' (each at least {similarity:.0%} similar to it).")
+    else:
+        print(f"\n🔍 Duplicate tasks detected for '{cluster.description}'.")
     print(f"   Found {cluster.total_count} related tasks:")
     
     all_tasks = cluster.get_all_tasks()
@@ -0,0 +1,190 @@
+"""
+Process-level run lock for applied syncs.
+
+Only one applied sync may run against a data directory at a time. A second
+invocation does not repeat the work in parallel: it records a rerun request,
+which the current holder honours with one more pass once its run finishes,
+and either waits to reuse that pass's result or returns immediately.
+
+The lock is an advisory ``flock`` held for the whole run; a small JSON state
+file next to it carries the rerun request, with the direction and vault
+target of every pass asked for, and the outcome of the last pass. Every change to the state file is a locked read-modify-write, so triggers
+arriving together, or racing the holder's own updates, never lose a
+request.
+"""
+
+import logging
+import os
+import time
+from typing import IO, Any, Callable, Dict, List, Optional
+
+from .io import safe_read_json, update_json
+
+try:  # fcntl is only available on POSIX platforms
+    import fcntl
+    _HAS_FLOCK = True
+except ImportError:  # pragma: no cover - Windows fallback
+    _HAS_FLOCK = False
+
+
+RUN_LOCK_FILE = "sync.run.lock"
+LOCK_POLL_INTERVAL = 0.2  # seconds
+
+
+class RunLock:
+    """Exclusive lock around applied sync runs, with coalescing state.
+
+    Args:
+        path: Lock file path; the state file is ``<path>.state``
+    """
+
+    def __init__(self, path: str, logger: Optional[logging.Logger] = None):
+        self.path = os.path.expanduser(path)
+        self.state_path = f"{self.path}.state"
+        self.logger = logger or logging.getLogger(__name__)
+        self._handle: Optional[IO[str]] = None
+
+    @classmethod
+    def for_config(cls, config: Any, logger: Optional[logging.Logger] = None) -> "RunLock":
+        """Lock guarding the data directory that holds the config's links file."""
+        directory = os.path.dirname(os.path.expanduser(config.links_path or "")) or "."
+        return cls(os.path.join(directory, RUN_LOCK_FILE), logger=logger)
+
+    @property
+    def held(self) -> bool:
+        return self._handle is not None
+
+    def acquire(self, blocking: bool = False, timeout: Optional[float] = None) -> bool:
+        """Try to take the lock.
+
+        Args:
+            blocking: Wait for the current holder to finish
+            timeout: Maximum seconds to wait when blocking (None waits forever)
+
+        Returns:
+            True if the lock is now held by this process
+        """
+        if self._handle is not None:
+            return True
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        handle = open(self.path, "a+")
+        if not _HAS_FLOCK:  # pragma: no cover - no advisory locks available
+            self._handle = handle
+            return True
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            try:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                    handle.close()
+                    return False
+                time.sleep(LOCK_POLL_INTERVAL)
+
+        handle.seek(0)
+        handle.truncate()
+        handle.write(f"{os.getpid()}\n")
+        handle.flush()
+        self._handle = handle
+        self._update_state(holder={"pid": os.getpid(), "since": time.time()})
+        return True
+
+    def release(self) -> None:
+        if self._handle is None:
+            return
+        self._update_state(holder=None)
+        try:
+            if _HAS_FLOCK:
+                fcntl.flock(self._handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self) -> "RunLock":
+        self.acquire(blocking=True)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    # ------------------------------------------------------------------ state
+
+    def state(self) -> Dict[str, Any]:
+        data = safe_read_json(self.state_path, default={})
+        return data if isinstance(data, dict) else {}
+
+    def _modify_state(self, change: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply ``change`` to the state under the state file's lock."""
+        def apply(data: Any) -> Dict[str, Any]:
+            state: Dict[str, Any] = data if isinstance(data, dict) else {}
+            change(state)
+            return state
+
+        if not update_json(self.state_path, apply):
+            self.logger.debug("Could not update run lock state at %s", self.state_path)
+
+    def _update_state(self, **changes: Any) -> None:
+        self._modify_state(lambda data: data.update(changes))
+
+    def request_rerun(self, direction: str, target: Optional[Dict[str, List[str]]] = None) -> None:
+        """Ask the current holder for one more pass after its current run.
+
+        Args:
+            direction: Sync direction the pass must use
+            target: ``{"files": [...], "tags": [...]}`` for a targeted pass,
+                None for the whole vault
+        """
+        def add_request(data: Dict[str, Any]) -> None:
+            request = data.get("rerun_requested") or {}
+            passes = [entry for entry in request.get("passes") or [] if isinstance(entry, dict)]
+            wanted = {"direction": direction, "target": target}
+            if wanted not in passes:
+                passes.append(wanted)
+            request.update({
+                "count": int(request.get("count", 0)) + 1,
+                "last_requested_at": time.time(),
+                "passes": passes,
+            })
+            data["rerun_requested"] = request
+
+        self._modify_state(add_request)
+
+    def rerun_requested(self) -> bool:
+        return bool(self.state().get("rerun_requested"))
+
+    def clear_rerun_request(self) -> None:
+        self._update_state(rerun_requested=None)
+
+    def take_rerun_requests(self) -> List[Dict[str, Any]]:
+        """Clear the pending request and return the passes it asked for.
+
+        Each pass is ``{"direction": ..., "target": ...}``. A whole-vault pass
+        covers targeted ones in the same direction, so those are dropped.
+        """
+        taken: List[Dict[str, Any]] = []
+
+        def take(data: Dict[str, Any]) -> None:
+            request = data.get("rerun_requested") or {}
+            taken.extend(entry for entry in request.get("passes") or [] if isinstance(entry, dict))
+            data["rerun_requested"] = None
+
+        self._modify_state(take)
+        full = {entry.get("direction") for entry in taken if entry.get("target") is None}
+        return [entry for entry in taken
+                if entry.get("target") is None or entry.get("direction") not in full]
+
+    def record_pass(self, started_at: float, success: bool, direction: str,
+                    target: Optional[Dict[str, List[str]]] = None) -> None:
+        self._update_state(last_pass={
+            "started_at": started_at,
+            "finished_at": time.time(),
+            "success": bool(success),
+            "direction": direction,
+            "target": target,
+        })
+
+    def last_pass(self) -> Dict[str, Any]:
+        last = self.state().get("last_pass")
+        return last if isinstance(last, dict) else {}
@@ -0,0 +1,227 @@
+"""
+Lightweight tracing for sync runs.
+
+A :class:`Tracer` records timed spans and exports them in the Chrome trace
+event format (load the file in ``chrome://tracing`` or https://ui.perfetto.dev).
+The active tracer lives in a context variable; when none is installed the
+module-level helpers reduce to a context-variable lookup, so instrumented hot
+paths cost next to nothing in normal runs.
+"""
+
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Tracer:
+    """Collects spans for one run.
+
+    Args:
+        trace_memory: Also track peak memory with tracemalloc. Phase spans then
+            carry the peak observed while they were open.
+    """
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.events: List[Dict[str, Any]] = []
+        self.memory_peak_bytes: Optional[int] = None
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self.trace_memory and tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            self.memory_peak_bytes = max(peak, self.memory_peak_bytes or 0)
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    def _now_us(self) -> float:
+        return (time.perf_counter() - self._origin) * 1_000_000
+
+    def add_span(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        duration: float,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a finished span from ``time.perf_counter`` values (seconds)."""
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1_000_000, 1),
+            "dur": round(duration * 1_000_000, 1),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    @contextlib.contextmanager
+    def span(self, name: str, category: str = "sync", **args: Any) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, category, start, time.perf_counter() - start, args or None)
+
+    def memory_checkpoint(self) -> Optional[int]:
+        """Return the peak traced memory since the last checkpoint and reset it."""
+        if not (self.trace_memory and tracemalloc.is_tracing()):
+            return None
+        _, peak = tracemalloc.get_traced_memory()
+        self.memory_peak_bytes = max(peak, self.memory_peak_bytes or 0)
+        if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+            tracemalloc.reset_peak()
+        return peak
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        metadata: Dict[str, Any] = {"tool": "obs-sync"}
+        if self.memory_peak_bytes is not None:
+            metadata["memory_peak_bytes"] = self.memory_peak_bytes
+        with self._lock:
+            events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms", "metadata": metadata}
+
+    def write(self, path: str) -> str:
+        """Write the trace as JSON and return the absolute path."""
+        path = os.path.abspath(os.path.expanduser(path))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.to_chrome_trace(), handle)
+        return path
+
+
+_current_tracer: "contextvars.ContextVar[Optional[Tracer]]" = contextvars.ContextVar(
+    "obs_sync_tracer", default=None
+)
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Return the tracer installed for the current context, if any."""
+    return _current_tracer.get()
+
+
+@contextlib.contextmanager
+def use_tracer(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """Install ``tracer`` for the duration of the block."""
+    token = _current_tracer.set(tracer)
+    if tracer is not None:
+        tracer.start()
+    try:
+        yield tracer
+    finally:
+        if tracer is not None:
+            tracer.stop()
+        _current_tracer.reset(token)
+
+
+@contextlib.contextmanager
+def span(name: str, category: str = "sync", **args: Any) -> Iterator[None]:
+    """Trace a block with the active tracer; a no-op when tracing is off."""
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, category, **args):
+        yield
+
+
+def traced(
+    name: str,
+    category: str = "sync",
+    detail: Optional[Callable[..., Dict[str, Any]]] = None,
+) -> Callable:
+    """Decorator recording a span per call while a tracer is active.
+
+    Args:
+        name: Span name
+        category: Chrome trace category
+        detail: Optional callable receiving the call's arguments and returning
+            span args; only evaluated when tracing
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            tracer = _current_tracer.get()
+            if tracer is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                span_args = None
+                if detail is not None:
+                    try:
+                        span_args = detail(*args, **kwargs)
+                    except Exception:  # pragma: no cover - tracing must never break a run
+                        span_args = None
+                tracer.add_span(name, category, start, time.perf_counter() - start, span_args)
+
+        return wrapper
+
+    return decorator
+
+
+class PhaseTimer:
+    """Sequential phase stopwatch used by the sync engine.
+
+    ``start(name)`` closes the running phase and opens the next one, so a
+    long function can be instrumented with one line per phase boundary.
+    Durations are always recorded (two ``perf_counter`` calls per phase);
+    trace spans and memory peaks are only produced when a tracer is active.
+    """
+
+    def __init__(self, prefix: str = "sync"):
+        self.prefix = prefix
+        self.timings: Dict[str, float] = {}
+        self.memory_peaks: Dict[str, int] = {}
+        self._tracer = _current_tracer.get()
+        self._current: Optional[str] = None
+        self._started = 0.0
+
+    def start(self, name: str) -> None:
+        self.stop()
+        if self._tracer is not None:
+            self._tracer.memory_checkpoint()
+        self._current = name
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._current is None:
+            return
+        elapsed = time.perf_counter() - self._started
+        name = self._current
+        self._current = None
+        self.timings[name] = self.timings.get(name, 0.0) + elapsed
+        if self._tracer is not None:
+            args = None
+            peak = self._tracer.memory_checkpoint()
+            if peak is not None:
+                self.memory_peaks[name] = max(peak, self.memory_peaks.get(name, 0))
+                args = {"memory_peak_bytes": peak}
+            self._tracer.add_span(f"{self.prefix}.{name}", "phase", self._started, elapsed, args)
+
+    def summary(self) -> Dict[str, float]:
+        """Return phase durations in seconds, rounded to microseconds."""
+        return {name: round(seconds, 6) for name, seconds in self.timings.items()}
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Shared fixtures for the obs-sync test suite."""
+
+import pytest
+
+from obs_sync.bench import VaultSpec, generate_workload
+from obs_sync.core.models import RemindersTask
+from obs_sync.reminders.tasks import RemindersTaskManager
+from obs_sync.sync.engine import SyncEngine
+
+
+class FakeRemindersManager:
+    """In-memory stand-in for :class:`RemindersTaskManager` that records writes."""
+
+    def __init__(self) -> None:
+        self.tasks = []
+        self.updated = []
+        self.deleted = []
+
+    def list_tasks(self, list_ids=None, include_completed: bool = True):
+        return list(self.tasks)
+
+    def create_task(self, list_id: str, task: RemindersTask) -> RemindersTask:
+        task.uuid = f"rem-{len(self.tasks) + 1}"
+        task.item_id = task.uuid
+        task.calendar_id = list_id
+        self.tasks.append(task)
+        return task
+
+    def update_task(self, task: RemindersTask, changes: dict) -> RemindersTask:
+        self.updated.append((task.uuid, changes))
+        for key, value in changes.items():
+            if hasattr(task, key):
+                setattr(task, key, value)
+        return task
+
+    def delete_task(self, task: RemindersTask) -> bool:
+        self.deleted.append(task.uuid)
+        return True
+
+
+@pytest.fixture
+def fake_reminders_manager():
+    """A fresh :class:`FakeRemindersManager`."""
+    return FakeRemindersManager()
+
+
+@pytest.fixture
+def synthetic_workload():
+    """Factory generating a synthetic vault and Reminders list under a directory.
+
+    ``synthetic_workload(root, **spec)`` passes ``spec`` to :class:`VaultSpec`.
+    """
+
+    def build(root: str, **spec):
+        return generate_workload(root, VaultSpec(**spec))
+
+    return build
+
+
+@pytest.fixture
+def synthetic_engine(synthetic_workload):
+    """Factory for a synthetic workload and a :class:`SyncEngine` wired to its gateway.
+
+    ``synthetic_engine(root, direction="both", **spec)`` returns ``(workload, engine)``.
+    """
+
+    def build(root: str, direction: str = "both", **spec):
+        workload = synthetic_workload(root, **spec)
+        engine = SyncEngine(workload.engine_config(), direction=direction)
+        engine.rem_manager = RemindersTaskManager(gateway=workload.gateway)
+        return workload, engine
+
+    return build
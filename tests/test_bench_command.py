@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for the read-only `obs-sync bench` command."""
+
+import json
+import os
+import tempfile
+
+from obs_sync.commands.bench import BenchCommand, format_bench_report
+from obs_sync.core.models import RemindersList, SyncConfig, SyncLink, Vault
+from obs_sync.utils.io import safe_write_json
+
+
+def _setup(synthetic_workload, root: str):
+    workload = synthetic_workload(root, tasks=60, tasks_per_note=10)
+    links_path = os.path.join(root, "links.json")
+    safe_write_json(links_path, {"links": [
+        SyncLink(obs_uuid="obs-t000001", rem_uuid="rem-000001", score=1.0).to_dict()
+    ]})
+    config = SyncConfig(
+        vaults=[Vault(name="Bench", path=workload.vault_path, vault_id="bench")],
+        reminders_lists=[RemindersList(name="Benchmark", identifier=workload.list_id)],
+        links_path=links_path,
+    )
+    command = BenchCommand(config)
+    command.reminders_gateway = workload.gateway
+    return workload, command, links_path
+
+
+def test_bench_reports_every_subsystem_without_writing(synthetic_workload) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, command, links_path = _setup(synthetic_workload, root)
+        with open(links_path, "rb") as handle:
+            links_before = handle.read()
+        workload.gateway.reset_calls()
+
+        report = command.collect(repeat=2, sample=20)
+
+        assert report["errors"] == []
+        vault = report["vaults"][0]
+        assert vault["files"] == 6 and vault["tasks"] == 60 and vault["runs"] == 2
+        reminders = report["reminders"][0]
+        assert reminders["reminders"] == len(workload.gateway.reminders)
+        assert reminders["fetch"]["seconds"] <= reminders["fetch"]["median_seconds"]
+        assert report["links"]["links"] == 1 and "persist" in report["links"]
+        assert report["matcher"]["pairs"] == 400 and report["matcher"]["matches"] > 0
+
+        # Read-only: only fetches reached the gateway and the links file is untouched
+        assert set(workload.gateway.calls) == {"get_reminders"}
+        with open(links_path, "rb") as handle:
+            assert handle.read() == links_before
+
+        text = format_bench_report(report)
+        assert "Vault scan" in text and "60 tasks" in text and "1 links" in text
+
+
+def test_bench_writes_json_for_selected_probes(capsys, synthetic_workload) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        _, command, _ = _setup(synthetic_workload, root)
+        json_path = os.path.join(root, "out", "bench.json")
+
+        assert command.run(probes=["links"], repeat=1, json_path=json_path) is True
+        with open(json_path, encoding="utf-8") as handle:
+            report = json.load(handle)
+        assert set(report) >= {"links", "repeat", "errors"}
+        assert "vaults" not in report and "matcher" not in report
+        capsys.readouterr()
+
+        assert command.run(probes=["vaults"], repeat=1, json_path="-") is True
+        printed = json.loads(capsys.readouterr().out)
+        assert printed["vaults"][0]["tasks"] == 60
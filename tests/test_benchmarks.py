@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Synthetic-vault benchmarks with stored baselines (obs_sync/bench).
+
+The baseline comparison is marked slow and runs the 1k-task workload by
+default. Choose sizes with ``OBS_SYNC_BENCH_SIZES`` (e.g. ``1000,10000,100000``),
+loosen the threshold on noisy machines with ``OBS_SYNC_BENCH_TOLERANCE`` and
+record new baselines with ``OBS_SYNC_BENCH_UPDATE=1``.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from obs_sync.bench import (
+    BenchmarkResult,
+    ScenarioResult,
+    VaultSpec,
+    compare_to_baselines,
+    generate_workload,
+    load_baselines,
+    run_benchmark,
+    save_baselines,
+)
+from obs_sync.obsidian.tasks import ObsidianTaskManager
+
+BASELINES_PATH = Path(__file__).resolve().parent / "benchmarks" / "baselines.json"
+BENCH_SIZES = [int(size) for size in os.environ.get("OBS_SYNC_BENCH_SIZES", "1000").split(",") if size.strip()]
+
+
+def test_generated_workload_follows_the_spec() -> None:
+    spec = VaultSpec(tasks=120, tasks_per_note=10, paired_ratio=0.5, block_id_ratio=1.0, reminders_only_ratio=0.1)
+    with tempfile.TemporaryDirectory() as root:
+        workload = generate_workload(root, spec)
+        tasks = ObsidianTaskManager().list_tasks(workload.vault_path, include_completed=True)
+
+        assert len(tasks) == 120
+        assert len(workload.notes) == 12
+        assert all(task.block_id for task in tasks)
+        paired = [r for r in workload.gateway.reminders.values() if not r.uuid.startswith("rem-only-")]
+        assert 40 <= len(paired) <= 80
+        assert len(workload.gateway.reminders) - len(paired) == 12
+
+        # Same seed, same workload
+        with tempfile.TemporaryDirectory() as other:
+            again = generate_workload(other, spec)
+            assert sorted(r.title for r in again.gateway.reminders.values()) == sorted(
+                r.title for r in workload.gateway.reminders.values()
+            )
+
+
+def test_scenarios_run_against_the_stand_in_gateway() -> None:
+    result = run_benchmark(150)
+
+    assert list(result.scenarios) == ["first_match", "cold_sync", "warm_noop", "churn_sync"]
+    assert result.scenarios["first_match"].gateway_calls == {"get_reminders": 1}
+    assert result.scenarios["cold_sync"].changes["links_created"] > 0
+    assert not any(result.scenarios["warm_noop"].changes.values())
+    assert any(result.scenarios["churn_sync"].changes.values())
+    assert "match" in result.scenarios["cold_sync"].timings
+
+
+def test_baseline_comparison_flags_only_real_regressions() -> None:
+    result = BenchmarkResult(size=1000, scenarios={
+        "cold_sync": ScenarioResult("cold_sync", seconds=2.0),
+        "warm_noop": ScenarioResult("warm_noop", seconds=0.3),
+        "churn_sync": ScenarioResult("churn_sync", seconds=5.0),
+    })
+    baselines = {"tolerance": 1.5, "slack_seconds": 0.25, "sizes": {"1000": {"cold_sync": 1.0, "warm_noop": 0.1}}}
+
+    regressions = compare_to_baselines([result], baselines)
+    assert [(r.scenario, r.allowed) for r in regressions] == [("cold_sync", 1.75)]
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "baselines.json")
+        save_baselines(path, [result])
+        stored = load_baselines(path)
+        assert stored["sizes"]["1000"] == {"cold_sync": 2.0, "warm_noop": 0.3, "churn_sync": 5.0}
+        assert not compare_to_baselines([result], stored)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("size", BENCH_SIZES)
+def test_sync_benchmarks_stay_within_baselines(size: int) -> None:
+    result = run_benchmark(size)
+    baselines = load_baselines(str(BASELINES_PATH))
+
+    if os.environ.get("OBS_SYNC_BENCH_UPDATE"):
+        save_baselines(str(BASELINES_PATH), [result], existing=baselines)
+        return
+
+    if str(size) not in baselines["sizes"]:
+        pytest.skip(f"No stored baseline for {size} tasks (set OBS_SYNC_BENCH_UPDATE=1 to record one)")
+
+    tolerance = os.environ.get("OBS_SYNC_BENCH_TOLERANCE")
+    regressions = compare_to_baselines(
+        [result], baselines, tolerance=float(tolerance) if tolerance else None
+    )
+    assert not regressions, "Benchmark regressions:\n" + "\n".join(str(r) for r in regressions)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for the compact task representations (obs_sync/core/models.py)."""
+
+import sys
+from dataclasses import replace
+
+import pytest
+
+from obs_sync.core import models
+from obs_sync.core.models import ObsidianTask, RemindersTask, SyncLink, TaskStatus
+
+
+def _obs(uuid: str, tags) -> ObsidianTask:
+    # Build the strings at runtime so they are distinct objects before interning
+    return ObsidianTask(
+        uuid=uuid, vault_id="".join(["v", "1"]), vault_name="".join(["Va", "ult"]),
+        vault_path="/".join(["", "vault"]), file_path="".join(["inbox", ".md"]), line_number=1,
+        block_id=None, status=TaskStatus.TODO, description="Task", raw_line="- [ ] Task", tags=tags,
+    )
+
+
+def test_repeated_metadata_and_tags_share_one_string() -> None:
+    first = _obs("o1", ["#" + "work"])
+    second = ObsidianTask.from_dict(_obs("o2", ["#" + "work"]).to_dict())
+
+    assert first.vault is second.vault
+    assert first.vault_path is second.vault_path
+    assert first.file_path is second.file_path
+    assert first.tags[0] is second.tags[0]
+
+    rem = [
+        RemindersTask(
+            uuid=f"r{index}", item_id=f"r{index}", calendar_id="".join(["cal", "-1"]),
+            list_name="".join(["Wo", "rk"]), status=TaskStatus.TODO, title="Task",
+        )
+        for index in range(2)
+    ]
+    assert rem[0].calendar_id is rem[1].calendar_id and rem[0].list_name is rem[1].list_name
+
+
+def test_tasks_keep_their_field_api() -> None:
+    task = _obs("o1", [])
+    task.tags.append("#new")
+    task.description = "Edited"
+
+    task.vault_path = "/moved"
+    assert (task.vault_id, task.vault_name, task.vault_path) == ("v1", "Vault", "/moved")
+
+    assert replace(task, uuid="o2").description == "Edited"
+    assert replace(task, uuid="o2").vault is task.vault
+    moved = replace(task, vault_id="v2", vault_path="/other")
+    assert (moved.vault_id, moved.vault_name, moved.vault_path) == ("v2", "Vault", "/other")
+    assert task.vault_id == "v1"
+    assert ObsidianTask.from_dict(task.to_dict()) == replace(task)
+    assert SyncLink.from_dict(SyncLink("o1", "r1", 1.0, vault_id="v1").to_dict()).vault_id == "v1"
+
+
+def test_shared_vault_refs_are_bounded(monkeypatch) -> None:
+    monkeypatch.setattr(models, "VAULT_REF_CACHE_SIZE", 4)
+    for index in range(10):
+        _obs(f"o{index}", []).vault_path = f"/vault-{index}"
+    assert len(models._VAULT_REFS) <= 4
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_tasks_and_links_have_no_instance_dict() -> None:
+    for obj in (_obs("o1", []), SyncLink("o1", "r1", 1.0)):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unexpected = True
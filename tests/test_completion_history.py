@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Tests for the columnar completion history (obs_sync/analytics/history.py)."""
+
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+
+from obs_sync.analytics.history import CompletionHistory
+from obs_sync.analytics.streaks import StreakTracker
+
+
+TODAY = date(2025, 3, 12)
+
+
+def test_round_trip_keeps_series_and_backfills() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "streaks.history")
+        history = CompletionHistory(path)
+        for offset in (3, 2, 0):
+            assert history.record("v1", "tags", "#work", TODAY - timedelta(days=offset), 2) is None
+        # Filling in a day before the first one shifts the series
+        history.record("v1", "tags", "#work", TODAY - timedelta(days=10), 1)
+        assert history.record("v1", "tags", "#work", TODAY, 5) == 2
+        history.record("v1", "lists", "Inbox ✓", TODAY, 1)
+        history.save()
+        assert not history.dirty
+
+        reloaded = CompletionHistory(path)
+        assert reloaded.counts("v1", "tags", "#work") == {
+            TODAY - timedelta(days=10): 1,
+            TODAY - timedelta(days=3): 2,
+            TODAY - timedelta(days=2): 2,
+            TODAY: 5,
+        }
+        assert reloaded.keys("v1", "lists") == ["Inbox ✓"]
+
+
+def test_totals_and_trim() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        history = CompletionHistory(os.path.join(root, "streaks.history"))
+        for offset in range(60):
+            history.record("v1", "tags", "#home", TODAY - timedelta(days=offset), 1 + offset % 2)
+
+        assert history.total("v1", "tags", "#home", TODAY - timedelta(days=6), TODAY) == 10
+        assert history.total("v1", "tags", "#home", TODAY - timedelta(days=59), TODAY) == 90
+
+        history.trim(TODAY - timedelta(days=6))
+        assert len(history.counts("v1", "tags", "#home")) == 7
+        assert history.total("v1", "tags", "#missing", TODAY - timedelta(days=6), TODAY) == 0
+
+        # A zero count for a key without history does not create a series
+        history.dirty = False
+        assert history.record("v1", "tags", "#idle", TODAY, 0) is None
+        assert history.series("v1", "tags", "#idle") is None and not history.dirty
+
+
+def test_tracker_moves_legacy_json_history_into_the_store() -> None:
+    today = date.today()
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "streaks.json")
+        history = {(today - timedelta(days=offset)).isoformat(): 3 for offset in range(4)}
+        with open(path, "w") as handle:
+            json.dump({"v1": {"tags": {"#work": history}, "lists": {"Work": history}}}, handle)
+
+        tracker = StreakTracker(data_path=path)
+        assert tracker.get_streak("v1", "#work") == {"current": 4, "best": 4}
+        tracker.record_completions("v1", today, by_tag={"#work": 4}, by_list={})
+
+        with open(path) as handle:
+            assert "tags" not in json.load(handle)["v1"]
+        reloaded = StreakTracker(data_path=path)
+        assert reloaded.history.counts("v1", "tags", "#work")[today] == 4
+        assert reloaded.get_all_streaks("v1") == {
+            "tag:#work": {"current": 4, "best": 4},
+            "list:Work": {"current": 4, "best": 4},
+        }
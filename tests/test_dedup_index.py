@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Tests for the incremental duplicate index (obs_sync/sync/dedup_index.py)."""
+
+import os
+import random
+import tempfile
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from obs_sync.core.models import ObsidianTask, RemindersTask, SyncLink, TaskStatus
+from obs_sync.sync.dedup_index import DuplicateIndex, DuplicateIndexStore
+from obs_sync.sync.deduplicator import TaskDeduplicator
+
+
+def _obs(uuid: str, description: str) -> ObsidianTask:
+    return ObsidianTask(
+        uuid=uuid, vault_id="v1", vault_name="Vault", vault_path="/vault", file_path="inbox.md",
+        line_number=1, block_id=None, status=TaskStatus.TODO, description=description,
+        raw_line=f"- [ ] {description}",
+    )
+
+
+def _rem(uuid: str, title: str, calendar_id: str = "work") -> RemindersTask:
+    return RemindersTask(
+        uuid=uuid, item_id=uuid, calendar_id=calendar_id, list_name=calendar_id.title(),
+        status=TaskStatus.TODO, title=title, created_at=datetime.now(timezone.utc),
+    )
+
+
+def _shape(results):
+    return sorted(
+        (cluster.key, tuple(sorted(cluster.member_ids())))
+        for cluster in results.get_duplicate_clusters()
+    )
+
+
+def test_only_new_and_edited_tasks_are_normalized() -> None:
+    obs = [_obs(f"o{i}", f"Task {i % 10}") for i in range(40)]
+    rem = [_rem(f"r{i}", f"Task {i % 10}") for i in range(20)]
+    deduplicator = TaskDeduplicator(Mock(), Mock(), index=DuplicateIndex())
+    deduplicator.analyze_duplicates(obs, rem)
+
+    calls = []
+    normalize = deduplicator._normalize_description
+    deduplicator._normalize_description = lambda text: calls.append(text) or normalize(text)
+    obs[3].description = "Something else"
+    deduplicator.analyze_duplicates(obs[:-1], rem + [_rem("r-new", "Task 1")])
+
+    assert sorted(calls) == ["Something else", "Task 1"]
+
+
+def test_incremental_results_match_a_fresh_analysis() -> None:
+    rng = random.Random(11)
+    words = ["Buy milk", "Call mum", "buy  MILK", "Pay rent", "Water plants"]
+    obs = [_obs(f"o{i}", rng.choice(words)) for i in range(30)]
+    rem = [_rem(f"r{i}", rng.choice(words), rng.choice(["work", "home"])) for i in range(30)]
+    incremental = TaskDeduplicator(Mock(), Mock(), index=DuplicateIndex())
+
+    for _ in range(15):
+        target = rng.choice(obs + rem)
+        if isinstance(target, ObsidianTask):
+            target.description = rng.choice(words)
+        else:
+            target.title = rng.choice(words)
+        links = [SyncLink(obs_uuid=f"o{i}", rem_uuid=f"r{i}", score=1.0) for i in range(rng.randint(0, 8))]
+        expected = TaskDeduplicator(Mock(), Mock()).analyze_duplicates(obs, rem, links)
+        actual = incremental.analyze_duplicates(obs, rem, links)
+        assert _shape(actual) == _shape(expected)
+        assert actual.duplicate_tasks == expected.duplicate_tasks
+
+
+def test_kept_clusters_return_only_when_membership_changes() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        store = DuplicateIndexStore(os.path.join(root, "dedup_index.json"))
+        obs = [_obs("o1", "Buy milk"), _obs("o2", "buy milk")]
+
+        deduplicator = TaskDeduplicator(Mock(), Mock(), index=store.load("/vault"))
+        cluster = deduplicator.analyze_duplicates(obs, []).get_duplicate_clusters()[0]
+        deduplicator.mark_kept(cluster)
+        store.save("/vault", deduplicator.index)
+
+        reloaded = TaskDeduplicator(Mock(), Mock(), index=store.load("/vault"))
+        results = reloaded.analyze_duplicates(obs, [])
+        assert results.duplicate_clusters == 0 and results.kept_clusters == 1
+
+        results = reloaded.analyze_duplicates(obs + [_obs("o3", "Buy Milk")], [])
+        assert results.duplicate_clusters == 1 and results.kept_clusters == 0
+        assert store.load("/other-vault").members == {}
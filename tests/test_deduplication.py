@@ -450,7 +450,7 @@ def test_deletion_stats():
 @patch('obs_sync.obsidian.tasks.ObsidianTaskManager')
 @patch('obs_sync.reminders.tasks.RemindersTaskManager')
 @patch('obs_sync.utils.prompts.confirm_deduplication')
-def test_integration_dry_run(mock_confirm, mock_rem_manager, mock_obs_manager):
+def test_integration_dry_run(mock_confirm, mock_rem_manager, mock_obs_manager, tmp_path):
     """Test deduplication integration in dry run mode."""
     print("🧪 Testing deduplication integration (dry run)...")
     
@@ -505,7 +505,7 @@ def test_integration_dry_run(mock_confirm, mock_rem_manager, mock_obs_manager):
     mock_obs_mgr.list_tasks.return_value = obs_tasks
     mock_rem_mgr.list_tasks.return_value = rem_tasks
     
-    config = SyncConfig()
+    config = SyncConfig(links_path=str(tmp_path / "sync_links.json"))
     config.enable_deduplication = True
     
     # Run deduplication in dry run mode
@@ -520,6 +520,7 @@ def test_integration_dry_run(mock_confirm, mock_rem_manager, mock_obs_manager):
     assert stats["obs_deleted"] == 0, "Should not delete tasks in dry run"
     assert stats["rem_deleted"] == 0, "Should not delete tasks in dry run"
     mock_confirm.assert_not_called()  # Should not prompt in dry run
+    assert not (tmp_path / "dedup_index.json").exists(), "Dry runs should not store the duplicate index"
     
     print("✅ Deduplication integration (dry run) tests passed")
 
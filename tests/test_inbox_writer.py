@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for buffered inbox appends and rotation (obs_sync/obsidian/inbox.py)."""
+
+import os
+import tempfile
+from datetime import date
+
+import pytest
+
+from obs_sync.core.models import ObsidianTask, RemindersTask, TaskStatus
+from obs_sync.obsidian.inbox import InboxWriter
+from obs_sync.obsidian.tasks import ObsidianTaskManager
+from obs_sync.sync.engine import SyncEngine
+
+
+def _new_task(vault_path: str, description: str) -> ObsidianTask:
+    return ObsidianTask(
+        uuid="obs-temp",
+        vault_id="vault",
+        vault_name="vault",
+        vault_path=vault_path,
+        file_path="Inbox.md",
+        line_number=0,
+        block_id=None,
+        status=TaskStatus.TODO,
+        description=description,
+        raw_line="",
+    )
+
+
+def test_deferred_appends_are_written_once_with_aligned_line_numbers() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        manager = ObsidianTaskManager()
+        manager.defer_appends = True
+
+        created = [
+            manager.create_task(vault_path, "Inbox.md", _new_task(vault_path, f"Reminder {i}"))
+            for i in range(3)
+        ]
+
+        inbox_path = os.path.join(vault_path, "Inbox.md")
+        assert not os.path.exists(inbox_path), "Appends should stay buffered until flushed"
+        assert len({task.block_id for task in created}) == 3
+
+        assert manager.flush_appends() == 3
+        manager.defer_appends = False
+
+        listed = {task.uuid: task for task in manager.list_tasks(vault_path)}
+        for task in created:
+            assert listed[task.uuid].line_number == task.line_number
+
+        with open(inbox_path, "r", encoding="utf-8") as handle:
+            assert handle.read().startswith("# Inbox\n\n- [ ] Reminder 0")
+
+
+def test_writer_reloads_after_external_edit() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        inbox_path = os.path.join(vault_path, "Inbox.md")
+        with open(inbox_path, "w", encoding="utf-8") as handle:
+            handle.write("# Inbox\n- [ ] Existing ^abc123")  # no trailing newline
+
+        manager = ObsidianTaskManager()
+        first = manager.create_task(vault_path, "Inbox.md", _new_task(vault_path, "First"))
+        assert first.line_number == 3
+
+        with open(inbox_path, "a", encoding="utf-8") as handle:
+            handle.write("- [ ] Added in Obsidian ^def456\n")
+
+        second = manager.create_task(vault_path, "Inbox.md", _new_task(vault_path, "Second"))
+        assert second.line_number == 5
+        assert "def456" in manager.get_inbox_writer(vault_path).state_for("Inbox.md").block_ids
+
+        with open(inbox_path, "r", encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        assert lines[1] == "- [ ] Existing ^abc123"
+        assert lines[2].startswith("- [ ] First")
+
+
+def test_rotation_targets() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        with open(os.path.join(vault_path, "Inbox.md"), "w", encoding="utf-8") as handle:
+            handle.write("# Inbox\n" + "- [ ] filler\n" * 20)
+
+        dated = InboxWriter(vault_path, rotation="dated", max_bytes=100)
+        assert dated.resolve_path("Inbox.md", today=date(2024, 5, 1)) == "Inbox 2024-05-01.md"
+
+        per_list = InboxWriter(vault_path, rotation="per-list", max_bytes=100)
+        assert per_list.resolve_path("Inbox.md", list_name="Work/Home") == "Inbox - Work-Home.md"
+
+        unlimited = InboxWriter(vault_path, rotation="dated", max_bytes=0)
+        assert unlimited.resolve_path("Inbox.md") == "Inbox.md"
+
+
+if __name__ == "__main__":
+    test_deferred_appends_are_written_once_with_aligned_line_numbers()
+    test_writer_reloads_after_external_edit()
+    test_rotation_targets()
+    print("✅ Inbox writer tests passed")
+
+
+def test_engine_flushes_buffered_appends_when_a_creation_fails() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        engine = SyncEngine({"links_path": os.path.join(vault_path, "links.json")}, direction="rem-to-obs")
+        engine.vault_path = vault_path
+        reminders = [
+            RemindersTask(
+                uuid=f"rem-{i}", item_id=f"rem-{i}", calendar_id="list", list_name="List",
+                status=TaskStatus.TODO, title=f"Reminder {i}",
+            )
+            for i in range(2)
+        ]
+        create = engine.obs_manager.create_task
+
+        def fail_second(*args, **kwargs):
+            if engine.changes_made["obs_created"]:
+                raise RuntimeError("disk full")
+            return create(*args, **kwargs)
+
+        engine.obs_manager.create_task = fail_second
+        with pytest.raises(RuntimeError):
+            engine._create_counterparts([], reminders, None, dry_run=False)
+
+        assert engine.obs_manager.defer_appends is False
+        with open(os.path.join(vault_path, engine.inbox_path), "r", encoding="utf-8") as handle:
+            assert "Reminder 0" in handle.read()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the single-pass insights aggregation (obs_sync/analytics/aggregator.py)."""
+
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from obs_sync.analytics.aggregator import InsightsAggregator
+from obs_sync.core.models import ObsidianTask, RemindersTask, SyncLink, TaskStatus
+
+
+TODAY = date(2025, 6, 16)
+LONG_AGO = datetime(2025, 5, 1, tzinfo=timezone.utc)
+
+
+def _rem(uuid, list_name="Work", status=TaskStatus.TODO, **fields):
+    return RemindersTask(uuid=uuid, item_id=uuid, calendar_id="cal", list_name=list_name, status=status,
+                         title=f"Task {uuid}", **fields)
+
+
+def _obs(uuid, tags):
+    return ObsidianTask(uuid=uuid, vault_id="v", vault_name="V", vault_path="/v", file_path="A.md",
+                        line_number=1, block_id=None, status=TaskStatus.TODO, description=uuid,
+                        raw_line="", tags=tags)
+
+
+def test_one_pass_counts_by_list_and_tag() -> None:
+    rem_tasks = [
+        _rem("r1", status=TaskStatus.DONE, completion_date=TODAY - timedelta(days=1)),
+        _rem("r2", status=TaskStatus.DONE, completion_date=TODAY - timedelta(days=30)),
+        _rem("r3", list_name="Home", due_date=TODAY - timedelta(days=2)),
+        _rem("r4", list_name=None),
+    ]
+    obs_tasks = [_obs("o1", ["#Work", "#deep"]), _obs("o3", ["#home"]), _obs("o5", ["#new"])]
+    links = [SyncLink(obs_uuid="o1", rem_uuid="r1", score=1.0), SyncLink(obs_uuid="o3", rem_uuid="r3", score=1.0)]
+
+    summary = InsightsAggregator(today=TODAY).run(
+        rem_tasks, obs_tasks, links, created_rem_ids=["r4"], created_obs_ids=["o5", "missing"]
+    )
+
+    assert summary.insights() == {
+        "completions": 1,
+        "overdue": 1,
+        "new_tasks": 2,
+        "by_list": {
+            "Work": {"completions": 1, "overdue": 0, "new_tasks": 0},
+            "Home": {"completions": 0, "overdue": 1, "new_tasks": 0},
+            "Unknown": {"completions": 0, "overdue": 0, "new_tasks": 1},
+        },
+        "by_tag": {
+            "#work": {"completions": 1, "overdue": 0, "new_tasks": 0},
+            "#deep": {"completions": 1, "overdue": 0, "new_tasks": 0},
+            "#home": {"completions": 0, "overdue": 1, "new_tasks": 0},
+            "#new": {"completions": 0, "overdue": 0, "new_tasks": 1},
+        },
+    }
+    assert summary.completions_by_date == {
+        TODAY - timedelta(days=1): {"by_tag": {"#work": 1, "#deep": 1}, "by_list": {"Work": 1}},
+    }
+    assert summary.hygiene == {}
+
+
+def test_hygiene_counts_stagnant_and_missing_due_per_list() -> None:
+    rem_tasks = [
+        _rem("r1", created_at=LONG_AGO),
+        _rem("r2", list_name="Home", due_date=TODAY + timedelta(days=3), modified_at=LONG_AGO),
+        _rem("r3", list_name="Home", due_date=TODAY - timedelta(days=4), modified_at=LONG_AGO),
+        _rem("r4", status=TaskStatus.DONE),
+    ]
+
+    summary = InsightsAggregator(hygiene=True, today=TODAY).run(rem_tasks)
+
+    assert (summary.stagnant, summary.missing_due, summary.overdue) == (2, 1, 1)
+    assert summary.by_list["Work"] == {
+        "completions": 0, "overdue": 0, "new_tasks": 0, "stagnant": 1, "missing_due": 1,
+    }
+    assert summary.by_list["Home"]["stagnant"] == 1
+    assert [item["uuid"] for item in summary.hygiene["stagnant"]] == ["r1", "r2"]
+    assert summary.hygiene["overdue"][0]["days_overdue"] == 4
+
+
+def test_engine_aggregates_insights_once_per_sync(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, engine = synthetic_engine(root, tasks=30, tasks_per_note=10)
+
+        summaries = []
+        original = InsightsAggregator.run
+
+        def run(self, *args, **kwargs):
+            summaries.append(original(self, *args, **kwargs))
+            return summaries[-1]
+
+        with patch.object(InsightsAggregator, "run", run):
+            result = engine.sync(workload.vault_path, [workload.list_id], dry_run=True)
+
+        assert len(summaries) == 1
+        assert result["insights"] == summaries[0].insights()
+        assert result["insights"]["overdue"] > 0
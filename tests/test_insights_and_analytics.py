@@ -86,6 +86,7 @@ def test_streak_tracking():
         
         # Cleanup
         Path(f.name).unlink()
+        Path(tracker.history.path).unlink(missing_ok=True)
 
 
 def test_reminders_task_update_captures_completion_date():
@@ -289,12 +290,14 @@ def test_streak_recording_per_completion_date():
             by_list={"Work": 3}
         )
         
-        # Load raw data to verify per-day recording
-        with open(f.name, 'r') as data_file:
-            raw_data = json.load(data_file)
+        # Reload the persisted history to verify per-day recording
+        reloaded = StreakTracker(data_path=f.name)
         
         # Verify each day has its own entry
-        work_tag_data = raw_data[vault_id]["tags"]["work"]
+        work_tag_data = {
+            day.isoformat(): count
+            for day, count in reloaded.history.counts(vault_id, "tags", "work").items()
+        }
         date_keys = sorted(work_tag_data.keys())
         
         assert len(date_keys) == 3, f"Should have 3 separate date entries, got {len(date_keys)}"
@@ -308,6 +311,7 @@ def test_streak_recording_per_completion_date():
         
         # Cleanup
         Path(f.name).unlink()
+        Path(reloaded.history.path).unlink()
 
 
 def test_hygiene_analysis():
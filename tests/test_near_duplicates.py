@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for MinHash/LSH near-duplicate detection (obs_sync/sync/near_duplicates.py)."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from obs_sync.core.models import ObsidianTask, RemindersTask, TaskStatus
+from obs_sync.sync.dedup_index import DuplicateIndex
+from obs_sync.sync.deduplicator import TaskDeduplicator
+from obs_sync.sync.near_duplicates import NearDuplicateFinder
+
+
+def _obs(uuid: str, description: str) -> ObsidianTask:
+    return ObsidianTask(
+        uuid=uuid, vault_id="v1", vault_name="Vault", vault_path="/vault", file_path="inbox.md",
+        line_number=1, block_id=None, status=TaskStatus.TODO, description=description,
+        raw_line=f"- [ ] {description}",
+    )
+
+
+def _rem(uuid: str, title: str, calendar_id: str = "work") -> RemindersTask:
+    return RemindersTask(
+        uuid=uuid, item_id=uuid, calendar_id=calendar_id, list_name=calendar_id.title(),
+        status=TaskStatus.TODO, title=title, created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_similar_titles_cluster_but_distinct_ones_do_not() -> None:
+    titles = ["Call dentist re: cleaning", "Call mum", "call the dentist about cleaning", "Call dad"]
+    clusters = NearDuplicateFinder().find(titles, text=lambda title: title)
+
+    assert len(clusters) == 1
+    members, similarity = clusters[0]
+    assert members == ["Call dentist re: cleaning", "call the dentist about cleaning"]
+    assert 0.6 <= similarity < 1.0
+
+
+def test_near_duplicates_merge_with_exact_clusters() -> None:
+    obs = [_obs("o1", "Call dentist re: cleaning"), _obs("o2", "Water plants")]
+    rem = [_rem("r1", "call dentist re: cleaning"), _rem("r2", "Call the dentist about cleaning")]
+
+    exact = TaskDeduplicator(Mock(), Mock(), index=DuplicateIndex()).analyze_duplicates(obs, rem)
+    # The identical pair alone looks like a sync pair, not a duplicate
+    assert exact.get_duplicate_clusters() == []
+
+    deduplicator = TaskDeduplicator(
+        Mock(), Mock(), index=DuplicateIndex(), near_finder=NearDuplicateFinder()
+    )
+    clusters = deduplicator.analyze_duplicates(obs, rem).get_duplicate_clusters()
+
+    assert len(clusters) == 1
+    assert sorted(clusters[0].member_ids()) == ["obs:o1", "rem:r1", "rem:r2"]
+    assert clusters[0].key.startswith("~") and clusters[0].similarity is not None
+
+
+def test_candidate_pairs_stay_far_below_all_pairs() -> None:
+    finder = NearDuplicateFinder()
+    titles = [f"Review invoice {index} for client {index * 7}" for index in range(400)]
+    signatures = [finder.signature(finder.tokenize(title)) for title in titles]
+
+    assert len(finder.candidate_pairs(signatures)) < len(titles) * (len(titles) - 1) // 20
+
+
+def test_results_are_deterministic() -> None:
+    titles = [f"Plan {word} trip with family" for word in ("summer", "winter", "spring", "beach")]
+    titles += ["Buy groceries", "buy the groceries today"]
+
+    first = NearDuplicateFinder().find(titles, text=lambda title: title)
+    second = NearDuplicateFinder().find(list(titles), text=lambda title: title)
+    assert first == second and first
+
+
+def test_clusters_do_not_chain_through_intermediate_members() -> None:
+    # B is similar to both A and C, but C is not similar to A
+    titles = ["t1 t2 t3 t4", "t1 t2 t3 t5", "t1 t2 t5 t6"]
+    clusters = NearDuplicateFinder(tokenize=lambda title: (title or "").split()).find(
+        titles, text=lambda title: title
+    )
+
+    assert clusters == [(["t1 t2 t3 t4", "t1 t2 t3 t5"], 0.75)]
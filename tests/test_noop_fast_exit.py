@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Tests for skipping unchanged sync runs via fingerprints (obs_sync/sync/fingerprint.py)."""
+
+import os
+import tempfile
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+from obs_sync.commands.sync import sync_command
+from obs_sync.core.models import SyncConfig
+from obs_sync.sync.fingerprint import FingerprintStore
+
+
+def _setup(synthetic_engine, root: str):
+    workload, engine = synthetic_engine(root, tasks=30, tasks_per_note=10)
+    config = SyncConfig(
+        links_path=workload.links_path,
+        run_history_enabled=False,
+        enable_deduplication=False,
+        default_calendar_id=workload.list_id,
+    )
+
+    def run(dry_run: bool = False, **kwargs):
+        workload.gateway.reset_calls()
+        result = sync_command(
+            workload.vault_path, [workload.list_id], dry_run=dry_run,
+            config=config, show_summary=False, engine=engine, **kwargs,
+        )
+        assert result["success"]
+        return result
+
+    return workload, config, run
+
+
+def test_unchanged_runs_exit_without_fetching_or_scanning(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, config, run = _setup(synthetic_engine, root)
+
+        assert run()["has_changes"], "first run creates links and counterparts"
+        store = FingerprintStore.for_config(config)
+        assert store.get(workload.vault_path, "both") is None, "runs with changes never record a fingerprint"
+        assert not run(dry_run=True)["has_changes"]
+        assert store.get(workload.vault_path, "both") is None, "dry runs never record a fingerprint"
+
+        settled = run()
+        assert not settled["has_changes"] and not settled.get("skipped")
+        assert store.get(workload.vault_path, "both")["counts"]["obs_tasks"] == 30
+
+        skipped = run()
+        assert skipped["skipped"] is True
+        assert skipped["results"]["obs_tasks"] == 30
+        assert workload.gateway.calls == {"get_list_fingerprints": 1}
+
+        forced = run(force=True)
+        assert not forced.get("skipped")
+        assert "get_reminders" in workload.gateway.calls
+
+
+def test_edits_on_either_side_invalidate_the_fingerprint(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, config, run = _setup(synthetic_engine, root)
+        run()
+        run()
+        assert run()["skipped"]
+
+        note = os.path.join(workload.vault_path, workload.notes[0])
+        with open(note, "a", encoding="utf-8") as handle:
+            handle.write("- [ ] Brand new task\n")
+        assert not run(dry_run=True).get("skipped")
+        # A dry run with pending changes must not hide them from the next run
+        assert not run(dry_run=True).get("skipped")
+        run()
+        run()
+        assert run()["skipped"]
+
+        reminder = next(iter(workload.gateway.reminders.values()))
+        reminder.title = "Renamed in Reminders"
+        reminder.modified_at = datetime.now(timezone.utc).isoformat()
+        assert not run().get("skipped")
+
+        config.min_score = 0.9
+        assert not run().get("skipped"), "settings changes force a full run"
+
+
+def test_first_run_of_a_new_day_and_behaviour_settings_are_not_skipped(synthetic_engine) -> None:
+    class _Tomorrow(date):
+        @classmethod
+        def today(cls):
+            return date.today() + timedelta(days=1)
+
+    with tempfile.TemporaryDirectory() as root:
+        _, config, run = _setup(synthetic_engine, root)
+        run()
+        run()
+        assert run()["skipped"]
+
+        # Daily-note insights, streaks and overdue counts are due after midnight
+        with patch("obs_sync.sync.fingerprint.date", _Tomorrow):
+            assert not run().get("skipped")
+            assert run()["skipped"]
+
+        for name, value in (
+            ("sync_calendar_events", True),
+            ("enable_streak_tracking", False),
+            ("dedup_near_duplicates", True),
+        ):
+            run()
+            assert run()["skipped"]
+            setattr(config, name, value)
+            assert not run().get("skipped"), f"changing {name} forces a full run"
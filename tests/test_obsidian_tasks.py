@@ -40,6 +40,93 @@ def test_delete_task_without_block_id() -> None:
         assert "Another task" in remaining
 
 
+def test_update_patches_line_in_place_and_shifts_siblings() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault_path = os.path.join(tmpdir, "Vault")
+        os.makedirs(vault_path)
+        note_path = os.path.join(vault_path, "Tasks.md")
+        _write_markdown(
+            note_path,
+            "# Heading\n- [ ] First ^aaa111\n- [ ] Second ^bbb222\n- [ ] Third ^ccc333\n",
+        )
+
+        manager = ObsidianTaskManager()
+        tasks = {task.block_id: task for task in manager.list_tasks(vault_path)}
+        index = manager.get_index(vault_path)
+        assert index.lookup("obs-ccc333") is not None
+        third_offset = index.lookup("obs-ccc333").offset
+
+        updated = manager.update_task(tasks["aaa111"], {"description": "First, now longer"})
+        assert updated is not None
+
+        third_after = index.lookup("obs-ccc333")
+        assert third_after is not None, "Index should stay fresh after an in-place patch"
+        assert third_after.offset == third_offset + len(", now longer")
+
+        # Subsequent updates and deletes reuse the shifted offsets
+        assert manager.update_task(tasks["ccc333"], {"status": "done"}) is not None
+        assert manager.delete_task(tasks["bbb222"])
+
+        with open(note_path, "r", encoding="utf-8") as handle:
+            content = handle.read()
+
+        assert content == "# Heading\n- [ ] First, now longer ^aaa111\n- [x] Third ^ccc333\n"
+        assert index.lookup("obs-ccc333").line_number == 3
+
+
+def test_update_falls_back_when_file_changed_externally() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault_path = os.path.join(tmpdir, "Vault")
+        os.makedirs(vault_path)
+        note_path = os.path.join(vault_path, "Tasks.md")
+        _write_markdown(note_path, "- [ ] Keep ^keep01\r\n- [ ] Edit ^edit01\r\n")
+
+        manager = ObsidianTaskManager()
+        target = next(task for task in manager.list_tasks(vault_path) if task.block_id == "edit01")
+
+        # An external edit invalidates the recorded offsets
+        _write_markdown(note_path, "- [ ] Inserted line\n- [ ] Keep ^keep01\n- [ ] Edit ^edit01\n")
+        assert manager.get_index(vault_path).lookup(target.uuid) is None
+
+        target.line_number = 3
+        assert manager.update_task(target, {"description": "Edited"}) is not None
+
+        with open(note_path, "r", encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+
+        assert lines == ["- [ ] Inserted line", "- [ ] Keep ^keep01", "- [ ] Edited ^edit01"]
+
+
+
+def test_update_ignores_index_entry_from_another_note() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault_path = os.path.join(tmpdir, "Vault")
+        os.makedirs(vault_path)
+        _write_markdown(os.path.join(vault_path, "A.md"), "- [ ] Copied to B ^dup001\n")
+        _write_markdown(os.path.join(vault_path, "B.md"), "- [ ] Copy ^dup001\n- [ ] Next\n")
+
+        manager = ObsidianTaskManager()
+        index = manager.get_index(vault_path)
+        tasks = {task.file_path: task for task in manager.list_tasks(vault_path) if task.block_id == "dup001"}
+        # Both notes share the UUID; the index keeps only one of them
+        indexed = index.lookup("obs-dup001")
+        assert indexed is not None
+        other = "A.md" if indexed.file_path == "B.md" else "B.md"
+        original = {}
+        for name in ("A.md", "B.md"):
+            with open(os.path.join(vault_path, name), "r", encoding="utf-8") as handle:
+                original[name] = handle.read()
+
+        assert manager.update_task(tasks[other], {"description": "Edited"}) is not None
+
+        with open(os.path.join(vault_path, other), "r", encoding="utf-8") as handle:
+            assert handle.read().splitlines()[0] == "- [ ] Edited ^dup001"
+        with open(os.path.join(vault_path, indexed.file_path), "r", encoding="utf-8") as handle:
+            assert handle.read() == original[indexed.file_path]
+
 if __name__ == "__main__":
     test_delete_task_without_block_id()
+    test_update_patches_line_in_place_and_shifts_siblings()
+    test_update_falls_back_when_file_changed_externally()
+    test_update_ignores_index_entry_from_another_note()
     print("✅ Obsidian task manager tests passed")
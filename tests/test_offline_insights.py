@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for the Reminders snapshot behind offline ``obs-sync insights`` (obs_sync/reminders/snapshot.py)."""
+
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from obs_sync.bench import SyntheticRemindersGateway
+from obs_sync.commands.insights import InsightsCommand
+from obs_sync.core.models import RemindersList, SyncConfig
+from obs_sync.reminders.gateway import ReminderData
+from obs_sync.reminders.snapshot import RemindersSnapshot, describe_age
+from obs_sync.reminders.tasks import RemindersTaskManager
+
+
+def _reminder(uuid: str, list_id: str, title: str = "Task", **extra) -> ReminderData:
+    return ReminderData(uuid=uuid, title=title, completed=False, list_id=list_id, list_name=list_id.title(), **extra)
+
+
+def _config(root: str) -> SyncConfig:
+    return SyncConfig(
+        enable_hygiene_assistant=True,
+        reminders_lists=[
+            RemindersList(name="Work", identifier="work", source_name="iCloud", source_type="Local"),
+            RemindersList(name="Home", identifier="home", source_name="iCloud", source_type="Local"),
+        ],
+        reminders_index_path=os.path.join(root, "reminders_index.json"),
+    )
+
+
+def test_record_replaces_only_the_fetched_lists() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        snapshot = RemindersSnapshot(os.path.join(root, "reminders_index.json"))
+        snapshot.record(None, [_reminder("a", "work"), _reminder("b", "home")])
+        snapshot.record(["work"], [_reminder("c", "work", title="Fresh")])
+
+        assert sorted(rem.uuid for rem in snapshot.reminders()) == ["b", "c"]
+        assert [rem.title for rem in snapshot.reminders(["work"])] == ["Fresh"]
+        fetched = snapshot.fetched_at(["work", "home", "errands"])
+        assert fetched["work"] is not None and fetched["home"] is not None
+        assert fetched["errands"] is None
+
+
+def test_sync_fetch_writes_the_snapshot() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        gateway = SyntheticRemindersGateway({"work": "Work"})
+        gateway.add(_reminder("a", "work", title="Draft report"))
+        manager = RemindersTaskManager(gateway=gateway)
+        manager.snapshot = RemindersSnapshot.for_config(config)
+
+        manager.list_tasks(["work"])
+
+        assert [rem.title for rem in RemindersSnapshot(config.reminders_index_path).reminders()] == ["Draft report"]
+        config.reminders_snapshot_enabled = False
+        assert RemindersSnapshot.for_config(config) is None
+
+
+def test_insights_runs_from_snapshot_without_eventkit(capsys) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        old = (datetime.now(timezone.utc) - timedelta(days=40)).isoformat()
+        RemindersSnapshot(config.reminders_index_path).record(
+            ["work"], [_reminder("a", "work", title="Stale idea", created_at=old, modified_at=old)]
+        )
+
+        with patch("obs_sync.reminders.tasks.RemindersGateway", side_effect=AssertionError("EventKit used")):
+            assert InsightsCommand(config).run()
+        output = capsys.readouterr().out
+
+        assert "📸 Using the Reminders snapshot from just now" in output
+        assert "1 configured list(s) are not in the snapshot yet" in output
+        assert "Stale idea" in output
+
+
+def test_live_flag_and_missing_snapshot_fetch_from_reminders(capsys) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        with patch("obs_sync.commands.insights.RemindersTaskManager") as manager_class:
+            manager_class.return_value.list_tasks.return_value = []
+            assert InsightsCommand(config).run()
+            assert "No Reminders snapshot" in capsys.readouterr().out
+
+            RemindersSnapshot(config.reminders_index_path).record(None, [_reminder("a", "work")])
+            assert InsightsCommand(config).run(live=True)
+
+        assert "gateway" not in manager_class.call_args_list[-1].kwargs
+        assert "📸" not in capsys.readouterr().out
+
+
+def test_describe_age() -> None:
+    now = datetime(2024, 5, 10, 12, 0, tzinfo=timezone.utc)
+    assert describe_age(now - timedelta(seconds=20), now) == "just now"
+    assert describe_age(now - timedelta(minutes=5), now) == "5 min ago"
+    assert describe_age(now - timedelta(hours=3), now) == "3 h ago"
+    assert describe_age(now - timedelta(days=1), now) == "1 day ago"
+    assert describe_age(now - timedelta(days=4), now) == "4 days ago"
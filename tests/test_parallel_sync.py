@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Tests for parallel multi-vault sync and the shared Reminders fetch (obs_sync/reminders/shared.py)."""
+
+import os
+import tempfile
+
+from obs_sync.commands.sync import SyncCommand
+from obs_sync.core.models import SyncConfig, Vault
+from obs_sync.reminders.shared import SharedRemindersFetch
+from obs_sync.utils.io import safe_read_json
+
+
+def _setup(synthetic_workload, root: str):
+    workload = synthetic_workload(os.path.join(root, "a"), tasks=40, tasks_per_note=10)
+    workload.gateway.lists["other-list"] = "Other"
+
+    second_path = os.path.join(root, "b", "SecondVault")
+    os.makedirs(os.path.join(second_path, ".obsidian"))
+    with open(os.path.join(second_path, "Inbox.md"), "w", encoding="utf-8") as handle:
+        handle.write("- [ ] Water the plants\n- [ ] Call the plumber\n- [ ] Buy stamps\n")
+
+    vaults = [Vault(name="Bench", path=workload.vault_path), Vault(name="Second", path=second_path)]
+    config = SyncConfig(
+        vaults=vaults,
+        vault_mappings=[
+            {"vault_id": vaults[0].vault_id, "calendar_id": workload.list_id},
+            {"vault_id": vaults[1].vault_id, "calendar_id": "other-list"},
+        ],
+        links_path=os.path.join(root, "data", "sync_links.json"),
+        reminders_index_path=os.path.join(root, "data", "reminders_tasks_index.json"),
+        run_history_enabled=False,
+        enable_deduplication=False,
+        enable_streak_tracking=False,
+        insights_in_daily_notes=False,
+    )
+    command = SyncCommand(config, reuse_engines=True)
+    command.reminders_gateway = workload.gateway
+    return workload, vaults, config, command
+
+
+def _links_by_vault(config: SyncConfig):
+    counts = {}
+    for entry in safe_read_json(config.links_path, default={"links": []})["links"]:
+        counts[entry.get("vault_id")] = counts.get(entry.get("vault_id"), 0) + 1
+    return counts
+
+
+def test_parallel_run_matches_serial_run_with_one_reminders_fetch(capsys, synthetic_workload) -> None:
+    with tempfile.TemporaryDirectory() as serial_root, tempfile.TemporaryDirectory() as parallel_root:
+        _, serial_vaults, serial_config, serial = _setup(synthetic_workload, serial_root)
+        assert serial.run(apply_changes=True)
+
+        workload, vaults, config, command = _setup(synthetic_workload, parallel_root)
+        capsys.readouterr()
+        assert command.run(apply_changes=True, parallel=2)
+        output = capsys.readouterr().out
+
+        serial_links = _links_by_vault(serial_config)
+        parallel_links = _links_by_vault(config)
+        assert parallel_links[vaults[1].vault_id] == 3
+        assert parallel_links[vaults[0].vault_id] == serial_links[serial_vaults[0].vault_id]
+        assert workload.gateway.calls["get_reminders"] == 1
+
+        # Buffered per-vault output comes out whole and in vault order
+        first, second = output.index("Vault 1/2: Bench"), output.index("Vault 2/2: Second")
+        assert first < output.index("✅ Sync completed.") < second
+
+
+def test_shared_fetch_refetches_lists_written_during_the_run(synthetic_workload) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload = synthetic_workload(root, tasks=10, tasks_per_note=10)
+        shared = SharedRemindersFetch(workload.gateway, [workload.list_id])
+        first, second = shared.view(), shared.view()
+
+        before = first.get_reminders([workload.list_id])
+        assert len(second.get_reminders([workload.list_id])) == len(before)
+        assert workload.gateway.calls["get_reminders"] == 1
+
+        first.create_reminder("Fresh reminder", list_id=workload.list_id)
+        after = second.get_reminders([workload.list_id])
+        assert len(after) == len(before) + 1
+        assert workload.gateway.calls["get_reminders"] == 2
+        assert first.calls == {"get_reminders": 1, "create_reminder": 1}
@@ -89,9 +89,10 @@ class TestAutomationToggles:
 class TestSyncCommandFlags:
     """Regression tests for sync command CLI flags."""
     
-    def test_sync_dry_run_default(self):
+    def test_sync_dry_run_default(self, tmp_path):
         """Test that sync defaults to dry-run."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
@@ -116,9 +117,10 @@ class TestSyncCommandFlags:
             call_kwargs = mock_engine.sync.call_args[1]
             assert call_kwargs.get('dry_run') is True
     
-    def test_sync_apply_flag_disables_dry_run(self):
+    def test_sync_apply_flag_disables_dry_run(self, tmp_path):
         """Test that --apply flag disables dry-run."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
@@ -143,9 +145,10 @@ class TestSyncCommandFlags:
             call_kwargs = mock_engine.sync.call_args[1]
             assert call_kwargs.get('dry_run') is False
     
-    def test_sync_direction_to_reminders(self):
+    def test_sync_direction_to_reminders(self, tmp_path):
         """Test --to-reminders direction flag."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
@@ -164,9 +167,10 @@ class TestSyncCommandFlags:
             call_kwargs = mock_engine_class.call_args[1]
             assert call_kwargs.get('direction') == "to-reminders"
     
-    def test_sync_direction_from_reminders(self):
+    def test_sync_direction_from_reminders(self, tmp_path):
         """Test --from-reminders direction flag."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
@@ -184,9 +188,10 @@ class TestSyncCommandFlags:
             call_kwargs = mock_engine_class.call_args[1]
             assert call_kwargs.get('direction') == "from-reminders"
     
-    def test_deduplication_runs_when_enabled(self):
+    def test_deduplication_runs_when_enabled(self, tmp_path):
         """Test that deduplication runs when enabled in config."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
@@ -213,9 +218,10 @@ class TestSyncCommandFlags:
                 # Dedup should be called
                 assert mock_dedup.called
     
-    def test_deduplication_skipped_when_disabled(self):
+    def test_deduplication_skipped_when_disabled(self, tmp_path):
         """Test that deduplication is skipped when disabled."""
         config = SyncConfig(
+            links_path=str(tmp_path / "sync_links.json"),
             vaults=[Vault(name="Test", path="/tmp/test", vault_id="v1")],
             reminders_lists=[
                 RemindersList(name="Work", identifier="cal-1", source_name="iCloud", source_type="Local")
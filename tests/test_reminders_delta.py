@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""Tests for delta detection against the Reminders snapshot (obs_sync/reminders/snapshot.py)."""
+
+import json
+import os
+import tempfile
+from dataclasses import replace
+from unittest.mock import patch
+
+from obs_sync.bench import SyntheticRemindersGateway
+from obs_sync.reminders.gateway import ReminderData
+from obs_sync.reminders.snapshot import RemindersSnapshot, content_hash
+from obs_sync.reminders.tasks import RemindersTaskManager
+from obs_sync.sync.match_memo import MatchMemoStore
+
+
+def _gateway() -> SyntheticRemindersGateway:
+    gateway = SyntheticRemindersGateway({"work": "Work"})
+    for index in range(5):
+        gateway.add(ReminderData(
+            uuid=f"r{index}", title=f"Task {index}", completed=False, list_id="work", list_name="Work",
+            modified_at="2024-05-01T09:00:00+00:00",
+        ))
+    return gateway
+
+
+def _manager(root: str, gateway) -> RemindersTaskManager:
+    manager = RemindersTaskManager(gateway=gateway)
+    manager.snapshot = RemindersSnapshot(os.path.join(root, "reminders_tasks_index.json"))
+    return manager
+
+
+class _ListOnlyGateway:
+    """Gateway without change checks, so every fetch converts everything."""
+
+    def __init__(self, inner: SyntheticRemindersGateway):
+        self.inner = inner
+
+    def get_reminders(self, list_ids=None):
+        return self.inner.get_reminders(list_ids)
+
+
+def test_content_hash_ignores_timestamps() -> None:
+    reminder = ReminderData(uuid="a", title="Call", completed=False, modified_at="2024-05-01T09:00:00+00:00")
+    assert content_hash(reminder) == content_hash(replace(reminder, modified_at="2024-06-01T09:00:00+00:00"))
+    assert content_hash(reminder) != content_hash(replace(reminder, completed=True))
+
+
+def test_only_modified_reminders_are_converted() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        gateway = _gateway()
+        manager = _manager(root, gateway)
+        assert len(manager.list_tasks(["work"])) == 5
+        assert manager.last_delta.to_dict() == {"added": 5, "changed": 0, "removed": 0, "unchanged": 0}
+
+        gateway.update_reminder("r1", completed=True)
+        gateway.delete_reminder("r2")
+        gateway.create_reminder("Fresh", list_id="work")
+        converted = []
+        fetch = gateway.get_changed_reminders
+
+        def capture(*args):
+            changed, unchanged = fetch(*args)
+            converted.extend(changed)
+            return changed, unchanged
+
+        gateway.get_changed_reminders = capture
+        tasks = {task.uuid: task for task in manager.list_tasks(["work"])}
+
+        assert len(converted) == 2
+        delta = manager.last_delta
+        assert delta.changed == {"r1"} and delta.removed == {"r2"} and len(delta.added) == 1
+        assert delta.unchanged == {"r0", "r3", "r4"}
+        assert len(tasks) == 5
+        assert tasks["r0"].title == "Task 0"
+        assert tasks["r1"].status.value == "done"
+
+
+def test_hash_detects_changes_when_every_reminder_is_converted() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        gateway = _gateway()
+        manager = _manager(root, _ListOnlyGateway(gateway))
+        manager.list_tasks(["work"])
+
+        # Touched without a content change, then edited without a date change
+        gateway.reminders["r0"].modified_at = "2024-05-02T09:00:00+00:00"
+        gateway.reminders["r3"].title = "Renamed"
+        manager.list_tasks(["work"])
+
+        assert manager.last_delta.changed == {"r3"}
+        assert "r0" in manager.last_delta.unchanged
+
+
+def test_falls_back_to_full_fetch_when_snapshot_lost_entries() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        gateway = _gateway()
+        manager = _manager(root, gateway)
+        manager.list_tasks(["work"])
+
+        known = manager.snapshot.known_modified(["work"])
+        # Another process rewrites the snapshot between the read and the merge
+        manager.snapshot.known_modified = lambda list_ids=None: known
+        manager.snapshot.record(["work"], [])
+        gateway.reset_calls()
+
+        assert len(manager.list_tasks(["work"])) == 5
+        assert gateway.calls == {"get_changed_reminders": 1, "get_reminders": 1}
+        assert manager.last_delta.added == {f"r{index}" for index in range(5)}
+
+
+def test_engine_reports_delta_since_last_sync(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, engine = synthetic_engine(root, tasks=30, paired_ratio=1.0)
+        engine.rem_manager = _manager(root, workload.gateway)
+        first = engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+        assert first["reminders_delta"]["added"] == first["rem_tasks"]
+
+        target = next(iter(workload.gateway.reminders))
+        workload.gateway.update_reminder(target, title="Edited in Reminders")
+        second = engine.sync(workload.vault_path, [workload.list_id], dry_run=True)
+
+        assert second["reminders_delta"] == {
+            "added": 0, "changed": 1, "removed": 0, "unchanged": second["rem_tasks"] - 1,
+        }
+
+
+def test_apply_reuses_the_snapshot_read_by_known_modified() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        gateway = _gateway()
+        manager = _manager(root, gateway)
+        manager.list_tasks(["work"])
+        gateway.update_reminder("r1", title="Renamed")
+
+        load = json.load
+        with patch("obs_sync.utils.io.json.load", side_effect=load) as loads:
+            manager.list_tasks(["work"])
+
+        assert loads.call_count == 1
+        assert manager.last_delta.changed == {"r1"}
+
+
+def test_unchanged_unmatched_pairs_are_not_scored_again(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        # Completed Obsidian tasks and Reminders-only items stay unmatched
+        workload, engine = synthetic_engine(
+            root, direction="obs-to-rem", tasks=40, paired_ratio=0.5, done_ratio=0.5, reminders_only_ratio=0.25,
+        )
+        engine.rem_manager = _manager(root, workload.gateway)
+        scored = []
+        similarity = engine.matcher._calculate_similarity
+
+        def counting(obs_task, rem_task):
+            scored.append((obs_task.uuid, rem_task.uuid))
+            return similarity(obs_task, rem_task)
+
+        engine.matcher._calculate_similarity = counting
+        engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+        assert scored
+
+        scored.clear()
+        engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+        assert scored == []
+
+        # An edited reminder is scored again, against every unmatched task
+        memo = MatchMemoStore.beside(workload.links_path).load(workload.vault_path)
+        target = sorted(memo.reminders)[0]
+        workload.gateway.update_reminder(target, title="Edited in Reminders")
+        engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+        assert scored and {rem_uuid for _, rem_uuid in scored} == {target}
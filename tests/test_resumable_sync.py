@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for time-boxed syncs and resume cursors (obs_sync/sync/cursor.py)."""
+
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from obs_sync.bench import apply_churn
+from obs_sync.commands.sync import sync_command
+from obs_sync.core.models import SyncConfig
+from obs_sync.sync.cursor import (
+    PRIORITY_OTHER,
+    PRIORITY_STATUS,
+    PRIORITY_URGENT,
+    SyncCursorStore,
+    work_priority,
+)
+from obs_sync.utils.io import safe_read_json
+
+
+class _CountingBudget:
+    """Budget that allows a fixed number of operations."""
+
+    def __init__(self, allow):
+        self.allow = allow
+        self.limited = True
+        self.exhausted = False
+
+    def spent(self):
+        if self.allow <= 0:
+            self.exhausted = True
+        self.allow -= 1
+        return self.exhausted
+
+
+def _setup(synthetic_engine, root: str, **spec):
+    workload, engine = synthetic_engine(root, tasks=60, tasks_per_note=10, **spec)
+    config = SyncConfig(
+        links_path=workload.links_path,
+        run_history_enabled=False,
+        enable_deduplication=False,
+        enable_streak_tracking=False,
+        default_calendar_id=workload.list_id,
+    )
+    return workload, config, engine
+
+
+class _Task:
+    def __init__(self, due_date=None):
+        self.due_date = due_date
+
+
+def test_work_priority_ranks_status_then_urgent_due_dates() -> None:
+    today = date.today()
+    assert work_priority(_Task(), status_changed=True) == PRIORITY_STATUS
+    assert work_priority(_Task(today - timedelta(days=5))) == PRIORITY_URGENT
+    assert work_priority(_Task(), _Task(today + timedelta(days=2))) == PRIORITY_URGENT
+    assert work_priority(_Task(today + timedelta(days=30))) == PRIORITY_OTHER
+    assert work_priority(_Task()) == PRIORITY_OTHER
+
+
+def test_exhausted_budget_defers_writes_but_keeps_matches(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, _, engine = _setup(synthetic_engine, root)
+        result = engine.sync(workload.vault_path, [workload.list_id], dry_run=False, max_seconds=0)
+
+        assert result["changes"]["rem_created"] == 0
+        assert result["changes"]["obs_created"] == 0
+        assert result["deferred"]["create_rem"]
+        assert result["deferred"]["create_obs"]
+        assert "create_reminder" not in workload.gateway.calls
+        # Matching work survives the cut-off
+        links = safe_read_json(workload.links_path, default={"links": []})["links"]
+        assert len(links) == result["links"]
+
+
+def test_budget_applies_status_changes_first(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, _, engine = _setup(synthetic_engine, root, paired_ratio=1.0, reminders_only_ratio=0.0)
+        engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+        apply_churn(workload, fraction=0.2)
+
+        updates = []
+        original = workload.gateway.update_reminder
+
+        def record(uuid, **changes):
+            updates.append(changes)
+            return original(uuid, **changes)
+
+        workload.gateway.update_reminder = record
+        with patch("obs_sync.sync.engine.RunBudget", return_value=_CountingBudget(1)):
+            result = engine.sync(workload.vault_path, [workload.list_id], dry_run=False, max_seconds=1)
+
+        assert updates and all("completed" in changes for changes in updates)
+        assert result["deferred"]["updates"]
+
+
+def test_cursor_is_saved_then_resumed_and_cleared(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, config, engine = _setup(synthetic_engine, root)
+        store = SyncCursorStore.for_config(config)
+
+        def run(**kwargs):
+            return sync_command(
+                workload.vault_path, [workload.list_id], dry_run=False,
+                config=config, show_summary=False, engine=engine, **kwargs,
+            )
+
+        cut = run(max_seconds=0)
+        assert cut["success"] and cut["deferred"]
+        pending = store.get(workload.vault_path, "both")
+        assert pending and pending["create_rem"]
+
+        with patch.object(engine, "sync", wraps=engine.sync) as engine_sync:
+            resumed = run()
+        assert engine_sync.call_args.kwargs["resume"] == pending
+        assert resumed["deferred"] == 0
+        assert store.get(workload.vault_path, "both") is None
+
+        assert workload.gateway.calls.get("create_reminder")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Tests for the compiled tag-routing table (obs_sync/sync/routing.py)."""
+
+from obs_sync.core.models import RemindersList, SyncConfig
+from obs_sync.sync.routing import RoutingTable
+
+
+def _config() -> SyncConfig:
+    config = SyncConfig(
+        reminders_lists=[
+            RemindersList(name="Work", identifier="work", source_name="iCloud", source_type="Local"),
+            RemindersList(name="Client A", identifier="client-a", source_name="iCloud", source_type="Local"),
+        ],
+    )
+    config.set_tag_route("v1", "#work", "work", import_mode="full_import")
+    config.set_tag_route("v1", "work/ClientA", "client-a")
+    config.set_tag_route("v2", "#home", "home")
+    return config
+
+
+def test_nested_tags_route_by_their_most_specific_parent() -> None:
+    table = RoutingTable.compile(_config(), "v1")
+
+    assert table.calendar_for_tags(["#work/clienta"]) == "client-a"
+    assert table.calendar_for_tags(["#Work/ClientB/urgent"]) == "work"
+    assert table.calendar_for_tags(["#workshop", "#home"]) is None
+    assert table.calendar_for_tags(["#work/clienta/q3"], list_ids=["work"]) == "work"
+    assert [route["tag"] for route in table.matching_routes(["#work/clienta"])] == ["#work/clienta", "#work"]
+
+
+def test_calendar_lookups_follow_the_first_route() -> None:
+    table = RoutingTable.compile(_config(), "v1")
+
+    assert table.calendars == ["work", "client-a"]
+    assert table.route_tag_for_calendar("client-a") == "#work/clienta"
+    assert table.import_mode_for_calendar("work") == "full_import"
+    assert table.import_mode_for_calendar("client-a") == "existing_only"
+    assert table.import_mode_for_calendar("home") is None
+    assert table.list_name("client-a") == "Client A"
+    assert table.list_name("unknown") == "unknown"
+
+
+def test_routes_sharing_a_tag_are_all_kept() -> None:
+    table = RoutingTable([
+        {"tag": "#work", "calendar_id": "work"},
+        {"tag": "work", "calendar_id": "client-a", "import_mode": None},
+    ])
+
+    assert table.calendar_for_tags(["#work"]) == "work"
+    assert table.calendar_for_tags(["#work"], list_ids=["client-a"]) == "client-a"
+    assert [route["calendar_id"] for route in table.matching_routes(["#work"])] == ["work", "client-a"]
+    assert table.calendars == ["work", "client-a"]
+    assert table.import_mode_for_calendar("client-a") is None
+
+def test_table_without_routes_is_empty() -> None:
+    assert not RoutingTable.compile(_config(), "v3")
+    assert not RoutingTable.compile(None, "v1")
+    assert RoutingTable.compile(_config(), "v3").calendar_for_tags(["#work"]) is None
+
+
+def test_list_names_are_compiled_without_a_vault() -> None:
+    table = RoutingTable.compile(_config(), None)
+
+    assert not table
+    assert table.list_name("client-a") == "Client A"
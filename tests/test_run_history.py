@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the run-history ledger and `obs-sync stats` (obs_sync/utils/ledger.py)."""
+
+import json
+import os
+import tempfile
+
+from obs_sync.bench import VaultSpec, generate_workload
+from obs_sync.commands.stats import StatsCommand
+from obs_sync.commands.sync import sync_command
+from obs_sync.core.models import SyncConfig
+from obs_sync.reminders.tasks import RemindersTaskManager
+from obs_sync.sync.engine import SyncEngine
+from obs_sync.utils.ledger import RunLedger, percentile, summarize_runs
+
+
+def _record(index: int, duration: float, **extra) -> dict:
+    record = {
+        "ts": f"2026-10-{index + 1:02d}T08:00:00+00:00",
+        "vault": "Work",
+        "dry_run": False,
+        "success": True,
+        "duration": duration,
+        "phases": {"match": duration / 2, "collect_obsidian": duration / 4},
+        "inbox_bytes": 1000 * (index + 1),
+    }
+    record.update(extra)
+    return record
+
+
+def test_ledger_rotates_and_reads_oldest_first() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        ledger = RunLedger(os.path.join(root, "runs.ndjson"), max_bytes=300, backups=2)
+        for index in range(12):
+            assert ledger.append(_record(index, 1.0 + index))
+
+        assert os.path.exists(ledger.path.with_name("runs.ndjson.1"))
+        assert not os.path.exists(ledger.path.with_name("runs.ndjson.3"))
+        records = ledger.read()
+        assert [r["duration"] for r in records] == sorted(r["duration"] for r in records)
+        assert records[-1]["duration"] == 12.0
+        assert len(records) < 12, "oldest records fall off once backups are exhausted"
+        assert [r["duration"] for r in ledger.read(limit=2)] == [11.0, 12.0]
+
+        with open(ledger.path, "a", encoding="utf-8") as handle:
+            handle.write("{not json\n")
+        assert ledger.read(limit=1)[0]["duration"] == 12.0
+
+
+def test_summary_reports_percentiles_trend_and_growth() -> None:
+    assert percentile([], 50) is None
+    assert percentile([3, 1, 2, 4], 50) == 2
+    assert percentile(range(1, 101), 90) == 90
+
+    records = [_record(i, 1.0) for i in range(5)] + [_record(i + 5, 3.0) for i in range(5)]
+    records.append(_record(10, 3.0, success=False, dry_run=True))
+    summary = summarize_runs(records)
+
+    assert summary["runs"] == 11 and summary["failed"] == 1 and summary["applied"] == 10
+    assert summary["duration"]["p50"] == 3.0 and summary["duration"]["max"] == 3.0
+    assert summary["trend"] == {"older_p50": 1.0, "newer_p50": 3.0}
+    assert summary["phases"]["match"]["p95"] == 1.5
+    assert summary["volume"]["inbox_bytes"]["first"] == 1000
+    assert summary["volume"]["inbox_bytes"]["last"] == 11000
+
+
+def test_sync_runs_are_recorded_and_summarised(capsys) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload = generate_workload(root, VaultSpec(tasks=40, tasks_per_note=10))
+        config = SyncConfig(
+            links_path=workload.links_path,
+            run_history_path=os.path.join(root, "data", "run_history.ndjson"),
+            enable_deduplication=False,
+        )
+        engine = SyncEngine(workload.engine_config())
+        engine.rem_manager = RemindersTaskManager(gateway=workload.gateway)
+
+        for _ in range(2):
+            result = sync_command(
+                workload.vault_path, [workload.list_id], dry_run=False,
+                config=config, show_summary=False, engine=engine,
+            )
+            assert result["success"]
+
+        records = RunLedger(config.run_history_path).read()
+        assert len(records) == 2
+        first, second = records
+        assert first["vault"] == "BenchVault" and first["dry_run"] is False
+        assert first["files_read"] == 4 and first["eventkit_calls"] >= 1
+        assert first["links_created"] > 0 and first["writes"] > 0
+        assert second["writes"] == 0 and second["links_file_bytes"] > 0
+        assert "match" in first["phases"] and first["duration"] > 0
+
+        assert StatsCommand(config).run(last=10) is True
+        text = capsys.readouterr().out
+        assert "last 2 run(s)" in text and "Phases" in text
+
+        assert StatsCommand(config).run(json_output=True) is True
+        assert json.loads(capsys.readouterr().out)["runs"] == 2
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Tests for the process-level sync run lock (obs_sync/utils/runlock.py)."""
+
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+from obs_sync.commands.sync import SyncCommand
+from obs_sync.core.models import SyncConfig
+from obs_sync.sync.scope import SyncScope
+from obs_sync.utils.runlock import RunLock
+
+
+def _config(root: str) -> SyncConfig:
+    return SyncConfig(links_path=os.path.join(root, "data", "sync_links.json"), run_lock_timeout=10)
+
+
+def test_second_holder_cannot_take_a_held_lock() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        first = RunLock.for_config(_config(root))
+        second = RunLock.for_config(_config(root))
+        assert first.acquire()
+        assert not second.acquire()
+        assert not second.acquire(blocking=True, timeout=0.3)
+        first.release()
+        assert second.acquire()
+        assert second.state()["holder"]["pid"] == os.getpid()
+        second.release()
+        assert second.state()["holder"] is None
+
+
+def test_queued_trigger_requests_a_rerun_without_syncing() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        holder = RunLock.for_config(config)
+        assert holder.acquire()
+        try:
+            with patch.object(SyncCommand, "_run", return_value=True) as run:
+                assert SyncCommand(config).run(apply_changes=True, if_busy="queue")
+            run.assert_not_called()
+            assert holder.rerun_requested()
+        finally:
+            holder.release()
+
+
+def test_holder_does_one_more_pass_for_requests_made_while_running() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        other = RunLock.for_config(config)
+        calls = []
+
+        def fake_run(apply_changes, direction):
+            calls.append(direction)
+            if len(calls) == 1:
+                other.request_rerun(direction)
+            return True
+
+        with patch.object(SyncCommand, "_run", side_effect=fake_run):
+            assert SyncCommand(config).run(apply_changes=True)
+        assert calls == ["both", "both"]
+        assert not other.rerun_requested()
+        assert other.last_pass()["success"] is True
+
+
+def test_holder_reruns_with_the_requested_direction_and_target() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        other = RunLock.for_config(config)
+        command = SyncCommand(config)
+        calls = []
+
+        def fake_run(apply_changes, direction):
+            calls.append((direction, command._target))
+            if len(calls) == 1:
+                other.request_rerun("obs-to-rem", {"files": ["Notes/a.md"], "tags": []})
+                other.request_rerun("both")
+            return True
+
+        with patch.object(command, "_run", side_effect=fake_run):
+            assert command.run(apply_changes=True)
+        assert calls == [
+            ("both", None),
+            ("obs-to-rem", SyncScope(files={"Notes/a.md"})),
+            ("both", None),
+        ]
+        assert not other.rerun_requested()
+        assert other.last_pass()["target"] is None
+
+
+def test_waiting_trigger_reuses_the_holders_rerun_result() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        started = threading.Event()
+        release = threading.Event()
+        holder_calls = []
+
+        def holder_run(apply_changes, direction):
+            holder_calls.append(direction)
+            if len(holder_calls) == 1:
+                started.set()
+                release.wait(5)
+            return True
+
+        holder = SyncCommand(config)
+        with patch.object(holder, "_run", side_effect=holder_run):
+            thread = threading.Thread(target=holder.run, kwargs={"apply_changes": True})
+            thread.start()
+            assert started.wait(5)
+
+            waiter = SyncCommand(config)
+            with patch.object(waiter, "_run", return_value=False) as waiter_run:
+                timer = threading.Timer(0.3, release.set)
+                timer.start()
+                assert waiter.run(apply_changes=True)
+            thread.join(5)
+
+        waiter_run.assert_not_called()
+        assert holder_calls == ["both", "both"]
+
+
+def test_concurrent_triggers_never_lose_a_rerun_request() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        holder = RunLock.for_config(config)
+        assert holder.acquire()
+        triggers = 8
+        barrier = threading.Barrier(triggers + 1)
+
+        def trigger() -> None:
+            barrier.wait(5)
+            for _ in range(5):
+                RunLock.for_config(config).request_rerun("both")
+
+        def holder_updates() -> None:
+            barrier.wait(5)
+            for _ in range(20):
+                holder.record_pass(time.time(), True, "both")
+
+        threads = [threading.Thread(target=trigger) for _ in range(triggers)]
+        threads.append(threading.Thread(target=holder_updates))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        try:
+            state = holder.state()
+            assert state["rerun_requested"]["count"] == triggers * 5
+            assert state["last_pass"]["success"] is True
+            assert state["holder"]["pid"] == os.getpid()
+        finally:
+            holder.release()
+
+
+def test_dry_runs_do_not_take_the_lock() -> None:
+    with tempfile.TemporaryDirectory() as root:
+        config = _config(root)
+        holder = RunLock.for_config(config)
+        assert holder.acquire()
+        try:
+            with patch.object(SyncCommand, "_run", return_value=True) as run:
+                started = time.monotonic()
+                assert SyncCommand(config).run(apply_changes=False)
+            run.assert_called_once_with(False, "both")
+            assert time.monotonic() - started < 1
+        finally:
+            holder.release()
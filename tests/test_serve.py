@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Tests for the sync daemon, its IPC channel and warm-cache reuse."""
+
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from obs_sync.commands.serve import SyncDaemon
+from obs_sync.commands.sync import SyncCommand
+from obs_sync.core.models import SyncConfig
+from obs_sync.sync.engine import SyncEngine
+from obs_sync.utils.ipc import IPCError, IPCServer, send_request
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets required")
+
+
+@pytest.fixture
+def socket_path():
+    # Keep the path short: AF_UNIX paths are limited to ~104 bytes on macOS
+    directory = tempfile.mkdtemp(prefix="obs-ipc-", dir="/tmp" if os.path.isdir("/tmp") else None)
+    try:
+        yield os.path.join(directory, "daemon.sock")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _start_server(path, handler):
+    server = IPCServer(path, handler)
+    server.start()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def test_ipc_round_trip_and_stale_socket_replacement(socket_path) -> None:
+    # A leftover socket file from a crashed daemon must not block startup
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    server, thread = _start_server(socket_path, lambda request: {"ok": True, "echo": request})
+    try:
+        assert oct(os.stat(socket_path).st_mode & 0o777) == oct(0o600)
+        reply = send_request(socket_path, "ping", value=3)
+        assert reply == {"ok": True, "echo": {"command": "ping", "value": 3}}
+
+        with pytest.raises(IPCError):
+            IPCServer(socket_path, lambda request: {}).start()
+    finally:
+        server.shutdown()
+        thread.join(timeout=5)
+        server.close()
+
+    assert not os.path.exists(socket_path)
+    with pytest.raises(IPCError):
+        send_request(socket_path, "ping")
+
+
+def test_daemon_serializes_syncs_and_reports_metrics(socket_path) -> None:
+    daemon = SyncDaemon(SyncConfig())
+    calls = []
+
+    def fake_run(apply_changes=False, direction="both"):
+        calls.append((apply_changes, direction))
+        print("synced!")
+        return True
+
+    daemon.command.run = fake_run
+    server, thread = _start_server(socket_path, daemon.handle)
+    daemon.server = server
+    try:
+        reply = send_request(socket_path, "sync", apply_changes=True, direction="obs-to-rem")
+        assert reply["ok"] is True
+        assert reply["output"] == "synced!\n"
+        assert calls == [(True, "obs-to-rem")]
+
+        status = send_request(socket_path, "status")
+        assert status["syncs"] == 1
+        assert status["last_sync"]["success"] is True
+        assert status["last_sync"]["trigger"] == "ipc"
+
+        metrics = send_request(socket_path, "metrics")
+        assert metrics["syncs"] == 1 and metrics["failures"] == 0
+
+        assert send_request(socket_path, "sync", direction="sideways")["ok"] is False
+        assert send_request(socket_path, "bogus")["ok"] is False
+
+        assert send_request(socket_path, "stop")["ok"] is True
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+    finally:
+        server.close()
+
+
+def test_sync_command_reuses_engines_per_vault_and_direction() -> None:
+    command = SyncCommand(SyncConfig(), reuse_engines=True)
+    first = command._engine_kwargs("/vault/a", "both")["engine"]
+    assert command._engine_kwargs("/vault/a", "both")["engine"] is first
+    assert command._engine_kwargs("/vault/a", "obs-to-rem")["engine"] is not first
+
+    command.reset_engines()
+    assert command.engines == {}
+    assert SyncCommand(SyncConfig())._engine_kwargs("/vault/a", "both") == {}
+
+
+def test_engine_reuses_parsed_links_until_the_file_changes() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        links_path = os.path.join(tmp, "links.json")
+        link = {"obs_uuid": "obs-1", "rem_uuid": "rem-1", "score": 1.0, "vault_id": "v"}
+        with open(links_path, "w", encoding="utf-8") as handle:
+            json.dump({"links": [link]}, handle)
+
+        engine = SyncEngine({"links_path": links_path})
+        first = engine._load_existing_links()
+        first[0].rem_uuid = "mutated"
+        second = engine._load_existing_links()
+        assert second[0].rem_uuid == "rem-1", "Cached records must yield fresh link objects"
+
+        with open(links_path, "w", encoding="utf-8") as handle:
+            json.dump({"links": [link, dict(link, obs_uuid="obs-2", rem_uuid="rem-2")]}, handle)
+        assert len(engine._load_existing_links()) == 2
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Start-up import budget for the obs-sync CLI.
+
+Runs ``obs-sync sync --help`` under ``python -X importtime`` and fails when
+heavy modules are imported eagerly or when importing ``obs_sync.main`` takes
+longer than the budget. Override the budget on slow machines with
+``OBS_SYNC_IMPORT_BUDGET_MS``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+IMPORT_BUDGET_MS = float(os.environ.get("OBS_SYNC_IMPORT_BUDGET_MS", "200"))
+
+# Modules that only specific commands need
+DEFERRED_MODULES = (
+    "scipy",
+    "numpy",
+    "objc",
+    "Foundation",
+    "EventKit",
+    "obs_sync.commands.setup",
+    "obs_sync.commands.update",
+    "obs_sync.commands.install_deps",
+    "obs_sync.commands.sync",
+    "obs_sync.utils.launchd",
+    "obs_sync.sync.engine",
+)
+
+
+def _importtime(*cli_args: str) -> Dict[str, int]:
+    """Return cumulative import time in microseconds per imported module."""
+    code = "import sys; from obs_sync.main import main; sys.exit(main(sys.argv[1:]))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *cli_args],
+        cwd=str(REPO_ROOT),
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    timings: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def test_sync_help_does_not_import_heavy_modules() -> None:
+    timings = _importtime("sync", "--help")
+    eager = [
+        module
+        for module in timings
+        if any(module == name or module.startswith(name + ".") for name in DEFERRED_MODULES)
+    ]
+    assert not eager, f"Imported during 'obs-sync sync --help': {sorted(eager)}"
+
+
+def test_sync_help_import_time_within_budget() -> None:
+    timings = _importtime("sync", "--help")
+    elapsed_ms = timings["obs_sync.main"] / 1000
+    assert elapsed_ms <= IMPORT_BUDGET_MS, (
+        f"Importing obs_sync.main took {elapsed_ms:.1f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
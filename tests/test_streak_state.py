@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Tests for the incremental streak state kept by StreakTracker (obs_sync/analytics/streaks.py)."""
+
+import json
+import os
+import random
+import tempfile
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from obs_sync.analytics.streaks import STATE_KEY, StreakTracker
+
+
+def _walk(days, today):
+    """Reference streaks computed by walking the whole history."""
+    dates = sorted(set(days))
+    best = run = 0
+    previous = None
+    for day in dates:
+        run = run + 1 if previous and (day - previous).days == 1 else 1
+        best = max(best, run)
+        previous = day
+    current = 0
+    day = today
+    while day in set(dates):
+        current += 1
+        day -= timedelta(days=1)
+    return {"current": current, "best": best}
+
+
+def test_incremental_state_matches_full_walk_with_backfills() -> None:
+    today = date.today()
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as root:
+        tracker = StreakTracker(data_path=os.path.join(root, "streaks.json"))
+        recorded = []
+        with tracker.batch():
+            for _ in range(120):
+                # Mostly appends, with the odd day filled in behind
+                offset = rng.choice([0, 0, 0, 1, 2, 5])
+                day = today - timedelta(days=rng.randint(0, 60)) if offset == 5 else today - timedelta(days=offset)
+                recorded.append(day)
+                tracker.record_completions("v1", day, by_tag={"#work": 1}, by_list={})
+                assert tracker.get_streak("v1", "#work") == _walk(recorded, today)
+
+
+def test_batch_writes_once_and_reads_skip_history() -> None:
+    today = date.today()
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "streaks.json")
+        tracker = StreakTracker(data_path=path)
+
+        with patch("obs_sync.analytics.streaks.json.dump", wraps=json.dump) as dump:
+            with tracker.batch():
+                for offset in range(7, -1, -1):
+                    tracker.record_completions(
+                        "v1", today - timedelta(days=offset), by_tag={"#work": 2}, by_list={"Inbox": 2}
+                    )
+                assert not os.path.exists(path)
+        assert dump.call_count == 1
+
+        reloaded = StreakTracker(data_path=path)
+        with patch.object(StreakTracker, "_rebuild_state", side_effect=AssertionError("walked history")):
+            assert reloaded.get_all_streaks("v1") == {
+                "tag:#work": {"current": 8, "best": 8},
+                "list:Inbox": {"current": 8, "best": 8},
+            }
+
+
+def test_state_is_derived_for_files_written_before_it_existed() -> None:
+    today = date.today()
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "streaks.json")
+        history = {(today - timedelta(days=offset)).isoformat(): 1 for offset in (0, 1, 4, 5, 6)}
+        with open(path, "w") as handle:
+            json.dump({"v1": {"tags": {"#home": history}, "lists": {}}}, handle)
+
+        tracker = StreakTracker(data_path=path)
+        assert tracker.get_streak("v1", "#home") == {"current": 2, "best": 3}
+
+        tracker.record_completions("v1", today - timedelta(days=2), by_tag={"#home": 1}, by_list={})
+        tracker.record_completions("v1", today - timedelta(days=3), by_tag={"#home": 1}, by_list={})
+        assert tracker.get_streak("v1", "#home") == {"current": 7, "best": 7}
+        with open(path) as handle:
+            assert json.load(handle)["v1"][STATE_KEY]["tags"]["#home"]["best"] == 7
@@ -4,6 +4,8 @@ Tests for SyncConfig helper methods (obs_sync/core/models.py).
 Validates tag routing, vault mapping, and removal impact analysis.
 """
 
+import json
+
 import pytest
 from obs_sync.core.models import SyncConfig, Vault, RemindersList
 
@@ -214,6 +216,17 @@ class TestSyncConfigRemoval:
         
         assert "v1" not in config.tag_routes
     
+    def test_remove_vault_clears_scan_filters(self):
+        """Test that removing vault also removes its scan filters."""
+        config = SyncConfig(
+            vaults=[Vault(name="Work", path="/work", vault_id="v1")]
+        )
+        config.set_vault_scan_filters("v1", exclude=["Attachments/**"])
+        
+        config.remove_vault("v1")
+        
+        assert config.get_vault_scan_filters("v1") == {"exclude": [], "include": []}
+    
     def test_remove_vault_updates_default(self):
         """Test that removing default vault clears default_vault_id."""
         config = SyncConfig(
@@ -350,5 +363,120 @@ class TestSyncConfigDefaults:
         assert ids == ["cal-1", "cal-2"]
 
 
+class TestSyncConfigScanFilters:
+    """Test suite for per-vault scan filter helpers."""
+
+    def test_set_and_get_scan_filters(self):
+        config = SyncConfig(
+            vaults=[Vault(name="Work", path="/work", vault_id="v1")]
+        )
+        config.set_vault_scan_filters("v1", exclude=["Attachments/**"], include=["Projects/**"])
+
+        assert config.get_vault_scan_filters("v1") == {
+            "exclude": ["Attachments/**"],
+            "include": ["Projects/**"],
+        }
+        assert config.get_vault_scan_filters("v2") == {"exclude": [], "include": []}
+
+        config.set_vault_scan_filters("v1")
+        assert config.vault_scan_filters == []
+
+    def test_scan_filters_round_trip(self, tmp_path):
+        config = SyncConfig(
+            vaults=[Vault(name="Work", path="/work", vault_id="v1")],
+            respect_obsidian_ignore=False,
+        )
+        config.set_vault_scan_filters("v1", exclude=["*.excalidraw.md"])
+        config_path = tmp_path / "config.json"
+
+        config.save_to_file(str(config_path))
+        loaded = SyncConfig.load_from_file(str(config_path))
+
+        assert loaded.respect_obsidian_ignore is False
+        assert loaded.get_vault_scan_filters("v1")["exclude"] == ["*.excalidraw.md"]
+
+
+
+class TestSyncConfigIndexes:
+    """Indexed lookups stay in step with every way the config changes."""
+
+    def _config(self):
+        return SyncConfig(
+            vaults=[
+                Vault(name="Work", path="/work", vault_id="v1"),
+                Vault(name="Home", path="/home", vault_id="v2", is_default=True),
+            ],
+            reminders_lists=[
+                RemindersList(name="Tasks", identifier="cal-1", source_name="iCloud", source_type="Local"),
+            ],
+        )
+
+    def test_lookups_follow_method_mutations(self):
+        config = self._config()
+        config.set_vault_mapping("v1", "cal-1")
+        config.set_tag_route("v1", "#work", "cal-1")
+        assert config.get_vault_mapping("v1") == "cal-1"
+        assert config.get_route_tag_for_calendar("v1", "cal-1") == "#work"
+
+        config.set_vault_mapping("v1", "cal-2")
+        config.set_tag_route("v1", "work", "cal-2")
+        config.set_tag_route_import_mode("v1", "#work", "full_import")
+        assert config.get_vault_mapping("v1") == "cal-2"
+        assert config.get_tag_route("v1", "#work") == "cal-2"
+        assert config.get_route_tag_for_calendar("v1", "cal-1") is None
+        assert config.get_tag_route_import_mode("v1", "#work") == "full_import"
+
+        config.remove_vault("v2")
+        assert config.get_vault("v2") is None
+        assert config.default_vault.vault_id == "v1"
+
+    def test_lookups_follow_direct_list_changes(self):
+        config = self._config()
+        assert config.default_vault.vault_id == "v2"
+        assert config.get_reminders_list("cal-2") is None
+
+        config.reminders_lists = config.reminders_lists + [
+            RemindersList(name="Errands", identifier="cal-2", source_name="iCloud", source_type="Local")
+        ]
+        config.tag_routes = [{"vault_id": "v1", "tag": "#home", "calendar_id": "cal-2"}]
+        config.vaults = [Vault(name="Solo", path="/solo", vault_id="v3")]
+
+        assert config.get_reminders_list("cal-2").name == "Errands"
+        assert config.get_tag_route("v1", "home") == "cal-2"
+        assert config.default_vault.vault_id == "v3"
+        assert config.get_vault("v1") is None
+
+    def test_in_place_edits_need_an_explicit_invalidation(self):
+        config = self._config()
+        config.set_tag_route("v1", "#work", "cal-1")
+        assert config.get_vault("v1").name == "Work"
+
+        config.vaults[0] = Vault(name="Office", path="/office", vault_id="v1")
+        config.vaults.append(Vault(name="Lab", path="/lab", vault_id="v4"))
+        config.tag_routes[0]["calendar_id"] = "cal-2"
+        assert config.get_vault("v4") is None
+        config.invalidate_indexes()
+
+        assert config.get_vault("v4").name == "Lab"
+
+        assert config.get_vault("v1").name == "Office"
+        assert config.get_route_tag_for_calendar("v1", "cal-2") == "#work"
+
+    def test_json_format_is_unchanged(self, tmp_path):
+        config = self._config()
+        config.set_tag_route("v1", "#work", "cal-1")
+        config.get_tag_route("v1", "#work")
+        config_path = tmp_path / "config.json"
+
+        config.save_to_file(str(config_path))
+        data = json.loads(config_path.read_text())
+
+        assert not [key for key in data if key.startswith("_")]
+        assert data["tag_routes"] == [
+            {"vault_id": "v1", "tag": "#work", "calendar_id": "cal-1", "import_mode": "existing_only"}
+        ]
+        assert SyncConfig.load_from_file(str(config_path)).get_tag_route("v1", "work") == "cal-1"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
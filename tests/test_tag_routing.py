@@ -61,6 +61,9 @@ class FakeObsidianManager:
         self.created.append(task)
         return task
 
+    def flush_appends(self) -> int:
+        return 0
+
     def update_task(self, task: ObsidianTask, changes: dict) -> ObsidianTask:
         self.updated_calls.append((task, changes))
         # Apply changes to the task
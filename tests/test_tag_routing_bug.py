@@ -366,6 +366,9 @@ def test_cross_vault_routed_task_not_deleted_by_other_vault():
                 self.mapping.setdefault(vault_path_arg, []).append(task)
                 return task
 
+            def flush_appends(self):
+                return 0
+
         class SharedStubRemindersManager:
             def __init__(self):
                 self.tasks: Dict[str, RemindersTask] = {}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for ``obs-sync sync --file/--tag`` targeted runs (obs_sync/sync/scope.py)."""
+
+import os
+import tempfile
+
+from obs_sync.commands.sync import SyncCommand
+from obs_sync.core.models import SyncConfig, Vault
+from obs_sync.sync.scope import SyncScope
+from obs_sync.utils.io import safe_read_json
+
+
+def _setup(synthetic_engine, root: str):
+    workload, engine = synthetic_engine(
+        root, tasks=40, tasks_per_note=10, paired_ratio=1.0, reminders_only_ratio=0.0, block_id_ratio=1.0
+    )
+    engine.sync(workload.vault_path, [workload.list_id], dry_run=False)
+    workload.gateway.reset_calls()
+    return workload, engine
+
+
+def _note(workload, index: int = 0) -> str:
+    return os.path.join(workload.vault_path, workload.notes[index])
+
+
+def test_tag_scope_normalises_and_matches_nested_tags() -> None:
+    class _Task:
+        def __init__(self, tags):
+            self.tags = tags
+
+    scope = SyncScope.for_tags(["Project", "#home"])
+    assert scope.tags == {"#project", "#home"}
+    assert scope.matches(_Task(["#project/alpha"]))
+    assert scope.matches(_Task(["#Home"]))
+    assert not scope.matches(_Task(["#projects"]))
+    assert SyncScope.for_files(["A.md"]).matches(_Task([]))
+
+
+def test_linked_file_fetches_reminders_by_identifier(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, engine = _setup(synthetic_engine, root)
+        links_before = len(safe_read_json(workload.links_path, default={"links": []})["links"])
+
+        with open(_note(workload), encoding="utf-8") as handle:
+            content = handle.read()
+        line = next(line for line in content.splitlines() if line.startswith("- [ ] "))
+        block_id = line.rsplit("^", 1)[1]
+        with open(_note(workload), "w", encoding="utf-8") as handle:
+            handle.write(content.replace(line, line.replace("- [ ] ", "- [x] ", 1)))
+
+        result = engine.sync(
+            workload.vault_path, [workload.list_id], dry_run=False,
+            scope=SyncScope.for_files([workload.notes[0]]),
+        )
+
+        assert "get_reminders" not in workload.gateway.calls
+        assert workload.gateway.calls["get_reminders_by_ids"] == 1
+        assert result["rem_tasks"] == 10
+        assert workload.gateway.reminders[f"rem-{int(block_id[1:]):06d}"].completed
+        links_after = safe_read_json(workload.links_path, default={"links": []})["links"]
+        assert len(links_after) == links_before
+
+
+def test_unlinked_task_falls_back_to_listing_reminders(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, engine = _setup(synthetic_engine, root)
+        with open(_note(workload), "a", encoding="utf-8") as handle:
+            handle.write("- [ ] Brand new task for the scoped run\n")
+
+        result = engine.sync(
+            workload.vault_path, [workload.list_id], dry_run=False,
+            scope=SyncScope.for_files([workload.notes[0]]),
+        )
+
+        assert workload.gateway.calls["get_reminders"] == 1
+        assert result["changes"]["rem_created"] == 1
+
+
+def test_tag_scope_only_collects_tagged_tasks(synthetic_engine) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload, engine = _setup(synthetic_engine, root)
+        result = engine.sync(
+            workload.vault_path, [workload.list_id], dry_run=True, scope=SyncScope.for_tags(["work"])
+        )
+
+        tagged = sum(
+            1 for rem in workload.gateway.reminders.values() if "work" in rem.tags
+        )
+        assert result["obs_tasks"] == tagged
+        assert result["scope"]["tags"] == ["#work"]
+        assert "get_reminders" not in workload.gateway.calls
+
+
+def test_command_resolves_files_per_vault(capsys, synthetic_workload) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        workload = synthetic_workload(
+            os.path.join(root, "a"), tasks=20, tasks_per_note=10, paired_ratio=1.0, block_id_ratio=1.0
+        )
+        second_path = os.path.join(root, "b", "SecondVault")
+        os.makedirs(os.path.join(second_path, ".obsidian"))
+        with open(os.path.join(second_path, "Inbox.md"), "w", encoding="utf-8") as handle:
+            handle.write("- [ ] Water the plants\n")
+
+        vaults = [Vault(name="Bench", path=workload.vault_path), Vault(name="Second", path=second_path)]
+        config = SyncConfig(
+            vaults=vaults,
+            vault_mappings=[
+                {"vault_id": vaults[0].vault_id, "calendar_id": workload.list_id},
+                {"vault_id": vaults[1].vault_id, "calendar_id": workload.list_id},
+            ],
+            links_path=os.path.join(root, "data", "sync_links.json"),
+            reminders_index_path=os.path.join(root, "data", "reminders_tasks_index.json"),
+            run_history_enabled=False,
+            enable_deduplication=False,
+            enable_streak_tracking=False,
+            insights_in_daily_notes=False,
+        )
+        command = SyncCommand(config, reuse_engines=True)
+        command.reminders_gateway = workload.gateway
+        assert command.run(apply_changes=True)
+        workload.gateway.reset_calls()
+        capsys.readouterr()
+
+        assert command.run(apply_changes=True, files=[_note(workload)])
+        output = capsys.readouterr().out
+
+        assert "None of the requested notes are in this vault; skipped." in output
+        assert output.count("✅ Sync completed.") == 1
+        assert "get_reminders" not in workload.gateway.calls
+        assert workload.gateway.calls["get_reminders_by_ids"] == 1
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for sync phase timings and Chrome trace export (obs_sync/utils/tracing.py)."""
+
+import json
+import os
+import tempfile
+
+from obs_sync.sync.engine import SyncEngine
+from obs_sync.utils.tracing import PhaseTimer, Tracer, get_tracer, traced, use_tracer
+
+
+@traced("test.work", "test", detail=lambda value: {"value": value})
+def _work(value: int) -> int:
+    return value * 2
+
+
+def test_traced_functions_only_record_while_a_tracer_is_active() -> None:
+    assert get_tracer() is None
+    assert _work(2) == 4
+
+    tracer = Tracer()
+    with use_tracer(tracer):
+        assert _work(3) == 6
+        timer = PhaseTimer(prefix="demo")
+        timer.start("first")
+        timer.start("second")
+        timer.stop()
+    assert get_tracer() is None
+
+    names = [event["name"] for event in tracer.events]
+    assert names == ["test.work", "demo.first", "demo.second"]
+    work_event = tracer.events[0]
+    assert work_event["ph"] == "X" and work_event["cat"] == "test"
+    assert work_event["args"] == {"value": 3}
+    assert set(timer.summary()) == {"first", "second"}
+
+
+def test_sync_reports_phase_timings_and_writes_chrome_trace(fake_reminders_manager) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        vault_path = os.path.join(root, "Vault")
+        os.makedirs(vault_path)
+        with open(os.path.join(vault_path, "Tasks.md"), "w", encoding="utf-8") as handle:
+            handle.write("- [ ] Write the report ^t-report\n- [ ] Call the bank ^t-bank\n")
+
+        engine = SyncEngine({"links_path": os.path.join(root, "links.json")})
+        engine.rem_manager = fake_reminders_manager
+
+        tracer = Tracer(trace_memory=True)
+        with use_tracer(tracer):
+            results = engine.sync(vault_path, ["list-1"], dry_run=False)
+
+        timings = results["timings"]
+        for phase in ("collect_obsidian", "collect_reminders", "match", "create_counterparts", "persist_links"):
+            assert phase in timings and timings[phase] >= 0
+
+        trace_path = tracer.write(os.path.join(root, "trace", "sync.json"))
+        with open(trace_path, encoding="utf-8") as handle:
+            trace = json.load(handle)
+
+        names = {event["name"] for event in trace["traceEvents"]}
+        assert {"sync.collect_obsidian", "sync.match", "obsidian.parse_file", "io.write_json"} <= names
+        parse_event = next(e for e in trace["traceEvents"] if e["name"] == "obsidian.parse_file")
+        assert parse_event["args"] == {"file": "Tasks.md"}
+        assert trace["metadata"]["memory_peak_bytes"] > 0
+
+        # Without a tracer the engine still reports timings but records no spans
+        untraced = engine.sync(vault_path, ["list-1"], dry_run=True)
+        assert "match" in untraced["timings"]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for vault scan filters (obs_sync/obsidian/ignore.py)."""
+
+import json
+import os
+import tempfile
+
+from obs_sync.core.models import Vault
+from obs_sync.obsidian.ignore import IgnoreMatcher
+from obs_sync.obsidian.tasks import ObsidianTaskManager
+from obs_sync.obsidian.vault import VaultManager
+
+
+def _write(path: str, content: str = "- [ ] Task\n") -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(content)
+
+
+def _build_vault(root: str) -> str:
+    vault_path = os.path.join(root, "Vault")
+    _write(os.path.join(vault_path, "Inbox.md"), "- [ ] Inbox task\n")
+    _write(os.path.join(vault_path, "Projects", "Plan.md"), "- [ ] Plan task\n")
+    _write(os.path.join(vault_path, "Attachments", "deep", "Scan.md"), "- [ ] Attachment task\n")
+    _write(os.path.join(vault_path, "Drawings", "Sketch.excalidraw.md"), "- [ ] Drawing task\n")
+    _write(os.path.join(vault_path, ".git", "notes.md"), "- [ ] Git task\n")
+    _write(os.path.join(vault_path, ".trash", "Old.md"), "- [ ] Trashed task\n")
+    _write(os.path.join(vault_path, "node_modules", "pkg", "README.md"), "- [ ] Package task\n")
+    _write(
+        os.path.join(vault_path, ".obsidian", "app.json"),
+        json.dumps({"userIgnoreFilters": ["Attachments/", "/\\.excalidraw\\.md$/"]}),
+    )
+    return vault_path
+
+
+def test_matcher_prunes_system_and_obsidian_excluded_dirs() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault_path = _build_vault(tmpdir)
+        matcher = IgnoreMatcher.for_vault(vault_path)
+
+        assert matcher.is_dir_excluded(".git")
+        assert matcher.is_dir_excluded("Attachments")
+        assert not matcher.is_dir_excluded("Projects")
+
+        found = sorted(p.replace(os.sep, "/") for p in matcher.iter_markdown_files(vault_path))
+        assert found == ["Inbox.md", "Projects/Plan.md"]
+
+
+def test_config_globs_and_include_patterns() -> None:
+    matcher = IgnoreMatcher(exclude=["Archive/**", "*.tmp.md"], include=["Projects/**", "Inbox.md"])
+
+    assert matcher.is_dir_excluded("Archive")
+    assert not matcher.is_file_included("Archive/2023/Old.md")
+    assert not matcher.is_file_included("Projects/draft.tmp.md")
+    assert not matcher.is_file_included("Notes/Other.md")
+    assert matcher.is_file_included("Projects/Plan.md")
+    assert matcher.is_file_included("Inbox.md")
+
+
+def test_list_tasks_and_iter_markdown_files_share_filters() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        vault_path = _build_vault(tmpdir)
+
+        manager = ObsidianTaskManager()
+        descriptions = sorted(task.description for task in manager.list_tasks(vault_path))
+        assert descriptions == ["Inbox task", "Plan task"]
+
+        manager.configure_scan(vault_path, exclude=["Projects/**"], respect_app_config=False)
+        descriptions = sorted(task.description for task in manager.list_tasks(vault_path))
+        assert descriptions == ["Attachment task", "Drawing task", "Inbox task"]
+
+        vault = Vault(name="Vault", path=vault_path, vault_id="vault-1")
+        files = VaultManager([vault]).iter_markdown_files(vault)
+        assert sorted(os.path.relpath(p, vault.path).replace(os.sep, "/") for p in files) == [
+            "Inbox.md",
+            "Projects/Plan.md",
+        ]
+
+
+if __name__ == "__main__":
+    test_matcher_prunes_system_and_obsidian_excluded_dirs()
+    test_config_globs_and_include_patterns()
+    test_list_tasks_and_iter_markdown_files_share_filters()
+    print("✅ Vault ignore tests passed")
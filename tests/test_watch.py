@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for vault watchers, change debouncing and file-scoped syncs."""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+from obs_sync.core.models import RemindersTask, TaskStatus
+from obs_sync.obsidian.ignore import IgnoreMatcher
+from obs_sync.obsidian.watcher import ChangeDebouncer, InotifyWatcher, PollingWatcher
+from obs_sync.sync.engine import SyncEngine
+from obs_sync.sync.scope import SyncScope
+
+
+def _write(vault_path: str, rel_path: str, content: str) -> None:
+    full_path = os.path.join(vault_path, rel_path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, "w", encoding="utf-8") as handle:
+        handle.write(content)
+
+
+def _poll_until(watcher, expected, timeout: float = 5.0):
+    """Accumulate watcher results until ``expected`` paths were all reported."""
+    seen = set()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and not expected <= seen:
+        changed = watcher.poll(0.2)
+        assert changed is not None
+        seen |= changed
+    return seen
+
+
+def test_polling_watcher_reports_created_modified_and_deleted_notes() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        _write(vault_path, "Keep.md", "- [ ] keep\n")
+        _write(vault_path, "Gone.md", "- [ ] gone\n")
+
+        with PollingWatcher(vault_path, IgnoreMatcher(), interval=0.1) as watcher:
+            assert watcher.poll(0.2) == set()
+
+            _write(vault_path, "Keep.md", "- [x] keep, now longer\n")
+            _write(vault_path, os.path.join("Projects", "New.md"), "- [ ] new\n")
+            os.remove(os.path.join(vault_path, "Gone.md"))
+            _write(vault_path, os.path.join(".obsidian", "workspace.md"), "noise")
+
+            changed = _poll_until(watcher, {"Keep.md", "Gone.md", os.path.join("Projects", "New.md")})
+
+        assert changed == {"Keep.md", "Gone.md", os.path.join("Projects", "New.md")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_follows_new_folders_and_skips_excluded_ones() -> None:
+    with tempfile.TemporaryDirectory() as vault_path:
+        os.makedirs(os.path.join(vault_path, "Archive"))
+        matcher = IgnoreMatcher(exclude=["Archive/"])
+
+        with InotifyWatcher(vault_path, matcher) as watcher:
+            _write(vault_path, os.path.join("Archive", "Old.md"), "- [ ] old\n")
+            _write(vault_path, "Note.md", "- [ ] note\n")
+            _write(vault_path, os.path.join("Fresh", "Deep", "Task.md"), "- [ ] deep\n")
+
+            expected = {"Note.md", os.path.join("Fresh", "Deep", "Task.md")}
+            changed = _poll_until(watcher, expected)
+
+        assert changed == expected
+
+
+def test_debouncer_waits_for_quiet_period_and_caps_delay() -> None:
+    debouncer = ChangeDebouncer(quiet=1.0, max_delay=3.0)
+    assert not debouncer.ready(now=0.0)
+
+    debouncer.add("vault", {"a.md"}, now=0.0)
+    debouncer.add("vault", set(), now=0.5)  # empty polls do not extend the window
+    assert not debouncer.ready(now=0.9)
+    assert debouncer.ready(now=1.0)
+
+    debouncer.drain()
+    for step in range(6):
+        debouncer.add("vault", {f"{step}.md"}, now=step * 0.5)
+    assert debouncer.ready(now=3.0), "Continuous edits must not postpone the sync forever"
+
+    debouncer.add("other", None, now=3.0)
+    debouncer.add("other", {"x.md"}, now=3.0)
+    batches = debouncer.drain()
+    assert batches["other"] is None
+    assert batches["vault"] == {f"{step}.md" for step in range(6)}
+    assert not debouncer
+
+
+def test_scoped_sync_leaves_out_of_scope_links_and_unlinked_reminders_alone(fake_reminders_manager) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        vault_path = os.path.join(root, "Vault")
+        links_path = os.path.join(root, "links.json")
+        _write(vault_path, "A.md", "- [ ] Alpha task ^t-alpha\n")
+        _write(vault_path, "B.md", "- [ ] Beta task ^t-beta\n")
+
+        engine = SyncEngine(
+            {"links_path": links_path, "default_calendar_id": "list-1"},
+            direction="both",
+        )
+        rem_manager = fake_reminders_manager
+        engine.rem_manager = rem_manager
+
+        engine.sync(vault_path, ["list-1"], dry_run=False)
+        assert len(rem_manager.tasks) == 2
+
+        rem_manager.tasks.append(
+            RemindersTask(
+                uuid="rem-unlinked",
+                item_id="rem-unlinked",
+                calendar_id="list-1",
+                list_name="List",
+                status=TaskStatus.TODO,
+                title="Only in Reminders",
+            )
+        )
+        _write(vault_path, "A.md", "- [x] Alpha task ^t-alpha\n")
+
+        results = engine.sync(vault_path, ["list-1"], dry_run=False, scope=SyncScope.for_files(["A.md"]))
+
+        assert results["scope"] == {"files": ["A.md"]}
+        assert results["changes"]["rem_updated"] == 1
+        assert results["changes"]["obs_created"] == 0
+        assert rem_manager.deleted == []
+        with open(os.path.join(vault_path, "B.md"), encoding="utf-8") as handle:
+            assert handle.read() == "- [ ] Beta task ^t-beta\n"
+
+        with open(links_path, encoding="utf-8") as handle:
+            stored = json.load(handle)
+        assert len(stored["links"]) == 2, "Links for notes outside the scope must be preserved"